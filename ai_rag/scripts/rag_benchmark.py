@@ -0,0 +1,98 @@
+"""Latency / recall benchmark for rag_chat retrieval modes.
+
+Runs every question in data/training/qa through the vector, BM25 and
+hybrid retrievers and reports:
+  - cold and warm (cached) latency per query
+  - answer-term recall: share of the correct option's content words that
+    appear somewhere in the retrieved context (the QA bank has no gold
+    chunk labels, so this is a proxy)
+  - exact-term hit rate: for ICT shorthand queries, whether any retrieved
+    chunk contains the term itself
+
+Usage:
+    python ai_rag/scripts/rag_benchmark.py [--k 5]
+"""
+import argparse
+import glob
+import json
+import os
+import time
+
+from rag_retrieval import HybridRetriever
+from rag_store import PROJECT_ROOT, open_vector_store, store_exists
+
+QA_DIR = os.path.join(PROJECT_ROOT, "data/training/qa")
+EXACT_TERMS = ["SIBI", "BISI", "CBDR", "OTE", "MSS", "FVG", "BPR", "IPDA", "SMT", "NWOG"]
+STOPWORDS = {
+    "the", "a", "an", "and", "or", "of", "to", "in", "on", "at", "is", "are", "be",
+    "it", "its", "for", "with", "by", "as", "that", "this", "must", "there", "no",
+}
+
+
+def load_questions():
+    questions = []
+    for path in sorted(glob.glob(os.path.join(QA_DIR, "*.json"))):
+        with open(path, "r", encoding="utf-8") as f:
+            for item in json.load(f):
+                answer = item.get("options", {}).get(item.get("correct_answer"), "")
+                questions.append((item["question"], answer))
+    return questions
+
+
+def content_words(text):
+    words = {w.strip(".,:;()'\"-").lower() for w in text.split()}
+    return {w for w in words if w and w not in STOPWORDS}
+
+
+def run_mode(db, mode, questions, k):
+    retriever = HybridRetriever(db, k=k, mode=mode)
+    cold, warm, recall = [], [], []
+    for question, answer in questions:
+        start = time.perf_counter()
+        results = retriever.search(question)
+        cold.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        retriever.search(question)
+        warm.append(time.perf_counter() - start)
+
+        words = content_words(answer)
+        context = " ".join(doc.page_content.lower() for doc, _ in results)
+        if words:
+            recall.append(sum(w in context for w in words) / len(words))
+
+    hits = 0
+    for term in EXACT_TERMS:
+        results = retriever.search(f"What is {term}?")
+        hits += any(term.lower() in doc.page_content.lower() for doc, _ in results)
+
+    return {
+        "mode": mode,
+        "cold_ms": 1000 * sum(cold) / len(cold),
+        "warm_ms": 1000 * sum(warm) / len(warm),
+        "answer_recall": sum(recall) / max(len(recall), 1),
+        "exact_hits": f"{hits}/{len(EXACT_TERMS)}",
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--k", type=int, default=5)
+    args = parser.parse_args()
+
+    if not store_exists():
+        print("Error: Database not found. Please run 'rag_ingest.py' first.")
+        return
+
+    db = open_vector_store()
+    questions = load_questions()
+    print(f"{len(questions)} questions from {QA_DIR}\n")
+    print(f"{'mode':<8} {'cold ms':>9} {'warm ms':>9} {'recall':>8} {'exact':>7}")
+    for mode in ("vector", "bm25", "hybrid"):
+        row = run_mode(db, mode, questions, args.k)
+        print(f"{row['mode']:<8} {row['cold_ms']:>9.1f} {row['warm_ms']:>9.3f} "
+              f"{row['answer_recall']:>8.2f} {row['exact_hits']:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,14 @@
 import argparse
 import os
 import sys
-from langchain_community.vectorstores import Chroma
-from langchain_ollama import OllamaEmbeddings
 from langchain_ollama import ChatOllama
 from langchain.prompts import ChatPromptTemplate
 
+from rag_retrieval import HybridRetriever
+from rag_store import DB_PATH, open_vector_store, store_exists
+
 # --- CONFIGURATION ---
-PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
-DB_PATH = os.path.join(PROJECT_ROOT, "ai_rag/rag_db")
 MODEL_NAME = "llama3.2"
-EMBEDDING_MODEL = "nomic-embed-text"
 
 # ICT Persona Prompt
 PROMPT_TEMPLATE = """
@@ -32,13 +30,13 @@ Question: {question}
 def chat_loop():
     print(f"Initializing ICT Mentor with Local Data from: {DB_PATH}")
     
-    if not os.path.exists(DB_PATH):
+    if not store_exists():
         print("Error: Database not found. Please run 'rag_ingest.py' first.")
         return
 
-    # Use dedicated embedding model for retrieval
-    embeddings = OllamaEmbeddings(model=EMBEDDING_MODEL)
-    db = Chroma(persist_directory=DB_PATH, embedding_function=embeddings)
+    # Same collection and embedding model that rag_ingest.py writes
+    db = open_vector_store()
+    retriever = HybridRetriever(db, k=5)
     model = ChatOllama(model=MODEL_NAME)
     prompt = ChatPromptTemplate.from_template(PROMPT_TEMPLATE)
     
@@ -54,8 +52,8 @@ def chat_loop():
             if not query_text.strip():
                 continue
                 
-            # 1. Search DB
-            results = db.similarity_search_with_score(query_text, k=5)
+            # 1. Search DB (BM25 + vector, fused and cached)
+            results = retriever.search(query_text)
             
             # 2. Prepare Context
             context_pieces = []
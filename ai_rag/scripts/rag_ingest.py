@@ -1,22 +1,18 @@
 import os
-import glob
+import sys
 import json
 import csv
+import hashlib
+import time
 from langchain_community.document_loaders import TextLoader
 from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langchain_ollama import OllamaEmbeddings
-try:
-    from langchain_community.vectorstores import FAISS
-except ImportError:
-    try:
-        from langchain.vectorstores import FAISS # Fallback
-    except ImportError:
-        print("Error: Could not import FAISS from langchain. Ensure `pip install faiss-cpu` is successful.")
-        raise
 from langchain_core.documents import Document
+from pathlib import Path
+
+from rag_store import PROJECT_ROOT, DB_PATH, open_vector_store, store_exists
 
-# --- CONFIGURATION ---
-PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "src"))
+from ict_agent.knowledge.manifest import SourceManifest
 
 # Prioritized directories to ingest
 SOURCE_DIRS = [
@@ -27,9 +23,11 @@ SOURCE_DIRS = [
     "docs",               # content: md
 ]
 
-DB_PATH = os.path.join(PROJECT_ROOT, "ai_rag/rag_db")
-MODEL_NAME = "llama3.2"
-EMBEDDING_MODEL = "nomic-embed-text"
+MANIFEST_PATH = os.path.join(DB_PATH, "manifest.json")
+SOURCE_IDS_PATH = os.path.join(DB_PATH, "source_ids.json")
+SOURCE_EXTENSIONS = {".md", ".json", ".csv"}
+# Chunks buffered before they are embedded and written to the store
+FLUSH_SIZE = 256
 
 def load_json_file(file_path):
     """Parses a JSON file and converts it into text documents."""
@@ -80,66 +78,57 @@ def load_csv_file(file_path):
         print(f"Error loading CSV {file_path}: {e}")
     return documents
 
-def load_documents():
-    documents = []
-    print(f"Scanning project root: {PROJECT_ROOT}")
-    
-    for dir_name in SOURCE_DIRS:
-        full_dir_path = os.path.join(PROJECT_ROOT, dir_name)
-        if not os.path.exists(full_dir_path):
-            print(f"Skipping {dir_name} (not found)")
-            continue
-            
-        print(f"Scanning {dir_name}...")
-        
-        # Helper to check size
-        def is_too_large(path):
-            # Limit to 1MB to avoid massive dumps
-            if os.path.getsize(path) > 1 * 1024 * 1024: 
-                print(f"  Skipping {os.path.basename(path)} (too large: {os.path.getsize(path)/1024/1024:.2f} MB)")
-                return True
-            return False
-
-        # 1. MARKDOWN FILES
-        md_files = glob.glob(os.path.join(full_dir_path, "**/*.md"), recursive=True)
-        for file_path in md_files:
-            if is_too_large(file_path): continue
-            try:
-                loader = TextLoader(file_path, encoding='utf-8')
-                loaded_docs = loader.load()
-                for doc in loaded_docs:
-                    doc.metadata['source_dir'] = dir_name
-                    doc.metadata['filename'] = os.path.basename(file_path)
-                documents.extend(loaded_docs)
-            except Exception:
-                pass
-
-        # 2. JSON FILES
-        json_files = glob.glob(os.path.join(full_dir_path, "**/*.json"), recursive=True)
-        for file_path in json_files:
-            if is_too_large(file_path): continue
-            documents.extend(load_json_file(file_path))
-
-        # 3. CSV FILES
-        csv_files = glob.glob(os.path.join(full_dir_path, "**/*.csv"), recursive=True)
-        for file_path in csv_files:
-            if is_too_large(file_path): continue
-            documents.extend(load_csv_file(file_path))
-            
-    print(f"Total documents loaded: {len(documents)}")
-    return documents
+def is_too_large(path):
+    """Limit to 1MB to avoid massive dumps"""
+    if os.path.getsize(path) > 1 * 1024 * 1024:
+        print(f"  Skipping {os.path.basename(path)} (too large: {os.path.getsize(path)/1024/1024:.2f} MB)")
+        return True
+    return False
 
-def ingest():
-    print("--- Starting Enhanced Ingestion ---")
-    
-    # 1. Load Data
-    docs = load_documents()
-    if not docs:
-        print("No documents found.")
-        return
+def load_file(file_path, dir_name):
+    """Load one source file into documents based on its extension."""
+    if is_too_large(file_path):
+        return []
+
+    # 1. MARKDOWN FILES
+    if file_path.endswith(".md"):
+        try:
+            loader = TextLoader(file_path, encoding='utf-8')
+            loaded_docs = loader.load()
+            for doc in loaded_docs:
+                doc.metadata['source_dir'] = dir_name
+                doc.metadata['filename'] = os.path.basename(file_path)
+            return loaded_docs
+        except Exception:
+            return []
+
+    # 2. JSON FILES
+    if file_path.endswith(".json"):
+        return load_json_file(file_path)
+
+    # 3. CSV FILES
+    if file_path.endswith(".csv"):
+        return load_csv_file(file_path)
+
+    return []
+
+def open_manifest():
+    """Manifest of every source file already embedded into the vector store."""
+    return SourceManifest.load(
+        Path(MANIFEST_PATH),
+        base=Path(PROJECT_ROOT),
+        sources=[Path(PROJECT_ROOT) / d for d in SOURCE_DIRS],
+        extensions=SOURCE_EXTENSIONS,
+    )
+
+def iter_documents(rel_paths):
+    """Yield (rel_path, documents) one source file at a time."""
+    for rel_path in rel_paths:
+        dir_name = rel_path.split("/", 1)[0]
+        yield rel_path, load_file(os.path.join(PROJECT_ROOT, rel_path), dir_name)
 
-    # 2. Split Text
-    # Use different splitting strategy based on content type
+def split_documents(docs):
+    """Split documents into chunks, keeping JSON records together where possible."""
     chunks = []
     
     # General text splitter for markdown/docs
@@ -161,29 +150,85 @@ def ingest():
             chunks.extend(json_splitter.split_documents([doc]))
         else:
             chunks.extend(general_splitter.split_documents([doc]))
-            
-    print(f"Created {len(chunks)} chunks from {len(docs)} source documents.")
+    return chunks
 
-    # 3. Embed and Store
-    print("Creating embeddings and storing in FAISS (batched)...")
-    embeddings = OllamaEmbeddings(model=EMBEDDING_MODEL)
-    
-    vector_store = None
-    batch_size = 5
-    total_chunks = len(chunks)
-    
-    for i in range(0, total_chunks, batch_size):
-        batch = chunks[i:i + batch_size]
-        print(f"Processing batch {i//batch_size + 1}/{(total_chunks+batch_size-1)//batch_size}...", end="\r")
-        
-        if vector_store is None:
-            vector_store = FAISS.from_documents(batch, embeddings)
-        else:
-            vector_store.add_documents(batch)
-            
-    print("\nSaving index...")
-    if vector_store:
-        vector_store.save_local(DB_PATH)
+def chunk_ids(rel_path, chunks):
+    """Content-addressed chunk ids: an unchanged chunk keeps its id (and its
+    embedding) even when other parts of the same file change."""
+    ids, seen = [], {}
+    for chunk in chunks:
+        digest = hashlib.sha256(chunk.page_content.encode("utf-8"))
+        digest.update(json.dumps(chunk.metadata, sort_keys=True, default=str).encode("utf-8"))
+        key = digest.hexdigest()[:24]
+        # Identical chunks inside one file still need distinct ids
+        n = seen[key] = seen.get(key, 0) + 1
+        ids.append(f"{rel_path}::{key}" if n == 1 else f"{rel_path}::{key}#{n}")
+    return ids
+
+def ingest():
+    print("--- Starting Incremental Ingestion ---")
+    print(f"Scanning project root: {PROJECT_ROOT}")
+    started = time.perf_counter()
+
+    # 1. Detect changed sources
+    manifest = open_manifest()
+    source_ids = {}
+    if store_exists() and os.path.exists(SOURCE_IDS_PATH):
+        with open(SOURCE_IDS_PATH, 'r') as f:
+            source_ids = json.load(f)
+    else:
+        # No store on disk: everything must be embedded again
+        manifest.entries.clear()
+
+    diff = manifest.scan()
+    print(f"Source changes: {diff}")
+    if not diff.has_changes:
+        print("--- Vector store is up to date ---")
+        return
+
+    vector_store = open_vector_store()
+    stale_ids = [i for rel_path in diff.deleted for i in source_ids.pop(rel_path, [])]
+
+    # 2. Stream new/changed sources, embedding only chunks whose content is new
+    pending = []
+    stats = {"chunks": 0, "embedded": 0}
+
+    def flush():
+        if not pending:
+            return
+        vector_store.add_texts(
+            texts=[c.page_content for _, c in pending],
+            metadatas=[c.metadata for _, c in pending],
+            ids=[i for i, _ in pending],
+        )
+        stats["embedded"] += len(pending)
+        print(f"Embedded {stats['embedded']} new chunks...", end="\r")
+        pending.clear()
+
+    for rel_path, docs in iter_documents(diff.updated):
+        file_chunks = split_documents(docs)
+        file_ids = chunk_ids(rel_path, file_chunks)
+        known = set(source_ids.get(rel_path, []))
+        current = set(file_ids)
+        stale_ids.extend(known - current)
+        source_ids[rel_path] = file_ids
+        stats["chunks"] += len(file_chunks)
+        pending.extend((i, c) for i, c in zip(file_ids, file_chunks) if i not in known)
+        if len(pending) >= FLUSH_SIZE:
+            flush()
+    flush()
+
+    # 3. Drop chunks that no longer exist in any source
+    if stale_ids:
+        vector_store.delete(ids=stale_ids)
+
+    with open(SOURCE_IDS_PATH, 'w') as f:
+        json.dump(source_ids, f)
+    manifest.save(Path(MANIFEST_PATH))
+
+    print(f"\n{len(diff.updated)} changed files -> {stats['chunks']} chunks, "
+          f"{stats['embedded']} embedded, {len(stale_ids)} removed "
+          f"({time.perf_counter() - started:.1f}s)")
     print(f"--- Ingestion Complete! Database saved to {DB_PATH} ---")
 
 if __name__ == "__main__":
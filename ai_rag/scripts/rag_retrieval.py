@@ -0,0 +1,177 @@
+"""Hybrid lexical + vector retrieval over the shared RAG store.
+
+Vector search alone misses exact ICT shorthand ("SIBI", "CBDR", "OTE"):
+the embedding of a four-letter acronym lands near anything vaguely about
+price action. HybridRetriever runs BM25 over the same chunks, using the
+InvertedIndex from ict_agent.knowledge, alongside the vector search, and
+merges both ranked lists with reciprocal-rank fusion.
+
+Query embeddings and fused results are kept in LRU caches keyed by the
+normalised question, so a repeated question makes no Ollama call at all.
+"""
+import hashlib
+import os
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+from langchain_core.documents import Document
+
+from rag_store import PROJECT_ROOT, DB_PATH
+
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "src"))
+from ict_agent.knowledge.inverted_index import InvertedIndex, load_pickle, save_pickle, tokenize
+
+BM25_PATH = os.path.join(DB_PATH, "bm25.pkl")
+# Standard RRF damping constant (Cormack et al.)
+RRF_K = 60
+
+
+class LRUCache:
+    """Small ordered-dict LRU."""
+
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        if key in self._data:
+            self._data.move_to_end(key)
+            self.hits += 1
+            return self._data[key]
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+def normalize_query(text):
+    return " ".join(text.lower().split())
+
+
+def doc_key(doc):
+    """Identity of a chunk that both retrievers agree on."""
+    source = str(doc.metadata.get("source", ""))
+    return hashlib.sha1(f"{source}\0{doc.page_content}".encode("utf-8")).hexdigest()
+
+
+def reciprocal_rank_fusion(ranked_lists, k=RRF_K):
+    """Fuse ranked Document lists; returns [(doc, score)] best first."""
+    scores, docs = {}, {}
+    for ranked in ranked_lists:
+        for rank, doc in enumerate(ranked):
+            key = doc_key(doc)
+            docs.setdefault(key, doc)
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank + 1)
+    order = sorted(scores, key=scores.get, reverse=True)
+    return [(docs[key], scores[key]) for key in order]
+
+
+class HybridRetriever:
+    """
+    BM25 + vector retrieval with RRF and query caches.
+
+    Args:
+        db: Chroma store from rag_store.open_vector_store()
+        k: Chunks returned per query
+        candidates: Chunks taken from each retriever before fusion
+        mode: "hybrid", "vector" or "bm25"
+        cache_size: Entries in each LRU cache
+    """
+
+    def __init__(self, db, k=5, candidates=20, mode="hybrid", cache_size=256):
+        self.db = db
+        self.k = k
+        self.candidates = candidates
+        self.mode = mode
+        self.embedding_cache = LRUCache(cache_size)
+        self.result_cache = LRUCache(cache_size)
+        self._chunks = []
+        self._index = InvertedIndex()
+        self._load_lexical_index()
+
+    # ── BM25 index ────────────────────────────────────────────
+
+    def _load_lexical_index(self):
+        """Load the pickled BM25 index, rebuilding it if the store changed."""
+        # Ids alone fingerprint the store; the corpus is read only to rebuild
+        ids = self.db.get(include=[])["ids"]
+        fingerprint = hashlib.sha1("\n".join(sorted(ids)).encode("utf-8")).hexdigest()
+
+        payload = load_pickle(Path(BM25_PATH))
+        if payload and payload.get("fingerprint") == fingerprint:
+            self._chunks = payload["chunks"]
+            self._index = InvertedIndex.from_state(payload["inverted"])
+            return
+
+        stored = self.db.get(include=["documents", "metadatas"])
+        self._chunks = [
+            (text, metadata or {})
+            for text, metadata in zip(stored["documents"], stored["metadatas"])
+        ]
+        self._index = InvertedIndex()
+        for doc_id, (text, _) in enumerate(self._chunks):
+            self._index.add_document(doc_id, text)
+        save_pickle(
+            Path(BM25_PATH),
+            {"fingerprint": fingerprint, "chunks": self._chunks, "inverted": self._index.to_state()},
+        )
+
+    def lexical_search(self, query, limit):
+        scores = self._index.bm25(tokenize(query))
+        top = sorted(scores, key=scores.get, reverse=True)[:limit]
+        return [Document(page_content=self._chunks[i][0], metadata=self._chunks[i][1]) for i in top]
+
+    # ── Vector search ─────────────────────────────────────────
+
+    def embed_query(self, query):
+        key = normalize_query(query)
+        vector = self.embedding_cache.get(key)
+        if vector is None:
+            vector = self.db.embeddings.embed_query(query)
+            self.embedding_cache.put(key, vector)
+        return vector
+
+    def vector_search(self, query, limit):
+        results = self.db.similarity_search_by_vector_with_relevance_scores(
+            self.embed_query(query), k=limit
+        )
+        return [doc for doc, _score in results]
+
+    # ── Public API ────────────────────────────────────────────
+
+    def search(self, query):
+        """Top-k [(Document, score)] for the query (cached)."""
+        key = (self.mode, normalize_query(query))
+        cached = self.result_cache.get(key)
+        if cached is not None:
+            return cached
+
+        ranked = []
+        if self.mode in ("hybrid", "vector"):
+            ranked.append(self.vector_search(query, self.candidates))
+        if self.mode in ("hybrid", "bm25"):
+            ranked.append(self.lexical_search(query, self.candidates))
+        results = reciprocal_rank_fusion(ranked)[:self.k]
+
+        self.result_cache.put(key, results)
+        return results
+
+    def stats(self):
+        return {
+            "chunks": len(self._chunks),
+            "embedding_cache": f"{self.embedding_cache.hits}/{self.embedding_cache.hits + self.embedding_cache.misses}",
+            "result_cache": f"{self.result_cache.hits}/{self.result_cache.hits + self.result_cache.misses}",
+        }
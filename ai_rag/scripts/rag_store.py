@@ -0,0 +1,62 @@
+"""Vector store shared by rag_ingest.py and rag_chat.py.
+
+Both scripts must open the same backend, collection and embedding model,
+otherwise chat queries a store that ingestion never wrote to.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from langchain_community.vectorstores import Chroma
+from langchain_core.embeddings import Embeddings
+from langchain_ollama import OllamaEmbeddings
+
+# --- CONFIGURATION ---
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+DB_PATH = os.path.join(PROJECT_ROOT, "ai_rag/rag_db")
+COLLECTION_NAME = "ict_notes"
+EMBEDDING_MODEL = "nomic-embed-text"
+
+# Texts per Ollama /api/embed request, and requests in flight at once
+EMBED_BATCH_SIZE = 32
+EMBED_WORKERS = 4
+
+
+class BatchedEmbeddings(Embeddings):
+    """Splits embed_documents into fixed-size batches sent concurrently.
+
+    Ollama serves several embedding requests in parallel, so a bounded pool
+    keeps it busy without queueing the whole corpus at once. Results come
+    back in input order.
+    """
+
+    def __init__(self, base, batch_size=EMBED_BATCH_SIZE, max_workers=EMBED_WORKERS):
+        self.base = base
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+
+    def embed_documents(self, texts):
+        batches = [texts[i:i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+        if len(batches) <= 1:
+            return self.base.embed_documents(list(texts))
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as pool:
+            results = pool.map(self.base.embed_documents, batches)
+            return [vector for batch in results for vector in batch]
+
+    def embed_query(self, text):
+        return self.base.embed_query(text)
+
+
+def store_exists():
+    """True once rag_ingest.py has persisted a store at DB_PATH."""
+    return os.path.exists(os.path.join(DB_PATH, "chroma.sqlite3"))
+
+
+def open_vector_store(embeddings=None):
+    """Open (or create) the persistent Chroma collection."""
+    if embeddings is None:
+        embeddings = BatchedEmbeddings(OllamaEmbeddings(model=EMBEDDING_MODEL))
+    return Chroma(
+        collection_name=COLLECTION_NAME,
+        persist_directory=DB_PATH,
+        embedding_function=embeddings,
+    )
@@ -10,13 +10,18 @@ Requirements:
 5. Save runs metadata in .CSV summary rows.
 """
 
-import json
 import csv
+import hashlib
 import sys
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence, Set
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+from ict_agent.data.datasets import iter_records
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -24,11 +29,9 @@ logger = logging.getLogger(__name__)
 
 try:
     import numpy as np
-    from sklearn.metrics.pairwise import cosine_similarity
 except ImportError:
-    logger.warning("numpy or scikit-learn not found. Cosine similarity will be disabled.")
+    logger.warning("numpy not found. Cosine similarity will be disabled.")
     np = None
-    cosine_similarity = None
 
 try:
     from sentence_transformers import SentenceTransformer
@@ -37,20 +40,105 @@ except ImportError:
     logger.warning("sentence-transformers not found. Semantic similarity will be disabled.")
     HAS_SENTENCE_TRANSFORMERS = False
 
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+CSV_FIELDNAMES = ["timestamp", "category", "keyword_accuracy", "cosine_similarity", "samples"]
+
+
+class EmbeddingCache:
+    """
+    On-disk embedding cache keyed by SHA-256 of (model name, text).
+
+    Vectors for one model live in a single .npz file, so a rerun over an
+    unchanged QA bank never calls the encoder for gold answers again.
+    """
+
+    def __init__(self, cache_dir: Path, model_name: str):
+        self.model_name = model_name
+        self.path = Path(cache_dir) / f"{model_name.replace('/', '_')}.npz"
+        self._vectors: Dict[str, Any] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        if self.path.exists():
+            try:
+                with np.load(self.path) as stored:
+                    self._vectors = {key: stored[key] for key in stored.files}
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable embedding cache {self.path}: {e}")
+
+    def key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model_name}\0{text}".encode("utf-8")).hexdigest()
+
+    def encode(self, model, texts: Sequence[str], batch_size: int = 64):
+        """Embed texts as a (len(texts), dim) matrix, encoding only cache misses."""
+        keys = [self.key(t) for t in texts]
+        with self._lock:
+            missing = {}
+            for key, text in zip(keys, texts):
+                if key not in self._vectors and key not in missing:
+                    missing[key] = text
+        # Encode outside the lock so category workers run in parallel
+        if missing:
+            vectors = model.encode(list(missing.values()), batch_size=batch_size)
+            encoded = {key: np.asarray(vector, dtype=np.float32) for key, vector in zip(missing, vectors)}
+        with self._lock:
+            if missing:
+                self._vectors.update(encoded)
+                self._dirty = True
+            return np.stack([self._vectors[k] for k in keys]) if keys else np.zeros((0, 0))
+
+    def save(self):
+        """Persist new vectors (atomic replace)"""
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                vectors = dict(self._vectors)
+                self._dirty = False
+            # Written outside the lock; encoders keep going meanwhile
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix(".tmp.npz")
+                np.savez(tmp_path, **vectors)
+                tmp_path.replace(self.path)
+            except Exception:
+                with self._lock:
+                    self._dirty = True
+                raise
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+
+def gold_answer_for(item: Dict[str, Any]) -> str:
+    """Explanation, or the correct option text when the explanation is missing."""
+    gold_answer = item.get("explanation", "")
+    if not gold_answer:
+        correct_opt_key = item.get("correct_answer")
+        if correct_opt_key and "options" in item:
+            gold_answer = item["options"].get(correct_opt_key, "")
+    return gold_answer
+
 
 class EvaluationSystem:
-    def __init__(self, qa_file_path: Optional[str] = None, output_csv_path: Optional[str] = None):
+    def __init__(
+        self,
+        qa_file_path: Optional[str] = None,
+        output_csv_path: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        max_workers: int = 4,
+    ):
         self.project_root = Path(__file__).resolve().parent.parent
         self.qa_file_path = Path(qa_file_path) if qa_file_path else self.project_root / "data" / "training" / "qa" / "ict_concepts_qa.json"
         self.output_csv_path = Path(output_csv_path) if output_csv_path else self.project_root / "experiments" / "evaluation_summary.csv"
-        
-        # Determine model for embeddings if available
+        self.cache_dir = Path(cache_dir) if cache_dir else self.project_root / "data" / "cache" / "eval_embeddings"
+        self.max_workers = max_workers
+
+        # Loaded lazily by load_embedding_model(); callers may also inject
+        # any object with a sentence-transformers style encode()
         self.embedding_model = None
-        if HAS_SENTENCE_TRANSFORMERS:
-            # We use a small model for speed, avoiding massive downloads if possible
-            # But the user asked to avoid loading inference. We establish the *architecture* here.
-            # Lazy loading in invoke if needed
-            pass
+        self.embedding_cache: Optional[EmbeddingCache] = None
+        self._csv_lock = threading.Lock()
 
         self.results_history = []
         self.current_run_metrics = {}
@@ -62,21 +150,39 @@ class EvaluationSystem:
             return []
         
         try:
-            with open(self.qa_file_path, 'r') as f:
-                data = json.load(f)
-                logger.info(f"Loaded {len(data)} QA pairs from {self.qa_file_path}")
-                return data
+            # .json array or .jsonl, parsed incrementally
+            data = list(iter_records(self.qa_file_path))
+            logger.info(f"Loaded {len(data)} QA pairs from {self.qa_file_path}")
+            return data
         except Exception as e:
             logger.error(f"Failed to load QA data: {e}")
             return []
 
     def load_embedding_model(self):
-        """Loads embedding model only when needed to avoid overhead during initialization."""
-        if HAS_SENTENCE_TRANSFORMERS and self.embedding_model is None:
-            logger.info("Loading embedding model (architecture only - actual load would happen here)...")
-            # self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2') 
-            # Commented out to avoid 'excessively executing slow 4bit loading inference now' as requested.
-            pass
+        """Loads the embedding model (and its disk cache) on first use."""
+        if np is None:
+            return None
+        if self.embedding_model is None and HAS_SENTENCE_TRANSFORMERS:
+            logger.info(f"Loading embedding model {EMBEDDING_MODEL_NAME}...")
+            self.embedding_model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+        if self.embedding_model is not None and self.embedding_cache is None:
+            name = getattr(self.embedding_model, "model_name", EMBEDDING_MODEL_NAME)
+            self.embedding_cache = EmbeddingCache(self.cache_dir, name)
+        return self.embedding_model
+
+    def embed(self, texts: Sequence[str]):
+        """Cached embeddings for texts, or None when embeddings are unavailable."""
+        model = self.load_embedding_model()
+        if model is None:
+            return None
+        return self.embedding_cache.encode(model, texts)
+
+    def save_embedding_cache(self):
+        if self.embedding_cache is not None:
+            try:
+                self.embedding_cache.save()
+            except Exception as e:
+                logger.warning(f"Could not save embedding cache: {e}")
 
     def invoke_logic(self, question: str, context: Optional[str] = None) -> str:
         """
@@ -94,95 +200,130 @@ class EvaluationSystem:
         """
         Compares outputs against Keyword Presence metric + cosine similarity score against gold_answers.
         """
-        metrics = {
-            "keyword_presence": 0.0,
-            "cosine_similarity": 0.0
+        keyword, cosine = self.calculate_batch_metrics([model_output], [gold_answer])
+        return {
+            "keyword_presence": float(keyword[0]),
+            "cosine_similarity": float(cosine[0]),
         }
 
-        # 1. Keyword Presence (Simple implementation)
-        # Tokenize gold answer and check presence in model output
-        gold_tokens = set(gold_answer.lower().split())
-        output_lower = model_output.lower()
-        if gold_tokens:
+    def calculate_batch_metrics(
+        self,
+        model_outputs: Sequence[str],
+        gold_answers: Sequence[str],
+        gold_embeddings=None,
+    ):
+        """
+        Keyword presence and cosine similarity (both 0-100) for aligned
+        lists of outputs and gold answers.
+
+        Args:
+            gold_embeddings: Precomputed gold vectors (rows aligned with
+                gold_answers); embedded here when omitted
+
+        Returns:
+            (keyword_presence, cosine_similarity) lists of floats
+        """
+        # 1. Keyword Presence: share of gold tokens found in the output
+        keyword = []
+        for output, gold in zip(model_outputs, gold_answers):
+            gold_tokens = set(gold.lower().split())
+            output_lower = output.lower()
             present_count = sum(1 for token in gold_tokens if token in output_lower)
-            metrics["keyword_presence"] = (present_count / len(gold_tokens)) * 100.0
-
-        # 2. Cosine Similarity
-        if HAS_SENTENCE_TRANSFORMERS and np is not None:
-             self.load_embedding_model()
-             # Logic to encode and compare:
-             # embeddings = self.embedding_model.encode([model_output, gold_answer])
-             # metrics["cosine_similarity"] = cosine_similarity([embeddings[0]], [embeddings[1]])[0][0] * 100.0
-             pass
-        else:
-             # Fallback or stub
-             metrics["cosine_similarity"] = 0.0
-
-        return metrics
-
-    def run_evaluation(self):
+            keyword.append(present_count / len(gold_tokens) * 100.0 if gold_tokens else 0.0)
+
+        # 2. Cosine Similarity, row-wise over the whole batch
+        cosine = [0.0] * len(keyword)
+        if keyword:
+            outputs = self.embed(list(model_outputs))
+            if outputs is not None:
+                golds = gold_embeddings if gold_embeddings is not None else self.embed(list(gold_answers))
+                dots = np.einsum("ij,ij->i", outputs, golds)
+                norms = np.linalg.norm(outputs, axis=1) * np.linalg.norm(golds, axis=1)
+                sims = np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+                cosine = (sims * 100.0).tolist()
+
+        return keyword, cosine
+
+    def evaluate_category(self, items: List[Dict[str, Any]], gold_embeddings=None) -> Dict[str, float]:
+        """Invoke the model for one category group and score it as a batch."""
+        golds = [gold_answer_for(item) for item in items]
+        outputs = [self.invoke_logic(item.get("question", "")) for item in items]
+        keyword, cosine = self.calculate_batch_metrics(outputs, golds, gold_embeddings)
+        count = len(items)
+        return {
+            "avg_keyword_presence": sum(keyword) / count,
+            "avg_cosine_similarity": sum(cosine) / count,
+            "samples": count,
+        }
+
+    def completed_categories(self, timestamp: str) -> Set[str]:
+        """Categories already written to the CSV for the run `timestamp`."""
+        if not self.output_csv_path.exists():
+            return set()
+        with open(self.output_csv_path, 'r', newline='') as f:
+            return {row["category"] for row in csv.DictReader(f) if row.get("timestamp") == timestamp}
+
+    def run_evaluation(self, resume: Optional[str] = None) -> Dict[str, Dict[str, float]]:
         """
         Main execution loop.
+
+        Category groups are evaluated in parallel workers and each one is
+        appended to the CSV as soon as it finishes. Passing the timestamp of
+        an interrupted run as `resume` skips the categories it already wrote.
         """
         qa_data = self.load_qa_data()
         if not qa_data:
-            return
+            return {}
 
-        run_timestamp = datetime.now().isoformat()
-        category_metrics = {}
-        
-        logger.info("Starting Evaluation Run...")
+        run_timestamp = resume or datetime.now().isoformat()
+        done = self.completed_categories(run_timestamp) if resume else set()
 
-        for item in qa_data:
+        groups: Dict[str, List[int]] = {}
+        for i, item in enumerate(qa_data):
             category = item.get("category", "Unknown")
-            question = item.get("question", "")
-            # Assuming 'options' and 'correct_answer' or 'explanation' constitutes the gold answer
-            gold_answer = item.get("explanation", "")
-            if not gold_answer:
-                 # fallback to correct option text if explanation missing
-                 correct_opt_key = item.get("correct_answer")
-                 if correct_opt_key and "options" in item:
-                     gold_answer = item["options"].get(correct_opt_key, "")
-
-            # Invoke Logic
-            model_output = self.invoke_logic(question)
-
-            # Calculate metrics
-            metrics = self.calculate_metrics(model_output, gold_answer)
-
-            # Aggregate per category
-            if category not in category_metrics:
-                category_metrics[category] = {"count": 0, "keyword_sum": 0.0, "cosine_sum": 0.0}
-            
-            category_metrics[category]["count"] += 1
-            category_metrics[category]["keyword_sum"] += metrics["keyword_presence"]
-            category_metrics[category]["cosine_sum"] += metrics["cosine_similarity"]
-
-        # Calculate final category accuracy
+            if category not in done:
+                groups.setdefault(category, []).append(i)
+        if done:
+            logger.info(f"Resuming run {run_timestamp}: skipping {len(done)} finished categories")
+
+        # Embed every gold answer once, up front (cached on disk across runs)
+        gold_matrix = self.embed([gold_answer_for(item) for item in qa_data])
+        self.save_embedding_cache()
+
+        logger.info("Starting Evaluation Run...")
         final_results = {}
         print("\n--- Evaluation Results ---")
-        for category, data in category_metrics.items():
-            count = data["count"]
-            if count > 0:
-                avg_keyword = data["keyword_sum"] / count
-                avg_cosine = data["cosine_sum"] / count
-                # Setup a blended score or report both
-                final_results[category] = {
-                    "avg_keyword_presence": avg_keyword,
-                    "avg_cosine_similarity": avg_cosine,
-                    "samples": count
-                }
-                print(f"Category: {category} | Keyword: {avg_keyword:.1f}% | Cosine: {avg_cosine:.1f}% | Samples: {count}")
-        
-        self.save_results(run_timestamp, final_results)
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as pool:
+            futures = {
+                pool.submit(
+                    self.evaluate_category,
+                    [qa_data[i] for i in indices],
+                    None if gold_matrix is None else gold_matrix[indices],
+                ): category
+                for category, indices in groups.items()
+            }
+            for future in as_completed(futures):
+                category = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Category {category} failed: {e}")
+                    continue
+                final_results[category] = result
+                self.save_results(run_timestamp, {category: result})
+                # Per category, so a resumed run finds this one's vectors
+                self.save_embedding_cache()
+                print(f"Category: {category} | Keyword: {result['avg_keyword_presence']:.1f}% | "
+                      f"Cosine: {result['avg_cosine_similarity']:.1f}% | Samples: {result['samples']}")
+
+        self.current_run_metrics = final_results
+        return final_results
 
     def save_results(self, timestamp: str, results: Dict[str, Dict[str, float]]):
         """
         Save runs metadata in .CSV summary rows.
         It should handle history over time too.
         """
-        file_exists = self.output_csv_path.exists()
-        
         # Flatten results for CSV
         rows = []
         for category, metrics in results.items():
@@ -199,18 +340,27 @@ class EvaluationSystem:
             logger.warning("No results to save.")
             return
 
-        fieldnames = ["timestamp", "category", "keyword_accuracy", "cosine_similarity", "samples"]
-        
         try:
-            with open(self.output_csv_path, 'a', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                if not file_exists:
-                    writer.writeheader()
-                writer.writerows(rows)
+            with self._csv_lock:
+                file_exists = self.output_csv_path.exists()
+                with open(self.output_csv_path, 'a', newline='') as f:
+                    writer = csv.DictWriter(f, fieldnames=CSV_FIELDNAMES)
+                    if not file_exists:
+                        writer.writeheader()
+                    writer.writerows(rows)
+                    f.flush()
             logger.info(f"Results saved to {self.output_csv_path}")
         except Exception as e:
             logger.error(f"Failed to save CSV results: {e}")
 
 if __name__ == "__main__":
-    harness = EvaluationSystem()
-    harness.run_evaluation()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Evaluation Harness V1")
+    parser.add_argument("--qa-file", help="QA bank JSON (default: data/training/qa/ict_concepts_qa.json)")
+    parser.add_argument("--workers", type=int, default=4, help="Parallel category workers")
+    parser.add_argument("--resume", metavar="TIMESTAMP", help="Resume an interrupted run")
+    args = parser.parse_args()
+
+    harness = EvaluationSystem(qa_file_path=args.qa_file, max_workers=args.workers)
+    harness.run_evaluation(resume=args.resume)
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+ICT Knowledge Engine — API Load Test
+====================================
+
+Starts the read API on one uvicorn worker, keeps a fake controller
+publishing snapshots (24 symbols x 11 gates) in the background, and drives
+it with concurrent clients for a fixed time. Half of the clients revalidate
+with If-None-Match, like a polling dashboard; a few hold SSE streams open.
+Clients share the server's process (and GIL), so the numbers are a floor.
+
+Usage:
+    python scripts/api_load_test.py
+    python scripts/api_load_test.py --clients 64 --seconds 20 --sse 8
+"""
+
+import argparse
+import asyncio
+import random
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+import httpx
+import uvicorn
+
+from ict_agent.api.app import create_app
+from ict_agent.api.publisher import ControllerPublisher
+from ict_agent.api.snapshots import SnapshotStore
+
+SYMBOLS = [f"{base}_USD" for base in ("EUR", "GBP", "AUD", "NZD", "XAU", "XAG")] + [
+    f"USD_{quote}" for quote in ("JPY", "CAD", "CHF", "SEK", "NOK", "MXN")
+] + [f"EUR_{quote}" for quote in ("GBP", "JPY", "CHF", "AUD", "CAD", "NZD")] + [
+    f"GBP_{quote}" for quote in ("JPY", "CHF", "AUD", "CAD", "NZD", "SGD")
+]
+ENDPOINTS = ["/api/status", "/api/gates", "/api/positions", "/api/signals"] + [
+    f"/api/gates/{s}" for s in SYMBOLS[:6]
+]
+
+
+class FakeController:
+    """Publishes a cycle's worth of snapshots every `interval` seconds."""
+
+    def __init__(self, store: SnapshotStore, interval: float):
+        self.publisher = ControllerPublisher(self, store)
+        self.interval = interval
+        self.cycle = 0
+        self.stop = threading.Event()
+
+    def get_status(self):
+        return {"state": "idle", "running": True, "cycle_count": self.cycle, "symbols": SYMBOLS}
+
+    def run(self):
+        rng = random.Random(0)
+        while not self.stop.is_set():
+            self.cycle += 1
+            for symbol in SYMBOLS:
+                passed = rng.randint(3, 11)
+                trace = [
+                    {"gate": f"G{i + 1}", "passed": i < passed, "summary": f"{symbol} gate {i + 1} " * 4}
+                    for i in range(min(passed + 1, 11))
+                ]
+                self.publisher.record_analysis(symbol, {"gate_trace": trace, "trade": passed == 11})
+            self.publisher.publish_positions([
+                {"id": str(i), "instrument": s, "currentUnits": 1000, "unrealizedPL": rng.uniform(-50, 50)}
+                for i, s in enumerate(SYMBOLS[:4])
+            ])
+            self.publisher.cycle_complete()
+            self.stop.wait(self.interval)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def client_loop(base, deadline, revalidate, latencies, statuses):
+    etags = {}
+    async with httpx.AsyncClient(base_url=base, timeout=10) as client:
+        while time.perf_counter() < deadline:
+            path = random.choice(ENDPOINTS)
+            headers = {"If-None-Match": etags[path]} if revalidate and path in etags else {}
+            start = time.perf_counter()
+            response = await client.get(path, headers=headers)
+            latencies.append(time.perf_counter() - start)
+            statuses[response.status_code] += 1
+            if "etag" in response.headers:
+                etags[path] = response.headers["etag"]
+
+
+async def sse_loop(base, deadline, received):
+    async with httpx.AsyncClient(base_url=base, timeout=None) as client:
+        async with client.stream("GET", "/api/stream") as response:
+            async for line in response.aiter_lines():
+                if line.startswith("event:"):
+                    received.append(line)
+                if time.perf_counter() >= deadline:
+                    break
+
+
+async def drive(base, clients, seconds, sse):
+    latencies, statuses, events = [], Counter(), []
+    deadline = time.perf_counter() + seconds
+    tasks = [
+        client_loop(base, deadline, i % 2 == 0, latencies, statuses) for i in range(clients)
+    ] + [sse_loop(base, deadline, events) for _ in range(sse)]
+    start = time.perf_counter()
+    await asyncio.gather(*tasks)
+    return time.perf_counter() - start, latencies, statuses, events
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the ICT Knowledge Engine read API")
+    parser.add_argument("--clients", type=int, default=32, help="Concurrent polling clients")
+    parser.add_argument("--seconds", type=float, default=10.0, help="Test duration")
+    parser.add_argument("--sse", type=int, default=4, help="Concurrent SSE listeners")
+    parser.add_argument("--publish-interval", type=float, default=0.5, help="Seconds between fake cycles")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SnapshotStore(Path(tmp))
+        controller = FakeController(store, args.publish_interval)
+        threading.Thread(target=controller.run, daemon=True).start()
+
+        port = free_port()
+        server = uvicorn.Server(uvicorn.Config(
+            create_app(store, poll_interval=0.25), host="127.0.0.1", port=port,
+            log_level="warning", workers=1,
+        ))
+        threading.Thread(target=server.run, daemon=True).start()
+        while not server.started:
+            time.sleep(0.05)
+
+        base = f"http://127.0.0.1:{port}"
+        elapsed, latencies, statuses, events = asyncio.run(
+            drive(base, args.clients, args.seconds, args.sse)
+        )
+        controller.stop.set()
+        server.should_exit = True
+
+    total = len(latencies)
+    ordered = sorted(latencies)
+    pct = lambda q: 1000 * ordered[min(int(q * total), total - 1)]
+    print(f"\n{total} requests in {elapsed:.1f}s on 1 worker "
+          f"({args.clients} clients, {args.sse} SSE listeners, {controller.cycle} cycles published)")
+    print(f"  throughput: {total / elapsed:,.0f} req/s")
+    print(f"  latency ms: p50 {pct(0.50):.1f}  p95 {pct(0.95):.1f}  p99 {pct(0.99):.1f}  "
+          f"mean {1000 * statistics.mean(latencies):.1f}")
+    print(f"  statuses:   {dict(sorted(statuses.items()))}")
+    print(f"  SSE events: {len(events)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Bulk OANDA history download into the local bar store.
+
+Resumable: rerun the same command after an interruption and it picks up
+after the last stored candle.
+
+    python scripts/download_history.py EUR_USD --granularity M1 --years 10
+    python scripts/download_history.py XAU_USD GBP_USD --granularity M15 --start 2020-01-01
+"""
+
+import argparse
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from ict_agent.data.history import DEFAULT_STORE, BarStore, HistoryDownloader
+from ict_agent.data.oanda_fetcher import OANDAFetcher
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Download OANDA candles into the bar store")
+    parser.add_argument("symbols", nargs="+")
+    parser.add_argument("--granularity", default="M1")
+    parser.add_argument("--years", type=float, default=10)
+    parser.add_argument("--start", help="YYYY-MM-DD (overrides --years)")
+    parser.add_argument("--end", help="YYYY-MM-DD (default: now)")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--store", default=str(DEFAULT_STORE))
+    args = parser.parse_args()
+
+    end = datetime.fromisoformat(args.end).replace(tzinfo=timezone.utc) if args.end \
+        else datetime.now(timezone.utc)
+    start = datetime.fromisoformat(args.start).replace(tzinfo=timezone.utc) if args.start \
+        else end - timedelta(days=365.25 * args.years)
+
+    store = BarStore(Path(args.store))
+    fetcher = OANDAFetcher()
+    downloader = HistoryDownloader(fetcher, store, workers=args.workers)
+
+    def progress(state: dict) -> None:
+        print(f"\r   {state['instrument']} {state['granularity']}: "
+              f"page {state['pages']}/{state['total_pages']} "
+              f"through {state['through'][:16]} ({state['candles']:,} candles)",
+              end="", flush=True)
+
+    for symbol in args.symbols:
+        print(f"📥 {symbol} {args.granularity} {start:%Y-%m-%d} → {end:%Y-%m-%d}")
+        summary = downloader.download(symbol, args.granularity, start, end, progress=progress)
+        print(f"\n   ✅ {summary['stored']:,} stored, last candle {summary['last_candle']}")
+
+    print(f"   Transport: {fetcher.transport.stats()['requests']} requests, "
+          f"{fetcher.transport.stats()['retries']} retries")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,10 @@
-import json
 import random
 import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from ict_agent.data.datasets import JsonlWriter
 
 # ICT Terminology Mapping
 ICT_TERMS = {
@@ -94,9 +98,8 @@ TEMPLATES = [
     "The {term} suggests lower prices."
 ]
 
-def generate_shorthand_data(num_samples=1000):
-    data = []
-    
+def iter_shorthand_data(num_samples=1000):
+    """Yield forward and reverse shorthand pairs one entry at a time."""
     # Flatten terms for easier access
     all_terms = list(ICT_TERMS.keys())
     
@@ -109,38 +112,29 @@ def generate_shorthand_data(num_samples=1000):
         short_sentence = template.format(term=shorthand)
         
         # Create a training entry pair
-        entry = {
+        yield {
             "input": f"Rewrite this using ICT shorthand: {full_sentence}",
             "output": short_sentence,
             "term": term,
             "shorthand": shorthand
         }
-        data.append(entry)
         
         # Also create the reverse mapping for robustness
-        entry_reverse = {
+        yield {
             "input": f"Expand this ICT shorthand: {short_sentence}",
             "output": full_sentence,
             "term": term,
             "shorthand": shorthand
         }
-        data.append(entry_reverse)
 
-    return data
+def generate_shorthand_data(num_samples=1000):
+    return list(iter_shorthand_data(num_samples))
 
 if __name__ == "__main__":
-    generated_data = generate_shorthand_data(2000)
-    
-    import os
-    # Get the directory of the current script
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    # Construct absolute path for output
-    output_path = os.path.join(script_dir, "../data/training/shorthand_training_data.json")
-    
-    # Ensure directory exists
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    
-    with open(output_path, "w") as f:
-        json.dump(generated_data, f, indent=2)
+    output_path = Path(__file__).parent.parent / "data/training/shorthand_training_data.jsonl"
+
+    with JsonlWriter(output_path) as out:
+        for entry in iter_shorthand_data(2000):
+            out.write(entry)
         
-    print(f"Generated {len(generated_data)} shorthand training examples in {output_path}")
+    print(f"Generated {out.count} shorthand training examples in {output_path}")
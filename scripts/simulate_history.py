@@ -4,9 +4,10 @@ Tests the VEX Brain (CoreEngine + KnowledgeManager) on past market data.
 Simulates a live trading session candle-by-candle.
 """
 
+import argparse
 import sys
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 from pathlib import Path
 
@@ -15,7 +16,8 @@ sys.path.append(str(Path(__file__).parent.parent / "src"))
 
 from ict_agent.core.vex_core_engine import VexCoreEngine
 from ict_agent.learning.knowledge_manager import KnowledgeManager
-from ict_agent.data.oanda_fetcher import get_oanda_data
+from ict_agent.data.history import BarStore, HistoryDownloader
+from ict_agent.data.oanda_fetcher import OANDAFetcher
 
 NY_TZ = ZoneInfo("America/New_York")
 
@@ -27,11 +29,17 @@ def run_simulation(symbol: str, days: int = 5):
     engine = VexCoreEngine()
     km = KnowledgeManager()
     
-    # Fetch ample history
-    print(f"📥 Fetching data for {symbol}...")
-    # Get enough candles to cover the period + lookback
-    df_15m = get_oanda_data(symbol, timeframe="M15", count=days * 96 + 200)
-    df_1h = get_oanda_data(symbol, timeframe="H1", count=days * 24 + 100)
+    # Sync the local bar store (resumes after the last stored candle),
+    # with a week of lookback for the first 200 M15 / 50 H1 bars
+    print(f"📥 Syncing history for {symbol}...")
+    end = datetime.now(timezone.utc)
+    start = end - timedelta(days=days + 7)
+    store = BarStore()
+    downloader = HistoryDownloader(OANDAFetcher(), store)
+    for timeframe in ("M15", "H1"):
+        downloader.download(symbol, timeframe, start, end)
+    df_15m = store.load(symbol, "M15", start, end)
+    df_1h = store.load(symbol, "H1", start, end)
     
     if df_15m is None or df_15m.empty:
         print("❌ Failed to fetch data.")
@@ -122,5 +130,8 @@ def run_simulation(symbol: str, days: int = 5):
     print("=" * 60)
 
 if __name__ == "__main__":
-    # Test on EUR_USD for last 5 days
-    run_simulation("EUR_USD", days=5)
+    parser = argparse.ArgumentParser(description="Replay the VEX brain over stored history")
+    parser.add_argument("--symbol", default="EUR_USD")
+    parser.add_argument("--days", type=int, default=5)
+    args = parser.parse_args()
+    run_simulation(args.symbol, days=args.days)
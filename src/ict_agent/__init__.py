@@ -1,9 +1,21 @@
 """ICT AI Trading Agent - Main Package"""
 
+from typing import TYPE_CHECKING
+
+from ict_agent._lazy import lazy_exports
+
 __version__ = "0.1.0"
 __author__ = "ICT Agent Team"
 
-from ict_agent.engine.agent import ICTTradingAgent
-from ict_agent.engine.signal_generator import SignalGenerator
+if TYPE_CHECKING:
+    from ict_agent.engine.agent import ICTTradingAgent
+    from ict_agent.engine.signal_generator import SignalGenerator
 
 __all__ = ["ICTTradingAgent", "SignalGenerator"]
+
+_EXPORTS = {
+    "ICTTradingAgent": "ict_agent.engine.agent",
+    "SignalGenerator": "ict_agent.engine.signal_generator",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
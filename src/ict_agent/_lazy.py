@@ -0,0 +1,40 @@
+"""Lazy package exports (PEP 562)
+
+Package ``__init__`` modules declare what they export instead of importing
+it, so ``import ict_agent.grader`` does not drag in pandas, pydantic or the
+detector stack through sibling packages:
+
+    _EXPORTS = {"SetupGrader": "ict_agent.grader.setup_grader"}
+    __getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+The defining module is imported on first attribute access and the value is
+cached on the package, so later lookups are plain attribute reads.
+Unlisted names fall back to importing the submodule of the same name.
+"""
+
+import importlib
+import importlib.util
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build module-level ``__getattr__`` / ``__dir__`` for a package."""
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is not None:
+            value = getattr(importlib.import_module(module_name), name)
+        elif not name.startswith("__") and importlib.util.find_spec(f"{package}.{name}"):
+            value = importlib.import_module(f"{package}.{name}")
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -1,4 +1,16 @@
 """AI Chart Analysis module."""
-from .chart_analyzer import ChartAnalyzer
+
+from typing import TYPE_CHECKING
+
+from ict_agent._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .chart_analyzer import ChartAnalyzer
 
 __all__ = ['ChartAnalyzer']
+
+_EXPORTS = {
+    "ChartAnalyzer": "ict_agent.analysis.chart_analyzer",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
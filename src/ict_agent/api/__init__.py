@@ -0,0 +1,22 @@
+"""ICT Knowledge Engine API — async read service over published agent state."""
+
+from typing import TYPE_CHECKING
+
+from ict_agent._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ict_agent.api.app import create_app
+    from ict_agent.api.publisher import ControllerPublisher
+    from ict_agent.api.snapshots import Snapshot, SnapshotStore, get_store
+
+__all__ = ["create_app", "ControllerPublisher", "Snapshot", "SnapshotStore", "get_store"]
+
+_EXPORTS = {
+    "create_app": "ict_agent.api.app",
+    "ControllerPublisher": "ict_agent.api.publisher",
+    "Snapshot": "ict_agent.api.snapshots",
+    "SnapshotStore": "ict_agent.api.snapshots",
+    "get_store": "ict_agent.api.snapshots",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,283 @@
+"""
+ICT Knowledge Engine - async read API over the VEX agent's latest state.
+
+Every engine endpoint serves the pre-encoded bytes of a snapshot the
+controller published (see snapshots.py); no request runs analysis. All
+JSON responses carry an ETag and honour If-None-Match with 304.
+
+Endpoints:
+    GET /api/health
+    GET /api/status
+    GET /api/gates                  latest gate trace per symbol
+    GET /api/gates/{symbol}
+    GET /api/positions
+    GET /api/signals                recent signal / trade events
+    GET /api/stream?topics=a,b      server-sent events on snapshot changes
+    GET /api/kb/search?q=...&category=...&limit=10
+    GET /api/kb/concepts
+    GET /api/kb/concepts/{name}
+    GET /api/kb/terms/{term}
+    /hub/...                        static hub pages (dashboard.html)
+
+Run:
+    uvicorn ict_agent.api.app:app --port 8000
+"""
+
+import asyncio
+import json
+import threading
+import time
+from dataclasses import asdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Optional
+
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
+from fastapi.staticfiles import StaticFiles
+
+from ict_agent.api.snapshots import TOPICS, Snapshot, SnapshotStore, encode, get_store, make_etag
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+HUB_DIR = PROJECT_ROOT / "hub"
+
+DEFAULTS = {
+    "status": {"state": "offline", "running": False},
+    "gate_traces": {},
+    "positions": [],
+    "signals": [],
+}
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def json_response(request: Request, body: bytes, etag: str) -> Response:
+    """200 with body, or 304 when the client already holds this ETag."""
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def format_sse(snapshot: Snapshot) -> bytes:
+    return b"event: %s\nid: %d\ndata: %s\n\n" % (
+        snapshot.topic.encode(), snapshot.version, snapshot.body
+    )
+
+
+async def snapshot_events(
+    store: SnapshotStore,
+    topics: Iterable[str],
+    is_disconnected: Callable[[], Awaitable[bool]],
+    poll_interval: float = 1.0,
+    heartbeat: float = 15.0,
+) -> AsyncIterator[bytes]:
+    """
+    Server-sent events for a set of topics.
+
+    Sends the current snapshots first, then one event per published
+    change. Changes published in this process arrive through a store
+    listener; a mirror written by another process is polled every
+    poll_interval. A comment line goes out after `heartbeat` seconds of
+    silence to keep proxies from closing the connection.
+    """
+    topics = [t for t in topics if t in TOPICS]
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+
+    def listener(snapshot: Snapshot) -> None:
+        if snapshot.topic in topics:
+            loop.call_soon_threadsafe(queue.put_nowait, snapshot)
+
+    store.add_listener(listener)
+    try:
+        sent: Dict[str, int] = {}
+        for topic in topics:
+            snapshot = store.get(topic)
+            if snapshot is not None:
+                sent[topic] = snapshot.version
+                yield format_sse(snapshot)
+
+        idle = 0.0
+        while not await is_disconnected():
+            try:
+                snapshot = await asyncio.wait_for(queue.get(), timeout=poll_interval)
+            except asyncio.TimeoutError:
+                store.refresh(topics)
+                idle += poll_interval
+                if idle >= heartbeat:
+                    idle = 0.0
+                    yield b": keep-alive\n\n"
+                continue
+            idle = 0.0
+            if sent.get(snapshot.topic, 0) >= snapshot.version:
+                continue
+            sent[snapshot.topic] = snapshot.version
+            yield format_sse(snapshot)
+    finally:
+        store.remove_listener(listener)
+
+
+def create_app(
+    store: Optional[SnapshotStore] = None,
+    kb_factory: Optional[Callable[[], Any]] = None,
+    poll_interval: float = 1.0,
+    kb_refresh_seconds: Optional[float] = 60.0,
+) -> FastAPI:
+    """
+    Build the API app.
+
+    store defaults to the process-wide snapshot store; kb_factory builds
+    the KnowledgeBaseSearch on first use (off the event loop). The KB
+    re-scans its files at most every kb_refresh_seconds, and memoized KB
+    responses are keyed on its generation so edits show up.
+    """
+    store = store or get_store()
+    if kb_factory is None:
+        def kb_factory():
+            from ict_agent.knowledge.kb_search import KnowledgeBaseSearch
+            return KnowledgeBaseSearch()
+
+    app = FastAPI(
+        title="ICT Knowledge Engine",
+        description="Read API over the VEX agent's published state and the ICT knowledge base.",
+        version="0.1.0",
+    )
+    app.state.store = store
+
+    kb_state: Dict[str, Any] = {}
+    kb_lock = asyncio.Lock()
+    # KnowledgeBaseSearch is not safe to query while refresh() patches it
+    kb_guard = threading.Lock()
+
+    def refresh_kb(kb) -> None:
+        with kb_guard:
+            kb.refresh()
+
+    async def get_kb():
+        if "kb" not in kb_state:
+            async with kb_lock:
+                if "kb" not in kb_state:
+                    kb_state["kb"] = await asyncio.to_thread(kb_factory)
+                    kb_state["refreshed"] = time.monotonic()
+        kb = kb_state["kb"]
+        if (kb_refresh_seconds is not None and hasattr(kb, "refresh")
+                and time.monotonic() - kb_state["refreshed"] >= kb_refresh_seconds):
+            async with kb_lock:
+                if time.monotonic() - kb_state["refreshed"] >= kb_refresh_seconds:
+                    await asyncio.to_thread(refresh_kb, kb)
+                    kb_state["refreshed"] = time.monotonic()
+        return kb
+
+    def snapshot_or_default(topic: str) -> Snapshot:
+        snapshot = store.get(topic)
+        if snapshot is None:
+            body = encode(DEFAULTS[topic])
+            snapshot = Snapshot(topic, 0, make_etag(body), body, 0.0)
+        return snapshot
+
+    @lru_cache(maxsize=64)
+    def _gate_entry(etag: str, symbol: str, body: bytes) -> Optional[bytes]:
+        # body is in the key only so the entry is computed from the snapshot
+        # the caller read; bytes cache their hash, and the etag decides hits
+        traces = json.loads(body)
+        entry = traces.get(symbol) or traces.get(symbol.upper())
+        return encode(entry) if entry is not None else None
+
+    def gate_entry(snapshot: Snapshot, symbol: str) -> Optional[bytes]:
+        return _gate_entry(snapshot.etag, symbol, snapshot.body)
+
+    @lru_cache(maxsize=2048)
+    def kb_body(generation: int, kind: str, *args) -> Optional[bytes]:
+        with kb_guard:
+            return kb_lookup(kb_state["kb"], kind, *args)
+
+    def kb_lookup(kb, kind: str, *args) -> Optional[bytes]:
+        if kind == "search":
+            query, category, limit = args
+            return encode([asdict(r) for r in kb.search(query, category=category, max_results=limit)])
+        if kind == "concepts":
+            return encode(kb.list_concepts())
+        if kind == "concept":
+            concept = kb.get_concept(args[0])
+            return encode(concept) if concept is not None else None
+        if kind == "term":
+            definition = kb.lookup_term(args[0])
+            return encode({"term": args[0], "definition": definition}) if definition else None
+        raise ValueError(kind)
+
+    async def kb_response(request: Request, kind: str, *args) -> Response:
+        kb = await get_kb()
+        body = await asyncio.to_thread(kb_body, getattr(kb, "generation", 0), kind, *args)
+        if body is None:
+            raise HTTPException(status_code=404, detail=f"No {kind} found for {args[0]!r}")
+        return json_response(request, body, make_etag(body))
+
+    def topic_endpoint(topic: str):
+        async def endpoint(request: Request) -> Response:
+            snapshot = snapshot_or_default(topic)
+            return json_response(request, snapshot.body, snapshot.etag)
+        endpoint.__name__ = f"get_{topic}"
+        return endpoint
+
+    @app.get("/api/health")
+    async def health() -> Dict[str, Any]:
+        versions = {t: s.version for t in TOPICS if (s := store.get(t)) is not None}
+        return {"ok": True, "snapshots": versions}
+
+    app.get("/api/status")(topic_endpoint("status"))
+    app.get("/api/gates")(topic_endpoint("gate_traces"))
+    app.get("/api/positions")(topic_endpoint("positions"))
+    app.get("/api/signals")(topic_endpoint("signals"))
+
+    @app.get("/api/gates/{symbol}")
+    async def gates_for_symbol(request: Request, symbol: str) -> Response:
+        snapshot = snapshot_or_default("gate_traces")
+        body = gate_entry(snapshot, symbol)
+        if body is None:
+            raise HTTPException(status_code=404, detail=f"No gate trace for {symbol}")
+        return json_response(request, body, make_etag(body))
+
+    @app.get("/api/stream")
+    async def stream(request: Request, topics: str = ",".join(TOPICS)) -> StreamingResponse:
+        events = snapshot_events(
+            store, topics.split(","), request.is_disconnected, poll_interval=poll_interval
+        )
+        return StreamingResponse(
+            events,
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    @app.get("/api/kb/search")
+    async def kb_search(
+        request: Request,
+        q: str = Query(..., min_length=1),
+        category: Optional[str] = None,
+        limit: int = Query(10, ge=1, le=50),
+    ) -> Response:
+        return await kb_response(request, "search", q, category, limit)
+
+    @app.get("/api/kb/concepts")
+    async def kb_concepts(request: Request) -> Response:
+        return await kb_response(request, "concepts")
+
+    @app.get("/api/kb/concepts/{name}")
+    async def kb_concept(request: Request, name: str) -> Response:
+        return await kb_response(request, "concept", name)
+
+    @app.get("/api/kb/terms/{term}")
+    async def kb_term(request: Request, term: str) -> Response:
+        return await kb_response(request, "term", term)
+
+    app.mount("/hub", StaticFiles(directory=HUB_DIR, html=True, check_dir=False), name="hub")
+    return app
+
+
+app = create_app()
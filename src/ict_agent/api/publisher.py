@@ -0,0 +1,96 @@
+"""
+Controller Publisher - feeds VexController state into the snapshot store.
+
+The controller hands over what it already computed (analysis results,
+the open trades it fetched while monitoring, events on its stream); the
+publisher shapes them into the API topics. Nothing here calls a skill,
+the broker or the engine.
+"""
+
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+from ict_agent.api.snapshots import SnapshotStore, get_store
+
+NY_TZ = ZoneInfo("America/New_York")
+
+SIGNAL_EVENTS = {
+    "signal_generated",
+    "signal_rejected",
+    "trade_entry",
+    "trade_exit",
+    "trade_rejected",
+}
+
+
+class ControllerPublisher:
+    """
+    Publishes status, gate_traces, positions and signals snapshots.
+
+    Usage (wired by VexController.boot when config.publish_snapshots):
+        publisher = ControllerPublisher(controller)
+        event_stream.subscribe_all(publisher.on_event)
+        publisher.record_analysis(symbol, analyze_result.data)
+        publisher.publish_positions(open_trades)
+        publisher.cycle_complete()
+    """
+
+    def __init__(self, controller: Any, store: Optional[SnapshotStore] = None, max_signals: int = 100):
+        self.controller = controller
+        self.store = store or get_store()
+        self._gate_traces: Dict[str, Dict[str, Any]] = {}
+        self._traces_changed = False
+        self._signals: deque = deque(maxlen=max_signals)
+
+    def record_analysis(self, symbol: str, data: Dict[str, Any]) -> None:
+        """Keep the latest gate trace for a symbol (published per cycle)."""
+        has_trade = bool(data.get("trade", False))
+        trace = data.get("gate_trace", [])
+        gate_stopped = ""
+        if not has_trade:
+            for g in reversed(trace):
+                if not g.get("passed", True):
+                    gate_stopped = g.get("gate", "")
+                    break
+        self._gate_traces[symbol] = {
+            "symbol": symbol,
+            "trace": trace,
+            "trade": has_trade,
+            "direction": data.get("direction", ""),
+            "confidence": data.get("confidence", 0),
+            "rejection": data.get("rejection_reason", ""),
+            "gate_stopped": gate_stopped,
+            "updated_at": datetime.now(NY_TZ).isoformat(),
+        }
+        self._traces_changed = True
+
+    def publish_positions(self, open_trades: List[Dict[str, Any]]) -> None:
+        """Publish the open trades the controller just fetched from the broker."""
+        positions = []
+        for t in open_trades or []:
+            units = float(t.get("currentUnits", t.get("initialUnits", 0)))
+            positions.append({
+                "trade_id": str(t.get("id", "")),
+                "symbol": t.get("instrument", ""),
+                "direction": "BUY" if units > 0 else "SELL",
+                "units": abs(units),
+                "price": float(t.get("price", 0) or 0),
+                "unrealized_pnl": float(t.get("unrealizedPL", 0)),
+            })
+        self.store.publish("positions", positions)
+
+    def on_event(self, event: Any) -> None:
+        """EventStream subscriber: keep recent signal and trade events."""
+        if event.event_type.value not in SIGNAL_EVENTS:
+            return
+        self._signals.appendleft(event.to_dict())
+        self.store.publish("signals", list(self._signals))
+
+    def cycle_complete(self) -> None:
+        """Publish the per-cycle topics after VexController.step()."""
+        if self._traces_changed:
+            self.store.publish("gate_traces", self._gate_traces)
+            self._traces_changed = False
+        self.store.publish("status", self.controller.get_status())
@@ -0,0 +1,163 @@
+"""
+API Snapshot Store - the controller's latest state, ready to serve.
+
+The controller publishes plain dicts under a few topics (status,
+gate_traces, positions, signals). Each publish serializes the value once
+and derives a content ETag, so the read API hands out pre-built bytes and
+answers If-None-Match with 304 without ever touching the engine.
+
+With a mirror_dir every snapshot is also written to
+<mirror_dir>/<topic>.json. A store in another process pointed at the same
+directory (the API server from scripts/start_server.py) picks changes up
+by file signature when a topic is read or refreshed.
+
+Usage:
+    store = get_store()
+    store.publish("positions", [...])          # controller side
+    snapshot = store.get("positions")          # API side
+    snapshot.body, snapshot.etag
+"""
+
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+SNAPSHOT_DIR = PROJECT_ROOT / "data" / "cache" / "api_snapshots"
+
+TOPICS = ("status", "gate_traces", "positions", "signals")
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """One published version of a topic, pre-encoded as JSON bytes."""
+    topic: str
+    version: int
+    etag: str
+    body: bytes
+    published_at: float
+
+
+def encode(value: Any) -> bytes:
+    """Compact JSON encoding used for every snapshot body."""
+    return json.dumps(value, default=str, separators=(",", ":")).encode("utf-8")
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag derived from the body, stable across processes."""
+    return '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+
+
+class SnapshotStore:
+    """
+    Thread-safe latest-value store keyed by topic.
+
+    Publishing identical content is a no-op (same ETag, same version), so
+    listeners only hear about real changes. Listeners are called on the
+    publishing thread and must not block.
+    """
+
+    def __init__(self, mirror_dir: Optional[Path] = None):
+        self.mirror_dir = Path(mirror_dir) if mirror_dir else None
+        self._snapshots: Dict[str, Snapshot] = {}
+        self._file_signatures: Dict[str, Tuple[int, int]] = {}
+        self._listeners: List[Callable[[Snapshot], None]] = []
+        self._lock = threading.Lock()
+        # Serializes mirror reads/writes so a slow reader never stores an older file
+        self._mirror_lock = threading.Lock()
+        self._version = 0
+
+    def publish(self, topic: str, value: Any) -> Snapshot:
+        """Serialize value as the latest snapshot of topic."""
+        return self._store(topic, encode(value), mirror=True)
+
+    def get(self, topic: str) -> Optional[Snapshot]:
+        """Latest snapshot of topic, or None if nothing was published."""
+        if self.mirror_dir is not None:
+            self._reload(topic)
+        return self._snapshots.get(topic)
+
+    def refresh(self, topics: Iterable[str] = TOPICS) -> None:
+        """Pick up snapshots another process wrote to the mirror directory."""
+        if self.mirror_dir is not None:
+            for topic in topics:
+                self._reload(topic)
+
+    def add_listener(self, listener: Callable[[Snapshot], None]) -> None:
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[Snapshot], None]) -> None:
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def _store(self, topic: str, body: bytes, mirror: bool) -> Snapshot:
+        etag = make_etag(body)
+        with self._lock:
+            current = self._snapshots.get(topic)
+            if current is not None and current.etag == etag:
+                return current
+            self._version += 1
+            snapshot = Snapshot(topic, self._version, etag, body, time.time())
+            self._snapshots[topic] = snapshot
+            listeners = list(self._listeners)
+
+        if mirror and self.mirror_dir is not None:
+            self._write_mirror(snapshot)
+        for listener in listeners:
+            try:
+                listener(snapshot)
+            except Exception:
+                pass  # A broken subscriber must not fail the publisher
+        return snapshot
+
+    def _mirror_path(self, topic: str) -> Path:
+        return self.mirror_dir / f"{topic}.json"
+
+    def _write_mirror(self, snapshot: Snapshot) -> None:
+        path = self._mirror_path(snapshot.topic)
+        with self._mirror_lock:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(".json.tmp")
+                tmp_path.write_bytes(snapshot.body)
+                tmp_path.replace(path)
+                st = path.stat()
+                self._file_signatures[snapshot.topic] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                pass  # Serving in-process still works without the mirror
+
+    def _reload(self, topic: str) -> None:
+        path = self._mirror_path(topic)
+        with self._mirror_lock:
+            try:
+                st = path.stat()
+            except OSError:
+                return
+            signature = (st.st_mtime_ns, st.st_size)
+            if self._file_signatures.get(topic) == signature:
+                return
+            try:
+                body = path.read_bytes()
+            except OSError:
+                return
+            self._file_signatures[topic] = signature
+            self._store(topic, body, mirror=False)
+
+
+_default_store: Optional[SnapshotStore] = None
+_default_lock = threading.Lock()
+
+
+def get_store() -> SnapshotStore:
+    """Process-wide store mirrored to data/cache/api_snapshots."""
+    global _default_store
+    with _default_lock:
+        if _default_store is None:
+            _default_store = SnapshotStore(mirror_dir=SNAPSHOT_DIR)
+        return _default_store
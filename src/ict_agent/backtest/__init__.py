@@ -1,6 +1,18 @@
 """ICT Backtesting Module"""
 
-from ict_agent.backtest.engine import BacktestEngine
-from ict_agent.backtest.metrics import BacktestMetrics
+from typing import TYPE_CHECKING
+
+from ict_agent._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ict_agent.backtest.engine import BacktestEngine
+    from ict_agent.backtest.metrics import BacktestMetrics
 
 __all__ = ["BacktestEngine", "BacktestMetrics"]
+
+_EXPORTS = {
+    "BacktestEngine": "ict_agent.backtest.engine",
+    "BacktestMetrics": "ict_agent.backtest.metrics",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -28,12 +28,79 @@ class BacktestConfig:
     require_confirmation_candle: bool = True
 
 
+class PositionBook:
+    """
+    Open positions in structure-of-arrays form.
+
+    Prices, sizes and flags live in parallel NumPy arrays so stops, targets
+    and unrealized P&L are evaluated for every open trade in one vectorized
+    step per bar. Row order is entry order; closing compacts the arrays so
+    that order is kept. Non-numeric trade fields stay in `records`.
+    """
+
+    _FIELDS = ("sign", "entry_price", "stop_loss", "target_1", "target_2", "position_size", "pnl")
+
+    def __init__(self, capacity: int = 16):
+        self.sign = np.zeros(capacity)
+        self.entry_price = np.zeros(capacity)
+        self.stop_loss = np.zeros(capacity)
+        self.target_1 = np.zeros(capacity)
+        self.target_2 = np.zeros(capacity)  # NaN when the signal has no T2
+        self.position_size = np.zeros(capacity)
+        self.pnl = np.zeros(capacity)
+        self.t1_hit = np.zeros(capacity, dtype=bool)
+        self.records: list[dict] = []
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def add(self, trade: dict) -> None:
+        """Append a trade dict (same keys as a closed trade record)"""
+        n = len(self.records)
+        if n == len(self.sign):
+            for name in self._FIELDS + ("t1_hit",):
+                array = getattr(self, name)
+                setattr(self, name, np.concatenate([array, np.zeros_like(array)]))
+        self.sign[n] = 1.0 if trade["direction"] == SignalType.LONG else -1.0
+        self.entry_price[n] = trade["entry_price"]
+        self.stop_loss[n] = trade["stop_loss"]
+        self.target_1[n] = trade["target_1"]
+        self.target_2[n] = trade["target_2"] if trade["target_2"] else np.nan
+        self.position_size[n] = trade["position_size"]
+        self.pnl[n] = trade["pnl"]
+        self.t1_hit[n] = trade["t1_hit"]
+        self.records.append(trade)
+
+    def record(self, i: int) -> dict:
+        """Trade dict for row i with the array state written back"""
+        trade = self.records[i]
+        trade["stop_loss"] = float(self.stop_loss[i])
+        trade["position_size"] = float(self.position_size[i])
+        trade["pnl"] = float(self.pnl[i])
+        trade["t1_hit"] = bool(self.t1_hit[i])
+        return trade
+
+    def remove(self, rows: np.ndarray) -> None:
+        """Drop the given row indices, keeping the rest in entry order"""
+        n = len(self.records)
+        keep = np.ones(n, dtype=bool)
+        keep[rows] = False
+        m = int(keep.sum())
+        for name in self._FIELDS + ("t1_hit",):
+            array = getattr(self, name)
+            array[:m] = array[:n][keep]
+        self.records = [t for t, k in zip(self.records, keep) if k]
+
+    def __iter__(self):
+        return (self.record(i) for i in range(len(self.records)))
+
+
 @dataclass
 class BacktestState:
     """Current state during backtest"""
     capital: float
     equity: float
-    open_trades: list = field(default_factory=list)
+    open_trades: PositionBook = field(default_factory=PositionBook)
     closed_trades: list = field(default_factory=list)
     signals: list = field(default_factory=list)
     daily_trade_count: dict = field(default_factory=dict)
@@ -96,51 +163,60 @@ class BacktestEngine:
             ltf_data = ltf_data[ltf_data.index <= end_date]
         
         lookback = 100
-        equity_curve = []
         
         logger.info(f"Starting backtest: {symbol} | {len(ltf_data)} bars")
 
         if ltf_data.empty:
             logger.warning(f"No LTF data available for backtest: {symbol}")
-            return self._calculate_metrics(equity_curve, symbol)
+            return self._calculate_metrics(ltf_data.index[:0], np.zeros(0), np.zeros(0, dtype=int), symbol)
+        
+        # Bar data as plain arrays; HTF/ITF windows located by binary search
+        highs = ltf_data["high"].to_numpy(dtype=float)
+        lows = ltf_data["low"].to_numpy(dtype=float)
+        closes = ltf_data["close"].to_numpy(dtype=float)
+        times = ltf_data.index
+        itf_ends = itf_data.index.searchsorted(times, side="right")
+        htf_ends = htf_data.index.searchsorted(times, side="right")
+        
+        # Equity curve written into preallocated arrays, framed once at the end
+        n_bars = max(len(ltf_data) - lookback, 0)
+        equity_values = np.empty(n_bars)
+        open_counts = np.empty(n_bars, dtype=int)
         
         for i in range(lookback, len(ltf_data)):
-            current_bar = ltf_data.iloc[i]
-            current_time = ltf_data.index[i]
+            current_time = times[i]
             current_date = current_time.date()
             
             if self.state.current_date != current_date:
                 self.state.current_date = current_date
                 self.state.daily_trade_count[current_date] = 0
             
-            self._check_exits(current_bar, current_time)
+            self._check_exits(highs[i], lows[i], current_time)
             
-            self._update_equity(current_bar)
-            equity_curve.append({
-                "timestamp": current_time,
-                "equity": self.state.equity,
-                "open_trades": len(self.state.open_trades),
-            })
+            self._update_equity(closes[i])
+            equity_values[i - lookback] = self.state.equity
+            open_counts[i - lookback] = len(self.state.open_trades)
             
             if self.state.daily_trade_count.get(current_date, 0) >= self.config.max_trades_per_day:
                 continue
             
-            ltf_window = ltf_data.iloc[i - lookback : i + 1]
-            itf_window = itf_data[itf_data.index <= current_time].tail(200)
-            htf_window = htf_data[htf_data.index <= current_time].tail(100)
-            
-            if len(htf_window) < 20 or len(itf_window) < 20:
+            itf_end, htf_end = itf_ends[i], htf_ends[i]
+            if min(itf_end, 200) < 20 or min(htf_end, 100) < 20:
                 continue
             
+            ltf_window = ltf_data.iloc[i - lookback : i + 1]
+            itf_window = itf_data.iloc[max(itf_end - 200, 0) : itf_end]
+            htf_window = htf_data.iloc[max(htf_end - 100, 0) : htf_end]
+            
             signal = self.agent.analyze(symbol, htf_window, itf_window, ltf_window)
             
             if signal:
                 self.state.signals.append(signal)
-                self._execute_signal(signal, current_bar, current_time)
+                self._execute_signal(signal, current_time)
         
-        self._close_all_trades(ltf_data.iloc[-1], ltf_data.index[-1])
+        self._close_all_trades(closes[-1], times[-1])
         
-        return self._calculate_metrics(equity_curve, symbol)
+        return self._calculate_metrics(times[lookback:], equity_values, open_counts, symbol)
     
     def _reset_state(self) -> None:
         """Reset backtest state"""
@@ -153,7 +229,6 @@ class BacktestEngine:
     def _execute_signal(
         self,
         signal: TradeSignal,
-        current_bar: pd.Series,
         current_time: datetime,
     ) -> None:
         """Execute a trade signal"""
@@ -193,7 +268,7 @@ class BacktestEngine:
             "pnl": 0.0,
         }
         
-        self.state.open_trades.append(trade)
+        self.state.open_trades.add(trade)
         self.state.daily_trade_count[self.state.current_date] = \
             self.state.daily_trade_count.get(self.state.current_date, 0) + 1
         
@@ -202,81 +277,74 @@ class BacktestEngine:
             f"Size: {position_size} | Model: {signal.model.value}"
         )
     
-    def _check_exits(self, current_bar: pd.Series, current_time: datetime) -> None:
-        """Check and execute exits for open trades"""
-        trades_to_close = []
+    def _check_exits(self, high: float, low: float, current_time: datetime) -> None:
+        """Check and execute exits for all open trades at once"""
+        book = self.state.open_trades
+        n = len(book)
+        if n == 0:
+            return
         
-        for trade in self.state.open_trades:
-            exit_price = None
-            exit_reason = None
-            
-            if trade["direction"] == SignalType.LONG:
-                if current_bar["low"] <= trade["stop_loss"]:
-                    exit_price = trade["stop_loss"] - (self.config.slippage_pips * self.config.pip_size)
-                    exit_reason = "stop_loss"
-                
-                elif not trade["t1_hit"] and current_bar["high"] >= trade["target_1"]:
-                    trade["t1_hit"] = True
-                    partial_pnl = self._calculate_pnl(
-                        trade["entry_price"],
-                        trade["target_1"],
-                        trade["position_size"] * 0.5,
-                        trade["direction"],
-                    )
-                    trade["pnl"] += partial_pnl
-                    trade["position_size"] *= 0.5
-                    trade["stop_loss"] = trade["entry_price"]
-                    logger.debug(f"T1 HIT: Trade {trade['id']} | Partial: {partial_pnl:.2f}")
-                
-                elif trade["t1_hit"] and trade["target_2"] and current_bar["high"] >= trade["target_2"]:
-                    exit_price = trade["target_2"]
-                    exit_reason = "target_2"
-            
-            else:
-                if current_bar["high"] >= trade["stop_loss"]:
-                    exit_price = trade["stop_loss"] + (self.config.slippage_pips * self.config.pip_size)
-                    exit_reason = "stop_loss"
-                
-                elif not trade["t1_hit"] and current_bar["low"] <= trade["target_1"]:
-                    trade["t1_hit"] = True
-                    partial_pnl = self._calculate_pnl(
-                        trade["entry_price"],
-                        trade["target_1"],
-                        trade["position_size"] * 0.5,
-                        trade["direction"],
-                    )
-                    trade["pnl"] += partial_pnl
-                    trade["position_size"] *= 0.5
-                    trade["stop_loss"] = trade["entry_price"]
-                    logger.debug(f"T1 HIT: Trade {trade['id']} | Partial: {partial_pnl:.2f}")
-                
-                elif trade["t1_hit"] and trade["target_2"] and current_bar["low"] <= trade["target_2"]:
-                    exit_price = trade["target_2"]
-                    exit_reason = "target_2"
+        long = book.sign[:n] > 0
+        stop = book.stop_loss[:n]
+        t1_hit = book.t1_hit[:n]
+        
+        # Per trade, at most one of: stop, T1 partial, T2 exit (in that order)
+        stop_hit = np.where(long, low <= stop, high >= stop)
+        t1_now = ~stop_hit & ~t1_hit & np.where(long, high >= book.target_1[:n], low <= book.target_1[:n])
+        t2_now = ~stop_hit & t1_hit & np.where(long, high >= book.target_2[:n], low <= book.target_2[:n])
+        
+        if t1_now.any():
+            rows = np.flatnonzero(t1_now)
+            half = book.position_size[rows] * 0.5
+            partial = self._pnl_array(book.entry_price[rows], book.target_1[rows], half, book.sign[rows])
+            book.pnl[rows] += partial
+            book.position_size[rows] = half
+            book.stop_loss[rows] = book.entry_price[rows]
+            book.t1_hit[rows] = True
+            for row, pnl in zip(rows, partial):
+                logger.debug(f"T1 HIT: Trade {book.records[row]['id']} | Partial: {pnl:.2f}")
+        
+        exit_price = np.where(
+            stop_hit,
+            stop - book.sign[:n] * (self.config.slippage_pips * self.config.pip_size),
+            np.where(t2_now, book.target_2[:n], 0.0),
+        )
+        closing = np.flatnonzero(exit_price != 0)
+        if len(closing) == 0:
+            return
+        
+        base = np.where(book.t1_hit[closing], book.stop_loss[closing], book.entry_price[closing])
+        book.pnl[closing] += self._pnl_array(
+            base, exit_price[closing], book.position_size[closing], book.sign[closing]
+        )
+        
+        for row in closing:
+            trade = book.record(row)
+            trade["exit_time"] = current_time
+            trade["exit_price"] = float(exit_price[row])
+            trade["exit_reason"] = "stop_loss" if stop_hit[row] else "target_2"
             
-            if exit_price:
-                final_pnl = self._calculate_pnl(
-                    trade["entry_price"] if not trade["t1_hit"] else trade["stop_loss"],
-                    exit_price,
-                    trade["position_size"],
-                    trade["direction"],
-                )
-                trade["pnl"] += final_pnl
-                trade["exit_time"] = current_time
-                trade["exit_price"] = exit_price
-                trade["exit_reason"] = exit_reason
-                
-                self.state.capital += trade["pnl"]
-                trades_to_close.append(trade)
-                
-                logger.debug(
-                    f"EXIT: Trade {trade['id']} | {exit_reason} @ {exit_price:.5f} | "
-                    f"PnL: {trade['pnl']:.2f}"
-                )
-        
-        for trade in trades_to_close:
-            self.state.open_trades.remove(trade)
+            self.state.capital += trade["pnl"]
             self.state.closed_trades.append(trade)
+            
+            logger.debug(
+                f"EXIT: Trade {trade['id']} | {trade['exit_reason']} @ {trade['exit_price']:.5f} | "
+                f"PnL: {trade['pnl']:.2f}"
+            )
+        
+        book.remove(closing)
+    
+    def _pnl_array(
+        self,
+        entry: np.ndarray,
+        exit: np.ndarray,
+        size: np.ndarray,
+        sign: np.ndarray,
+    ) -> np.ndarray:
+        """Vectorized _calculate_pnl; sign is +1 long / -1 short"""
+        pips = sign * (exit - entry) / self.config.pip_size
+        pips -= self.config.commission_pips
+        return pips * size * self.config.pip_value
     
     def _calculate_pnl(
         self,
@@ -295,26 +363,22 @@ class BacktestEngine:
         
         return pips * size * self.config.pip_value
     
-    def _update_equity(self, current_bar: pd.Series) -> None:
+    def _update_equity(self, current_price: float) -> None:
         """Update equity based on open positions"""
+        book = self.state.open_trades
+        n = len(book)
         unrealized = 0.0
-        
-        for trade in self.state.open_trades:
-            current_price = current_bar["close"]
-            
-            if trade["direction"] == SignalType.LONG:
-                pips = (current_price - trade["entry_price"]) / self.config.pip_size
-            else:
-                pips = (trade["entry_price"] - current_price) / self.config.pip_size
-            
-            unrealized += pips * trade["position_size"] * self.config.pip_value
+        if n:
+            pips = book.sign[:n] * (current_price - book.entry_price[:n]) / self.config.pip_size
+            unrealized = float(np.sum(pips * book.position_size[:n] * self.config.pip_value))
         
         self.state.equity = self.state.capital + unrealized
     
-    def _close_all_trades(self, final_bar: pd.Series, final_time: datetime) -> None:
+    def _close_all_trades(self, exit_price: float, final_time: datetime) -> None:
         """Close all remaining open trades at end of backtest"""
-        for trade in self.state.open_trades[:]:
-            exit_price = final_bar["close"]
+        book = self.state.open_trades
+        for row in range(len(book)):
+            trade = book.record(row)
             
             final_pnl = self._calculate_pnl(
                 trade["entry_price"],
@@ -328,12 +392,15 @@ class BacktestEngine:
             trade["exit_reason"] = "end_of_test"
             
             self.state.capital += trade["pnl"]
-            self.state.open_trades.remove(trade)
             self.state.closed_trades.append(trade)
+        
+        self.state.open_trades = PositionBook()
     
     def _calculate_metrics(
         self,
-        equity_curve: list[dict],
+        timestamps: pd.Index,
+        equity: np.ndarray,
+        open_counts: np.ndarray,
         symbol: str,
     ) -> BacktestMetrics:
         """Calculate comprehensive backtest metrics"""
@@ -355,9 +422,10 @@ class BacktestEngine:
             for t in self.state.closed_trades
         ]
         
-        equity_df = pd.DataFrame(equity_curve)
-        if not equity_df.empty:
-            equity_df.set_index("timestamp", inplace=True)
+        equity_df = pd.DataFrame(
+            {"equity": equity, "open_trades": open_counts},
+            index=pd.Index(timestamps, name="timestamp"),
+        )
         
         return BacktestMetrics(
             symbol=symbol,
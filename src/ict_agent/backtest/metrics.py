@@ -43,34 +43,49 @@ class BacktestMetrics:
         self._calculate_metrics()
     
     def _calculate_metrics(self) -> None:
-        """Calculate all performance metrics"""
+        """Calculate all performance metrics in one pass over trade arrays"""
+        n = len(self.trades)
+        self._pnl = np.fromiter((t.pnl for t in self.trades), dtype=float, count=n)
+        self._models = np.array([t.model for t in self.trades], dtype=object)
+        self._confluences = np.fromiter((t.confluences for t in self.trades), dtype=int, count=n)
+        self._exit_times = pd.Index([t.exit_time for t in self.trades])
+        
         if not self.trades:
             self._set_empty_metrics()
             return
         
-        pnls = [t.pnl for t in self.trades]
-        wins = [p for p in pnls if p > 0]
-        losses = [p for p in pnls if p <= 0]
+        pnl = self._pnl
+        win = pnl > 0
+        wins, losses = pnl[win], pnl[~win]
+        
+        # Sufficient statistics; combine() merges these instead of raw trades
+        negative = pnl[pnl < 0]
+        self._moments = {
+            "n": n,
+            "sum": float(pnl.sum()),
+            "sumsq": float(np.dot(pnl, pnl)),
+            "neg_n": len(negative),
+            "neg_sum": float(negative.sum()),
+            "neg_sumsq": float(np.dot(negative, negative)),
+        }
         
-        self.total_trades = len(self.trades)
+        self.total_trades = n
         self.winning_trades = len(wins)
         self.losing_trades = len(losses)
-        self.win_rate = self.winning_trades / self.total_trades if self.total_trades > 0 else 0
+        self.win_rate = self.winning_trades / self.total_trades
         
-        self.total_pnl = sum(pnls)
-        self.gross_profit = sum(wins) if wins else 0
-        self.gross_loss = abs(sum(losses)) if losses else 0
+        self.total_pnl = float(pnl.sum())
+        self.gross_profit = float(wins.sum())
+        self.gross_loss = abs(float(losses.sum()))
         self.profit_factor = self.gross_profit / self.gross_loss if self.gross_loss > 0 else float("inf")
         
-        self.avg_win = np.mean(wins) if wins else 0
-        self.avg_loss = abs(np.mean(losses)) if losses else 0
-        self.avg_trade = np.mean(pnls) if pnls else 0
-        self.largest_win = max(wins) if wins else 0
-        self.largest_loss = min(losses) if losses else 0
-        
-        self.expectancy = (self.win_rate * self.avg_win) - ((1 - self.win_rate) * self.avg_loss)
+        self.avg_win = float(wins.mean()) if len(wins) else 0
+        self.avg_loss = abs(float(losses.mean())) if len(losses) else 0
+        self.avg_trade = float(pnl.mean())
+        self.largest_win = float(wins.max()) if len(wins) else 0
+        self.largest_loss = float(losses.min()) if len(losses) else 0
         
-        self.return_pct = ((self.final_capital - self.initial_capital) / self.initial_capital) * 100
+        self._set_derived_metrics()
         
         if not self.equity_curve.empty and "equity" in self.equity_curve.columns:
             self.max_drawdown, self.max_drawdown_pct = self._calculate_drawdown()
@@ -78,16 +93,23 @@ class BacktestMetrics:
             self.max_drawdown = 0
             self.max_drawdown_pct = 0
         
-        self.sharpe_ratio = self._calculate_sharpe()
-        self.sortino_ratio = self._calculate_sortino()
+        returns = pnl / self.initial_capital
+        self.sharpe_ratio = self._calculate_sharpe(returns)
+        self.sortino_ratio = self._calculate_sortino(returns)
         
         self.model_performance = self._analyze_by_model()
         self.confluence_performance = self._analyze_by_confluence()
         
         self.consecutive_wins, self.consecutive_losses = self._calculate_streaks()
     
+    def _set_derived_metrics(self) -> None:
+        """Metrics that follow from the totals above"""
+        self.expectancy = (self.win_rate * self.avg_win) - ((1 - self.win_rate) * self.avg_loss)
+        self.return_pct = ((self.final_capital - self.initial_capital) / self.initial_capital) * 100
+    
     def _set_empty_metrics(self) -> None:
         """Set default values for empty backtest"""
+        self._moments = {"n": 0, "sum": 0.0, "sumsq": 0.0, "neg_n": 0, "neg_sum": 0.0, "neg_sumsq": 0.0}
         self.total_trades = 0
         self.winning_trades = 0
         self.losing_trades = 0
@@ -114,102 +136,305 @@ class BacktestMetrics:
     
     def _calculate_drawdown(self) -> tuple[float, float]:
         """Calculate maximum drawdown"""
-        equity = self.equity_curve["equity"]
-        peak = equity.expanding().max()
+        equity = self.equity_curve["equity"].to_numpy(dtype=float)
+        peak = np.maximum.accumulate(equity)
         drawdown = equity - peak
-        max_dd = drawdown.min()
-        max_dd_pct = (max_dd / peak[drawdown.idxmin()]) * 100 if max_dd < 0 else 0
-        return abs(max_dd), abs(max_dd_pct)
+        worst = int(np.argmin(drawdown))
+        max_dd = drawdown[worst]
+        max_dd_pct = (max_dd / peak[worst]) * 100 if max_dd < 0 else 0
+        return abs(float(max_dd)), abs(float(max_dd_pct))
     
-    def _calculate_sharpe(self, risk_free_rate: float = 0.02) -> float:
+    @staticmethod
+    def _annualized_ratio(mean: float, std: float, risk_free_rate: float) -> float:
+        excess_returns = mean - (risk_free_rate / 252)
+        return (excess_returns / std) * np.sqrt(252)
+    
+    def _calculate_sharpe(self, returns: np.ndarray, risk_free_rate: float = 0.02) -> float:
         """Calculate Sharpe Ratio"""
-        if not self.trades:
+        if len(returns) == 0:
             return 0
-        
-        returns = pd.Series([t.pnl / self.initial_capital for t in self.trades])
-        
-        if returns.std() == 0:
+        # Sample deviation; undefined (NaN) for a single trade
+        std = returns.std(ddof=1) if len(returns) > 1 else np.nan
+        if std == 0:
             return 0
-        
-        excess_returns = returns.mean() - (risk_free_rate / 252)
-        return (excess_returns / returns.std()) * np.sqrt(252)
+        return float(self._annualized_ratio(returns.mean(), std, risk_free_rate))
     
-    def _calculate_sortino(self, risk_free_rate: float = 0.02) -> float:
+    def _calculate_sortino(self, returns: np.ndarray, risk_free_rate: float = 0.02) -> float:
         """Calculate Sortino Ratio (only considers downside volatility)"""
-        if not self.trades:
-            return 0
-        
-        returns = pd.Series([t.pnl / self.initial_capital for t in self.trades])
         negative_returns = returns[returns < 0]
         
-        if len(negative_returns) == 0 or negative_returns.std() == 0:
+        if len(negative_returns) == 0:
             return float("inf") if returns.mean() > 0 else 0
-        
-        excess_returns = returns.mean() - (risk_free_rate / 252)
-        return (excess_returns / negative_returns.std()) * np.sqrt(252)
+        # A single losing trade has no sample deviation
+        std = negative_returns.std(ddof=1) if len(negative_returns) > 1 else np.nan
+        if std == 0:
+            return float("inf") if returns.mean() > 0 else 0
+        return float(self._annualized_ratio(returns.mean(), std, risk_free_rate))
+    
+    @staticmethod
+    def _group_stats(keys: np.ndarray, pnl: np.ndarray) -> dict:
+        """trades / win_rate / total_pnl / avg_pnl per distinct key, via bincount"""
+        labels, inverse = np.unique(keys, return_inverse=True)
+        counts = np.bincount(inverse, minlength=len(labels))
+        wins = np.bincount(inverse, weights=pnl > 0, minlength=len(labels))
+        totals = np.bincount(inverse, weights=pnl, minlength=len(labels))
+        return {
+            label: {
+                "trades": int(count),
+                "win_rate": float(won / count),
+                "total_pnl": float(total),
+                "avg_pnl": float(total / count),
+            }
+            for label, count, won, total in zip(labels.tolist(), counts, wins, totals)
+        }
     
     def _analyze_by_model(self) -> dict:
         """Analyze performance by ICT model"""
-        model_stats = {}
-        
-        models = set(t.model for t in self.trades)
-        
-        for model in models:
-            model_trades = [t for t in self.trades if t.model == model]
-            pnls = [t.pnl for t in model_trades]
-            wins = [p for p in pnls if p > 0]
-            
-            model_stats[model] = {
-                "trades": len(model_trades),
-                "win_rate": len(wins) / len(model_trades) if model_trades else 0,
-                "total_pnl": sum(pnls),
-                "avg_pnl": np.mean(pnls) if pnls else 0,
-            }
-        
-        return model_stats
+        return self._group_stats(self._models.astype(str), self._pnl)
     
     def _analyze_by_confluence(self) -> dict:
-        """Analyze performance by confluence count"""
-        conf_stats = {}
-        
-        for conf_count in range(1, 12):
-            conf_trades = [t for t in self.trades if t.confluences == conf_count]
-            if not conf_trades:
-                continue
-            
-            pnls = [t.pnl for t in conf_trades]
-            wins = [p for p in pnls if p > 0]
-            
-            conf_stats[conf_count] = {
-                "trades": len(conf_trades),
-                "win_rate": len(wins) / len(conf_trades),
-                "total_pnl": sum(pnls),
-                "avg_pnl": np.mean(pnls),
-            }
-        
-        return conf_stats
+        """Analyze performance by confluence count (1-11)"""
+        in_range = (self._confluences >= 1) & (self._confluences < 12)
+        if not in_range.any():
+            return {}
+        return self._group_stats(self._confluences[in_range], self._pnl[in_range])
+    
+    @staticmethod
+    def _longest_run(mask: np.ndarray) -> int:
+        if not mask.any():
+            return 0
+        edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+        return int((np.flatnonzero(edges == -1) - np.flatnonzero(edges == 1)).max())
     
     def _calculate_streaks(self) -> tuple[int, int]:
         """Calculate maximum consecutive wins and losses"""
-        if not self.trades:
-            return 0, 0
-        
-        max_wins = 0
-        max_losses = 0
-        current_wins = 0
-        current_losses = 0
-        
-        for trade in self.trades:
-            if trade.pnl > 0:
-                current_wins += 1
-                current_losses = 0
-                max_wins = max(max_wins, current_wins)
+        win = self._pnl > 0
+        return self._longest_run(win), self._longest_run(~win)
+    
+    # ── Rolling and resampled statistics ─────────────────────
+    
+    def rolling_sharpe(self, window: int = 20, risk_free_rate: float = 0.02) -> pd.Series:
+        """Sharpe ratio over a sliding window of trades, indexed by exit time"""
+        returns = self._pnl / self.initial_capital
+        n = len(returns)
+        values = np.full(n, np.nan)
+        if window >= 2 and n >= window:
+            sums = np.cumsum(np.concatenate(([0.0], returns)))
+            sumsq = np.cumsum(np.concatenate(([0.0], returns * returns)))
+            win_sum = sums[window:] - sums[:-window]
+            win_sumsq = sumsq[window:] - sumsq[:-window]
+            mean = win_sum / window
+            var = np.maximum(win_sumsq - window * mean * mean, 0.0) / (window - 1)
+            std = np.sqrt(var)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratio = self._annualized_ratio(mean, std, risk_free_rate)
+            values[window - 1:] = np.where(std > 0, ratio, 0.0)
+        return pd.Series(values, index=self._exit_times, name="rolling_sharpe")
+    
+    def rolling_drawdown(self, window: int = 96) -> pd.Series:
+        """Drawdown (%) from the highest equity of the last `window` bars"""
+        if self.equity_curve.empty or "equity" not in self.equity_curve.columns:
+            return pd.Series(dtype=float, name="rolling_drawdown")
+        equity = self.equity_curve["equity"]
+        peak = equity.rolling(window, min_periods=1).max()
+        return ((equity - peak) / peak * 100).rename("rolling_drawdown")
+    
+    _BOOTSTRAP_STATISTICS = ("avg_trade", "total_pnl", "win_rate", "profit_factor", "sharpe_ratio")
+    _BOOTSTRAP_MAX_CELLS = 1 << 21  # resamples x trades per chunk (~16 MB of float64)
+    
+    def bootstrap_ci(
+        self,
+        statistic: str = "sharpe_ratio",
+        n_resamples: int = 2000,
+        confidence: float = 0.95,
+        seed: Optional[int] = None,
+        block_size: int = 256,
+    ) -> tuple[float, float]:
+        """
+        Percentile bootstrap confidence interval for a per-trade statistic.
+        
+        Trades are resampled with replacement, at most `block_size`
+        resamples at a time and fewer for long histories, so a chunk never
+        exceeds _BOOTSTRAP_MAX_CELLS resampled trades.
+        
+        Args:
+            statistic: One of avg_trade, total_pnl, win_rate, profit_factor, sharpe_ratio
+        
+        Returns:
+            (low, high) bounds; (nan, nan) without trades
+        """
+        if statistic not in self._BOOTSTRAP_STATISTICS:
+            raise ValueError(f"Unsupported statistic {statistic!r}; use one of {self._BOOTSTRAP_STATISTICS}")
+        n = len(self._pnl)
+        if n == 0:
+            return float("nan"), float("nan")
+        
+        rng = np.random.default_rng(seed)
+        estimates = []
+        chunk = min(block_size, max(1, self._BOOTSTRAP_MAX_CELLS // n))
+        for start in range(0, n_resamples, chunk):
+            size = min(chunk, n_resamples - start)
+            sample = self._pnl[rng.integers(0, n, size=(size, n))]
+            estimates.append(self._resampled_statistic(statistic, sample))
+        estimates = np.concatenate(estimates)
+        
+        alpha = (1 - confidence) / 2
+        low, high = np.nanquantile(estimates, [alpha, 1 - alpha])
+        return float(low), float(high)
+    
+    def _resampled_statistic(self, statistic: str, sample: np.ndarray) -> np.ndarray:
+        """Statistic per row of a (resamples, trades) P&L matrix"""
+        if statistic == "avg_trade":
+            return sample.mean(axis=1)
+        if statistic == "total_pnl":
+            return sample.sum(axis=1)
+        if statistic == "win_rate":
+            return (sample > 0).mean(axis=1)
+        if statistic == "profit_factor":
+            profit = np.where(sample > 0, sample, 0.0).sum(axis=1)
+            loss = -np.where(sample <= 0, sample, 0.0).sum(axis=1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return np.where(loss > 0, profit / loss, np.inf)
+        returns = sample / self.initial_capital
+        std = returns.std(axis=1, ddof=1) if sample.shape[1] > 1 else np.zeros(len(sample))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = self._annualized_ratio(returns.mean(axis=1), std, 0.02)
+        return np.where(std > 0, ratio, 0.0)
+    
+    # ── Merging parallel runs ────────────────────────────────
+    
+    @classmethod
+    def combine(cls, parts: list["BacktestMetrics"], symbol: Optional[str] = None) -> "BacktestMetrics":
+        """
+        Merge metrics from independent (e.g. per-symbol) runs into one
+        portfolio view without re-deriving anything from the Trade objects.
+        
+        Totals, averages and ratios are rebuilt from each part's counts and
+        P&L moments; equity curves are summed on their union of timestamps.
+        Streaks are the longest of any part, since parallel runs share no
+        single trade order.
+        """
+        if not parts:
+            raise ValueError("combine() needs at least one BacktestMetrics")
+        
+        merged = cls.__new__(cls)
+        merged.symbol = symbol or "+".join(p.symbol for p in parts)
+        starts = [p.start_date for p in parts if p.start_date is not None]
+        ends = [p.end_date for p in parts if p.end_date is not None]
+        merged.start_date = min(starts) if starts else None
+        merged.end_date = max(ends) if ends else None
+        merged.initial_capital = sum(p.initial_capital for p in parts)
+        merged.final_capital = sum(p.final_capital for p in parts)
+        merged.trades = [t for p in parts for t in p.trades]
+        merged.signals = [s for p in parts for s in p.signals]
+        merged.equity_curve = cls._combine_equity(parts)
+        
+        merged._pnl = np.concatenate([p._pnl for p in parts])
+        merged._models = np.concatenate([p._models for p in parts])
+        merged._confluences = np.concatenate([p._confluences for p in parts])
+        merged._exit_times = pd.Index([t for p in parts for t in p._exit_times])
+        
+        moments = {key: sum(p._moments[key] for p in parts) for key in parts[0]._moments}
+        if moments["n"] == 0:
+            merged._set_empty_metrics()
+            return merged
+        merged._moments = moments
+        
+        n = moments["n"]
+        merged.total_trades = n
+        merged.winning_trades = sum(p.winning_trades for p in parts)
+        merged.losing_trades = sum(p.losing_trades for p in parts)
+        merged.win_rate = merged.winning_trades / n
+        merged.total_pnl = sum(p.total_pnl for p in parts)
+        merged.gross_profit = sum(p.gross_profit for p in parts)
+        merged.gross_loss = sum(p.gross_loss for p in parts)
+        merged.profit_factor = (
+            merged.gross_profit / merged.gross_loss if merged.gross_loss > 0 else float("inf")
+        )
+        merged.avg_win = merged.gross_profit / merged.winning_trades if merged.winning_trades else 0
+        merged.avg_loss = merged.gross_loss / merged.losing_trades if merged.losing_trades else 0
+        merged.avg_trade = merged.total_pnl / n
+        merged.largest_win = max(p.largest_win for p in parts)
+        merged.largest_loss = min(p.largest_loss for p in parts)
+        merged._set_derived_metrics()
+        
+        if not merged.equity_curve.empty:
+            merged.max_drawdown, merged.max_drawdown_pct = merged._calculate_drawdown()
+        else:
+            merged.max_drawdown = 0
+            merged.max_drawdown_pct = 0
+        
+        merged.sharpe_ratio, merged.sortino_ratio = merged._ratios_from_moments()
+        merged.model_performance = cls._combine_groups([p.model_performance for p in parts])
+        merged.confluence_performance = cls._combine_groups([p.confluence_performance for p in parts])
+        merged.consecutive_wins = max(p.consecutive_wins for p in parts)
+        merged.consecutive_losses = max(p.consecutive_losses for p in parts)
+        return merged
+    
+    def _ratios_from_moments(self, risk_free_rate: float = 0.02) -> tuple[float, float]:
+        """Sharpe and Sortino from summed P&L moments"""
+        m, capital = self._moments, self.initial_capital
+        n = m["n"]
+        mean = m["sum"] / n / capital
+        
+        def sample_std(count, total, total_sq):
+            if count < 2:
+                return np.nan
+            var = max(total_sq - total * total / count, 0.0) / (count - 1)
+            return np.sqrt(var) / capital
+        
+        std = sample_std(n, m["sum"], m["sumsq"])
+        sharpe = 0 if std == 0 else float(self._annualized_ratio(mean, std, risk_free_rate))
+        
+        if m["neg_n"] == 0:
+            sortino = float("inf") if mean > 0 else 0
+        else:
+            neg_std = sample_std(m["neg_n"], m["neg_sum"], m["neg_sumsq"])
+            if neg_std == 0:
+                sortino = float("inf") if mean > 0 else 0
             else:
-                current_losses += 1
-                current_wins = 0
-                max_losses = max(max_losses, current_losses)
+                sortino = float(self._annualized_ratio(mean, neg_std, risk_free_rate))
+        return sharpe, sortino
+    
+    @staticmethod
+    def _combine_groups(groups: list[dict]) -> dict:
+        merged = {}
+        for stats in groups:
+            for key, s in stats.items():
+                into = merged.setdefault(key, {"trades": 0, "wins": 0, "total_pnl": 0.0})
+                into["trades"] += s["trades"]
+                into["wins"] += round(s["win_rate"] * s["trades"])
+                into["total_pnl"] += s["total_pnl"]
+        return {
+            key: {
+                "trades": s["trades"],
+                "win_rate": s["wins"] / s["trades"],
+                "total_pnl": s["total_pnl"],
+                "avg_pnl": s["total_pnl"] / s["trades"],
+            }
+            for key, s in merged.items()
+        }
+    
+    @staticmethod
+    def _combine_equity(parts: list["BacktestMetrics"]) -> pd.DataFrame:
+        """Sum equity / open trade counts across runs on the union of timestamps"""
+        has_curve = [not p.equity_curve.empty and "equity" in p.equity_curve.columns for p in parts]
+        curves = [p for p, has in zip(parts, has_curve) if has]
+        if not curves:
+            return pd.DataFrame(columns=["equity", "open_trades"])
+        
+        equity = pd.concat([p.equity_curve["equity"] for p in curves], axis=1, ignore_index=True)
+        equity = equity.sort_index().ffill()
+        # Before a run's first bar its equity is its starting capital
+        equity = equity.fillna({i: p.initial_capital for i, p in enumerate(curves)})
+        # Runs without an equity curve contribute their flat final capital
+        flat = sum(p.final_capital for p, has in zip(parts, has_curve) if not has)
+        combined = pd.DataFrame({"equity": equity.sum(axis=1) + flat})
         
-        return max_wins, max_losses
+        if all("open_trades" in p.equity_curve.columns for p in curves):
+            counts = pd.concat([p.equity_curve["open_trades"] for p in curves], axis=1, ignore_index=True)
+            combined["open_trades"] = counts.sort_index().ffill().fillna(0).sum(axis=1).astype(int)
+        return combined
     
     def summary(self) -> str:
         """Generate text summary of backtest results"""
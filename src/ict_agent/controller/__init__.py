@@ -1,4 +1,20 @@
 """VEX Controller — Agent loop and state machine."""
-from ict_agent.controller.agent_controller import VexController, VexState, VexConfig
 
-__all__ = ["VexController", "VexState", "VexConfig"]
+from typing import TYPE_CHECKING
+
+from ict_agent._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ict_agent.controller.agent_controller import VexController, VexState, VexConfig
+    from ict_agent.controller.scheduler import EventScheduler
+
+__all__ = ["VexController", "VexState", "VexConfig", "EventScheduler"]
+
+_EXPORTS = {
+    "VexController": "ict_agent.controller.agent_controller",
+    "VexState": "ict_agent.controller.agent_controller",
+    "VexConfig": "ict_agent.controller.agent_controller",
+    "EventScheduler": "ict_agent.controller.scheduler",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -66,7 +66,7 @@ class VexConfig:
             "EUR_GBP",
         ]
     )
-    scan_interval_seconds: int = 300  # 5 minutes between scan cycles
+    scan_interval_seconds: int = 300  # Between cycles (heartbeat when event_driven)
     max_trades_per_day: int = 8
     dry_run: bool = False  # If True, no real trades placed
 
@@ -89,6 +89,13 @@ class VexConfig:
     learn_from_trades: bool = True
     check_news: bool = True
     use_core_engine: bool = True  # Use VexCoreEngine vs old SignalGenerator
+    warm_graph_in_background: bool = True  # Load GraphReasoner off the boot thread
+    publish_snapshots: bool = True  # Feed the ict_agent.api read service
+    event_driven: bool = True  # Wake on candle closes / level crosses / killzones
+    stream_prices: bool = True  # Price stream feeding level-cross wakes
+    wake_granularities: List[str] = field(default_factory=lambda: ["M15", "H1"])
+    analysis_cache_size: int = 128  # Memoized gate results (symbol × timeframe × bar)
+    stream_transactions: bool = True  # Account snapshot from the transaction stream (live only)
     verbose: bool = True
 
     @classmethod
@@ -133,6 +140,7 @@ class VexController:
         self.event_stream = None
         self.skill_registry = None
         self.executor = None
+        self.async_executor = None  # ExecutorLoop(AsyncOANDAExecutor): snapshot + flatten
         self.risk_guardian = None
         self.journal = None
         self.trade_learner = None
@@ -140,6 +148,9 @@ class VexController:
         self.core_engine = None
         self.killzone_manager = None
         self.dashboard = None  # VexLiveDashboard (optional)
+        self.snapshots = None  # ControllerPublisher for the read API (optional)
+        self.scheduler = None  # EventScheduler (config.event_driven)
+        self.price_stream = None  # OANDAPriceStream feeding the scheduler
 
         # State data
         self._pending_setups: List[Dict] = []
@@ -191,6 +202,32 @@ class VexController:
             )
             print(f"   ✅ OANDAExecutor ({self.config.environment})")
 
+            # 4b. Async executor: stream-maintained account snapshot and
+            # concurrent flatten. Risk checks read the snapshot instead of polling.
+            if self.config.stream_transactions and not self.config.dry_run:
+                loop = None
+                try:
+                    from ict_agent.execution.async_executor import (
+                        AsyncOANDAExecutor,
+                        ExecutorLoop,
+                    )
+
+                    loop = ExecutorLoop(
+                        AsyncOANDAExecutor(
+                            api_key=self.config.api_key,
+                            account_id=self.config.account_id,
+                            environment=self.config.environment,
+                        )
+                    )
+                    loop.start()
+                    self.async_executor = loop
+                    self.executor.snapshot = loop.executor.snapshot
+                    print("   ✅ Account snapshot (transaction stream)")
+                except Exception as e:
+                    if loop is not None:
+                        loop.stop()
+                    print(f"   ⚠️ Transaction stream unavailable, polling account: {e}")
+
             # 5. Risk Guardian
             from ict_agent.execution.risk_guardian import RiskGuardian, RiskConfig
 
@@ -244,25 +281,29 @@ class VexController:
 
             # 9. VEX Core Engine
             if self.config.use_core_engine:
+                from ict_agent.core.analysis_cache import AnalysisCache
                 from ict_agent.core.vex_core_engine import VexCoreEngine
 
-                self.core_engine = VexCoreEngine()
+                self.core_engine = VexCoreEngine(
+                    analysis_cache=AnalysisCache(self.config.analysis_cache_size)
+                )
                 print("   ✅ VexCoreEngine (8-gate system)")
 
                 # 9a. Graph-Driven Reasoner (enhances Gate 8)
-                if self.core_engine.graph_reasoner is not None:
-                    # Trigger lazy load during boot so any errors show up early
+                graph_reasoner = self.core_engine.graph_reasoner
+                if graph_reasoner is not None:
                     try:
-                        loaded = self.core_engine.graph_reasoner._ensure_loaded()
-                        if loaded:
-                            store = self.core_engine.graph_reasoner._store
-                            n = store.G.number_of_nodes() if store else 0
-                            e = store.G.number_of_edges() if store else 0
+                        if self.config.warm_graph_in_background:
+                            # Load off the trading thread; the first analysis
+                            # waits only if it arrives before this finishes
+                            graph_reasoner.warm_up(background=True)
+                            print("   ✅ GraphReasoner (warming up in background)")
+                        elif graph_reasoner._ensure_loaded():
+                            # Load now so any errors show up during boot
+                            n, e = graph_reasoner.graph_size
                             print(f"   ✅ GraphReasoner ({n:,} nodes, {e:,} edges)")
                         else:
-                            print(
-                                "   ⚠️ GraphReasoner unavailable (graph_rag not found)"
-                            )
+                            print("   ⚠️ GraphReasoner unavailable (knowledge base not found)")
                     except Exception as gr_err:
                         print(f"   ⚠️ GraphReasoner failed: {gr_err}")
 
@@ -332,13 +373,53 @@ class VexController:
             else:
                 print("   ⚠️ Could not verify OANDA (will retry)")
 
-            # 15. Live Dashboard (optional — activated by controller.enable_dashboard())
+            # 15. API snapshots (served by ict_agent.api, never recomputed per request)
+            if self.config.publish_snapshots:
+                try:
+                    from ict_agent.api.publisher import ControllerPublisher
+
+                    self.snapshots = ControllerPublisher(self)
+                    self.event_stream.subscribe_all(self.snapshots.on_event)
+                    print("   ✅ API snapshots publishing")
+                except Exception as e:
+                    print(f"   ⚠️ API snapshots disabled: {e}")
+                    self.snapshots = None
+
+            # 16. Live Dashboard (optional — activated by controller.enable_dashboard())
             if self.dashboard:
                 self.dashboard.set_mode(self.config.dry_run)
                 bal = account.balance if account and hasattr(account, "balance") else 0
                 self.dashboard.set_balance(bal)
                 print("   ✅ LiveDashboard attached")
 
+            # 17. Event scheduler (replaces the fixed scan interval)
+            if self.config.event_driven:
+                from ict_agent.controller.scheduler import EventScheduler
+
+                self.scheduler = EventScheduler(
+                    self.config.symbols,
+                    self.killzone_manager,
+                    granularities=self.config.wake_granularities,
+                    heartbeat_seconds=self.config.scan_interval_seconds,
+                )
+                if self.config.stream_prices:
+                    from ict_agent.data.oanda_fetcher import OANDAConfig
+                    from ict_agent.data.price_stream import OANDAPriceStream
+
+                    self.price_stream = OANDAPriceStream(
+                        self.config.symbols,
+                        self.scheduler.on_price,
+                        OANDAConfig(
+                            api_key=self.config.api_key,
+                            account_id=self.config.account_id,
+                            environment=self.config.environment,
+                        ),
+                    )
+                print(
+                    f"   ✅ EventScheduler ({'/'.join(self.config.wake_granularities)} closes"
+                    f"{', price stream' if self.price_stream else ''})"
+                )
+
             print("═" * 62)
             print(f"🟢 VEX AGENT READY — {len(self.config.symbols)} symbols")
             print(f"   Mode: {'DRY RUN' if self.config.dry_run else 'LIVE TRADING'}")
@@ -468,6 +549,12 @@ class VexController:
         if self.dashboard:
             live_ctx = self.dashboard.start_live()
 
+        if self.price_stream:
+            self.price_stream.start()
+
+        # None = full cycle over every symbol; [] = idle tick (monitor only)
+        symbols: Optional[List[str]] = None
+
         try:
             if live_ctx:
                 live_ctx.__enter__()
@@ -481,8 +568,15 @@ class VexController:
                 if max_cycles and self.cycle_count >= max_cycles:
                     break
 
-                # Run one complete cycle
-                self.step()
+                # Run one complete cycle (or just watch positions)
+                if symbols is None or symbols:
+                    self.step(symbols)
+                else:
+                    self._idle_tick()
+
+                # Publish per-cycle API snapshots
+                if self.snapshots:
+                    self.snapshots.cycle_complete()
 
                 # Refresh dashboard after each step
                 if self.dashboard:
@@ -490,7 +584,16 @@ class VexController:
 
                 # Wait before next cycle
                 if self.running and self.state != VexState.SHUTDOWN:
-                    time.sleep(self.config.scan_interval_seconds)
+                    if self.scheduler:
+                        wakes = self.scheduler.wait(deadline=end_time)
+                        symbols = self.scheduler.symbols_for(wakes)
+                        if self.config.verbose and wakes:
+                            reasons = ", ".join(
+                                f"{w.reason}{f' {w.detail}' if w.detail else ''}" for w in wakes
+                            )
+                            print(f"\n   ⏰ Wake: {reasons}")
+                    else:
+                        time.sleep(self.config.scan_interval_seconds)
 
         except KeyboardInterrupt:
             if not self.dashboard:
@@ -500,6 +603,8 @@ class VexController:
                 print(f"\n❌ Fatal error: {e}")
             traceback.print_exc()
         finally:
+            if self.price_stream:
+                self.price_stream.stop()
             if live_ctx:
                 try:
                     live_ctx.__exit__(None, None, None)
@@ -513,12 +618,16 @@ class VexController:
     # STEP — One complete trading cycle
     # ═══════════════════════════════════════════════════════════════════════════
 
-    def step(self) -> None:
+    def step(self, symbols: Optional[List[str]] = None) -> None:
         """
         Execute one complete trading cycle.
 
         IDLE → SCAN → ANALYZE (per symbol) → GATE → EXECUTE → MONITOR → LEARN → IDLE
+
+        Args:
+            symbols: Subset to scan and analyze (default: all configured)
         """
+        symbols = symbols or self.config.symbols
         self.cycle_count += 1
         self.last_cycle_time = datetime.now(NY_TZ)
         now = self.last_cycle_time
@@ -556,7 +665,7 @@ class VexController:
         scan_result = self._safe_execute(
             "scan",
             {
-                "symbols": self.config.symbols,
+                "symbols": symbols,
                 "killzone_manager": self.killzone_manager,
             },
         )
@@ -623,7 +732,7 @@ class VexController:
         best_setup = None
         best_confidence = 0
 
-        for symbol in self.config.symbols:
+        for symbol in symbols:
             # Build rich analysis context with memory recall
             analyze_context = {
                 "symbol": symbol,
@@ -655,6 +764,12 @@ class VexController:
 
             analyze_result = self._safe_execute("analyze", analyze_context)
 
+            if self.snapshots and analyze_result and analyze_result.data:
+                self.snapshots.record_analysis(symbol, analyze_result.data)
+
+            if self.scheduler and analyze_result and analyze_result.data:
+                self.scheduler.watch_levels(symbol, analyze_result.data.get("watch_levels", []))
+
             # Print gate trace if verbose
             if self.config.verbose and analyze_result and analyze_result.data:
                 trace = analyze_result.data.get("gate_trace", [])
@@ -881,6 +996,27 @@ class VexController:
     # MONITORING
     # ═══════════════════════════════════════════════════════════════════════════
 
+    def _idle_tick(self) -> None:
+        """Scheduler wake with nothing to analyze: watch positions and learn."""
+        self.state = VexState.MONITORING
+        self._monitor_positions()
+        if self.dashboard:
+            self._push_positions_to_dashboard()
+            kz = (
+                self.killzone_manager.get_current_killzone(datetime.now(NY_TZ))
+                if self.killzone_manager
+                else None
+            )
+            self.dashboard.update_header(
+                cycle=self.cycle_count,
+                state="IDLE",
+                killzone=kz.value if kz else "No Session",
+            )
+        if self.config.learn_from_trades:
+            self.state = VexState.LEARNING
+            self._check_and_learn_from_closed_trades()
+        self.state = VexState.IDLE
+
     def _monitor_positions(self) -> None:
         """Monitor open positions for status updates."""
         if not self.executor:
@@ -888,6 +1024,8 @@ class VexController:
 
         try:
             open_trades = self.executor.get_open_trades()
+            if self.snapshots:
+                self.snapshots.publish_positions(open_trades)
             if not open_trades:
                 return
 
@@ -1088,6 +1226,12 @@ class VexController:
         """Stop the agent gracefully."""
         self.running = False
         self.state = VexState.SHUTDOWN
+        if self.scheduler:
+            self.scheduler.stop()
+        if self.async_executor:
+            self.async_executor.stop()
+            self.executor.snapshot = None
+            self.async_executor = None
 
         from ict_agent.events.event_types import SystemEvent, EventType
 
@@ -1102,11 +1246,26 @@ class VexController:
                 )
             )
 
-    def enable_dashboard(self) -> None:
-        """Attach the live terminal dashboard. Call before boot()."""
+    def flatten_all(self) -> List[Any]:
+        """
+        Emergency: close every open position concurrently.
+        Returns one OrderResult per position.
+        """
+        if self.async_executor:
+            return self.async_executor.call(self.async_executor.executor.close_all_positions())
+        if self.executor:
+            return self.executor.close_all_positions()
+        return []
+
+    def enable_dashboard(self, max_fps: float = 4.0, on_frame=None) -> None:
+        """
+        Attach the live terminal dashboard. Call before boot().
+
+        max_fps caps redraws; on_frame receives a FrameStats per frame.
+        """
         from ict_agent.dashboard.live_dashboard import VexLiveDashboard
 
-        self.dashboard = VexLiveDashboard()
+        self.dashboard = VexLiveDashboard(max_fps=max_fps, on_frame=on_frame)
 
     def reset_daily(self) -> None:
         """Reset daily counters (call at start of new trading day)."""
@@ -1139,4 +1298,17 @@ class VexController:
             status["memory"] = self.memory.get_status()
         if hasattr(self, "performance") and self.performance:
             status["performance"] = self.performance.status()
+        if self.core_engine and self.core_engine.analysis_cache is not None:
+            status["analysis_cache"] = self.core_engine.analysis_cache.stats()
+        if getattr(self.executor, "transport", None) is not None:
+            status["oanda_transport"] = self.executor.transport.stats()
+        if self.async_executor:
+            status["account_snapshot"] = self.async_executor.executor.snapshot.status()
+        if self.scheduler:
+            status["scheduler"] = self.scheduler.stats()
+            if self.price_stream:
+                status["scheduler"]["price_stream"] = {
+                    "connected": self.price_stream.connected,
+                    "reconnects": self.price_stream.reconnects,
+                }
         return status
@@ -0,0 +1,291 @@
+"""
+VEX Event Scheduler
+===================
+Decides when the controller should run a cycle, and for which symbols,
+instead of sleeping a fixed scan interval.
+
+Wake sources:
+    candle_close    a watched granularity closed (M15/H1 by default) while a
+                    primary killzone is open → re-analyze every symbol
+    level_cross     a streamed price crossed one of the symbol's watched
+                    levels (liquidity pools, PD-array edges from its last
+                    analysis) → re-analyze that symbol only
+    killzone_open   a primary killzone started → re-analyze every symbol
+    killzone_close  a primary killzone ended → idle tick
+    heartbeat       nothing happened for heartbeat_seconds → idle tick
+                    (position monitoring and learning, no analysis)
+
+Candle closes outside primary killzones (and on weekends) are counted but
+do not wake the controller, so nothing is fetched or analyzed there.
+
+Usage (wired by VexController.boot when config.event_driven):
+    scheduler = EventScheduler(symbols, killzone_manager)
+    wakes = scheduler.wait(deadline)          # blocks until something is due
+    symbols = scheduler.symbols_for(wakes)    # [] → idle tick
+    scheduler.watch_levels("EUR_USD", [1.0850, 1.0875])
+    scheduler.on_price("EUR_USD", bid, ask)   # from the price stream thread
+"""
+
+import bisect
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, time, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+from zoneinfo import ZoneInfo
+
+NY_TZ = ZoneInfo("America/New_York")
+
+# Candle length per OANDA granularity
+GRANULARITY_SECONDS = {
+    "M1": 60,
+    "M5": 300,
+    "M15": 900,
+    "M30": 1800,
+    "H1": 3600,
+    "H4": 14400,
+    "D": 86400,
+}
+
+# H4 and D candles are aligned to the 17:00 New York roll
+DAILY_ALIGNMENT = time(17, 0)
+
+
+@dataclass
+class Wake:
+    """One reason to run a cycle. Empty symbols means an idle tick."""
+
+    reason: str
+    at: datetime
+    symbols: List[str] = field(default_factory=list)
+    detail: str = ""
+
+
+def next_candle_close(now: datetime, granularity: str) -> datetime:
+    """First candle close of `granularity` strictly after `now` (UTC)."""
+    seconds = GRANULARITY_SECONDS[granularity]
+    now_utc = now.astimezone(timezone.utc)
+    if seconds <= 3600:
+        epoch = int(now_utc.timestamp())
+        return datetime.fromtimestamp(epoch - epoch % seconds + seconds, timezone.utc)
+
+    # Walk forward from the most recent 17:00 NY roll
+    ny_now = now_utc.astimezone(NY_TZ)
+    anchor = datetime.combine(ny_now.date(), DAILY_ALIGNMENT, tzinfo=NY_TZ)
+    if anchor > ny_now:
+        anchor -= timedelta(days=1)
+    close = anchor + timedelta(seconds=seconds)
+    while close <= ny_now:
+        close += timedelta(seconds=seconds)
+    return close.astimezone(timezone.utc)
+
+
+class EventScheduler:
+    """
+    Blocking wake-up source for VexController.run.
+
+    Timers (candle closes, killzone boundaries, heartbeat) are computed
+    from the clock; level crossings are pushed by the price stream thread
+    through on_price(). Wakes that are due together are returned together,
+    so a burst of ticks right at a candle close costs one cycle.
+    """
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        killzone_manager: Any,
+        granularities: Sequence[str] = ("M15", "H1"),
+        settle_seconds: float = 2.0,
+        heartbeat_seconds: float = 300.0,
+        level_cooldown_seconds: float = 60.0,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ):
+        self.symbols = list(symbols)
+        self.killzone_manager = killzone_manager
+        self.granularities = list(granularities)
+        self.settle = timedelta(seconds=settle_seconds)
+        self.heartbeat = timedelta(seconds=heartbeat_seconds)
+        self.level_cooldown = timedelta(seconds=level_cooldown_seconds)
+        self._clock = clock
+
+        self._cond = threading.Condition()
+        self._pending: List[Wake] = []
+        self._stopped = False
+
+        self._levels: Dict[str, List[float]] = {}
+        self._last_mid: Dict[str, float] = {}
+        self._last_cross: Dict[str, datetime] = {}
+
+        now = self._clock()
+        self._in_killzone = self._killzone_active(now)
+        self._last_wake = now
+        # Closes are shifted by the settle delay so the candle is complete
+        self._next_closes = {g: next_candle_close(now - self.settle, g) + self.settle
+                             for g in self.granularities}
+        self._next_killzone = self._next_killzone_change(now)
+
+        self._counts: Counter = Counter()
+        self._analyzed = 0
+        self._ticks = 0
+
+    # ─── Inputs ──────────────────────────────────────────────────────────
+
+    def watch_levels(self, symbol: str, levels: Iterable[float]) -> None:
+        """Replace the price levels whose crossing re-analyzes `symbol`."""
+        clean = sorted({float(p) for p in levels if p})
+        with self._cond:
+            self._levels[symbol] = clean
+
+    def on_price(self, symbol: str, bid: float, ask: float) -> None:
+        """Price stream callback. Queues a level_cross wake on a crossing."""
+        mid = (bid + ask) / 2
+        with self._cond:
+            self._ticks += 1
+            prev = self._last_mid.get(symbol)
+            self._last_mid[symbol] = mid
+            levels = self._levels.get(symbol)
+            if prev is None or not levels or prev == mid:
+                return
+
+            low, high = (prev, mid) if prev < mid else (mid, prev)
+            i = bisect.bisect_left(levels, low)
+            if i == len(levels) or levels[i] > high:
+                return
+
+            now = self._clock()
+            if not self._in_killzone:
+                self._counts["level_cross_suppressed"] += 1
+                return
+            last = self._last_cross.get(symbol)
+            if last is not None and now - last < self.level_cooldown:
+                self._counts["level_cross_cooldown"] += 1
+                return
+            self._last_cross[symbol] = now
+            self._pending.append(Wake("level_cross", now, [symbol], f"{levels[i]:g}"))
+            self._cond.notify_all()
+
+    def stop(self) -> None:
+        """Release any thread blocked in wait()."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+
+    # ─── Scheduling ──────────────────────────────────────────────────────
+
+    def poll(self, now: Optional[datetime] = None) -> List[Wake]:
+        """Collect every wake due at `now` (pushed ones included)."""
+        now = now or self._clock()
+        with self._cond:
+            return self._collect(now)
+
+    def wait(self, deadline: Optional[datetime] = None) -> List[Wake]:
+        """
+        Block until at least one wake is due, then return all due wakes.
+
+        Returns [] when stop() is called or `deadline` passes first.
+        """
+        with self._cond:
+            while not self._stopped:
+                now = self._clock()
+                wakes = self._collect(now)
+                if wakes:
+                    return wakes
+                if deadline is not None and now >= deadline:
+                    return []
+                until = min(self._next_timer(), deadline or datetime.max.replace(tzinfo=timezone.utc))
+                self._cond.wait(timeout=max(0.0, (until - now).total_seconds()))
+            return []
+
+    def symbols_for(self, wakes: Iterable[Wake]) -> List[str]:
+        """Symbols to analyze for a batch of wakes, in configured order."""
+        wanted = set()
+        for wake in wakes:
+            wanted.update(wake.symbols)
+        symbols = [s for s in self.symbols if s in wanted]
+        with self._cond:
+            self._analyzed += len(symbols)
+        return symbols
+
+    def stats(self) -> Dict[str, Any]:
+        """Wake counters for VexController.get_status()."""
+        with self._cond:
+            return {
+                "in_killzone": self._in_killzone,
+                "wakes": dict(self._counts),
+                "symbols_analyzed": self._analyzed,
+                "ticks": self._ticks,
+                "watched_levels": sum(len(v) for v in self._levels.values()),
+                "next_candle_close": min(self._next_closes.values()).isoformat(),
+                "next_killzone_change": self._next_killzone.isoformat(),
+            }
+
+    # ─── Internals (called with the condition held) ──────────────────────
+
+    def _collect(self, now: datetime) -> List[Wake]:
+        wakes = self._pending
+        self._pending = []
+
+        if now >= self._next_killzone:
+            was_open = self._in_killzone
+            self._in_killzone = self._killzone_active(now)
+            if self._in_killzone:
+                wakes.append(Wake("killzone_open", now, list(self.symbols)))
+            elif was_open:
+                wakes.append(Wake("killzone_close", now))
+            self._next_killzone = self._next_killzone_change(now)
+
+        closed = [g for g, at in self._next_closes.items() if now >= at]
+        if closed:
+            if self._in_killzone and self._trading_day(now):
+                wakes.append(Wake("candle_close", now, list(self.symbols), ",".join(closed)))
+            else:
+                self._counts["candle_close_suppressed"] += 1
+            for g in closed:
+                self._next_closes[g] = next_candle_close(now - self.settle, g) + self.settle
+
+        if not wakes and now - self._last_wake >= self.heartbeat:
+            wakes.append(Wake("heartbeat", now))
+
+        if wakes:
+            self._last_wake = now
+            for wake in wakes:
+                self._counts[wake.reason] += 1
+        return wakes
+
+    def _next_timer(self) -> datetime:
+        return min(min(self._next_closes.values()), self._next_killzone,
+                   self._last_wake + self.heartbeat)
+
+    def _primary(self, now: datetime) -> bool:
+        return bool(self.killzone_manager and self.killzone_manager.is_primary_killzone(now))
+
+    def _killzone_active(self, now: datetime) -> bool:
+        """Inside a primary killzone on a trading day (weekend windows don't count)"""
+        return self._primary(now) and self._trading_day(now)
+
+    def _trading_day(self, now: datetime) -> bool:
+        if self.killzone_manager is None or not hasattr(self.killzone_manager, "is_trading_day"):
+            return True
+        return self.killzone_manager.is_trading_day(now)
+
+    def _killzone_boundaries(self, now: datetime) -> List[datetime]:
+        """Window starts and ends around `now`, in the manager's clock."""
+        manager = self.killzone_manager
+        windows = getattr(manager, "KILLZONES", {}).values()
+        offset = timedelta(hours=getattr(manager, "timezone_offset", -5))
+        local_day = (now.astimezone(timezone.utc) + offset).date()
+        boundaries = []
+        for day in (local_day, local_day + timedelta(days=1)):
+            for window in windows:
+                for t, pad in ((window.start, 0), (window.end, 1)):
+                    # Windows include their end time; they close one second later
+                    local = datetime.combine(day, t, tzinfo=timezone.utc) + timedelta(seconds=pad)
+                    boundaries.append(local - offset)
+        return sorted(b for b in boundaries if b > now)
+
+    def _next_killzone_change(self, now: datetime) -> datetime:
+        current = self._primary(now)
+        for boundary in self._killzone_boundaries(now):
+            if self._primary(boundary) != current:
+                return boundary
+        return now + timedelta(days=1)
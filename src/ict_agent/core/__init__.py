@@ -8,46 +8,52 @@ Modules:
 - amd_engine: Accumulation-Manipulation-Distribution cycle tracking
 """
 
-from .stop_hunt import (
-    StopHuntDetector,
-    StopHunt,
-    HuntType,
-    RejectionQuality,
-    LiquidityTarget,
-    detect_stop_hunts,
-)
-from .structure_breaks import (
-    EnhancedStructureAnalyzer,
-    StructureBreakSignal,
-    BreakType,
-    Trend,
-    SwingPoint,
-    analyze_structure,
-)
-from .amd_engine import (
-    AMDEngine,
-    AMDState,
-    Phase,
-    Direction,
-    SessionType,
-    AccumulationRange,
-    ManipulationEvent,
-    analyze_amd,
-)
-from .vex_core_engine import (
-    VexCoreEngine,
-    EngineResult,
-    TradeSetup,
-    TradeType,
-    SessionPhase,
-    ModelType,
-    Bias,
-    LiquidityLevel,
-    PDArray,
-    GateLog,
-)
-from .graph_reasoner import VexGraphReasoner, EnhancedResult
-from .mem0_advisor import Mem0Advisor, Mem0Insight
+from typing import TYPE_CHECKING
+
+from ict_agent._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .stop_hunt import (
+        StopHuntDetector,
+        StopHunt,
+        HuntType,
+        RejectionQuality,
+        LiquidityTarget,
+        detect_stop_hunts,
+    )
+    from .structure_breaks import (
+        EnhancedStructureAnalyzer,
+        StructureBreakSignal,
+        BreakType,
+        Trend,
+        SwingPoint,
+        analyze_structure,
+    )
+    from .amd_engine import (
+        AMDEngine,
+        AMDState,
+        Phase,
+        Direction,
+        SessionType,
+        AccumulationRange,
+        ManipulationEvent,
+        analyze_amd,
+    )
+    from .vex_core_engine import (
+        VexCoreEngine,
+        EngineResult,
+        TradeSetup,
+        TradeType,
+        SessionPhase,
+        ModelType,
+        Bias,
+        LiquidityLevel,
+        PDArray,
+        GateLog,
+    )
+    from .analysis_cache import AnalysisCache
+    from .graph_reasoner import VexGraphReasoner, EnhancedResult
+    from .mem0_advisor import Mem0Advisor, Mem0Insight
 
 __all__ = [
     # Stop Hunt
@@ -84,6 +90,7 @@ __all__ = [
     "LiquidityLevel",
     "PDArray",
     "GateLog",
+    "AnalysisCache",
     # Graph Reasoner Bridge
     "VexGraphReasoner",
     "EnhancedResult",
@@ -91,3 +98,43 @@ __all__ = [
     "Mem0Advisor",
     "Mem0Insight",
 ]
+
+_EXPORTS = {
+    "StopHuntDetector": "ict_agent.core.stop_hunt",
+    "StopHunt": "ict_agent.core.stop_hunt",
+    "HuntType": "ict_agent.core.stop_hunt",
+    "RejectionQuality": "ict_agent.core.stop_hunt",
+    "LiquidityTarget": "ict_agent.core.stop_hunt",
+    "detect_stop_hunts": "ict_agent.core.stop_hunt",
+    "EnhancedStructureAnalyzer": "ict_agent.core.structure_breaks",
+    "StructureBreakSignal": "ict_agent.core.structure_breaks",
+    "BreakType": "ict_agent.core.structure_breaks",
+    "Trend": "ict_agent.core.structure_breaks",
+    "SwingPoint": "ict_agent.core.structure_breaks",
+    "analyze_structure": "ict_agent.core.structure_breaks",
+    "AMDEngine": "ict_agent.core.amd_engine",
+    "AMDState": "ict_agent.core.amd_engine",
+    "Phase": "ict_agent.core.amd_engine",
+    "Direction": "ict_agent.core.amd_engine",
+    "SessionType": "ict_agent.core.amd_engine",
+    "AccumulationRange": "ict_agent.core.amd_engine",
+    "ManipulationEvent": "ict_agent.core.amd_engine",
+    "analyze_amd": "ict_agent.core.amd_engine",
+    "VexCoreEngine": "ict_agent.core.vex_core_engine",
+    "EngineResult": "ict_agent.core.vex_core_engine",
+    "TradeSetup": "ict_agent.core.vex_core_engine",
+    "TradeType": "ict_agent.core.vex_core_engine",
+    "SessionPhase": "ict_agent.core.vex_core_engine",
+    "ModelType": "ict_agent.core.vex_core_engine",
+    "Bias": "ict_agent.core.vex_core_engine",
+    "LiquidityLevel": "ict_agent.core.vex_core_engine",
+    "PDArray": "ict_agent.core.vex_core_engine",
+    "GateLog": "ict_agent.core.vex_core_engine",
+    "AnalysisCache": "ict_agent.core.analysis_cache",
+    "VexGraphReasoner": "ict_agent.core.graph_reasoner",
+    "EnhancedResult": "ict_agent.core.graph_reasoner",
+    "Mem0Advisor": "ict_agent.core.mem0_advisor",
+    "Mem0Insight": "ict_agent.core.mem0_advisor",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
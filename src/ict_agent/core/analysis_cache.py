@@ -0,0 +1,123 @@
+"""
+Analysis Cache - reuse VexCoreEngine's data-dependent gates between bars.
+
+Bias, liquidity mapping, sweep detection, PD arrays, classification and
+displacement depend only on the candles and the engine configuration, so
+they are cached per (symbol, timeframe, last closed candle per frame,
+config hash). The killzone, session-phase and later gates depend on the
+clock and are re-evaluated on every call by the engine.
+
+A new bar for a (symbol, timeframe) drops the older entries for it; the
+cache also holds at most max_entries (least recently used go first).
+
+Usage:
+    cache = AnalysisCache(max_entries=128)
+    key = cache.key(symbol, "15m", (df_15m, df_1h), engine.config_hash())
+    gates = cache.get(key)
+    if gates is None:
+        gates = compute(...)
+        cache.put(key, gates)
+    cache.stats()   # hits, misses, hit_rate, invalidations, evictions
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+import pandas as pd
+
+CacheKey = Tuple[str, str, Tuple[Hashable, ...], str]
+
+
+def bar_stamp(df: Optional[pd.DataFrame]) -> Hashable:
+    """Identity of a frame's last closed candle: (timestamp, bar count)."""
+    if df is None or len(df) == 0:
+        return None
+    return (df.index[-1], len(df))
+
+
+class AnalysisCache:
+    """Bounded LRU of per-symbol gate results with new-bar invalidation."""
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, Any]" = OrderedDict()
+        self._latest: Dict[Tuple[str, str, str], Tuple[Hashable, ...]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(
+        symbol: str,
+        timeframe: str,
+        frames: Iterable[Optional[pd.DataFrame]],
+        config_hash: str,
+    ) -> CacheKey:
+        return (symbol, timeframe, tuple(bar_stamp(df) for df in frames), config_hash)
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """A private copy of the cached value, or None."""
+        with self._lock:
+            self._advance(key)
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        # Callers may mutate levels/arrays; never hand out the stored objects
+        return copy.deepcopy(value)
+
+    def put(self, key: CacheKey, value: Any) -> None:
+        stored = copy.deepcopy(value)
+        with self._lock:
+            self._advance(key)
+            self._entries[key] = stored
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, symbol: Optional[str] = None) -> int:
+        """Drop entries for one symbol (or all). Returns how many went."""
+        with self._lock:
+            doomed = [k for k in self._entries if symbol is None or k[0] == symbol]
+            for k in doomed:
+                del self._entries[k]
+            self._latest = {k: v for k, v in self._latest.items()
+                            if symbol is not None and k[0] != symbol}
+            self.invalidations += len(doomed)
+            return len(doomed)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "invalidations": self.invalidations,
+                "evictions": self.evictions,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _advance(self, key: CacheKey) -> None:
+        """On a new bar for (symbol, timeframe, config), drop older entries."""
+        symbol, timeframe, stamps, config_hash = key
+        series = (symbol, timeframe, config_hash)
+        if self._latest.get(series) == stamps:
+            return
+        self._latest[series] = stamps
+        stale = [k for k in self._entries
+                 if (k[0], k[1], k[3]) == series and k[2] != stamps]
+        for k in stale:
+            del self._entries[k]
+        self.invalidations += len(stale)
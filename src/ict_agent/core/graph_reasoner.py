@@ -34,6 +34,7 @@ from __future__ import annotations
 import logging
 import os
 import sys
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -99,21 +100,59 @@ class VexGraphReasoner:
 
     Initialisation is intentionally lazy — the heavy graph store is only
     loaded the first time ``enhance_setup`` is called.  This keeps VEX's
-    boot time unaffected if the graph files are missing.
+    boot time unaffected if the graph files are missing.  Call
+    ``warm_up()`` at boot to load it on a background thread instead, so
+    the first analysis never pays graph-construction latency.
     """
 
     def __init__(self):
         self._reasoner = None
         self._loaded = False
         self._available = True
+        self._load_lock = threading.Lock()
+        self._warm_thread: Optional[threading.Thread] = None
 
     # ── Lazy loading ──────────────────────────────────────────────────────
 
+    def warm_up(self, background: bool = True) -> Optional[threading.Thread]:
+        """Load the graph ahead of the first analysis.
+
+        With ``background=True`` the load runs on a daemon thread and the
+        thread is returned; an ``enhance_setup`` call that arrives before it
+        finishes simply waits on the same lock instead of loading twice.
+        """
+        if self._loaded:
+            return None
+        if not background:
+            self._ensure_loaded()
+            return None
+        if self._warm_thread is None or not self._warm_thread.is_alive():
+            self._warm_thread = threading.Thread(
+                target=self._ensure_loaded, name="vex-graph-warmup", daemon=True
+            )
+            self._warm_thread.start()
+        return self._warm_thread
+
+    @property
+    def graph_size(self) -> Tuple[int, int]:
+        """(nodes, edges) of the loaded graph, or (0, 0) if not loaded."""
+        if self._reasoner is None:
+            return 0, 0
+        graph = self._reasoner.graph
+        return len(graph.nodes), len(graph.edges)
+
     def _ensure_loaded(self) -> bool:
         """Lazy-load the graph store + reasoner on first use."""
         if self._loaded:
             return self._available
 
+        with self._load_lock:
+            # Another thread (e.g. the boot warm-up) may have finished first
+            if self._loaded:
+                return self._available
+            return self._load()
+
+    def _load(self) -> bool:
         try:
             # Locate Knowledge Base
             # Default: ../../knowledge_base relative to src/ict_agent/core
@@ -133,6 +172,7 @@ class VexGraphReasoner:
                 return False
 
             self._reasoner = GraphReasoner.from_knowledge_base(kb_root)
+            self._reasoner.compiled  # build the scoring index up front too
             self._loaded = True
             self._available = True
 
@@ -146,6 +186,16 @@ class VexGraphReasoner:
 
         return self._available
 
+    def refresh(self) -> bool:
+        """Patch the loaded graph with knowledge base edits made since load.
+
+        Returns True if the graph changed.  A no-op before the first load.
+        """
+        if not self._loaded or not self._available or self._reasoner is None:
+            return False
+        diff = self._reasoner.refresh()
+        return bool(diff and diff.has_changes)
+
     # ── Public API ────────────────────────────────────────────────────────
 
     def enhance_setup(
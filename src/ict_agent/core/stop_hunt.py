@@ -6,9 +6,10 @@ Enhanced detection for stop hunts with:
 - Trade level calculation
 """
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, List
+from typing import Optional, List, Dict
 import pandas as pd
 import numpy as np
 
@@ -89,6 +90,7 @@ class StopHuntDetector:
         self._liquidity_targets: List[LiquidityTarget] = []
         self._detected_hunts: List[StopHunt] = []
         self._atr: Optional[pd.Series] = None
+        self._bars: Dict[str, np.ndarray] = {}
 
     def detect(
         self,
@@ -102,6 +104,8 @@ class StopHuntDetector:
 
         self._detected_hunts = []
         self._calculate_atr(ohlc)
+        self._bars = {col: ohlc[col].to_numpy(dtype=float) for col in ("open", "high", "low", "close")}
+        self._bars["atr"] = self._atr.to_numpy(dtype=float)
         self._map_liquidity(ohlc)
         self._scan_for_sweeps(ohlc, symbol, timeframe)
         self._validate_hunts()
@@ -127,73 +131,106 @@ class StopHuntDetector:
         """Map all liquidity targets."""
         self._liquidity_targets = []
         n = self.swing_lookback
-        swing_highs, swing_lows = [], []
-
-        for i in range(n, len(ohlc) - n):
-            high, low = ohlc.iloc[i]["high"], ohlc.iloc[i]["low"]
-            left_h = ohlc.iloc[i-n:i]["high"].values
-            right_h = ohlc.iloc[i+1:i+n+1]["high"].values
+        high = ohlc["high"].to_numpy(dtype=float)
+        low = ohlc["low"].to_numpy(dtype=float)
+        size = len(ohlc)
+
+        is_high = np.zeros(size, dtype=bool)
+        is_low = np.zeros(size, dtype=bool)
+        if size > 2 * n and n > 0:
+            # Strict swing: above/below every bar within n on both sides
+            inner = slice(n, size - n)
+            left = slice(0, size - 2 * n)
+            right = slice(n + 1, size - n + 1)
+            high_max = np.lib.stride_tricks.sliding_window_view(high, n).max(axis=1)
+            low_min = np.lib.stride_tricks.sliding_window_view(low, n).min(axis=1)
+            is_high[inner] = (high[inner] > high_max[left]) & (high[inner] > high_max[right])
+            is_low[inner] = (low[inner] < low_min[left]) & (low[inner] < low_min[right])
 
-            if high > max(left_h) and high > max(right_h):
-                t = LiquidityTarget(high, "swing_high", 1, i, ohlc.index[i])
+        swing_highs, swing_lows = [], []
+        for i in np.flatnonzero(is_high | is_low):
+            if is_high[i]:
+                t = LiquidityTarget(high[i], "swing_high", 1, int(i), ohlc.index[i])
                 swing_highs.append(t)
                 self._liquidity_targets.append(t)
-
-            left_l = ohlc.iloc[i-n:i]["low"].values
-            right_l = ohlc.iloc[i+1:i+n+1]["low"].values
-
-            if low < min(left_l) and low < min(right_l):
-                t = LiquidityTarget(low, "swing_low", 1, i, ohlc.index[i])
+            if is_low[i]:
+                t = LiquidityTarget(low[i], "swing_low", 1, int(i), ohlc.index[i])
                 swing_lows.append(t)
                 self._liquidity_targets.append(t)
 
         # Detect equal levels (stronger liquidity)
-        for swing in swing_highs:
-            matches = [s for s in swing_highs
-                      if s != swing and abs(s.price - swing.price) <= self.equal_level_tolerance]
-            if matches:
-                swing.level_type = "equal_high"
-                swing.strength = len(matches) + 1
-
-        for swing in swing_lows:
-            matches = [s for s in swing_lows
-                      if s != swing and abs(s.price - swing.price) <= self.equal_level_tolerance]
+        self._mark_equal_levels(swing_highs, "equal_high")
+        self._mark_equal_levels(swing_lows, "equal_low")
+
+    def _mark_equal_levels(self, swings: List[LiquidityTarget], level_type: str):
+        """Tag swings with other swings within equal_level_tolerance (sorted-price window)."""
+        tol = self.equal_level_tolerance
+        if not swings or tol < 0:
+            return
+        prices = np.array([s.price for s in swings])
+        order = np.argsort(prices, kind="stable")
+        sorted_prices = prices[order].tolist()
+
+        for swing in swings:
+            lo = bisect_left(sorted_prices, swing.price - 2 * tol)
+            hi = bisect_right(sorted_prices, swing.price + 2 * tol)
+            matches = sum(
+                1 for k in order[lo:hi]
+                if swings[k] is not swing and abs(swings[k].price - swing.price) <= tol
+            )
             if matches:
-                swing.level_type = "equal_low"
-                swing.strength = len(matches) + 1
+                swing.level_type = level_type
+                swing.strength = matches + 1
 
     def _scan_for_sweeps(self, ohlc: pd.DataFrame, symbol: str, timeframe: str):
         """Scan for liquidity sweeps with rejection."""
-        avg_vol = ohlc["volume"].rolling(20).mean() if "volume" in ohlc.columns else None
-
-        for target in self._liquidity_targets:
-            if not target.is_protected:
-                continue
-
-            for i in range(target.index + 1, len(ohlc)):
-                candle = ohlc.iloc[i]
-                high, low, close = candle["high"], candle["low"], candle["close"]
-
-                # Buy-side sweep (swept highs, expect reversal down)
-                if "high" in target.level_type and high > target.price and close < target.price:
-                    hunt = self._create_hunt(ohlc, i, target, True, symbol, timeframe, avg_vol)
-                    if hunt:
-                        target.is_protected = False
-                        self._detected_hunts.append(hunt)
-                    break
-
-                # Sell-side sweep (swept lows, expect reversal up)
-                if "low" in target.level_type and low < target.price and close > target.price:
-                    hunt = self._create_hunt(ohlc, i, target, False, symbol, timeframe, avg_vol)
-                    if hunt:
-                        target.is_protected = False
-                        self._detected_hunts.append(hunt)
-                    break
+        avg_vol = None
+        if "volume" in ohlc.columns:
+            self._bars["volume"] = ohlc["volume"].to_numpy(dtype=float)
+            avg_vol = ohlc["volume"].rolling(20).mean().to_numpy(dtype=float)
+        high, low, close = self._bars["high"], self._bars["low"], self._bars["close"]
+
+        # Walk the bars once. Each protected target is "armed" from the bar
+        # after its swing; a bar resolves every armed high-side target priced
+        # in (close, high) and every low-side target in (low, close).
+        arm_at: Dict[int, List[int]] = {}
+        for pos, target in enumerate(self._liquidity_targets):
+            if target.is_protected:
+                arm_at.setdefault(target.index + 1, []).append(pos)
+
+        armed = {True: ([], []), False: ([], [])}  # is_buy_side -> (prices, positions)
+        first_sweep: Dict[int, int] = {}
+        for i in range(len(close)):
+            for pos in arm_at.get(i, ()):
+                target = self._liquidity_targets[pos]
+                prices, positions = armed["high" in target.level_type]
+                k = bisect_right(prices, target.price)
+                prices.insert(k, target.price)
+                positions.insert(k, pos)
+
+            for is_buy_side, lo, hi in ((True, close[i], high[i]), (False, low[i], close[i])):
+                prices, positions = armed[is_buy_side]
+                start, end = bisect_right(prices, lo), bisect_left(prices, hi)
+                if start < end:
+                    for pos in positions[start:end]:
+                        first_sweep[pos] = i
+                    del prices[start:end]
+                    del positions[start:end]
+
+        for pos in sorted(first_sweep):
+            target = self._liquidity_targets[pos]
+            hunt = self._create_hunt(
+                ohlc, first_sweep[pos], target, "high" in target.level_type,
+                symbol, timeframe, avg_vol
+            )
+            if hunt:
+                target.is_protected = False
+                self._detected_hunts.append(hunt)
 
     def _create_hunt(self, ohlc, idx, target, is_buy_side, symbol, timeframe, avg_vol):
         """Create a StopHunt from detected sweep."""
-        candle = ohlc.iloc[idx]
-        high, low, close = candle["high"], candle["low"], candle["close"]
+        bars = self._bars
+        open_, high, low, close = bars["open"][idx], bars["high"][idx], bars["low"][idx], bars["close"][idx]
 
         if is_buy_side:
             wick = (high - target.price) / self.pip_size
@@ -210,10 +247,10 @@ class StopHuntDetector:
             return None
 
         # Assess rejection quality
-        atr = self._atr.iloc[idx] if self._atr is not None else 0.001
-        body = abs(candle["close"] - candle["open"])
-        is_correct = (candle["close"] < candle["open"]) if is_buy_side else (candle["close"] > candle["open"])
-        range_size = candle["high"] - candle["low"]
+        atr = bars["atr"][idx] if self._atr is not None else 0.001
+        body = abs(close - open_)
+        is_correct = (close < open_) if is_buy_side else (close > open_)
+        range_size = high - low
 
         if body > atr * 1.5 and is_correct:
             quality = RejectionQuality.VIOLENT
@@ -226,10 +263,10 @@ class StopHuntDetector:
 
         # Volume analysis
         vol_spike, vol_ratio = False, 1.0
-        if avg_vol is not None and "volume" in ohlc.columns:
-            avg = avg_vol.iloc[idx]
+        if avg_vol is not None and "volume" in bars:
+            avg = avg_vol[idx]
             if not pd.isna(avg) and avg > 0:
-                vol_ratio = candle["volume"] / avg
+                vol_ratio = bars["volume"][idx] / avg
                 vol_spike = vol_ratio > self.volume_spike_mult
 
         # Displacement check
@@ -284,18 +321,15 @@ class StopHuntDetector:
         if idx + lookforward >= len(ohlc):
             return False
 
-        atr = self._atr.iloc[idx] if self._atr is not None else 0.001
+        atr = self._bars["atr"][idx] if self._atr is not None else 0.001
         if pd.isna(atr):
             atr = 0.001
 
-        for i in range(1, lookforward + 1):
-            c = ohlc.iloc[idx + i]
-            body = abs(c["close"] - c["open"])
-            if is_buy_side and c["close"] < c["open"] and body > atr * 1.5:
-                return True
-            if not is_buy_side and c["close"] > c["open"] and body > atr * 1.5:
-                return True
-        return False
+        window = slice(idx + 1, idx + lookforward + 1)
+        opens, closes = self._bars["open"][window], self._bars["close"][window]
+        large = np.abs(closes - opens) > atr * 1.5
+        directional = closes < opens if is_buy_side else closes > opens
+        return bool((large & directional).any())
 
     def _validate_hunts(self):
         """Validate and score detected hunts."""
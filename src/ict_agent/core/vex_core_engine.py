@@ -15,6 +15,7 @@ Created: January 15, 2026
 Author: VEX (ICT Trading AI Agent)
 """
 
+import hashlib
 import sys
 from pathlib import Path
 from dataclasses import dataclass, field
@@ -37,6 +38,7 @@ from ict_agent.detectors.order_block import OrderBlockDetector
 from ict_agent.detectors.market_structure import MarketStructureAnalyzer
 from ict_agent.detectors.liquidity import LiquidityDetector
 from ict_agent.detectors.displacement import DisplacementDetector
+from ict_agent.core.analysis_cache import AnalysisCache
 
 
 NY_TZ = ZoneInfo("America/New_York")
@@ -220,6 +222,9 @@ class EngineResult:
     # Raw Data
     analysis_time: datetime = field(default_factory=lambda: datetime.now(NY_TZ))
 
+    # Gates 3-7b came from the analysis cache (bars unchanged since last run)
+    cached: bool = False
+
 
 # =============================================================================
 # VEX CORE ENGINE
@@ -253,6 +258,7 @@ class VexCoreEngine:
         default_stop: float = 20.0,  # pips
         min_rr: float = 1.5,
         pip_size: float = 0.0001,
+        analysis_cache: Optional[AnalysisCache] = None,
     ):
         self.model_11_target = model_11_target
         self.model_12_target = model_12_target
@@ -287,6 +293,9 @@ class VexCoreEngine:
         # Session state tracking
         self.session_state = SessionState(phase=SessionPhase.UNKNOWN)
 
+        # Memoized data-only gates, keyed by last closed candle per frame
+        self.analysis_cache = analysis_cache if analysis_cache is not None else AnalysisCache()
+
     # =========================================================================
     # MAIN ANALYSIS METHOD
     # =========================================================================
@@ -368,127 +377,15 @@ class VexCoreEngine:
         )
 
         # ---------------------------------------------------------------------
-        # GATE 3: BIAS DETERMINATION
-        # ---------------------------------------------------------------------
-        bias = self._determine_bias(df, htf_df)
-
-        trace.append(
-            GateLog(
-                gate="G3_BIAS",
-                passed=bias != Bias.NEUTRAL,
-                summary=f"{bias.value}"
-                if bias != Bias.NEUTRAL
-                else "Neutral — no clear structure",
-                details={"bias": bias.value, "price": current_price},
-            )
-        )
-
-        if bias == Bias.NEUTRAL:
-            return EngineResult(
-                trade=False,
-                setup=None,
-                bias=bias,
-                session_phase=session_phase,
-                killzone_active=killzone_active,
-                liquidity_levels=[],
-                pd_arrays=[],
-                session_state=self.session_state,
-                rejection_reason="No clear bias - structure is neutral",
-                gate_trace=trace,
-            )
-
-        # ---------------------------------------------------------------------
-        # GATE 4: LIQUIDITY MAPPING (IRL vs ERL)
-        # ---------------------------------------------------------------------
-        liquidity_levels = self._map_liquidity(df, symbol)
-        erl_levels = [l for l in liquidity_levels if l.external]
-        irl_levels = [l for l in liquidity_levels if not l.external]
-
-        trace.append(
-            GateLog(
-                gate="G4_LIQUIDITY",
-                passed=len(erl_levels) > 0,
-                summary=f"{len(erl_levels)} ERL + {len(irl_levels)} IRL = {len(liquidity_levels)} total",
-                details={
-                    "total": len(liquidity_levels),
-                    "erl_count": len(erl_levels),
-                    "irl_count": len(irl_levels),
-                    "erl_types": {l.source: round(l.price, 5) for l in erl_levels[:8]},
-                    "irl_types": {l.source: round(l.price, 5) for l in irl_levels[:8]},
-                },
-            )
-        )
-
-        if not erl_levels:
-            return EngineResult(
-                trade=False,
-                setup=None,
-                bias=bias,
-                session_phase=session_phase,
-                killzone_active=killzone_active,
-                liquidity_levels=liquidity_levels,
-                pd_arrays=[],
-                session_state=self.session_state,
-                rejection_reason="No external liquidity target identified",
-                gate_trace=trace,
-            )
-
-        # ---------------------------------------------------------------------
-        # GATE 5: SWEEP DETECTION
-        # ---------------------------------------------------------------------
-        sweep_info = self._check_liquidity_sweep(df, liquidity_levels)
-
-        trace.append(
-            GateLog(
-                gate="G5_SWEEP",
-                passed=True,  # informational — sweep is not required
-                summary=f"Sweep {sweep_info['direction']} @ {sweep_info['level'].price:.5f} ({sweep_info['candles_ago']} bars ago)"
-                if sweep_info.get("occurred")
-                else "No recent sweep",
-                details=sweep_info
-                if not sweep_info.get("occurred")
-                else {
-                    "occurred": True,
-                    "direction": sweep_info["direction"],
-                    "price": round(sweep_info["level"].price, 5),
-                    "source": sweep_info["level"].source,
-                    "candles_ago": sweep_info["candles_ago"],
-                },
-            )
-        )
-
-        # ---------------------------------------------------------------------
-        # GATE 6: PD ARRAY ENTRY ZONES
+        # GATES 3-7b: DATA-ONLY GATES (memoized per closed candle)
         # ---------------------------------------------------------------------
-        pd_arrays = self._find_pd_arrays(df, bias, timeframe)
-        valid_entries = [p for p in pd_arrays if p.valid and not p.mitigated]
-
-        trace.append(
-            GateLog(
-                gate="G6_PD_ARRAYS",
-                passed=len(valid_entries) > 0,
-                summary=f"{len(valid_entries)} valid entries ({len(pd_arrays)} total)"
-                if valid_entries
-                else f"0 valid ({len(pd_arrays)} found, all mitigated/invalid)",
-                details={
-                    "total_found": len(pd_arrays),
-                    "valid_count": len(valid_entries),
-                    "entries": [
-                        {
-                            "type": p.type,
-                            "dir": p.direction,
-                            "top": round(p.top, 5),
-                            "bot": round(p.bottom, 5),
-                            "ote": round(p.ote_level, 5),
-                            "mitigated": p.mitigated,
-                        }
-                        for p in pd_arrays[:6]
-                    ],
-                },
-            )
-        )
+        gates, cached = self._data_gates(symbol, df, htf_df, timeframe, current_price)
+        trace.extend(gates["trace"])
+        bias = gates["bias"]
+        liquidity_levels = gates["liquidity_levels"]
+        pd_arrays = gates["pd_arrays"]
 
-        if not valid_entries:
+        if gates["rejection"]:
             return EngineResult(
                 trade=False,
                 setup=None,
@@ -498,57 +395,16 @@ class VexCoreEngine:
                 liquidity_levels=liquidity_levels,
                 pd_arrays=pd_arrays,
                 session_state=self.session_state,
-                rejection_reason="No valid PD array entry zones",
+                rejection_reason=gates["rejection"],
                 gate_trace=trace,
+                cached=cached,
             )
 
-        # ---------------------------------------------------------------------
-        # GATE 7: TRADE CLASSIFICATION (Type A or B)
-        # ---------------------------------------------------------------------
-        trade_type, target_liquidity = self._classify_trade(
-            current_price, bias, sweep_info, erl_levels, irl_levels
-        )
-
-        trace.append(
-            GateLog(
-                gate="G7_CLASSIFY",
-                passed=True,
-                summary=f"{trade_type.value} → target {target_liquidity.source} @ {target_liquidity.price:.5f}",
-                details={
-                    "trade_type": trade_type.value,
-                    "target_price": round(target_liquidity.price, 5),
-                    "target_source": target_liquidity.source,
-                    "target_type": target_liquidity.type,
-                },
-            )
-        )
-
-        # ---------------------------------------------------------------------
-        # GATE 7b: DISPLACEMENT CHECK
-        # ---------------------------------------------------------------------
-        displacement_detected = False
-        try:
-            disp_result = self.displacement_detector.detect(df)
-            if disp_result is not None and not disp_result.empty:
-                # Check last few candles for displacement
-                recent = disp_result.tail(5)
-                if "displacement" in recent.columns:
-                    displacement_detected = bool(recent["displacement"].any())
-                elif len(recent) > 0:
-                    displacement_detected = True
-        except Exception:
-            pass  # detector may fail on insufficient data
-
-        trace.append(
-            GateLog(
-                gate="G7b_DISPLACEMENT",
-                passed=True,  # informational
-                summary="Displacement confirmed"
-                if displacement_detected
-                else "No displacement",
-                details={"detected": displacement_detected},
-            )
-        )
+        sweep_info = gates["sweep_info"]
+        valid_entries = gates["valid_entries"]
+        trade_type = gates["trade_type"]
+        target_liquidity = gates["target_liquidity"]
+        displacement_detected = gates["displacement_detected"]
 
         # ---------------------------------------------------------------------
         # GATE 7c: GRAPH-DRIVEN REASONING
@@ -761,6 +617,7 @@ class VexCoreEngine:
                 session_state=self.session_state,
                 rejection_reason=f"R:R {setup.rr_ratio:.1f} below minimum {self.min_rr}",
                 gate_trace=trace,
+                cached=cached,
             )
 
         # ALL GATES PASSED
@@ -774,7 +631,246 @@ class VexCoreEngine:
             pd_arrays=pd_arrays,
             session_state=self.session_state,
             gate_trace=trace,
+            cached=cached,
+        )
+
+    # =========================================================================
+    # DATA GATES (3-7b) + ANALYSIS CACHE
+    # =========================================================================
+
+    def config_hash(self) -> str:
+        """Digest of every setting the data-only gates depend on."""
+        settings = [
+            self.model_11_target,
+            self.model_12_target,
+            self.default_stop,
+            self.min_rr,
+            self.pip_size,
+        ]
+        for detector in (
+            self.fvg_detector,
+            self.ob_detector,
+            self.structure_analyzer,
+            self.liquidity_detector,
+            self.displacement_detector,
+        ):
+            settings.append(
+                (
+                    type(detector).__name__,
+                    sorted(
+                        (k, v)
+                        for k, v in vars(detector).items()
+                        if not k.startswith("_")
+                        and isinstance(v, (int, float, str, bool))
+                    ),
+                )
+            )
+        return hashlib.sha1(repr(settings).encode()).hexdigest()[:12]
+
+    def _data_gates(
+        self,
+        symbol: str,
+        df: pd.DataFrame,
+        htf_df: Optional[pd.DataFrame],
+        timeframe: str,
+        current_price: float,
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Gates 3-7b, served from the analysis cache while the bars are unchanged."""
+        cache = self.analysis_cache
+        if cache is None:
+            return self._run_data_gates(symbol, df, htf_df, timeframe, current_price), False
+
+        key = cache.key(symbol, timeframe, (df, htf_df), self.config_hash())
+        gates = cache.get(key)
+        if gates is not None:
+            return gates, True
+        gates = self._run_data_gates(symbol, df, htf_df, timeframe, current_price)
+        cache.put(key, gates)
+        return gates, False
+
+    def _run_data_gates(
+        self,
+        symbol: str,
+        df: pd.DataFrame,
+        htf_df: Optional[pd.DataFrame],
+        timeframe: str,
+        current_price: float,
+    ) -> Dict[str, Any]:
+        """
+        Gates that depend only on the candles and engine settings.
+
+        Stops at the first rejecting gate; "rejection" holds its reason.
+        """
+        gates: Dict[str, Any] = {
+            "trace": [],
+            "rejection": None,
+            "liquidity_levels": [],
+            "pd_arrays": [],
+        }
+
+        # ---------------------------------------------------------------------
+        # GATE 3: BIAS DETERMINATION
+        # ---------------------------------------------------------------------
+        bias = self._determine_bias(df, htf_df)
+        gates["bias"] = bias
+
+        gates["trace"].append(
+            GateLog(
+                gate="G3_BIAS",
+                passed=bias != Bias.NEUTRAL,
+                summary=f"{bias.value}"
+                if bias != Bias.NEUTRAL
+                else "Neutral — no clear structure",
+                details={"bias": bias.value, "price": current_price},
+            )
+        )
+
+        if bias == Bias.NEUTRAL:
+            gates["rejection"] = "No clear bias - structure is neutral"
+            return gates
+
+        # ---------------------------------------------------------------------
+        # GATE 4: LIQUIDITY MAPPING (IRL vs ERL)
+        # ---------------------------------------------------------------------
+        liquidity_levels = self._map_liquidity(df, symbol)
+        erl_levels = [l for l in liquidity_levels if l.external]
+        irl_levels = [l for l in liquidity_levels if not l.external]
+        gates.update(
+            liquidity_levels=liquidity_levels,
+            erl_levels=erl_levels,
+            irl_levels=irl_levels,
+        )
+
+        gates["trace"].append(
+            GateLog(
+                gate="G4_LIQUIDITY",
+                passed=len(erl_levels) > 0,
+                summary=f"{len(erl_levels)} ERL + {len(irl_levels)} IRL = {len(liquidity_levels)} total",
+                details={
+                    "total": len(liquidity_levels),
+                    "erl_count": len(erl_levels),
+                    "irl_count": len(irl_levels),
+                    "erl_types": {l.source: round(l.price, 5) for l in erl_levels[:8]},
+                    "irl_types": {l.source: round(l.price, 5) for l in irl_levels[:8]},
+                },
+            )
+        )
+
+        if not erl_levels:
+            gates["rejection"] = "No external liquidity target identified"
+            return gates
+
+        # ---------------------------------------------------------------------
+        # GATE 5: SWEEP DETECTION
+        # ---------------------------------------------------------------------
+        sweep_info = self._check_liquidity_sweep(df, liquidity_levels)
+        gates["sweep_info"] = sweep_info
+
+        gates["trace"].append(
+            GateLog(
+                gate="G5_SWEEP",
+                passed=True,  # informational — sweep is not required
+                summary=f"Sweep {sweep_info['direction']} @ {sweep_info['level'].price:.5f} ({sweep_info['candles_ago']} bars ago)"
+                if sweep_info.get("occurred")
+                else "No recent sweep",
+                details=sweep_info
+                if not sweep_info.get("occurred")
+                else {
+                    "occurred": True,
+                    "direction": sweep_info["direction"],
+                    "price": round(sweep_info["level"].price, 5),
+                    "source": sweep_info["level"].source,
+                    "candles_ago": sweep_info["candles_ago"],
+                },
+            )
+        )
+
+        # ---------------------------------------------------------------------
+        # GATE 6: PD ARRAY ENTRY ZONES
+        # ---------------------------------------------------------------------
+        pd_arrays = self._find_pd_arrays(df, bias, timeframe)
+        valid_entries = [p for p in pd_arrays if p.valid and not p.mitigated]
+        gates.update(pd_arrays=pd_arrays, valid_entries=valid_entries)
+
+        gates["trace"].append(
+            GateLog(
+                gate="G6_PD_ARRAYS",
+                passed=len(valid_entries) > 0,
+                summary=f"{len(valid_entries)} valid entries ({len(pd_arrays)} total)"
+                if valid_entries
+                else f"0 valid ({len(pd_arrays)} found, all mitigated/invalid)",
+                details={
+                    "total_found": len(pd_arrays),
+                    "valid_count": len(valid_entries),
+                    "entries": [
+                        {
+                            "type": p.type,
+                            "dir": p.direction,
+                            "top": round(p.top, 5),
+                            "bot": round(p.bottom, 5),
+                            "ote": round(p.ote_level, 5),
+                            "mitigated": p.mitigated,
+                        }
+                        for p in pd_arrays[:6]
+                    ],
+                },
+            )
+        )
+
+        if not valid_entries:
+            gates["rejection"] = "No valid PD array entry zones"
+            return gates
+
+        # ---------------------------------------------------------------------
+        # GATE 7: TRADE CLASSIFICATION (Type A or B)
+        # ---------------------------------------------------------------------
+        trade_type, target_liquidity = self._classify_trade(
+            current_price, bias, sweep_info, erl_levels, irl_levels
+        )
+        gates.update(trade_type=trade_type, target_liquidity=target_liquidity)
+
+        gates["trace"].append(
+            GateLog(
+                gate="G7_CLASSIFY",
+                passed=True,
+                summary=f"{trade_type.value} → target {target_liquidity.source} @ {target_liquidity.price:.5f}",
+                details={
+                    "trade_type": trade_type.value,
+                    "target_price": round(target_liquidity.price, 5),
+                    "target_source": target_liquidity.source,
+                    "target_type": target_liquidity.type,
+                },
+            )
+        )
+
+        # ---------------------------------------------------------------------
+        # GATE 7b: DISPLACEMENT CHECK
+        # ---------------------------------------------------------------------
+        displacement_detected = False
+        try:
+            disp_result = self.displacement_detector.detect(df)
+            if disp_result is not None and not disp_result.empty:
+                # Check last few candles for displacement
+                recent = disp_result.tail(5)
+                if "displacement" in recent.columns:
+                    displacement_detected = bool(recent["displacement"].any())
+                elif len(recent) > 0:
+                    displacement_detected = True
+        except Exception:
+            pass  # detector may fail on insufficient data
+
+        gates["trace"].append(
+            GateLog(
+                gate="G7b_DISPLACEMENT",
+                passed=True,  # informational
+                summary="Displacement confirmed"
+                if displacement_detected
+                else "No displacement",
+                details={"detected": displacement_detected},
+            )
         )
+        gates["displacement_detected"] = displacement_detected
+        return gates
 
     # =========================================================================
     # GATE METHODS
@@ -1,6 +1,18 @@
 """VEX Dashboard module — HTML reports + live terminal UI."""
 
-from .dashboard import PerformanceDashboard
-from .live_dashboard import VexLiveDashboard
+from typing import TYPE_CHECKING
+
+from ict_agent._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .dashboard import PerformanceDashboard
+    from .live_dashboard import VexLiveDashboard
 
 __all__ = ["PerformanceDashboard", "VexLiveDashboard"]
+
+_EXPORTS = {
+    "PerformanceDashboard": "ict_agent.dashboard.dashboard",
+    "VexLiveDashboard": "ict_agent.dashboard.live_dashboard",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -9,12 +9,12 @@ Generates:
 - Psychology insights
 """
 
+import heapq
 import json
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
-from collections import defaultdict
 import webbrowser
 
 # Project paths
@@ -26,17 +26,27 @@ JOURNAL_DIR = PROJECT_ROOT / "journal" / "ashton"
 DASHBOARD_DIR = PROJECT_ROOT / "hub"
 TRADES_DB = JOURNAL_DIR / "trades_database.json"
 
+from ict_agent.dashboard.stats_store import DashboardStatsStore, digest
+
 
 class PerformanceDashboard:
     """
     Generates an HTML performance dashboard.
     """
     
-    def __init__(self):
-        self.trades = self._load_trades()
+    def __init__(self, stats_store: Optional[DashboardStatsStore] = None):
+        self._trades = None
+        self.stats_store = stats_store or DashboardStatsStore(trades_db=TRADES_DB)
         self.profile = self._load_json("trading_profile.json")
         self.milestones = self._load_json("milestones.json")
     
+    @property
+    def trades(self) -> List[Dict]:
+        """Trades from the database, read on first use."""
+        if self._trades is None:
+            self._trades = self._load_trades()
+        return self._trades
+    
     def _load_trades(self) -> List[Dict]:
         """Load trades from database."""
         if TRADES_DB.exists():
@@ -54,198 +64,302 @@ class PerformanceDashboard:
         return {}
     
     def calculate_stats(self) -> Dict:
-        """Calculate all performance statistics."""
-        stats = {
-            "total_trades": 0,
-            "wins": 0,
-            "losses": 0,
-            "breakeven": 0,
-            "win_rate": 0,
-            "total_pnl": 0,
-            "avg_win": 0,
-            "avg_loss": 0,
-            "profit_factor": 0,
-            "largest_win": 0,
-            "largest_loss": 0,
-            "avg_rr": 0,
-            "expectancy": 0,
-            "by_pair": {},
-            "by_session": {},
-            "by_day": {},
-            "by_setup": {},
-            "equity_curve": [],
-            "calendar": {},
-            "streaks": {"current_win": 0, "current_loss": 0, "max_win": 0, "max_loss": 0}
-        }
-        
-        if not self.trades:
-            return stats
-        
-        # Filter closed trades
-        closed_trades = [t for t in self.trades if t.get("status") == "closed"]
-        
-        if not closed_trades:
-            return stats
-        
-        wins = []
-        losses = []
-        equity = 10000  # Starting balance
-        equity_curve = [(0, equity)]
-        
-        # Group by categories
-        by_pair = defaultdict(lambda: {"wins": 0, "losses": 0, "pnl": 0})
-        by_session = defaultdict(lambda: {"wins": 0, "losses": 0, "pnl": 0})
-        by_day = defaultdict(lambda: {"wins": 0, "losses": 0, "pnl": 0})
-        by_setup = defaultdict(lambda: {"wins": 0, "losses": 0, "pnl": 0})
-        calendar = defaultdict(lambda: {"trades": 0, "pnl": 0, "result": "neutral"})
-        
-        # Streak tracking
-        current_streak = 0
-        max_win_streak = 0
-        max_loss_streak = 0
-        
-        for i, trade in enumerate(closed_trades):
-            pre_trade = trade.get("pre_trade", {})
-            result = trade.get("result", "")
-            pnl = trade.get("pnl_dollars", 0)
-            pair = pre_trade.get("pair", "UNKNOWN")
-            session = pre_trade.get("killzone", "UNKNOWN")
-            setup_grade = pre_trade.get("setup_grade", "UNKNOWN")
-            
-            # Get date and day of week
-            created = trade.get("created_at", "")
-            if created:
-                try:
-                    dt = datetime.fromisoformat(created.replace("Z", "+00:00"))
-                    day_name = dt.strftime("%A")
-                    date_str = dt.strftime("%Y-%m-%d")
-                except:
-                    day_name = "UNKNOWN"
-                    date_str = "UNKNOWN"
-            else:
-                day_name = "UNKNOWN"
-                date_str = "UNKNOWN"
+        """
+        Calculate all performance statistics.
+
+        Served from the running aggregates in DashboardStatsStore: the trade
+        database is only read when it changed since the last sync, and only
+        trades not counted yet are processed.
+        """
+        if not self.stats_store.is_current():
+            self.stats_store.sync(self.trades)
+        return self.stats_store.stats()
+    
+    def generate_html(self, stats: Dict) -> str:
+        """
+        Generate HTML dashboard.
+
+        Each section is cached in the stats store under a key derived from
+        its inputs and only re-rendered when that key changes.
+        """
+        store = self.stats_store
+        
+        # Generate equity curve data for chart
+        equity_data = stats.get("equity_curve", [(0, 10000)])
+        equity_key = [store.revision, len(equity_data), list(equity_data[-1]) if equity_data else None]
+        equity_labels = store.section(
+            "equity_labels", equity_key, lambda: str([str(e[0]) for e in equity_data])
+        )
+        equity_values = store.section(
+            "equity_values", equity_key, lambda: str([e[1] for e in equity_data])
+        )
+        
+        # Generate calendar data (only the current month is shown)
+        calendar = stats.get("calendar", {})
+        month = datetime.now().strftime("%Y-%m")
+        month_days = {k: v for k, v in calendar.items() if k.startswith(month)}
+        calendar_html = store.section(
+            "calendar", digest([month, bool(calendar), month_days]),
+            lambda: self._generate_calendar_html(calendar),
+        )
+        
+        # Generate category tables
+        category_rows = {}
+        for category in ("by_pair", "by_session", "by_day", "by_setup"):
+            data = stats.get(category, {})
+            category_rows[category] = store.section(
+                category, digest(data), lambda: self._generate_category_rows(data)
+            )
+        
+        # Generate recent insights (keyed by the database it was read from)
+        signature = store.db_signature()
+        if signature is None:
+            recent_insights_rows = self._generate_insights_rows(self.trades)
+        else:
+            recent_insights_rows = store.section(
+                "insights", signature, lambda: self._generate_insights_rows(self.trades)
+            )
+        
+        milestones_html = store.section(
+            "milestones", digest(self.milestones), self._generate_milestones_html
+        )
+        store.flush()
+        
+        return HTML_TEMPLATE.format(
+            updated=datetime.now().strftime('%B %d, %Y at %I:%M %p'),
+            stats=stats,
+            pnl_class='positive' if stats['total_pnl'] >= 0 else 'negative',
+            pf_class=(
+                'positive' if stats['profit_factor'] >= 1.5
+                else 'negative' if stats['profit_factor'] < 1 else 'neutral'
+            ),
+            expectancy_class='positive' if stats['expectancy'] > 0 else 'negative',
+            pair_rows=category_rows["by_pair"],
+            session_rows=category_rows["by_session"],
+            day_rows=category_rows["by_day"],
+            setup_rows=category_rows["by_setup"],
+            calendar_html=calendar_html,
+            recent_insights_rows=recent_insights_rows,
+            milestones_html=milestones_html,
+            equity_labels=equity_labels,
+            equity_values=equity_values,
+        )
+    
+    def _generate_category_rows(self, data: Dict) -> str:
+        """Generate table rows for category data."""
+        rows = []
+        
+        # Sort by win rate
+        sorted_data = sorted(data.items(), key=lambda x: x[1].get("win_rate", 0), reverse=True)
+        
+        for name, stats in sorted_data:
+            if name == "UNKNOWN" or not name:
+                continue
+                
+            win_rate = stats.get("win_rate", 0)
+            wins = stats.get("wins", 0)
+            losses = stats.get("losses", 0)
+            pnl = stats.get("pnl", 0)
             
-            # Update totals
-            stats["total_trades"] += 1
-            stats["total_pnl"] += pnl
-            equity += pnl
-            equity_curve.append((i + 1, equity))
+            wr_class = "high" if win_rate >= 60 else "medium" if win_rate >= 50 else "low"
+            pnl_class = "positive" if pnl >= 0 else "negative"
             
-            # Update calendar
-            calendar[date_str]["trades"] += 1
-            calendar[date_str]["pnl"] += pnl
+            rows.append(f'''<tr>
+                <td>{name}</td>
+                <td class="win-rate {wr_class}">{win_rate}%</td>
+                <td>{wins}/{losses}</td>
+                <td class="pnl {pnl_class}">${pnl:,.2f}</td>
+            </tr>''')
+        
+        return "\n".join(rows) if rows else "<tr><td colspan='4'>No data yet</td></tr>"
+    
+    def _generate_insights_rows(self, trades: List[Dict]) -> str:
+        """Generate rows for recent AI insights."""
+        if not trades:
+            return "<tr><td colspan='4'>No trades recorded yet.</td></tr>"
             
-            if result == "WIN":
-                stats["wins"] += 1
-                wins.append(pnl)
-                by_pair[pair]["wins"] += 1
-                by_session[session]["wins"] += 1
-                by_day[day_name]["wins"] += 1
-                by_setup[setup_grade]["wins"] += 1
-                calendar[date_str]["result"] = "win" if calendar[date_str]["pnl"] > 0 else "loss"
+        # Most recent first
+        recent = heapq.nlargest(5, trades, key=lambda x: x.get("created_at", ""))
+        
+        rows = []
+        for trade in recent:
+            # Extract basic info
+            created = trade.get("created_at", "")
+            try:
+                dt = datetime.fromisoformat(created.replace("Z", "+00:00"))
+                date_str = dt.strftime("%Y-%m-%d %H:%M")
+            except:
+                date_str = "Unknown"
                 
-                # Streak
-                if current_streak >= 0:
-                    current_streak += 1
-                else:
-                    current_streak = 1
-                max_win_streak = max(max_win_streak, current_streak)
+            pair = trade.get("pre_trade", {}).get("pair", "UNKNOWN")
+            result = trade.get("result", "OPEN")
+            
+            # Extract AI reasoning
+            # Check various locations for reasoning data
+            confluences = trade.get("confluences", [])
+            if not confluences and "pre_trade" in trade:
+                confluences = trade["pre_trade"].get("confluences", [])
                 
+            # Formatting result
+            res_class = "neutral"
+            if result == "WIN":
+                res_class = "positive"
             elif result == "LOSS":
-                stats["losses"] += 1
-                losses.append(pnl)
-                by_pair[pair]["losses"] += 1
-                by_session[session]["losses"] += 1
-                by_day[day_name]["losses"] += 1
-                by_setup[setup_grade]["losses"] += 1
-                calendar[date_str]["result"] = "loss" if calendar[date_str]["pnl"] < 0 else "win"
-                
-                # Streak
-                if current_streak <= 0:
-                    current_streak -= 1
-                else:
-                    current_streak = -1
-                max_loss_streak = max(max_loss_streak, abs(current_streak))
+                res_class = "negative"
                 
+            # Format confluences
+            if confluences:
+                reasoning_html = "<ul style='padding-left: 20px; font-size: 0.9rem; color: #ccc;'>"
+                for c in confluences[:3]: # Show top 3
+                    reasoning_html += f"<li>{c}</li>"
+                if len(confluences) > 3:
+                     reasoning_html += f"<li>... and {len(confluences)-3} more</li>"
+                reasoning_html += "</ul>"
             else:
-                stats["breakeven"] += 1
+                reasoning_html = "<i>No reasoning logged</i>"
+
+            rows.append(f'''<tr>
+                <td style="white-space: nowrap;">{date_str}</td>
+                <td>{pair}</td>
+                <td class="pnl {res_class}">{result}</td>
+                <td>{reasoning_html}</td>
+            </tr>''')
             
-            # Update category PnL
-            by_pair[pair]["pnl"] += pnl
-            by_session[session]["pnl"] += pnl
-            by_day[day_name]["pnl"] += pnl
-            by_setup[setup_grade]["pnl"] += pnl
-        
-        # Calculate derived stats
-        total_decided = stats["wins"] + stats["losses"]
-        if total_decided > 0:
-            stats["win_rate"] = round(stats["wins"] / total_decided * 100, 1)
-        
-        if wins:
-            stats["avg_win"] = round(sum(wins) / len(wins), 2)
-            stats["largest_win"] = round(max(wins), 2)
-        
-        if losses:
-            stats["avg_loss"] = round(sum(losses) / len(losses), 2)
-            stats["largest_loss"] = round(min(losses), 2)
-        
-        # Profit factor
-        gross_profit = sum(wins) if wins else 0
-        gross_loss = abs(sum(losses)) if losses else 0
-        if gross_loss > 0:
-            stats["profit_factor"] = round(gross_profit / gross_loss, 2)
-        
-        # Expectancy
-        if total_decided > 0:
-            win_rate = stats["wins"] / total_decided
-            avg_win = stats["avg_win"] if wins else 0
-            avg_loss = abs(stats["avg_loss"]) if losses else 0
-            stats["expectancy"] = round((win_rate * avg_win) - ((1 - win_rate) * avg_loss), 2)
-        
-        # Calculate win rates by category
-        def calc_win_rate(d):
-            total = d["wins"] + d["losses"]
-            return round(d["wins"] / total * 100, 1) if total > 0 else 0
-        
-        stats["by_pair"] = {k: {**v, "win_rate": calc_win_rate(v)} for k, v in by_pair.items()}
-        stats["by_session"] = {k: {**v, "win_rate": calc_win_rate(v)} for k, v in by_session.items()}
-        stats["by_day"] = {k: {**v, "win_rate": calc_win_rate(v)} for k, v in by_day.items()}
-        stats["by_setup"] = {k: {**v, "win_rate": calc_win_rate(v)} for k, v in by_setup.items()}
-        stats["equity_curve"] = equity_curve
-        stats["calendar"] = dict(calendar)
-        stats["streaks"] = {
-            "current_win": current_streak if current_streak > 0 else 0,
-            "current_loss": abs(current_streak) if current_streak < 0 else 0,
-            "max_win": max_win_streak,
-            "max_loss": max_loss_streak
-        }
-        stats["total_pnl"] = round(stats["total_pnl"], 2)
-        
-        return stats
+        return "\n".join(rows)
+
     
-    def generate_html(self, stats: Dict) -> str:
-        """Generate HTML dashboard."""
+    def _generate_calendar_html(self, calendar: Dict) -> str:
+        """Generate calendar heatmap HTML."""
+        if not calendar:
+            return "<p>No trading data yet</p>"
         
-        # Generate equity curve data for chart
-        equity_data = stats.get("equity_curve", [(0, 10000)])
-        equity_labels = [str(e[0]) for e in equity_data]
-        equity_values = [e[1] for e in equity_data]
+        # Get current month
+        now = datetime.now()
+        first_day = now.replace(day=1)
         
-        # Generate calendar data
-        calendar = stats.get("calendar", {})
-        calendar_html = self._generate_calendar_html(calendar)
+        # Days of week header
+        days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+        html = '<div class="calendar">'
         
-        # Generate category tables
-        pair_rows = self._generate_category_rows(stats.get("by_pair", {}))
-        session_rows = self._generate_category_rows(stats.get("by_session", {}))
-        day_rows = self._generate_category_rows(stats.get("by_day", {}))
-        setup_rows = self._generate_category_rows(stats.get("by_setup", {}))
+        for day in days:
+            html += f'<div class="calendar-day calendar-header">{day}</div>'
         
-        # Generate recent insights
-        recent_insights_rows = self._generate_insights_rows(self.trades)
+        # Add empty cells for days before first of month
+        first_weekday = first_day.weekday()
+        for _ in range(first_weekday):
+            html += '<div class="calendar-day"></div>'
+        
+        # Add days of month
+        days_in_month = 31  # Simplified
+        for day in range(1, days_in_month + 1):
+            try:
+                date_str = now.replace(day=day).strftime("%Y-%m-%d")
+                day_data = calendar.get(date_str, {})
+                result = day_data.get("result", "neutral")
+                pnl = day_data.get("pnl", 0)
+                trades = day_data.get("trades", 0)
+                
+                if result == "win":
+                    day_class = "win"
+                elif result == "loss":
+                    day_class = "loss"
+                else:
+                    day_class = "neutral"
+                
+                title = f"{trades} trades, ${pnl:.2f}" if trades > 0 else "No trades"
+                html += f'<div class="calendar-day {day_class}" title="{title}">{day}</div>'
+            except:
+                break
+        
+        html += '</div>'
+        return html
+    
+    def _generate_milestones_html(self) -> str:
+        """Generate milestones list HTML."""
+        achieved = self.milestones.get("achieved", [])
+        in_progress = self.milestones.get("in_progress", [])
+        
+        html = []
+        
+        for m in achieved[-5:]:
+            html.append(f'''<li>
+                <span class="badge achieved">✓</span>
+                {m.get('milestone', 'Unknown')} - {m.get('date', '')}
+            </li>''')
+        
+        for m in in_progress[:3]:
+            progress = m.get("progress", 0)
+            target = m.get("target", 1)
+            pct = int(progress / target * 100) if target > 0 else 0
+            html.append(f'''<li>
+                <span class="badge progress">{pct}%</span>
+                {m.get('milestone', 'Unknown')}
+            </li>''')
+        
+        return "\n".join(html) if html else "<li>No milestones yet</li>"
+    
+    def generate_and_open(self) -> str:
+        """Generate dashboard and open in browser."""
+        print("\n  📊 Calculating statistics...")
+        stats = self.calculate_stats()
+        
+        print("  🎨 Generating dashboard...")
+        html = self.generate_html(stats)
+        
+        # Save to file
+        DASHBOARD_DIR.mkdir(parents=True, exist_ok=True)
+        filepath = DASHBOARD_DIR / "dashboard.html"
+        
+        with open(filepath, "w") as f:
+            f.write(html)
+        
+        print(f"  ✅ Dashboard saved: {filepath}")
+        
+        # Open in browser
+        print("  🌐 Opening in browser...")
+        webbrowser.open(f"file://{filepath}")
+        
+        return str(filepath)
+    
+    def print_summary(self):
+        """Print quick stats summary to terminal."""
+        stats = self.calculate_stats()
+        
+        print("\n" + "═" * 60)
+        print("  PERFORMANCE SUMMARY")
+        print("═" * 60)
+        
+        print(f"\n  📊 OVERALL:")
+        print(f"     Total Trades: {stats['total_trades']}")
+        print(f"     Win Rate: {stats['win_rate']}%")
+        print(f"     Total P&L: ${stats['total_pnl']:,.2f}")
+        print(f"     Profit Factor: {stats['profit_factor']}")
+        print(f"     Expectancy: ${stats['expectancy']} per trade")
+        
+        print(f"\n  💰 WINS & LOSSES:")
+        print(f"     Wins: {stats['wins']} | Losses: {stats['losses']} | BE: {stats['breakeven']}")
+        print(f"     Avg Win: ${stats['avg_win']} | Avg Loss: ${stats['avg_loss']}")
+        print(f"     Largest Win: ${stats['largest_win']} | Largest Loss: ${stats['largest_loss']}")
         
-        html = f'''<!DOCTYPE html>
+        print(f"\n  🔥 STREAKS:")
+        print(f"     Current: {'🟢 ' + str(stats['streaks']['current_win']) + ' wins' if stats['streaks']['current_win'] > 0 else '🔴 ' + str(stats['streaks']['current_loss']) + ' losses'}")
+        print(f"     Max Win Streak: {stats['streaks']['max_win']}")
+        print(f"     Max Loss Streak: {stats['streaks']['max_loss']}")
+        
+        # Best performers
+        if stats['by_pair']:
+            best_pair = max(stats['by_pair'].items(), key=lambda x: x[1].get('win_rate', 0))
+            print(f"\n  🏆 BEST PAIR: {best_pair[0]} ({best_pair[1]['win_rate']}% win rate)")
+        
+        if stats['by_session']:
+            best_session = max(stats['by_session'].items(), key=lambda x: x[1].get('win_rate', 0))
+            print(f"  🏆 BEST SESSION: {best_session[0]} ({best_session[1]['win_rate']}% win rate)")
+        
+        print("\n" + "═" * 60)
+
+
+# Page shell; sections are filled in by PerformanceDashboard.generate_html
+HTML_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -438,41 +552,41 @@ class PerformanceDashboard:
     <div class="dashboard">
         <div class="header">
             <h1>📊 VEX Performance Dashboard</h1>
-            <p class="subtitle">Last updated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}</p>
+            <p class="subtitle">Last updated: {updated}</p>
         </div>
         
         <!-- Key Stats -->
         <div class="stats-grid">
-            <div class="stat-card {'positive' if stats['total_pnl'] >= 0 else 'negative'}">
-                <div class="value">${stats['total_pnl']:,.2f}</div>
+            <div class="stat-card {pnl_class}">
+                <div class="value">${stats[total_pnl]:,.2f}</div>
                 <div class="label">Total P&L</div>
             </div>
             <div class="stat-card neutral">
-                <div class="value">{stats['win_rate']}%</div>
+                <div class="value">{stats[win_rate]}%</div>
                 <div class="label">Win Rate</div>
             </div>
             <div class="stat-card neutral">
-                <div class="value">{stats['total_trades']}</div>
+                <div class="value">{stats[total_trades]}</div>
                 <div class="label">Total Trades</div>
             </div>
-            <div class="stat-card {'positive' if stats['profit_factor'] >= 1.5 else 'negative' if stats['profit_factor'] < 1 else 'neutral'}">
-                <div class="value">{stats['profit_factor']}</div>
+            <div class="stat-card {pf_class}">
+                <div class="value">{stats[profit_factor]}</div>
                 <div class="label">Profit Factor</div>
             </div>
             <div class="stat-card positive">
-                <div class="value">${stats['avg_win']}</div>
+                <div class="value">${stats[avg_win]}</div>
                 <div class="label">Avg Win</div>
             </div>
             <div class="stat-card negative">
-                <div class="value">${stats['avg_loss']}</div>
+                <div class="value">${stats[avg_loss]}</div>
                 <div class="label">Avg Loss</div>
             </div>
-            <div class="stat-card {'positive' if stats['expectancy'] > 0 else 'negative'}">
-                <div class="value">${stats['expectancy']}</div>
+            <div class="stat-card {expectancy_class}">
+                <div class="value">${stats[expectancy]}</div>
                 <div class="label">Expectancy</div>
             </div>
             <div class="stat-card neutral">
-                <div class="value">{stats['wins']}/{stats['losses']}</div>
+                <div class="value">{stats[wins]}/{stats[losses]}</div>
                 <div class="label">Wins/Losses</div>
             </div>
         </div>
@@ -541,19 +655,19 @@ class PerformanceDashboard:
                 <h2>🔥 Streaks</h2>
                 <div class="stats-grid" style="margin-bottom: 0;">
                     <div class="stat-card positive">
-                        <div class="value">{stats['streaks']['current_win']}</div>
+                        <div class="value">{stats[streaks][current_win]}</div>
                         <div class="label">Current Win Streak</div>
                     </div>
                     <div class="stat-card negative">
-                        <div class="value">{stats['streaks']['current_loss']}</div>
+                        <div class="value">{stats[streaks][current_loss]}</div>
                         <div class="label">Current Loss Streak</div>
                     </div>
                     <div class="stat-card positive">
-                        <div class="value">{stats['streaks']['max_win']}</div>
+                        <div class="value">{stats[streaks][max_win]}</div>
                         <div class="label">Max Win Streak</div>
                     </div>
                     <div class="stat-card negative">
-                        <div class="value">{stats['streaks']['max_loss']}</div>
+                        <div class="value">{stats[streaks][max_loss]}</div>
                         <div class="label">Max Loss Streak</div>
                     </div>
                 </div>
@@ -562,7 +676,7 @@ class PerformanceDashboard:
             <div class="section">
                 <h2>🏆 Milestones</h2>
                 <ul class="milestones">
-                    {self._generate_milestones_html()}
+                    {milestones_html}
                 </ul>
             </div>
         </div>
@@ -613,221 +727,6 @@ class PerformanceDashboard:
     </script>
 </body>
 </html>'''
-        
-        return html
-    
-    def _generate_category_rows(self, data: Dict) -> str:
-        """Generate table rows for category data."""
-        rows = []
-        
-        # Sort by win rate
-        sorted_data = sorted(data.items(), key=lambda x: x[1].get("win_rate", 0), reverse=True)
-        
-        for name, stats in sorted_data:
-            if name == "UNKNOWN" or not name:
-                continue
-                
-            win_rate = stats.get("win_rate", 0)
-            wins = stats.get("wins", 0)
-            losses = stats.get("losses", 0)
-            pnl = stats.get("pnl", 0)
-            
-            wr_class = "high" if win_rate >= 60 else "medium" if win_rate >= 50 else "low"
-            pnl_class = "positive" if pnl >= 0 else "negative"
-            
-            rows.append(f'''<tr>
-                <td>{name}</td>
-                <td class="win-rate {wr_class}">{win_rate}%</td>
-                <td>{wins}/{losses}</td>
-                <td class="pnl {pnl_class}">${pnl:,.2f}</td>
-            </tr>''')
-        
-        return "\n".join(rows) if rows else "<tr><td colspan='4'>No data yet</td></tr>"
-    
-    def _generate_insights_rows(self, trades: List[Dict]) -> str:
-        """Generate rows for recent AI insights."""
-        if not trades:
-            return "<tr><td colspan='4'>No trades recorded yet.</td></tr>"
-            
-        # Sort by date descending
-        sorted_trades = sorted(trades, key=lambda x: x.get("created_at", ""), reverse=True)
-        recent = sorted_trades[:5]
-        
-        rows = []
-        for trade in recent:
-            # Extract basic info
-            created = trade.get("created_at", "")
-            try:
-                dt = datetime.fromisoformat(created.replace("Z", "+00:00"))
-                date_str = dt.strftime("%Y-%m-%d %H:%M")
-            except:
-                date_str = "Unknown"
-                
-            pair = trade.get("pre_trade", {}).get("pair", "UNKNOWN")
-            result = trade.get("result", "OPEN")
-            
-            # Extract AI reasoning
-            # Check various locations for reasoning data
-            confluences = trade.get("confluences", [])
-            if not confluences and "pre_trade" in trade:
-                confluences = trade["pre_trade"].get("confluences", [])
-                
-            # Formatting result
-            res_class = "neutral"
-            if result == "WIN":
-                res_class = "positive"
-            elif result == "LOSS":
-                res_class = "negative"
-                
-            # Format confluences
-            if confluences:
-                reasoning_html = "<ul style='padding-left: 20px; font-size: 0.9rem; color: #ccc;'>"
-                for c in confluences[:3]: # Show top 3
-                    reasoning_html += f"<li>{c}</li>"
-                if len(confluences) > 3:
-                     reasoning_html += f"<li>... and {len(confluences)-3} more</li>"
-                reasoning_html += "</ul>"
-            else:
-                reasoning_html = "<i>No reasoning logged</i>"
-
-            rows.append(f'''<tr>
-                <td style="white-space: nowrap;">{date_str}</td>
-                <td>{pair}</td>
-                <td class="pnl {res_class}">{result}</td>
-                <td>{reasoning_html}</td>
-            </tr>''')
-            
-        return "\n".join(rows)
-
-    
-    def _generate_calendar_html(self, calendar: Dict) -> str:
-        """Generate calendar heatmap HTML."""
-        if not calendar:
-            return "<p>No trading data yet</p>"
-        
-        # Get current month
-        now = datetime.now()
-        first_day = now.replace(day=1)
-        
-        # Days of week header
-        days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-        html = '<div class="calendar">'
-        
-        for day in days:
-            html += f'<div class="calendar-day calendar-header">{day}</div>'
-        
-        # Add empty cells for days before first of month
-        first_weekday = first_day.weekday()
-        for _ in range(first_weekday):
-            html += '<div class="calendar-day"></div>'
-        
-        # Add days of month
-        days_in_month = 31  # Simplified
-        for day in range(1, days_in_month + 1):
-            try:
-                date_str = now.replace(day=day).strftime("%Y-%m-%d")
-                day_data = calendar.get(date_str, {})
-                result = day_data.get("result", "neutral")
-                pnl = day_data.get("pnl", 0)
-                trades = day_data.get("trades", 0)
-                
-                if result == "win":
-                    day_class = "win"
-                elif result == "loss":
-                    day_class = "loss"
-                else:
-                    day_class = "neutral"
-                
-                title = f"{trades} trades, ${pnl:.2f}" if trades > 0 else "No trades"
-                html += f'<div class="calendar-day {day_class}" title="{title}">{day}</div>'
-            except:
-                break
-        
-        html += '</div>'
-        return html
-    
-    def _generate_milestones_html(self) -> str:
-        """Generate milestones list HTML."""
-        achieved = self.milestones.get("achieved", [])
-        in_progress = self.milestones.get("in_progress", [])
-        
-        html = []
-        
-        for m in achieved[-5:]:
-            html.append(f'''<li>
-                <span class="badge achieved">✓</span>
-                {m.get('milestone', 'Unknown')} - {m.get('date', '')}
-            </li>''')
-        
-        for m in in_progress[:3]:
-            progress = m.get("progress", 0)
-            target = m.get("target", 1)
-            pct = int(progress / target * 100) if target > 0 else 0
-            html.append(f'''<li>
-                <span class="badge progress">{pct}%</span>
-                {m.get('milestone', 'Unknown')}
-            </li>''')
-        
-        return "\n".join(html) if html else "<li>No milestones yet</li>"
-    
-    def generate_and_open(self) -> str:
-        """Generate dashboard and open in browser."""
-        print("\n  📊 Calculating statistics...")
-        stats = self.calculate_stats()
-        
-        print("  🎨 Generating dashboard...")
-        html = self.generate_html(stats)
-        
-        # Save to file
-        DASHBOARD_DIR.mkdir(parents=True, exist_ok=True)
-        filepath = DASHBOARD_DIR / "dashboard.html"
-        
-        with open(filepath, "w") as f:
-            f.write(html)
-        
-        print(f"  ✅ Dashboard saved: {filepath}")
-        
-        # Open in browser
-        print("  🌐 Opening in browser...")
-        webbrowser.open(f"file://{filepath}")
-        
-        return str(filepath)
-    
-    def print_summary(self):
-        """Print quick stats summary to terminal."""
-        stats = self.calculate_stats()
-        
-        print("\n" + "═" * 60)
-        print("  PERFORMANCE SUMMARY")
-        print("═" * 60)
-        
-        print(f"\n  📊 OVERALL:")
-        print(f"     Total Trades: {stats['total_trades']}")
-        print(f"     Win Rate: {stats['win_rate']}%")
-        print(f"     Total P&L: ${stats['total_pnl']:,.2f}")
-        print(f"     Profit Factor: {stats['profit_factor']}")
-        print(f"     Expectancy: ${stats['expectancy']} per trade")
-        
-        print(f"\n  💰 WINS & LOSSES:")
-        print(f"     Wins: {stats['wins']} | Losses: {stats['losses']} | BE: {stats['breakeven']}")
-        print(f"     Avg Win: ${stats['avg_win']} | Avg Loss: ${stats['avg_loss']}")
-        print(f"     Largest Win: ${stats['largest_win']} | Largest Loss: ${stats['largest_loss']}")
-        
-        print(f"\n  🔥 STREAKS:")
-        print(f"     Current: {'🟢 ' + str(stats['streaks']['current_win']) + ' wins' if stats['streaks']['current_win'] > 0 else '🔴 ' + str(stats['streaks']['current_loss']) + ' losses'}")
-        print(f"     Max Win Streak: {stats['streaks']['max_win']}")
-        print(f"     Max Loss Streak: {stats['streaks']['max_loss']}")
-        
-        # Best performers
-        if stats['by_pair']:
-            best_pair = max(stats['by_pair'].items(), key=lambda x: x[1].get('win_rate', 0))
-            print(f"\n  🏆 BEST PAIR: {best_pair[0]} ({best_pair[1]['win_rate']}% win rate)")
-        
-        if stats['by_session']:
-            best_session = max(stats['by_session'].items(), key=lambda x: x[1].get('win_rate', 0))
-            print(f"  🏆 BEST SESSION: {best_session[0]} ({best_session[1]['win_rate']}% win rate)")
-        
-        print("\n" + "═" * 60)
 
 
 def main():
@@ -17,15 +17,22 @@ Usage:
     # OR
     with dashboard.live():               # auto-refreshing live mode
         controller.run(...)
+
+Live mode redraws from a background thread at most max_fps times per
+second and rebuilds only panels whose data changed. Pass on_frame to get
+a FrameStats (panels rebuilt, build/render ms) for every frame:
+    dashboard = VexLiveDashboard(max_fps=4, on_frame=frame_times.append)
 """
 
 from __future__ import annotations
 
 import io
+import threading
+import time
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from zoneinfo import ZoneInfo
 
 from rich.console import Console, Group
@@ -109,24 +116,79 @@ class DashboardState:
     last_update: Optional[datetime] = None
 
 
+@dataclass
+class FrameStats:
+    """Timing for one rendered frame, passed to the on_frame hook."""
+
+    frame: int
+    panels: List[str]  # panels rebuilt for this frame
+    build_ms: float  # time spent rebuilding panels
+    render_ms: float  # time spent drawing to the terminal
+
+
+PANELS = ("header", "market", "positions", "gates", "log", "footer")
+
+
 # ── Dashboard ────────────────────────────────────────────────────────────────
 
 
 class VexLiveDashboard:
-    """Renders the VEX live TUI using rich."""
+    """
+    Renders the VEX live TUI using rich.
 
-    def __init__(self) -> None:
+    The update_* methods only record state and mark the panels whose
+    content actually changed. In live mode a background thread redraws at
+    most max_fps times per second, rebuilding only the dirty panels, so a
+    burst of updates from one controller step costs one frame and none of
+    the rendering happens on the trading thread.
+
+    on_frame, if set, is called with a FrameStats after every live frame.
+    """
+
+    def __init__(
+        self,
+        max_fps: float = 4.0,
+        on_frame: Optional[Callable[[FrameStats], None]] = None,
+        console: Optional[Console] = None,
+    ) -> None:
+        if not max_fps > 0:
+            raise ValueError(f"max_fps must be positive, got {max_fps}")
         self.state = DashboardState()
-        self.console = Console()
+        self.console = console or Console()
+        self.frame_interval = 1.0 / max_fps
+        self.on_frame = on_frame
+        self.frame_count = 0
+        self.last_frame: Optional[FrameStats] = None
         self._live: Optional[Live] = None
+        self._builders: Dict[str, Callable[[], Any]] = {
+            "header": self._header_panel,
+            "market": self._market_panel,
+            "positions": self._positions_panel,
+            "gates": self._gates_panel,
+            "log": self._log_panel,
+            "footer": self._footer_bar,
+        }
+        self._layout = self._new_layout()
+        self._dirty = set(PANELS)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
 
     # ── Public API (called by controller) ────────────────────────────────
 
     def set_mode(self, dry_run: bool) -> None:
-        self.state.mode = "DRY RUN" if dry_run else "LIVE"
+        mode = "DRY RUN" if dry_run else "LIVE"
+        if mode != self.state.mode:
+            with self._lock:
+                self.state.mode = mode
+            self._mark("header")
 
     def set_balance(self, balance: float) -> None:
-        self.state.balance = balance
+        if balance != self.state.balance:
+            with self._lock:
+                self.state.balance = balance
+            self._mark("header")
 
     def update_header(
         self,
@@ -134,13 +196,26 @@ class VexLiveDashboard:
         state: str,
         killzone: str,
     ) -> None:
-        self.state.cycle_count = cycle
-        self.state.agent_state = state
-        self.state.killzone = killzone
-        self.state.last_update = datetime.now(NY_TZ)
+        s = self.state
+        now = datetime.now(NY_TZ)
+        changed = (
+            (cycle, state, killzone) != (s.cycle_count, s.agent_state, s.killzone)
+            or s.last_update is None
+            or now.strftime("%H:%M:%S") != s.last_update.strftime("%H:%M:%S")
+        )
+        with self._lock:
+            s.cycle_count = cycle
+            s.agent_state = state
+            s.killzone = killzone
+            s.last_update = now
+        if changed:
+            self._mark("header")
 
     def update_quotes(self, quotes: List[MarketQuote]) -> None:
-        self.state.quotes = quotes
+        if quotes != self.state.quotes:
+            with self._lock:
+                self.state.quotes = quotes
+            self._mark("market")
 
     def update_gate_trace(
         self,
@@ -149,21 +224,35 @@ class VexLiveDashboard:
         decision: str,
         rejection: str = "",
     ) -> None:
-        self.state.gate_traces[symbol] = trace
-        self.state.latest_symbol = symbol
-        self.state.latest_decision = decision
-        self.state.latest_rejection = rejection
+        s = self.state
+        changed = (
+            (symbol, decision, rejection)
+            != (s.latest_symbol, s.latest_decision, s.latest_rejection)
+            or trace != s.gate_traces.get(symbol)
+        )
+        with self._lock:
+            s.gate_traces[symbol] = trace
+            s.latest_symbol = symbol
+            s.latest_decision = decision
+            s.latest_rejection = rejection
+        if changed:
+            self._mark("gates")
 
     def update_positions(self, positions: List[Position]) -> None:
-        self.state.positions = positions
+        if positions != self.state.positions:
+            with self._lock:
+                self.state.positions = positions
+            self._mark("positions")
 
     def log_cycle(self, record: CycleRecord) -> None:
-        self.state.cycle_log.appendleft(record)
+        with self._lock:
+            self.state.cycle_log.appendleft(record)
+        self._mark("log")
 
     # ── Rendering ────────────────────────────────────────────────────────
 
-    def build_layout(self) -> Layout:
-        """Construct the full 4-panel Layout."""
+    def _new_layout(self) -> Layout:
+        """The empty 4-panel skeleton."""
         layout = Layout()
 
         layout.split_column(
@@ -187,14 +276,29 @@ class VexLiveDashboard:
             Layout(name="log", ratio=1),
         )
 
-        # Populate
-        layout["header"].update(self._header_panel())
-        layout["market"].update(self._market_panel())
-        layout["positions"].update(self._positions_panel())
-        layout["gates"].update(self._gates_panel())
-        layout["log"].update(self._log_panel())
-        layout["footer"].update(self._footer_bar())
+        return layout
+
+    def _mark(self, *panels: str) -> None:
+        """Flag panels for rebuild and wake the render thread."""
+        with self._lock:
+            self._dirty.update(panels)
+        self._wake.set()
+
+    def _rebuild_dirty(self) -> List[str]:
+        """Rebuild the dirty panels in the persistent layout. Caller holds the lock."""
+        rebuilt = [name for name in PANELS if name in self._dirty]
+        self._dirty.clear()
+        for name in rebuilt:
+            self._layout[name].update(self._builders[name]())
+        return rebuilt
 
+    def build_layout(self) -> Layout:
+        """Construct the full 4-panel Layout."""
+        with self._lock:
+            self._rebuild_dirty()
+            layout = self._new_layout()
+            for name in PANELS:
+                layout[name].update(self._layout[name].renderable)
         return layout
 
     def render(self) -> None:
@@ -202,21 +306,73 @@ class VexLiveDashboard:
         self.console.print(self.build_layout())
 
     def refresh(self) -> None:
-        """Update the live display if active."""
+        """Request a frame; the render thread draws it within one frame interval."""
         if self._live:
-            self._live.update(self.build_layout())
+            self._wake.set()
+
+    def draw_frame(self) -> Optional[FrameStats]:
+        """Rebuild dirty panels and redraw the live display now."""
+        live = self._live
+        if live is None or not live.is_started:
+            return None
+        start = time.perf_counter()
+        with self._lock:
+            if not self._dirty:
+                return None
+            rebuilt = self._rebuild_dirty()
+        built = time.perf_counter()
+        live.refresh()
+        done = time.perf_counter()
+
+        self.frame_count += 1
+        self.last_frame = FrameStats(
+            frame=self.frame_count,
+            panels=rebuilt,
+            build_ms=(built - start) * 1000,
+            render_ms=(done - built) * 1000,
+        )
+        if self.on_frame:
+            self.on_frame(self.last_frame)
+        return self.last_frame
+
+    def _render_loop(self) -> None:
+        next_frame = 0.0
+        while not self._stop.is_set():
+            self._wake.wait()
+            # Let the rest of a burst of updates land in the same frame
+            delay = next_frame - time.perf_counter()
+            if delay > 0 and self._stop.wait(delay):
+                break
+            self._wake.clear()
+            try:
+                self.draw_frame()
+            except Exception:
+                pass  # a bad frame must not take the render thread down
+            next_frame = time.perf_counter() + self.frame_interval
 
     def start_live(self) -> Live:
-        """Start a Live context for auto-refreshing display."""
+        """Start a Live context plus the background render thread."""
+        with self._lock:
+            self._rebuild_dirty()
         self._live = Live(
-            self.build_layout(),
+            self._layout,
             console=self.console,
-            refresh_per_second=1,
+            auto_refresh=False,
             screen=True,
         )
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._render_loop, name="vex-dashboard", daemon=True
+        )
+        self._thread.start()
         return self._live
 
     def stop_live(self) -> None:
+        if self._thread:
+            self._stop.set()
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
         if self._live:
             self._live.stop()
             self._live = None
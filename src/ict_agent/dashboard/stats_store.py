@@ -0,0 +1,324 @@
+"""
+VEX Dashboard Stats Store - materialized performance aggregates.
+
+Keeps the running state behind PerformanceDashboard.calculate_stats
+(totals, win/loss sums, by-pair/session/day/setup buckets, calendar,
+streaks, equity curve) in journal/ashton/dashboard_stats.json, next to
+the trade database, and folds in only trades it has not counted yet:
+
+- JournalEngine.close_trade calls sync() right after saving the database
+- the dashboard compares the database's (mtime, size) signature with the
+  one recorded at the last sync and skips reading it when nothing changed
+- an edit to an already-counted trade, or a close that lands before the
+  last counted trade in database order, rebuilds from scratch, so the
+  result always equals a full recompute
+
+The store also caches rendered HTML sections keyed by their inputs.
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Project paths
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+JOURNAL_DIR = PROJECT_ROOT / "journal" / "ashton"
+TRADES_DB = JOURNAL_DIR / "trades_database.json"
+STATS_PATH = JOURNAL_DIR / "dashboard_stats.json"
+
+SCHEMA_VERSION = 1
+STARTING_EQUITY = 10000
+CATEGORIES = ("by_pair", "by_session", "by_day", "by_setup")
+
+
+def empty_stats() -> Dict:
+    """Stats dict for a journal with no closed trades."""
+    return {
+        "total_trades": 0,
+        "wins": 0,
+        "losses": 0,
+        "breakeven": 0,
+        "win_rate": 0,
+        "total_pnl": 0,
+        "avg_win": 0,
+        "avg_loss": 0,
+        "profit_factor": 0,
+        "largest_win": 0,
+        "largest_loss": 0,
+        "avg_rr": 0,
+        "expectancy": 0,
+        "by_pair": {},
+        "by_session": {},
+        "by_day": {},
+        "by_setup": {},
+        "equity_curve": [],
+        "calendar": {},
+        "streaks": {"current_win": 0, "current_loss": 0, "max_win": 0, "max_loss": 0}
+    }
+
+
+def _empty_state() -> Dict:
+    return {
+        "version": SCHEMA_VERSION,
+        "db_signature": None,
+        "revision": 0,
+        "keys": [],
+        "total_trades": 0,
+        "wins": 0,
+        "losses": 0,
+        "breakeven": 0,
+        "total_pnl": 0,
+        "win_sum": 0,
+        "win_max": None,
+        "loss_sum": 0,
+        "loss_min": None,
+        "by_pair": {},
+        "by_session": {},
+        "by_day": {},
+        "by_setup": {},
+        "calendar": {},
+        "equity_curve": [],
+        "current_streak": 0,
+        "max_win_streak": 0,
+        "max_loss_streak": 0,
+        "sections": {},
+    }
+
+
+def _trade_fields(trade: Dict) -> List:
+    """The fields of a closed trade that feed the aggregates."""
+    pre_trade = trade.get("pre_trade", {})
+    return [
+        trade.get("id"),
+        trade.get("result", ""),
+        trade.get("pnl_dollars", 0),
+        pre_trade.get("pair", "UNKNOWN"),
+        pre_trade.get("killzone", "UNKNOWN"),
+        pre_trade.get("setup_grade", "UNKNOWN"),
+        trade.get("created_at", ""),
+    ]
+
+
+def _day_and_date(created: str):
+    if created:
+        try:
+            dt = datetime.fromisoformat(created.replace("Z", "+00:00"))
+            return dt.strftime("%A"), dt.strftime("%Y-%m-%d")
+        except (AttributeError, TypeError, ValueError):
+            pass
+    return "UNKNOWN", "UNKNOWN"
+
+
+def digest(value: Any) -> str:
+    """Short stable hash of a JSON-serializable value, used as a cache key."""
+    canonical = json.dumps(value, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class DashboardStatsStore:
+    """
+    Running dashboard aggregates persisted as JSON.
+
+    Usage:
+        store = DashboardStatsStore()
+        if not store.is_current():
+            store.sync(trades)
+        stats = store.stats()
+    """
+
+    def __init__(self, path: Path = STATS_PATH, trades_db: Path = TRADES_DB):
+        self.path = Path(path)
+        self.trades_db = Path(trades_db)
+        self.state = self._load()
+        self._dirty = False
+
+    def _load(self) -> Dict:
+        if self.path.exists():
+            try:
+                with open(self.path) as f:
+                    state = json.load(f)
+                if state.get("version") == SCHEMA_VERSION:
+                    return state
+            except (OSError, ValueError):
+                pass
+        return _empty_state()
+
+    def save(self) -> None:
+        """Write the state atomically (temp file + rename)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.state, f)
+        tmp_path.replace(self.path)
+        self._dirty = False
+
+    def db_signature(self) -> Optional[List[int]]:
+        """(mtime_ns, size) of the trade database, None if it is missing."""
+        try:
+            st = self.trades_db.stat()
+        except OSError:
+            return None
+        return [st.st_mtime_ns, st.st_size]
+
+    def is_current(self) -> bool:
+        """True if the database has not changed since the last sync."""
+        signature = self.db_signature()
+        return signature is not None and signature == self.state["db_signature"]
+
+    @property
+    def revision(self) -> int:
+        """Bumped on every change to the aggregates."""
+        return self.state["revision"]
+
+    def sync(self, trades: List[Dict]) -> int:
+        """
+        Bring the aggregates up to date with `trades` (the database's trade
+        list) and persist them. Returns the number of trades folded in.
+
+        Already-counted trades are only compared, not re-processed; the
+        date parsing and bucket updates run for new closed trades only.
+        """
+        signature = self.db_signature()
+        closed = [t for t in trades if t.get("status") == "closed"]
+        fields = [_trade_fields(t) for t in closed]
+        counted = self.state["keys"]
+
+        if fields[:len(counted)] != counted:
+            sections = self.state["sections"]
+            revision = self.state["revision"]
+            self.state = _empty_state()
+            self.state["sections"] = sections
+            self.state["revision"] = revision + 1
+            counted = self.state["keys"]
+
+        new = fields[len(counted):]
+        for trade_fields in new:
+            self._apply(trade_fields)
+            counted.append(trade_fields)
+        if new:
+            self.state["revision"] += 1
+
+        self.state["db_signature"] = signature
+        self.save()
+        return len(new)
+
+    def _apply(self, trade_fields: List) -> None:
+        """Fold one closed trade into the running aggregates."""
+        s = self.state
+        _, result, pnl, pair, session, setup_grade, created = trade_fields
+        day_name, date_str = _day_and_date(created)
+
+        s["total_trades"] += 1
+        s["total_pnl"] += pnl
+        if not s["equity_curve"]:
+            s["equity_curve"].append([0, STARTING_EQUITY])
+        equity = s["equity_curve"][-1][1] + pnl
+        s["equity_curve"].append([s["total_trades"], equity])
+
+        day = s["calendar"].setdefault(date_str, {"trades": 0, "pnl": 0, "result": "neutral"})
+        day["trades"] += 1
+        day["pnl"] += pnl
+
+        buckets = [
+            s[category].setdefault(name, {"wins": 0, "losses": 0, "pnl": 0})
+            for category, name in zip(CATEGORIES, (pair, session, day_name, setup_grade))
+        ]
+
+        if result == "WIN":
+            s["wins"] += 1
+            s["win_sum"] += pnl
+            s["win_max"] = pnl if s["win_max"] is None else max(s["win_max"], pnl)
+            for bucket in buckets:
+                bucket["wins"] += 1
+            day["result"] = "win" if day["pnl"] > 0 else "loss"
+
+            s["current_streak"] = s["current_streak"] + 1 if s["current_streak"] >= 0 else 1
+            s["max_win_streak"] = max(s["max_win_streak"], s["current_streak"])
+
+        elif result == "LOSS":
+            s["losses"] += 1
+            s["loss_sum"] += pnl
+            s["loss_min"] = pnl if s["loss_min"] is None else min(s["loss_min"], pnl)
+            for bucket in buckets:
+                bucket["losses"] += 1
+            day["result"] = "loss" if day["pnl"] < 0 else "win"
+
+            s["current_streak"] = s["current_streak"] - 1 if s["current_streak"] <= 0 else -1
+            s["max_loss_streak"] = max(s["max_loss_streak"], abs(s["current_streak"]))
+
+        else:
+            s["breakeven"] += 1
+
+        for bucket in buckets:
+            bucket["pnl"] += pnl
+
+    def stats(self) -> Dict:
+        """Materialize the calculate_stats() dict from the running state."""
+        s = self.state
+        stats = empty_stats()
+        if not s["total_trades"]:
+            return stats
+
+        for key in ("total_trades", "wins", "losses", "breakeven"):
+            stats[key] = s[key]
+
+        total_decided = s["wins"] + s["losses"]
+        if total_decided > 0:
+            stats["win_rate"] = round(s["wins"] / total_decided * 100, 1)
+
+        if s["wins"]:
+            stats["avg_win"] = round(s["win_sum"] / s["wins"], 2)
+            stats["largest_win"] = round(s["win_max"], 2)
+
+        if s["losses"]:
+            stats["avg_loss"] = round(s["loss_sum"] / s["losses"], 2)
+            stats["largest_loss"] = round(s["loss_min"], 2)
+
+        gross_loss = abs(s["loss_sum"]) if s["losses"] else 0
+        if gross_loss > 0:
+            stats["profit_factor"] = round(s["win_sum"] / gross_loss, 2)
+
+        if total_decided > 0:
+            win_rate = s["wins"] / total_decided
+            avg_win = stats["avg_win"] if s["wins"] else 0
+            avg_loss = abs(stats["avg_loss"]) if s["losses"] else 0
+            stats["expectancy"] = round((win_rate * avg_win) - ((1 - win_rate) * avg_loss), 2)
+
+        def calc_win_rate(d):
+            total = d["wins"] + d["losses"]
+            return round(d["wins"] / total * 100, 1) if total > 0 else 0
+
+        for category in CATEGORIES:
+            stats[category] = {k: {**v, "win_rate": calc_win_rate(v)} for k, v in s[category].items()}
+        stats["equity_curve"] = [tuple(point) for point in s["equity_curve"]]
+        stats["calendar"] = {k: dict(v) for k, v in s["calendar"].items()}
+        streak = s["current_streak"]
+        stats["streaks"] = {
+            "current_win": streak if streak > 0 else 0,
+            "current_loss": abs(streak) if streak < 0 else 0,
+            "max_win": s["max_win_streak"],
+            "max_loss": s["max_loss_streak"]
+        }
+        stats["total_pnl"] = round(s["total_pnl"], 2)
+        return stats
+
+    def section(self, name: str, key: Any, render: Callable[[], str]) -> str:
+        """
+        Cached HTML for a dashboard section: render() runs only when `key`
+        differs from the one stored with the last render. Call save() (or
+        flush()) afterwards to persist new renders.
+        """
+        cached = self.state["sections"].get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        html = render()
+        self.state["sections"][name] = [key, html]
+        self._dirty = True
+        return html
+
+    def flush(self) -> None:
+        """Persist section renders added since the last save."""
+        if self._dirty:
+            self.save()
@@ -1,6 +1,54 @@
 """Data Pipeline Components"""
 
-from ict_agent.data.fetcher import DataFetcher
-from ict_agent.data.preprocessor import DataPreprocessor
+from typing import TYPE_CHECKING
 
-__all__ = ["DataFetcher", "DataPreprocessor"]
+from ict_agent._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ict_agent.data.candle_parser import parse_candles
+    from ict_agent.data.datasets import (
+        DiskHashSet,
+        JsonlWriter,
+        content_hash,
+        iter_records,
+        parallel_map,
+        split_for,
+    )
+    from ict_agent.data.fetcher import DataFetcher
+    from ict_agent.data.history import BarStore, HistoryDownloader
+    from ict_agent.data.oanda_transport import OANDATransport, get_transport
+    from ict_agent.data.preprocessor import DataPreprocessor
+
+__all__ = [
+    "BarStore",
+    "DataFetcher",
+    "DataPreprocessor",
+    "DiskHashSet",
+    "HistoryDownloader",
+    "JsonlWriter",
+    "OANDATransport",
+    "content_hash",
+    "get_transport",
+    "iter_records",
+    "parallel_map",
+    "parse_candles",
+    "split_for",
+]
+
+_EXPORTS = {
+    "BarStore": "ict_agent.data.history",
+    "DataFetcher": "ict_agent.data.fetcher",
+    "DataPreprocessor": "ict_agent.data.preprocessor",
+    "DiskHashSet": "ict_agent.data.datasets",
+    "HistoryDownloader": "ict_agent.data.history",
+    "JsonlWriter": "ict_agent.data.datasets",
+    "OANDATransport": "ict_agent.data.oanda_transport",
+    "content_hash": "ict_agent.data.datasets",
+    "get_transport": "ict_agent.data.oanda_transport",
+    "iter_records": "ict_agent.data.datasets",
+    "parallel_map": "ict_agent.data.datasets",
+    "parse_candles": "ict_agent.data.candle_parser",
+    "split_for": "ict_agent.data.datasets",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
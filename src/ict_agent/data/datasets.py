@@ -0,0 +1,240 @@
+"""Streaming Dataset Module
+
+Constant-memory building blocks for the training-data scripts:
+
+- iter_records: stream records from JSONL, or from a legacy JSON array
+  without loading the whole file
+- JsonlWriter: append records one line at a time, atomically replacing the
+  target on close
+- DiskHashSet: content-hash dedup set kept in SQLite, not in memory
+- split_for: stable train/val/blind assignment from a record key
+- parallel_map: ordered, bounded-window map over a process pool
+
+Usage:
+    seen = DiskHashSet(tmp_dir / "seen.sqlite")
+    with JsonlWriter(out_path) as out:
+        for record in parallel_map(transform, iter_records(in_path), workers=4):
+            if seen.add(content_hash(record, fields=("input",))):
+                out.write(record)
+"""
+
+import hashlib
+import json
+import sqlite3
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+
+DEFAULT_SPLITS = {"train": 0.8, "val": 0.1, "blind": 0.1}
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+
+
+def _iter_json_array(f, chunk_size: int) -> Iterator[Any]:
+    """Decode the elements of a top-level JSON array from a text stream"""
+    buffer = ""
+    pos = 0
+    started = False      # consumed the opening "["
+    after_value = False  # last token was an element, so "," or "]" must follow
+    empty = True         # no element or "," seen yet, so "]" may close
+    eof = False
+
+    while True:
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+
+        if pos < len(buffer):
+            char = buffer[pos]
+            if not started:
+                if char != "[":
+                    # Not an array: a single top-level value
+                    yield _DECODER.decode(buffer[pos:] + f.read())
+                    return
+                started = True
+                pos += 1
+                continue
+            if char == "]" and empty:
+                return
+            if after_value:
+                if char == "]":
+                    return
+                if char != ",":
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+                after_value = False
+                pos += 1
+                continue
+            try:
+                value, end = _DECODER.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                # A value is complete once a delimiter follows it ("2." at
+                # the buffer edge may still be the start of "2.5")
+                if eof or (end < len(buffer) and buffer[end] in _WHITESPACE + ",]"):
+                    yield value
+                    after_value = True
+                    empty = False
+                    pos = end
+                    continue
+
+        if eof:
+            raise json.JSONDecodeError("Unterminated array" if started else "Expecting value", buffer, pos)
+        chunk = f.read(chunk_size)
+        eof = not chunk
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+
+def iter_records(path: Path, chunk_size: int = 1 << 16) -> Iterator[Any]:
+    """
+    Stream records from a dataset file.
+
+    .jsonl files yield one record per non-empty line. Anything else is
+    parsed as JSON: elements of a top-level array are decoded one at a time,
+    a single top-level object is yielded as one record.
+    """
+    path = Path(path)
+    with open(path, "r", encoding="utf-8") as f:
+        if path.suffix == ".jsonl":
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from _iter_json_array(f, chunk_size)
+
+
+class JsonlWriter:
+    """
+    Write records as JSON lines to a temp file and move it into place on
+    a clean close, so readers never see a half-written dataset.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.count = 0
+        self._tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        self._file = None
+
+    def __enter__(self) -> "JsonlWriter":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self._tmp_path, "w", encoding="utf-8")
+        return self
+
+    def write(self, record: Any) -> None:
+        self._file.write(json.dumps(record, ensure_ascii=False))
+        self._file.write("\n")
+        self.count += 1
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._file.close()
+        if exc_type is None:
+            self._tmp_path.replace(self.path)
+        else:
+            self._tmp_path.unlink(missing_ok=True)
+
+
+def content_hash(record: Any, fields: Optional[Sequence[str]] = None) -> bytes:
+    """128-bit digest of a record's canonical JSON (optionally only `fields`)"""
+    if fields is not None:
+        record = {name: record.get(name) for name in fields}
+    canonical = json.dumps(record, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).digest()
+
+
+class DiskHashSet:
+    """
+    Set of 16-byte digests stored in a SQLite table.
+
+    Memory stays flat however many records pass through; a temp-file path
+    gives a per-run set, a persistent path dedups across runs.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("PRAGMA journal_mode=OFF")
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen (digest BLOB PRIMARY KEY) WITHOUT ROWID"
+        )
+
+    def add(self, digest: bytes) -> bool:
+        """Insert digest; True if it was not already present"""
+        cursor = self._conn.execute("INSERT OR IGNORE INTO seen VALUES (?)", (digest,))
+        return cursor.rowcount == 1
+
+    def __contains__(self, digest: bytes) -> bool:
+        row = self._conn.execute("SELECT 1 FROM seen WHERE digest = ?", (digest,)).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.commit()
+        self._conn.close()
+
+    def __enter__(self) -> "DiskHashSet":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def split_for(key: str, splits: Dict[str, float] = DEFAULT_SPLITS) -> str:
+    """
+    Stable split name for a record key.
+
+    The key is hashed to a point in [0, 1) and mapped onto the cumulative
+    split fractions, so a record keeps its split as the corpus grows.
+    """
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    point = int.from_bytes(digest, "big") / 2 ** 64
+    total = sum(splits.values())
+    cumulative = 0.0
+    for name, fraction in splits.items():
+        cumulative += fraction / total
+        if point < cumulative:
+            return name
+    return name
+
+
+def _apply(fn: Callable[[Any], Any], batch: List[Any]) -> List[Any]:
+    return [fn(item) for item in batch]
+
+
+def parallel_map(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    workers: int = 1,
+    batch_size: int = 256,
+) -> Iterator[Any]:
+    """
+    Ordered map of a picklable fn over items in worker processes.
+
+    At most 2 * workers batches are in flight, so the input iterator is
+    consumed lazily. workers <= 1 maps in-process.
+    """
+    if workers <= 1:
+        for item in items:
+            yield fn(item)
+        return
+
+    iterator = iter(items)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        while True:
+            while len(pending) < 2 * workers:
+                batch = list(islice(iterator, batch_size))
+                if not batch:
+                    break
+                pending.append(pool.submit(_apply, fn, batch))
+            if not pending:
+                return
+            yield from pending.popleft().result()
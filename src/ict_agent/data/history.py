@@ -0,0 +1,282 @@
+"""Bulk Historical Download
+
+Pulls long OANDA histories (years of M1) into a local SQLite bar store.
+
+- A date range is split into API-sized pages: page_size candles of the
+  granularity, each requested with from/to.
+- Pages are fetched concurrently through the shared transport, so the
+  rate limiter and retries apply.
+- Pages are written strictly in order: a bounded window of in-flight
+  pages is drained from the left. The stored range therefore stays
+  contiguous, even after an interruption. download() then fetches only
+  what is missing around it: the tail after the last stored candle
+  (oldest page first) and the head before the first one (newest page
+  first).
+- Bars are keyed by (instrument, granularity, time), so overlapping
+  pages and reruns never duplicate rows.
+
+Usage:
+    store = BarStore()                                  # data/cache/bars.sqlite
+    downloader = HistoryDownloader(OANDAFetcher(), store, workers=4)
+    downloader.download("EUR_USD", "M1", datetime(2016, 1, 1, tzinfo=timezone.utc))
+    df = store.load("EUR_USD", "M1", start=..., end=...)
+"""
+
+import sqlite3
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_STORE = Path(__file__).resolve().parents[3] / "data" / "cache" / "bars.sqlite"
+MAX_PAGE_CANDLES = 5000  # OANDA per-request limit
+
+GRANULARITY_SECONDS = {
+    "S5": 5,
+    "S10": 10,
+    "S15": 15,
+    "S30": 30,
+    "M1": 60,
+    "M2": 120,
+    "M4": 240,
+    "M5": 300,
+    "M10": 600,
+    "M15": 900,
+    "M30": 1800,
+    "H1": 3600,
+    "H2": 7200,
+    "H3": 10800,
+    "H4": 14400,
+    "H6": 21600,
+    "H8": 28800,
+    "H12": 43200,
+    "D": 86400,
+    "W": 604800,
+}
+
+_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+def _utc(ts: datetime) -> datetime:
+    return ts.replace(tzinfo=timezone.utc) if ts.tzinfo is None else ts.astimezone(timezone.utc)
+
+
+def page_ranges(
+    start: datetime,
+    end: datetime,
+    granularity: str,
+    page_size: int = MAX_PAGE_CANDLES,
+) -> List[Tuple[datetime, datetime]]:
+    """Split [start, end) into from/to spans of at most page_size candles."""
+    span = timedelta(seconds=GRANULARITY_SECONDS[granularity] * min(page_size, MAX_PAGE_CANDLES))
+    start, end = _utc(start), _utc(end)
+    pages = []
+    while start < end:
+        stop = min(start + span, end)
+        pages.append((start, stop))
+        start = stop
+    return pages
+
+
+class BarStore:
+    """SQLite candle store, one row per (instrument, granularity, time)."""
+
+    def __init__(self, path: Path = DEFAULT_STORE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS bars ("
+            " instrument TEXT NOT NULL, granularity TEXT NOT NULL, time INTEGER NOT NULL,"
+            " open REAL, high REAL, low REAL, close REAL, volume INTEGER,"
+            " PRIMARY KEY (instrument, granularity, time)) WITHOUT ROWID"
+        )
+        self._conn.commit()
+
+    def append(self, instrument: str, granularity: str, df: pd.DataFrame) -> int:
+        """Upsert a page of candles (DatetimeIndex, OHLCV columns)."""
+        if df is None or df.empty:
+            return 0
+        times = pd.DatetimeIndex(df.index).as_unit("ns").asi8
+        volume = df["volume"].to_numpy(np.int64) if "volume" in df else np.zeros(len(df), np.int64)
+        rows = zip(
+            [instrument] * len(df),
+            [granularity] * len(df),
+            times.tolist(),
+            df["open"].to_numpy(float).tolist(),
+            df["high"].to_numpy(float).tolist(),
+            df["low"].to_numpy(float).tolist(),
+            df["close"].to_numpy(float).tolist(),
+            volume.tolist(),
+        )
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO bars VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._conn.commit()
+        return len(df)
+
+    def first_time(self, instrument: str, granularity: str) -> Optional[pd.Timestamp]:
+        return self._bound("MIN", instrument, granularity)
+
+    def last_time(self, instrument: str, granularity: str) -> Optional[pd.Timestamp]:
+        return self._bound("MAX", instrument, granularity)
+
+    def _bound(self, func: str, instrument: str, granularity: str) -> Optional[pd.Timestamp]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {func}(time) FROM bars WHERE instrument = ? AND granularity = ?",
+                (instrument, granularity),
+            ).fetchone()
+        return pd.Timestamp(row[0], tz="UTC") if row and row[0] is not None else None
+
+    def count(self, instrument: str, granularity: str) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM bars WHERE instrument = ? AND granularity = ?",
+                (instrument, granularity),
+            ).fetchone()[0]
+
+    def load(
+        self,
+        instrument: str,
+        granularity: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """Stored candles in [start, end) as an OHLCV frame with a UTC index."""
+        query = "SELECT time, open, high, low, close, volume FROM bars WHERE instrument = ? AND granularity = ?"
+        params: List[Any] = [instrument, granularity]
+        if start is not None:
+            query += " AND time >= ?"
+            params.append(pd.Timestamp(_utc(start)).value)
+        if end is not None:
+            query += " AND time < ?"
+            params.append(pd.Timestamp(_utc(end)).value)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY time", params).fetchall()
+        if not rows:
+            return pd.DataFrame(columns=list(_COLUMNS))
+        times, opens, highs, lows, closes, volumes = zip(*rows)
+        index = pd.DatetimeIndex(np.array(times, dtype=np.int64), tz="UTC", name="timestamp")
+        return pd.DataFrame(
+            {
+                "open": np.array(opens, dtype=np.float64),
+                "high": np.array(highs, dtype=np.float64),
+                "low": np.array(lows, dtype=np.float64),
+                "close": np.array(closes, dtype=np.float64),
+                "volume": np.array(volumes, dtype=np.int64),
+            },
+            index=index,
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class HistoryDownloader:
+    """Concurrent, resumable page downloader from OANDAFetcher into a BarStore."""
+
+    def __init__(
+        self,
+        fetcher: Any,
+        store: Optional[BarStore] = None,
+        workers: int = 4,
+        page_size: int = MAX_PAGE_CANDLES,
+    ):
+        self.fetcher = fetcher
+        self.store = store
+        self.workers = max(1, workers)
+        self.page_size = page_size
+
+    def iter_pages(
+        self,
+        instrument: str,
+        granularity: str,
+        start: datetime,
+        end: datetime,
+        newest_first: bool = False,
+    ) -> Iterator[Tuple[Tuple[datetime, datetime], pd.DataFrame]]:
+        """Fetch pages concurrently, yielding ((from, to), frame) in date order (or reversed)."""
+        ranges = page_ranges(start, end, granularity, self.page_size)
+        pages = iter(ranges[::-1] if newest_first else ranges)
+        window = self.workers * 2
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="oanda-history") as pool:
+            pending: deque = deque()
+            for page in pages:
+                pending.append((page, pool.submit(self.fetcher.fetch_range, instrument, granularity, *page)))
+                if len(pending) >= window:
+                    break
+            while pending:
+                page, future = pending.popleft()
+                frame = future.result()
+                nxt = next(pages, None)
+                if nxt is not None:
+                    pending.append((nxt, pool.submit(self.fetcher.fetch_range, instrument, granularity, *nxt)))
+                yield page, frame
+
+    def download(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: datetime,
+        end: Optional[datetime] = None,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Store [start, end) for a symbol. Only what lies outside the stored
+        range is fetched: after the last stored candle, and before the first
+        one when start is earlier. A window that does not touch the stored
+        range also fetches the gap between the two.
+
+        Returns a summary with pages fetched, candles written and the
+        stored range.
+        """
+        if self.store is None:
+            raise ValueError("HistoryDownloader.download needs a BarStore")
+        instrument = self.fetcher._get_instrument(symbol)
+        granularity = self.fetcher._get_granularity(timeframe)
+        start = _utc(start)
+        end = _utc(end or datetime.now(timezone.utc))
+
+        # (from, to, newest_first) spans missing from the store
+        spans = [(start, end, False)]
+        first = self.store.first_time(instrument, granularity)
+        last = self.store.last_time(instrument, granularity)
+        if first is not None:
+            # Both spans join the stored range, even when [start, end) lies
+            # outside it, so the store never has holes. The tail comes first
+            # (usually what a rerun wants). The head runs backwards so an
+            # interrupted backfill still leaves a contiguous range.
+            tail = last.to_pydatetime() + timedelta(seconds=GRANULARITY_SECONDS[granularity])
+            spans = [(tail, end, False), (start, first.to_pydatetime(), True)]
+
+        total_pages = sum(len(page_ranges(a, b, granularity, self.page_size)) for a, b, _ in spans)
+        summary = {
+            "instrument": instrument,
+            "granularity": granularity,
+            "resumed_from": spans[0][0].isoformat(),
+            "pages": 0,
+            "total_pages": total_pages,
+            "candles": 0,
+        }
+        for span_start, span_end, newest_first in spans:
+            pages = self.iter_pages(instrument, granularity, span_start, span_end, newest_first)
+            for (page_start, page_end), frame in pages:
+                summary["pages"] += 1
+                summary["candles"] += self.store.append(instrument, granularity, frame)
+                if progress:
+                    through = page_start if newest_first else page_end
+                    progress({**summary, "through": through.isoformat()})
+
+        last = self.store.last_time(instrument, granularity)
+        summary["last_candle"] = last.isoformat() if last is not None else None
+        summary["stored"] = self.store.count(instrument, granularity)
+        return summary
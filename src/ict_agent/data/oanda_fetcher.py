@@ -4,13 +4,14 @@ Fetches live and historical OHLCV data from OANDA's v20 REST API.
 """
 
 import os
-import requests
 from datetime import datetime, timedelta
-from typing import Optional, List
+from typing import Optional, List, Sequence
 import pandas as pd
 from dataclasses import dataclass, field
 
+from ict_agent.data.candle_parser import parse_candles, price_param
 from ict_agent.data.fetcher import BaseDataFetcher, DataConfig
+from ict_agent.data.oanda_transport import OANDATransport, get_transport
 
 
 def _env_api_key() -> str:
@@ -91,15 +92,19 @@ class OANDAFetcher(BaseDataFetcher):
         "W": "W",
     }
 
-    def __init__(self, config: Optional[OANDAConfig] = None):
+    def __init__(
+        self,
+        config: Optional[OANDAConfig] = None,
+        transport: Optional[OANDATransport] = None,
+        components: Sequence[str] = ("mid",),
+    ):
         self.config = config or OANDAConfig()
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "Authorization": f"Bearer {self.config.api_key}",
-                "Content-Type": "application/json",
-            }
-        )
+        # Price components to request; the first → open/high/low/close, others → bid_*/ask_*
+        self.components = tuple(components)
+        self.primary = self.components[0]
+        # Pooled, rate-limited session shared with every other OANDA client
+        self.transport = transport or get_transport(self.config)
+        self.session = self.transport.session
 
     def _get_instrument(self, symbol: str) -> str:
         """Convert symbol to OANDA instrument format"""
@@ -123,57 +128,53 @@ class OANDAFetcher(BaseDataFetcher):
         instrument = self._get_instrument(config.symbol)
         granularity = self._get_granularity(config.timeframe)
 
+        if config.start_date and config.end_date:
+            # Large spans are split into API-sized pages and fetched concurrently
+            from ict_agent.data.history import HistoryDownloader
+
+            pages = HistoryDownloader(self).iter_pages(
+                instrument, granularity, config.start_date, config.end_date
+            )
+            frames = [frame for _, frame in pages if not frame.empty]
+            if not frames:
+                return pd.DataFrame()
+            df = pd.concat(frames)
+            return df[~df.index.duplicated(keep="last")]
+
         params = {
             "granularity": granularity,
-            "price": "MBA",  # Mid, Bid, Ask
+            "price": price_param(self.components),
+            "count": min(config.limit, 5000),  # OANDA max is 5000
         }
+        return self._get_candles(instrument, params)
 
-        if config.start_date and config.end_date:
-            params["from"] = config.start_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-            params["to"] = config.end_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-        else:
-            params["count"] = min(config.limit, 5000)  # OANDA max is 5000
+    def fetch_range(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: datetime,
+        end: datetime,
+    ) -> pd.DataFrame:
+        """One from/to candle request; the span must fit in 5000 candles."""
+        params = {
+            "granularity": self._get_granularity(timeframe),
+            "price": price_param(self.components),
+            "from": start.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "to": end.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+        return self._get_candles(self._get_instrument(symbol), params)
 
+    def _get_candles(self, instrument: str, params: dict) -> pd.DataFrame:
         url = f"{self.config.base_url}/v3/instruments/{instrument}/candles"
 
-        response = self.session.get(url, params=params)
+        response = self.transport.get(url, params=params)
         response.raise_for_status()
 
-        data = response.json()
-
-        return self._parse_candles(data.get("candles", []))
+        return parse_candles(response.content, self.components, primary=self.primary)
 
     def _parse_candles(self, candles: List[dict]) -> pd.DataFrame:
         """Parse OANDA candle response to DataFrame"""
-
-        if not candles:
-            return pd.DataFrame()
-
-        rows = []
-        for candle in candles:
-            if not candle.get("complete", True):
-                continue  # Skip incomplete candles
-
-            # Use mid prices
-            mid = candle.get("mid", {})
-
-            rows.append(
-                {
-                    "timestamp": pd.to_datetime(candle["time"]),
-                    "open": float(mid.get("o", 0)),
-                    "high": float(mid.get("h", 0)),
-                    "low": float(mid.get("l", 0)),
-                    "close": float(mid.get("c", 0)),
-                    "volume": int(candle.get("volume", 0)),
-                }
-            )
-
-        df = pd.DataFrame(rows)
-        if not df.empty:
-            df.set_index("timestamp", inplace=True)
-            df.sort_index(inplace=True)
-
-        return df
+        return parse_candles(candles, self.components, primary=self.primary)
 
     def fetch_latest(
         self,
@@ -218,22 +219,22 @@ class OANDAFetcher(BaseDataFetcher):
             "price": "MBA",
         }
 
-        response = self.session.get(url, params=params)
+        response = self.transport.get(url, params=params)
         response.raise_for_status()
 
-        data = response.json()
-        candles = data.get("candles", [])
-
-        if candles:
-            candle = candles[-1]
-            return {
-                "bid": float(candle.get("bid", {}).get("c", 0)),
-                "ask": float(candle.get("ask", {}).get("c", 0)),
-                "mid": float(candle.get("mid", {}).get("c", 0)),
-                "time": candle.get("time"),
-            }
-
-        return {}
+        df = parse_candles(
+            response.content, ("mid", "bid", "ask"), include_incomplete=True
+        )
+        if df.empty:
+            return {}
+
+        last = df.iloc[-1]
+        return {
+            "bid": float(last["bid_close"]),
+            "ask": float(last["ask_close"]),
+            "mid": float(last["close"]),
+            "time": df.index[-1].strftime("%Y-%m-%dT%H:%M:%S.%f000Z"),
+        }
 
     def get_spread(self, symbol: str) -> float:
         """Get current spread in pips"""
@@ -251,7 +252,7 @@ class OANDAFetcher(BaseDataFetcher):
         url = f"{self.config.base_url}/v3/accounts/{self.config.account_id}/instruments"
 
         try:
-            response = self.session.get(url)
+            response = self.transport.get(url)
             response.raise_for_status()
             data = response.json()
             return [inst["name"] for inst in data.get("instruments", [])]
@@ -265,7 +266,7 @@ class OANDAFetcher(BaseDataFetcher):
             return {"error": "account_id not configured"}
 
         url = f"{self.config.base_url}/v3/accounts/{self.config.account_id}/summary"
-        response = self.session.get(url)
+        response = self.transport.get(url)
         response.raise_for_status()
         return response.json()
 
@@ -0,0 +1,348 @@
+"""OANDA Transport
+
+One pooled, rate-limited HTTP session shared by every OANDA REST client
+(OANDAFetcher, OANDAExecutor and the module-level helpers), per account
+credentials and environment.
+
+- Keep-alive connection pool sized for concurrent scanning, so threads
+  reuse sockets instead of opening new ones (OANDA allows 2 new
+  connections per second).
+- Token bucket below OANDA's 120 requests/second per-account limit.
+- Explicit (connect, read) timeouts on every call.
+- Retries with jittered exponential backoff:
+  - a 429 is retried for every method, since the request was never
+    processed, and Retry-After is honored;
+  - 5xx responses and connection errors are retried only for
+    idempotent methods, so an order POST is never sent twice.
+- Per-endpoint latency histograms (IDs templated out of the path).
+
+The asyncio executor (execution.async_executor) sends through its own
+httpx client but shares the transport's limiter, retry policy and
+histograms: acquire_async(), retryable(), retry_delay() and record().
+
+Usage:
+    transport = get_transport(OANDAConfig())
+    response = transport.get(url, params={"count": 500})
+    transport.stats()   # {"requests": ..., "endpoints": {"GET /v3/instruments/{instrument}/candles": {...}}}
+
+The pricing stream keeps its own long-lived connection (see price_stream).
+"""
+
+import asyncio
+import bisect
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# OANDA documents 120 requests/second; stay under it with some headroom
+DEFAULT_RATE_PER_SECOND = 100.0
+DEFAULT_BURST = 20
+DEFAULT_POOL_SIZE = 16
+DEFAULT_TIMEOUT = (5.0, 30.0)  # (connect, read) seconds
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+
+def retryable(status: int, idempotent: bool) -> bool:
+    """429 is always safe to retry; 5xx only when repeating the request is."""
+    return status == 429 or (idempotent and status in RETRY_STATUSES)
+
+# Path segment that follows each of these is an identifier
+_ID_SEGMENTS = {
+    "accounts": "{account}",
+    "instruments": "{instrument}",
+    "trades": "{trade}",
+    "orders": "{order}",
+    "positions": "{instrument}",
+    "transactions": "{transaction}",
+}
+_KEYWORD_SEGMENTS = {"summary", "candles", "pricing", "close", "orders", "clientExtensions",
+                     "cancel", "openTrades", "openPositions", "instruments", "stream",
+                     "changes", "idrange", "sinceid", "latest", "orderBook", "positionBook"}
+
+
+def endpoint_label(method: str, url: str) -> str:
+    """"GET /v3/accounts/{account}/trades/{trade}/close" style label."""
+    segments = [s for s in urlsplit(url).path.split("/") if s]
+    out: List[str] = []
+    for i, segment in enumerate(segments):
+        prev = segments[i - 1] if i else ""
+        if prev in _ID_SEGMENTS and segment not in _KEYWORD_SEGMENTS:
+            out.append(_ID_SEGMENTS[prev])
+        else:
+            out.append(segment)
+    return f"{method.upper()} /{'/'.join(out)}"
+
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until a token is free."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+        self.waits = 0
+        self.waited_seconds = 0.0
+
+    def acquire(self) -> float:
+        """Take one token. Returns the seconds spent waiting for it."""
+        waited = 0.0
+        while True:
+            delay = self._take(waited)
+            if delay is None:
+                return waited
+            self._sleep(delay)
+            waited += delay
+
+    async def acquire_async(self) -> float:
+        """acquire() for event-loop callers: waits without blocking the loop."""
+        waited = 0.0
+        while True:
+            delay = self._take(waited)
+            if delay is None:
+                return waited
+            await asyncio.sleep(delay)
+            waited += delay
+
+    def _take(self, waited: float) -> Optional[float]:
+        """Take a token (None), or return the seconds until one is free."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                if waited:
+                    self.waits += 1
+                    self.waited_seconds += waited
+                return None
+            return (1 - self._tokens) / self.rate
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram in milliseconds."""
+
+    BOUNDS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS_MS) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+        self.errors = 0
+
+    def observe(self, ms: float, error: bool = False) -> None:
+        self.counts[bisect.bisect_left(self.BOUNDS_MS, ms)] += 1
+        self.total += 1
+        self.sum_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        if error:
+            self.errors += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bucket bound holding the q-th observation (max for the overflow)."""
+        if not self.total:
+            return None
+        rank = q * self.total
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return float(self.BOUNDS_MS[i]) if i < len(self.BOUNDS_MS) else round(self.max_ms, 1)
+        return round(self.max_ms, 1)
+
+    def snapshot(self) -> Dict[str, Any]:
+        labels = [f"<={b}ms" for b in self.BOUNDS_MS] + [f">{self.BOUNDS_MS[-1]}ms"]
+        return {
+            "count": self.total,
+            "errors": self.errors,
+            "mean_ms": round(self.sum_ms / self.total, 1) if self.total else None,
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "max_ms": round(self.max_ms, 1),
+            "buckets": {label: n for label, n in zip(labels, self.counts) if n},
+        }
+
+
+class OANDATransport:
+    """Shared requests.Session with pooling, rate limiting, retries and metrics."""
+
+    def __init__(
+        self,
+        api_key: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        rate_per_second: float = DEFAULT_RATE_PER_SECOND,
+        burst: int = DEFAULT_BURST,
+        timeout: Tuple[float, float] = DEFAULT_TIMEOUT,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 8.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self._sleep = sleep
+        self.limiter = TokenBucket(rate_per_second, burst, sleep=sleep)
+
+        self.session = requests.Session()
+        self.session.headers.update(
+            {
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+                "Accept-Datetime-Format": "RFC3339",
+                "Connection": "keep-alive",
+            }
+        )
+        # Retries are handled here so each attempt goes through the limiter
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                              max_retries=0, pool_block=True)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self.requests = 0
+        self.retries = 0
+        self.rate_limited = 0
+
+    # ─── Requests ────────────────────────────────────────────────────────
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request, retrying as described in the module docstring.
+
+        Returns the final response without raising on HTTP errors (callers
+        keep using raise_for_status()); connection errors are re-raised
+        once retries are exhausted.
+        """
+        method = method.upper()
+        kwargs.setdefault("timeout", self.timeout)
+        label = endpoint_label(method, url)
+        idempotent = method in IDEMPOTENT_METHODS
+
+        attempt = 0
+        while True:
+            self.limiter.acquire()
+            start = time.perf_counter()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                self.record(label, start, None)
+                if not idempotent or attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                self._sleep(self.retry_delay(attempt, None))
+                continue
+
+            status = response.status_code
+            self.record(label, start, status)
+            if not retryable(status, idempotent) or attempt >= self.max_retries:
+                return response
+            attempt += 1
+            self._sleep(self.retry_delay(attempt, response.headers.get("Retry-After")))
+            response.close()
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> requests.Response:
+        return self.request("PUT", url, **kwargs)
+
+    # ─── Metrics ─────────────────────────────────────────────────────────
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "rate_limited": self.rate_limited,
+                "throttle_waits": self.limiter.waits,
+                "throttle_seconds": round(self.limiter.waited_seconds, 3),
+                "endpoints": {k: h.snapshot() for k, h in sorted(self._histograms.items())},
+            }
+
+    def close(self) -> None:
+        self.session.close()
+
+    # ─── Shared with the async executor ──────────────────────────────────
+
+    def record(self, label: str, start: float, status: Optional[int]) -> None:
+        """Count one attempt begun at perf_counter() `start`; status None is a connection error."""
+        ms = (time.perf_counter() - start) * 1000
+        with self._lock:
+            self.requests += 1
+            if status == 429:
+                self.rate_limited += 1
+            histogram = self._histograms.get(label)
+            if histogram is None:
+                histogram = self._histograms[label] = LatencyHistogram()
+            histogram.observe(ms, status is None or status >= 400)
+
+    def retry_delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        """Seconds to wait before retry number `attempt` (Retry-After wins)."""
+        with self._lock:
+            self.retries += 1
+        delay = None
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                delay = None
+        if delay is None:
+            # Full jitter so concurrent scanners don't retry in lockstep
+            delay = random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1)))
+        return delay
+
+
+# ─── Shared instances ────────────────────────────────────────────────────
+
+_transports: Dict[Tuple[str, str], OANDATransport] = {}
+_transports_lock = threading.Lock()
+
+
+def get_transport(config: Optional[Any] = None, **options) -> OANDATransport:
+    """
+    Process-wide transport for an OANDAConfig's credentials and environment.
+
+    `options` (pool_size, rate_per_second, ...) only apply when the
+    transport is first created.
+    """
+    if config is None:
+        from ict_agent.data.oanda_fetcher import OANDAConfig
+
+        config = OANDAConfig()
+    key = (config.api_key or "", config.base_url)
+    with _transports_lock:
+        transport = _transports.get(key)
+        if transport is None:
+            transport = _transports[key] = OANDATransport(config.api_key or "", **options)
+        return transport
+
+
+def reset_transports() -> None:
+    """Close and forget every shared transport (tests, credential changes)."""
+    with _transports_lock:
+        for transport in _transports.values():
+            transport.close()
+        _transports.clear()
@@ -0,0 +1,96 @@
+"""OANDA Price Stream
+
+Background reader for the v20 pricing stream. Each PRICE line is handed to
+a callback as (instrument, bid, ask); heartbeats only keep the connection
+alive. Dropped connections reconnect with capped backoff.
+"""
+
+import json
+import threading
+from typing import Callable, List, Optional
+
+import requests
+
+from ict_agent.data.oanda_fetcher import OANDAConfig
+
+
+class OANDAPriceStream:
+    """Stream bid/ask ticks for a set of instruments on a daemon thread."""
+
+    def __init__(
+        self,
+        symbols: List[str],
+        on_price: Callable[[str, float, float], None],
+        config: Optional[OANDAConfig] = None,
+        max_backoff_seconds: float = 60.0,
+    ):
+        self.symbols = list(symbols)
+        self.on_price = on_price
+        self.config = config or OANDAConfig()
+        self.max_backoff = max_backoff_seconds
+        self.connected = False
+        self.reconnects = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._response = None
+
+    def start(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="oanda-price-stream", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        response = self._response
+        if response is not None:
+            try:
+                response.close()
+            except Exception:
+                pass
+
+    def handle_line(self, line: bytes) -> None:
+        """Parse one stream line and forward PRICE messages."""
+        if not line:
+            return
+        msg = json.loads(line)
+        if msg.get("type") != "PRICE":
+            return
+        bids, asks = msg.get("bids"), msg.get("asks")
+        if not bids or not asks:
+            return
+        self.on_price(msg["instrument"], float(bids[0]["price"]), float(asks[0]["price"]))
+
+    def _run(self) -> None:
+        url = f"{self.config.stream_url}/v3/accounts/{self.config.account_id}/pricing/stream"
+        headers = {"Authorization": f"Bearer {self.config.api_key}"}
+        params = {"instruments": ",".join(self.symbols)}
+        backoff = 1.0
+
+        while not self._stop.is_set():
+            try:
+                # OANDA heartbeats every 5s, so a 30s read timeout means a dead link
+                with requests.get(url, headers=headers, params=params,
+                                  stream=True, timeout=(10, 30)) as response:
+                    response.raise_for_status()
+                    self._response = response
+                    self.connected = True
+                    backoff = 1.0
+                    for line in response.iter_lines():
+                        if self._stop.is_set():
+                            break
+                        try:
+                            self.handle_line(line)
+                        except (ValueError, KeyError):
+                            continue
+            except Exception:
+                pass
+            finally:
+                self.connected = False
+                self._response = None
+
+            if self._stop.is_set():
+                break
+            self.reconnects += 1
+            self._stop.wait(backoff)
+            backoff = min(backoff * 2, self.max_backoff)
@@ -1,5 +1,17 @@
 """VEX Database module - Turso cloud storage."""
 
-from .turso_db import TursoDB, get_db
+from typing import TYPE_CHECKING
+
+from ict_agent._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .turso_db import TursoDB, get_db
 
 __all__ = ["TursoDB", "get_db"]
+
+_EXPORTS = {
+    "TursoDB": "ict_agent.database.turso_db",
+    "get_db": "ict_agent.database.turso_db",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,10 +1,15 @@
 """ICT Concept Detection Modules"""
 
-from ict_agent.detectors.fvg import FVGDetector
-from ict_agent.detectors.order_block import OrderBlockDetector
-from ict_agent.detectors.market_structure import MarketStructureAnalyzer
-from ict_agent.detectors.liquidity import LiquidityDetector
-from ict_agent.detectors.displacement import DisplacementDetector
+from typing import TYPE_CHECKING
+
+from ict_agent._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ict_agent.detectors.fvg import FVGDetector
+    from ict_agent.detectors.order_block import OrderBlockDetector
+    from ict_agent.detectors.market_structure import MarketStructureAnalyzer
+    from ict_agent.detectors.liquidity import LiquidityDetector
+    from ict_agent.detectors.displacement import DisplacementDetector
 
 __all__ = [
     "FVGDetector",
@@ -13,3 +18,13 @@ __all__ = [
     "LiquidityDetector",
     "DisplacementDetector",
 ]
+
+_EXPORTS = {
+    "FVGDetector": "ict_agent.detectors.fvg",
+    "OrderBlockDetector": "ict_agent.detectors.order_block",
+    "MarketStructureAnalyzer": "ict_agent.detectors.market_structure",
+    "LiquidityDetector": "ict_agent.detectors.liquidity",
+    "DisplacementDetector": "ict_agent.detectors.displacement",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -10,11 +10,16 @@ ICT Concept (from SIBI/BISI transcript):
 - A range is NOT rebalanced just by price passing through it
 - Rebalance requires BOTH buy-side AND sell-side delivery
 - Until rebalanced, FVGs remain significant for entries/targets
+
+Active FVGs are indexed per pair by their low, so a price update only
+visits the gaps its candle overlaps. Rebalanced FVGs move to `archived`
+and are not visited again.
 """
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Dict, Literal
+from typing import List, Optional, Dict, Literal, Tuple
 from enum import Enum
 
 
@@ -99,6 +104,59 @@ class TrackedFVG:
         return False
 
 
+class _IntervalIndex:
+    """
+    Active FVGs of one pair, sorted by (low, insertion order).
+
+    A gap overlaps the candle [low, high] when gap.low <= high and
+    gap.high >= low. Every gap is at most `max_width` wide, so only lows
+    in [low - max_width, high] can qualify. That range is found by
+    bisection.
+    """
+
+    __slots__ = ("keys", "fvgs", "max_width")
+
+    def __init__(self):
+        self.keys: List[Tuple[float, int]] = []
+        self.fvgs: List[TrackedFVG] = []
+        self.max_width = 0.0
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add(self, seq: int, fvg: TrackedFVG) -> None:
+        key = (fvg.low, seq)
+        i = bisect_right(self.keys, key)
+        self.keys.insert(i, key)
+        self.fvgs.insert(i, fvg)
+        self.max_width = max(self.max_width, fvg.high - fvg.low)
+
+    def remove(self, seq: int, fvg: TrackedFVG) -> None:
+        key = (fvg.low, seq)
+        i = bisect_left(self.keys, key)
+        if i < len(self.keys) and self.keys[i] == key:
+            del self.keys[i]
+            del self.fvgs[i]
+        if not self.keys:
+            self.max_width = 0.0
+
+    def overlapping(self, low: float, high: float) -> List[Tuple[int, TrackedFVG]]:
+        """(seq, fvg) for gaps intersecting [low, high], in insertion order"""
+        # Small margin so float rounding in low - max_width never skips a gap
+        reach = self.max_width + 1e-9 * max(1.0, abs(low))
+        start = bisect_left(self.keys, (low - reach, -1))
+        stop = bisect_right(self.keys, (high, float("inf")))
+        hits = [(key[1], fvg) for key, fvg in zip(self.keys[start:stop], self.fvgs[start:stop])
+                if fvg.high >= low]
+        hits.sort(key=lambda hit: hit[0])
+        return hits
+
+    def in_order(self) -> List[TrackedFVG]:
+        """All gaps in insertion order"""
+        order = sorted(range(len(self.keys)), key=lambda i: self.keys[i][1])
+        return [self.fvgs[i] for i in order]
+
+
 class FVGRebalanceTracker:
     """
     Tracks FVGs and monitors their fill/rebalance status.
@@ -109,12 +167,21 @@ class FVGRebalanceTracker:
     - Sellside delivery = price moving down through zone
     - Partial fills create entry opportunities
     - Full rebalance removes FVG significance
+    
+    `tracked_fvgs` holds the active (not rebalanced) FVGs; rebalanced ones
+    are moved to `archived` as soon as an update rebalances them.
     """
     
     def __init__(self, pip_value: float = 0.0001):
         self.pip_value = pip_value
         self.tracked_fvgs: Dict[str, TrackedFVG] = {}
+        self.archived: Dict[str, TrackedFVG] = {}
         self.alerts: List[Dict] = []
+        
+        # Per-pair interval index over tracked_fvgs
+        self._index: Dict[str, _IntervalIndex] = {}
+        self._seq: Dict[str, int] = {}
+        self._next_seq = 0
     
     def add_fvg(
         self,
@@ -155,9 +222,29 @@ class FVGRebalanceTracker:
             formation_candle_idx=candle_idx
         )
         
+        # Re-adding the same FVG replaces the earlier one
+        previous = self.tracked_fvgs.pop(fvg_id, None)
+        if previous is not None:
+            self._index[previous.pair].remove(self._seq[fvg_id], previous)
+        self.archived.pop(fvg_id, None)
+        
         self.tracked_fvgs[fvg_id] = fvg
+        self._seq[fvg_id] = self._next_seq
+        self._index.setdefault(pair, _IntervalIndex()).add(self._next_seq, fvg)
+        self._next_seq += 1
         return fvg
     
+    def get_fvg(self, fvg_id: str) -> Optional[TrackedFVG]:
+        """Look up an FVG by id, active or archived"""
+        return self.tracked_fvgs.get(fvg_id) or self.archived.get(fvg_id)
+    
+    def _archive(self, fvg: TrackedFVG) -> None:
+        """Move a rebalanced FVG out of the active index"""
+        if self.tracked_fvgs.pop(fvg.id, None) is None:
+            return
+        self._index[fvg.pair].remove(self._seq[fvg.id], fvg)
+        self.archived[fvg.id] = fvg
+    
     def update_price(
         self,
         pair: str,
@@ -169,7 +256,7 @@ class FVGRebalanceTracker:
         timestamp: datetime
     ) -> List[Dict]:
         """
-        Update all tracked FVGs with new price data.
+        Update the pair's active FVGs that the candle overlaps.
         
         Args:
             pair: Trading pair
@@ -185,12 +272,15 @@ class FVGRebalanceTracker:
         """
         alerts = []
         
-        for fvg_id, fvg in self.tracked_fvgs.items():
-            if fvg.pair != pair:
-                continue
-            
+        index = self._index.get(pair)
+        if not index:
+            return alerts
+        
+        # Only gaps the candle's range touches can change
+        for _, fvg in index.overlapping(candle_low, candle_high):
             if fvg.status == FVGStatus.REBALANCED:
-                continue  # Skip already rebalanced FVGs
+                self._archive(fvg)  # Rebalanced outside update_price
+                continue
             
             # Check for FVG interaction
             alert = self._check_fvg_interaction(
@@ -200,6 +290,9 @@ class FVGRebalanceTracker:
             if alert:
                 alerts.append(alert)
                 self.alerts.append(alert)
+            
+            if fvg.status == FVGStatus.REBALANCED:
+                self._archive(fvg)
         
         return alerts
     
@@ -349,7 +442,16 @@ class FVGRebalanceTracker:
         """
         fvgs = []
         
-        for fvg in self.tracked_fvgs.values():
+        if pair:
+            index = self._index.get(pair)
+            candidates = index.in_order() if index else []
+        else:
+            candidates = list(self.tracked_fvgs.values())
+        if not exclude_rebalanced and self.archived:
+            candidates += list(self.archived.values())
+            candidates.sort(key=lambda fvg: self._seq[fvg.id])
+        
+        for fvg in candidates:
             if pair and fvg.pair != pair:
                 continue
             if timeframe and fvg.timeframe != timeframe:
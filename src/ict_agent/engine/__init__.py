@@ -1,9 +1,14 @@
 """Trading Engine Components"""
 
-from ict_agent.engine.agent import ICTTradingAgent
-from ict_agent.engine.signal_generator import SignalGenerator
-from ict_agent.engine.mtf_analyzer import MultiTimeframeAnalyzer
-from ict_agent.engine.killzone import KillzoneManager
+from typing import TYPE_CHECKING
+
+from ict_agent._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ict_agent.engine.agent import ICTTradingAgent
+    from ict_agent.engine.signal_generator import SignalGenerator
+    from ict_agent.engine.mtf_analyzer import MultiTimeframeAnalyzer
+    from ict_agent.engine.killzone import KillzoneManager
 
 __all__ = [
     "ICTTradingAgent",
@@ -11,3 +16,12 @@ __all__ = [
     "MultiTimeframeAnalyzer",
     "KillzoneManager",
 ]
+
+_EXPORTS = {
+    "ICTTradingAgent": "ict_agent.engine.agent",
+    "SignalGenerator": "ict_agent.engine.signal_generator",
+    "MultiTimeframeAnalyzer": "ict_agent.engine.mtf_analyzer",
+    "KillzoneManager": "ict_agent.engine.killzone",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -106,7 +106,7 @@ class ICTTradingAgent:
             pip_size=self.config.pip_size,
             min_rr=self.config.min_risk_reward,
         )
-        self.mtf_analyzer = MultiTimeframeAnalyzer()
+        self.mtf_analyzer = MultiTimeframeAnalyzer(pip_size=self.config.pip_size)
         self.killzone_manager = KillzoneManager()
         
         self._signal_history: list[TradeSignal] = []
@@ -146,6 +146,7 @@ class ICTTradingAgent:
             self.config.htf_timeframe,
             self.config.itf_timeframe,
             self.config.ltf_timeframe,
+            symbol=symbol,
         )
         
         self.state.htf_biases[symbol] = mtf_result.htf_bias
@@ -159,6 +160,7 @@ class ICTTradingAgent:
             ltf_ohlc=ltf_data,
             htf_bias=mtf_result.htf_bias,
             htf_ohlc=htf_data,
+            bundle=mtf_result.ltf_bundle,
         )
         
         if signal:
@@ -0,0 +1,121 @@
+"""Shared Detector Outputs
+
+One AnalysisBundle holds the five core detector runs (structure, FVG, OB,
+liquidity, displacement) for a single (symbol, timeframe, last bar) frame.
+
+MultiTimeframeAnalyzer builds a bundle per timeframe and SignalGenerator
+consumes the LTF bundle instead of re-running every detector on the same
+frame. Each bundle owns its own detector instances, so the stateful
+accessors (get_active_fvgs, get_recent_sweeps, ...) stay valid after
+other frames are analyzed.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable
+
+import pandas as pd
+
+from ict_agent.detectors import (
+    FVGDetector,
+    OrderBlockDetector,
+    MarketStructureAnalyzer,
+    LiquidityDetector,
+    DisplacementDetector,
+)
+
+
+def bundle_key(symbol: str, timeframe: Hashable, ohlc: pd.DataFrame, pip_size: float) -> tuple:
+    """Identify a frame by symbol, timeframe, window bounds/length and pip size"""
+    if len(ohlc) == 0:
+        return (symbol, timeframe, None, None, 0, pip_size)
+    return (symbol, timeframe, ohlc.index[0], ohlc.index[-1], len(ohlc), pip_size)
+
+
+@dataclass
+class AnalysisBundle:
+    """Detector results (and the detectors holding their state) for one frame"""
+    key: tuple
+    ohlc: pd.DataFrame
+    structure_analyzer: MarketStructureAnalyzer
+    fvg_detector: FVGDetector
+    ob_detector: OrderBlockDetector
+    liquidity_detector: LiquidityDetector
+    displacement_detector: DisplacementDetector
+    structure: pd.DataFrame
+    fvg: pd.DataFrame
+    ob: pd.DataFrame
+    liquidity: pd.DataFrame
+    displacement: pd.DataFrame
+
+    @classmethod
+    def build(
+        cls,
+        ohlc: pd.DataFrame,
+        timeframe: Hashable = None,
+        symbol: str = "",
+        pip_size: float = 0.0001,
+    ) -> "AnalysisBundle":
+        """Run all core detectors once on ohlc"""
+        structure_analyzer = MarketStructureAnalyzer()
+        fvg_detector = FVGDetector(pip_size=pip_size)
+        ob_detector = OrderBlockDetector(pip_size=pip_size)
+        liquidity_detector = LiquidityDetector()
+        displacement_detector = DisplacementDetector()
+
+        return cls(
+            key=bundle_key(symbol, timeframe, ohlc, pip_size),
+            ohlc=ohlc,
+            structure_analyzer=structure_analyzer,
+            fvg_detector=fvg_detector,
+            ob_detector=ob_detector,
+            liquidity_detector=liquidity_detector,
+            displacement_detector=displacement_detector,
+            structure=structure_analyzer.analyze(ohlc),
+            fvg=fvg_detector.detect(ohlc),
+            ob=ob_detector.detect(ohlc),
+            liquidity=liquidity_detector.detect(ohlc),
+            displacement=displacement_detector.detect(ohlc),
+        )
+
+    def matches(self, ohlc: pd.DataFrame, pip_size: float) -> bool:
+        """True if this bundle was built from the same frame window and pip size"""
+        symbol, timeframe = self.key[0], self.key[1]
+        return self.key == bundle_key(symbol, timeframe, ohlc, pip_size)
+
+
+class BundleCache:
+    """Small LRU of AnalysisBundles keyed by bundle_key"""
+
+    def __init__(self, max_size: int = 64):
+        self.max_size = max_size
+        self._bundles: "OrderedDict[tuple, AnalysisBundle]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(
+        self,
+        ohlc: pd.DataFrame,
+        timeframe: Hashable = None,
+        symbol: str = "",
+        pip_size: float = 0.0001,
+    ) -> AnalysisBundle:
+        key = bundle_key(symbol, timeframe, ohlc, pip_size)
+        bundle = self._bundles.get(key)
+        if bundle is not None:
+            self._bundles.move_to_end(key)
+            self.hits += 1
+            return bundle
+
+        self.misses += 1
+        bundle = AnalysisBundle.build(ohlc, timeframe, symbol, pip_size)
+        self._bundles[key] = bundle
+        if len(self._bundles) > self.max_size:
+            self._bundles.popitem(last=False)
+        return bundle
+
+    def clear(self) -> None:
+        self._bundles.clear()
+
+    def __len__(self) -> int:
+        return len(self._bundles)
@@ -20,6 +20,7 @@ from ict_agent.detectors import (
 from ict_agent.detectors.market_structure import StructureType
 from ict_agent.detectors.fvg import FVGDirection
 from ict_agent.detectors.order_block import OBDirection
+from ict_agent.engine.analysis_bundle import AnalysisBundle, BundleCache
 
 
 class Timeframe(Enum):
@@ -63,6 +64,7 @@ class MTFConfluence:
     confluence_score: float
     trade_direction: Optional[Bias]
     reasoning: list[str]
+    ltf_bundle: Optional[AnalysisBundle] = None
 
 
 class MultiTimeframeAnalyzer:
@@ -81,28 +83,35 @@ class MultiTimeframeAnalyzer:
     3. LTF (15M/5M): Find entry trigger
        - Wait for BOS/SMS in direction of HTF bias
        - Enter on FVG or OB within OTE zone
+    
+    Detector runs are kept per (symbol, timeframe, last bar) in a small
+    BundleCache, so unchanged HTF/ITF windows are not re-analyzed and the
+    LTF bundle can be handed to SignalGenerator.
     """
     
-    def __init__(self):
-        self.fvg_detector = FVGDetector()
-        self.ob_detector = OrderBlockDetector()
+    def __init__(self, pip_size: float = 0.0001, cache_size: int = 64):
+        self.pip_size = pip_size
+        self.fvg_detector = FVGDetector(pip_size=pip_size)
+        self.ob_detector = OrderBlockDetector(pip_size=pip_size)
         self.structure_analyzer = MarketStructureAnalyzer()
         self.liquidity_detector = LiquidityDetector()
         self.displacement_detector = DisplacementDetector()
         
+        self.bundles = BundleCache(max_size=cache_size)
         self._analyses: dict[Timeframe, TimeframeAnalysis] = {}
+        self._bundles_by_tf: dict[Timeframe, AnalysisBundle] = {}
     
     def analyze_timeframe(
-        self, ohlc: pd.DataFrame, timeframe: Timeframe
+        self, ohlc: pd.DataFrame, timeframe: Timeframe, symbol: str = ""
     ) -> TimeframeAnalysis:
         """Analyze a single timeframe for ICT concepts"""
-        structure = self.structure_analyzer.analyze(ohlc)
-        fvg = self.fvg_detector.detect(ohlc)
-        ob = self.ob_detector.detect(ohlc)
-        liquidity = self.liquidity_detector.detect(ohlc)
-        displacement = self.displacement_detector.detect(ohlc)
+        bundle = self.bundles.get_or_build(ohlc, timeframe, symbol, self.pip_size)
+        self._bundles_by_tf[timeframe] = bundle
+        fvg = bundle.fvg
+        ob = bundle.ob
+        displacement = bundle.displacement
         
-        trend = self.structure_analyzer.get_current_trend()
+        trend = bundle.structure_analyzer.get_current_trend()
         
         if trend == StructureType.BULLISH:
             bias = Bias.BULLISH
@@ -122,7 +131,7 @@ class MultiTimeframeAnalyzer:
         has_displacement = displacement["is_displacement"].any()
         
         current_price = ohlc.iloc[-1]["close"]
-        bsl_pools = self.liquidity_detector.get_active_liquidity()
+        bsl_pools = bundle.liquidity_detector.get_active_liquidity()
         nearest_bsl = None
         nearest_ssl = None
         
@@ -143,7 +152,7 @@ class MultiTimeframeAnalyzer:
         else:
             premium_discount = "discount"
         
-        last_break = self.structure_analyzer.get_latest_structure_break()
+        last_break = bundle.structure_analyzer.get_latest_structure_break()
         last_structure_break = last_break.break_type.value if last_break else None
         
         analysis = TimeframeAnalysis(
@@ -170,15 +179,17 @@ class MultiTimeframeAnalyzer:
         htf_timeframe: Timeframe = Timeframe.D1,
         itf_timeframe: Timeframe = Timeframe.H1,
         ltf_timeframe: Timeframe = Timeframe.M15,
+        symbol: str = "",
     ) -> MTFConfluence:
         """
         Perform complete multi-timeframe analysis.
         
-        Returns confluence assessment for trade decision.
+        Returns confluence assessment for trade decision, including the
+        LTF detector bundle for reuse by SignalGenerator.
         """
-        htf_analysis = self.analyze_timeframe(htf_ohlc, htf_timeframe)
-        itf_analysis = self.analyze_timeframe(itf_ohlc, itf_timeframe)
-        ltf_analysis = self.analyze_timeframe(ltf_ohlc, ltf_timeframe)
+        htf_analysis = self.analyze_timeframe(htf_ohlc, htf_timeframe, symbol)
+        itf_analysis = self.analyze_timeframe(itf_ohlc, itf_timeframe, symbol)
+        ltf_analysis = self.analyze_timeframe(ltf_ohlc, ltf_timeframe, symbol)
         
         htf_bias = htf_analysis.bias
         reasoning = []
@@ -252,6 +263,7 @@ class MultiTimeframeAnalyzer:
             confluence_score=score,
             trade_direction=trade_direction,
             reasoning=reasoning,
+            ltf_bundle=self._bundles_by_tf.get(ltf_timeframe),
         )
     
     def get_entry_zones(
@@ -23,6 +23,7 @@ from ict_agent.detectors.order_block import OrderBlock, OBDirection
 from ict_agent.detectors.liquidity import LiquidityType
 from ict_agent.engine.killzone import KillzoneManager, Killzone
 from ict_agent.engine.mtf_analyzer import MultiTimeframeAnalyzer, Bias, Timeframe
+from ict_agent.engine.analysis_bundle import AnalysisBundle
 
 
 class SignalType(Enum):
@@ -170,6 +171,7 @@ class SignalGenerator:
         ltf_ohlc: pd.DataFrame,
         htf_bias: Bias,
         htf_ohlc: Optional[pd.DataFrame] = None,
+        bundle: Optional[AnalysisBundle] = None,
     ) -> Optional[TradeSignal]:
         """
         Generate a trade signal if conditions are met.
@@ -179,6 +181,9 @@ class SignalGenerator:
             ltf_ohlc: Low timeframe OHLC data for entry
             htf_bias: Higher timeframe bias (BULLISH/BEARISH)
             htf_ohlc: Optional HTF data for additional analysis
+            bundle: Detector outputs already computed for ltf_ohlc
+                (e.g. MTFConfluence.ltf_bundle); detectors are only run
+                here if it is missing or was built from a different frame
         
         Returns:
             TradeSignal if valid setup found, None otherwise
@@ -189,11 +194,9 @@ class SignalGenerator:
         current_time = ltf_ohlc.index[-1]
         current_price = ltf_ohlc.iloc[-1]["close"]
         
-        structure = self.structure_analyzer.analyze(ltf_ohlc)
-        fvg = self.fvg_detector.detect(ltf_ohlc)
-        ob = self.ob_detector.detect(ltf_ohlc)
-        liquidity = self.liquidity_detector.detect(ltf_ohlc)
-        displacement = self.displacement_detector.detect(ltf_ohlc)
+        if bundle is None or not bundle.matches(ltf_ohlc, self.pip_size):
+            bundle = AnalysisBundle.build(ltf_ohlc, symbol=symbol, pip_size=self.pip_size)
+        self._use_bundle(bundle)
         
         confluences = self._build_confluences(
             ltf_ohlc, htf_bias, current_time, current_price
@@ -250,6 +253,14 @@ class SignalGenerator:
             reasoning=reasoning,
         )
     
+    def _use_bundle(self, bundle: AnalysisBundle) -> None:
+        """Point the generator's detectors at a bundle's already-run detectors"""
+        self.structure_analyzer = bundle.structure_analyzer
+        self.fvg_detector = bundle.fvg_detector
+        self.ob_detector = bundle.ob_detector
+        self.liquidity_detector = bundle.liquidity_detector
+        self.displacement_detector = bundle.displacement_detector
+    
     def _build_confluences(
         self,
         ohlc: pd.DataFrame,
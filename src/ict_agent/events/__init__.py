@@ -1,15 +1,21 @@
 """VEX Event System - All agent activity flows through typed events."""
-from ict_agent.events.event_types import (
-    VexEvent,
-    MarketEvent,
-    SignalEvent,
-    TradeEvent,
-    LearningEvent,
-    RiskEvent,
-    SystemEvent,
-    EventType,
-)
-from ict_agent.events.event_stream import EventStream
+
+from typing import TYPE_CHECKING
+
+from ict_agent._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ict_agent.events.event_types import (
+        VexEvent,
+        MarketEvent,
+        SignalEvent,
+        TradeEvent,
+        LearningEvent,
+        RiskEvent,
+        SystemEvent,
+        EventType,
+    )
+    from ict_agent.events.event_stream import EventStream
 
 __all__ = [
     "VexEvent",
@@ -22,3 +28,17 @@ __all__ = [
     "EventType",
     "EventStream",
 ]
+
+_EXPORTS = {
+    "VexEvent": "ict_agent.events.event_types",
+    "MarketEvent": "ict_agent.events.event_types",
+    "SignalEvent": "ict_agent.events.event_types",
+    "TradeEvent": "ict_agent.events.event_types",
+    "LearningEvent": "ict_agent.events.event_types",
+    "RiskEvent": "ict_agent.events.event_types",
+    "SystemEvent": "ict_agent.events.event_types",
+    "EventType": "ict_agent.events.event_types",
+    "EventStream": "ict_agent.events.event_stream",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,6 +1,35 @@
 """Trade Execution Components"""
 
-from ict_agent.execution.position_manager import PositionManager
-from ict_agent.execution.risk_manager import RiskManager
+from typing import TYPE_CHECKING
 
-__all__ = ["PositionManager", "RiskManager"]
+from ict_agent._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ict_agent.execution.async_executor import (
+        AccountSnapshot,
+        AsyncOANDAExecutor,
+        ExecutorLoop,
+    )
+    from ict_agent.execution.fake_broker import FakeBroker
+    from ict_agent.execution.position_manager import PositionManager
+    from ict_agent.execution.risk_manager import RiskManager
+
+__all__ = [
+    "AccountSnapshot",
+    "AsyncOANDAExecutor",
+    "ExecutorLoop",
+    "FakeBroker",
+    "PositionManager",
+    "RiskManager",
+]
+
+_EXPORTS = {
+    "AccountSnapshot": "ict_agent.execution.async_executor",
+    "AsyncOANDAExecutor": "ict_agent.execution.async_executor",
+    "ExecutorLoop": "ict_agent.execution.async_executor",
+    "FakeBroker": "ict_agent.execution.fake_broker",
+    "PositionManager": "ict_agent.execution.position_manager",
+    "RiskManager": "ict_agent.execution.risk_manager",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,571 @@
+"""
+Async OANDA Executor
+====================
+asyncio variant of OANDAExecutor for latency-sensitive paths:
+
+- Closes and SL/TP modifications run concurrently, bounded by
+  max_concurrency. close_all_positions() therefore takes about as long
+  as the slowest close, not the sum of all of them.
+- Orders are brackets: a single POST carries stopLossOnFill and
+  takeProfitOnFill, so there is no follow-up modify request after the
+  fill.
+- AccountSnapshot holds the account, positions and open trades. It is
+  loaded once, then kept current from the transaction stream: a
+  transaction newer than the snapshot triggers one
+  /changes?sinceTransactionID= delta request.
+  - Price moves change NAV and unrealized P&L without any transaction, so
+    the same /changes request also runs every state_refresh_seconds. Its
+    calculated state (account, per-position and per-trade unrealized P&L)
+    is applied every time.
+  - While the snapshot is current (stream connected and state refreshed
+    within max_state_age), OANDAExecutor and RiskGuardian read it instead
+    of calling /summary.
+- Requests go through the shared OANDATransport for these credentials
+  (see data.oanda_transport): the same token bucket as the sync clients,
+  jittered retries that honor Retry-After, and the per-endpoint latency
+  histograms. A 429 is retried for every request; 5xx and connection
+  errors are retried only where repeating is safe (GETs, SL/TP
+  modifications, full closes), never for an order POST.
+- ExecutorLoop runs the executor on a private event-loop thread so
+  synchronous code (the controller) can start it and submit coroutines.
+
+Usage:
+    executor = AsyncOANDAExecutor(api_key, account_id, "practice")
+    await executor.start()                      # load account, follow stream
+    await executor.place_market_order("EURUSD", 10000, stop_loss=1.0820, take_profit=1.0910)
+    await executor.close_all_positions()        # concurrent flatten
+    executor.snapshot.account_info()            # no HTTP
+
+Tests run it against execution.fake_broker.FakeBroker (httpx MockTransport).
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Dict, List, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo
+
+import httpx
+
+from ict_agent.data.oanda_fetcher import OANDAConfig
+from ict_agent.data.oanda_transport import (
+    IDEMPOTENT_METHODS,
+    OANDATransport,
+    endpoint_label,
+    get_transport,
+    retryable,
+)
+from ict_agent.execution.oanda_executor import (
+    AccountInfo,
+    OrderResult,
+    Position,
+    parse_account,
+    parse_order_response,
+    parse_position,
+)
+
+NY_TZ = ZoneInfo("America/New_York")
+
+# AccountChangesState fields copied onto the cached account
+_STATE_FIELDS = ("NAV", "unrealizedPL", "marginUsed", "marginAvailable",
+                 "positionValue", "withdrawalLimit", "balance")
+
+
+def _instrument(symbol: str) -> str:
+    """EURUSD / EUR/USD / EUR_USD → EUR_USD"""
+    symbol = symbol.upper().replace("/", "_")
+    if "_" not in symbol and len(symbol) == 6:
+        return f"{symbol[:3]}_{symbol[3:]}"
+    return symbol
+
+
+class AccountSnapshot:
+    """Account, positions and open trades maintained from the transaction stream."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._account: Dict[str, Any] = {}
+        self._positions: Dict[str, dict] = {}
+        self._trades: Dict[str, dict] = {}
+        self.last_transaction_id: Optional[str] = None
+        self.updated_at: Optional[datetime] = None
+        self.live = False
+        self.transactions = 0
+        self.syncs = 0
+        # monotonic time of the last calculated-state update
+        self.state_at: Optional[float] = None
+        self.max_state_age = 15.0
+
+    def load(self, account: dict, last_transaction_id: Optional[str]) -> None:
+        """Replace everything from a full GET /v3/accounts/{id}."""
+        with self._lock:
+            self._account = {k: v for k, v in account.items()
+                             if k not in ("positions", "trades", "orders")}
+            self._positions = {p["instrument"]: p for p in account.get("positions", [])
+                               if parse_position(p) is not None}
+            self._trades = {t["id"]: t for t in account.get("trades", [])}
+            self.last_transaction_id = last_transaction_id or account.get("lastTransactionID")
+            self.updated_at = datetime.now(NY_TZ)
+            self.state_at = time.monotonic()
+
+    def apply_changes(self, changes: dict, state: dict, last_transaction_id: str) -> None:
+        """Apply a /changes response (AccountChanges + AccountChangesState)."""
+        with self._lock:
+            for trade in changes.get("tradesOpened", []):
+                self._trades[trade["id"]] = trade
+            for trade in changes.get("tradesReduced", []):
+                self._trades.setdefault(trade["id"], {}).update(trade)
+            for trade in changes.get("tradesClosed", []):
+                self._trades.pop(trade["id"], None)
+            for pos in changes.get("positions", []):
+                if parse_position(pos) is None:
+                    self._positions.pop(pos["instrument"], None)
+                else:
+                    self._positions[pos["instrument"]] = pos
+            for key in _STATE_FIELDS:
+                if key in state:
+                    self._account[key] = state[key]
+            # Calculated state: P&L and margin move with price, not transactions
+            for calc in state.get("positions", []):
+                pos = self._positions.get(calc.get("instrument"))
+                if pos is None:
+                    continue
+                self._positions[pos["instrument"]] = {
+                    **pos,
+                    "long": {**pos.get("long", {}),
+                             "unrealizedPL": calc.get("longUnrealizedPL", "0")},
+                    "short": {**pos.get("short", {}),
+                              "unrealizedPL": calc.get("shortUnrealizedPL", "0")},
+                    "unrealizedPL": calc.get("netUnrealizedPL", pos.get("unrealizedPL")),
+                    "marginUsed": calc.get("marginUsed", pos.get("marginUsed")),
+                }
+            for calc in state.get("trades", []):
+                trade = self._trades.get(calc.get("id"))
+                if trade is not None:
+                    self._trades[trade["id"]] = {
+                        **trade,
+                        "unrealizedPL": calc.get("unrealizedPL", trade.get("unrealizedPL")),
+                        "marginUsed": calc.get("marginUsed", trade.get("marginUsed")),
+                    }
+            self.last_transaction_id = last_transaction_id
+            self.syncs += 1
+            self.updated_at = datetime.now(NY_TZ)
+            self.state_at = time.monotonic()
+
+    def apply_transaction(self, transaction: dict) -> bool:
+        """
+        Fields a transaction carries directly (fills report the new balance).
+        Returns False when a /changes sync already covered it.
+        """
+        with self._lock:
+            self.transactions += 1
+            if int(transaction.get("id", 0)) <= int(self.last_transaction_id or 0):
+                return False
+            if "accountBalance" in transaction:
+                self._account["balance"] = transaction["accountBalance"]
+            return True
+
+    # ─── Reads (any thread) ──────────────────────────────────────────────
+
+    def current(self) -> bool:
+        """Stream connected and NAV/P&L refreshed within max_state_age."""
+        state_at = self.state_at
+        return (self.live and state_at is not None
+                and time.monotonic() - state_at <= self.max_state_age)
+
+    def account_info(self) -> AccountInfo:
+        with self._lock:
+            account = dict(self._account)
+            account["openTradeCount"] = len(self._trades)
+            account["openPositionCount"] = len(self._positions)
+        return parse_account(account)
+
+    def positions(self) -> List[Position]:
+        with self._lock:
+            raw = list(self._positions.values())
+        return [p for p in (parse_position(pos) for pos in raw) if p is not None]
+
+    def position(self, instrument: str) -> Optional[Position]:
+        with self._lock:
+            raw = self._positions.get(instrument)
+        return parse_position(raw) if raw else None
+
+    def trades(self) -> List[dict]:
+        with self._lock:
+            return [dict(t) for t in self._trades.values()]
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "live": self.live,
+                "last_transaction_id": self.last_transaction_id,
+                "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+                "state_age_seconds": (round(time.monotonic() - self.state_at, 2)
+                                      if self.state_at is not None else None),
+                "open_trades": len(self._trades),
+                "open_positions": len(self._positions),
+                "transactions": self.transactions,
+                "syncs": self.syncs,
+            }
+
+
+class AsyncOANDAExecutor:
+    """Concurrent OANDA order execution with a stream-maintained account snapshot."""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        account_id: Optional[str] = None,
+        environment: str = "practice",
+        client: Optional[httpx.AsyncClient] = None,
+        max_concurrency: int = 8,
+        max_backoff_seconds: float = 30.0,
+        state_refresh_seconds: Optional[float] = 5.0,
+        transport: Optional[OANDATransport] = None,
+    ):
+        self.api_key = api_key or os.getenv("OANDA_API_KEY", "")
+        self.account_id = account_id or os.getenv("OANDA_ACCOUNT_ID", "")
+        config = OANDAConfig(api_key=self.api_key, account_id=self.account_id,
+                             environment=environment)
+        self.base_url = config.base_url
+        self.stream_url = config.stream_url
+        self.max_backoff = max_backoff_seconds
+        # Rate limit, retry policy and latency metrics shared with OANDAExecutor
+        self.transport = transport or get_transport(config)
+
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_connections=max_concurrency * 2,
+                                max_keepalive_connections=max_concurrency),
+        )
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "Accept-Datetime-Format": "RFC3339",
+        }
+        self._max_concurrency = max_concurrency
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._sync_lock: Optional[asyncio.Lock] = None
+        self._stream_task: Optional[asyncio.Task] = None
+        self._state_task: Optional[asyncio.Task] = None
+        self.state_refresh_seconds = state_refresh_seconds
+        self.snapshot = AccountSnapshot()
+        if state_refresh_seconds:
+            # Three missed refreshes and readers fall back to polling
+            self.snapshot.max_state_age = 3 * state_refresh_seconds
+
+    # ─── Lifecycle ───────────────────────────────────────────────────────
+
+    async def start(self) -> None:
+        """Load the account, then follow the transaction stream and refresh state."""
+        await self.refresh()
+        if self._stream_task is None or self._stream_task.done():
+            self._stream_task = asyncio.create_task(self._follow_transactions())
+        if self.state_refresh_seconds and (self._state_task is None or self._state_task.done()):
+            self._state_task = asyncio.create_task(self._refresh_state())
+
+    async def stop(self) -> None:
+        for task in (self._stream_task, self._state_task):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._stream_task = self._state_task = None
+        self.snapshot.live = False
+        if self._owns_client:
+            await self.client.aclose()
+
+    # ─── Snapshot maintenance ────────────────────────────────────────────
+
+    async def refresh(self) -> AccountInfo:
+        """Full reload of account, positions and trades."""
+        status, body = await self._request("GET", "")
+        if status != 200:
+            raise RuntimeError(f"Account load failed: {body.get('errorMessage', body)}")
+        self.snapshot.load(body.get("account", {}), body.get("lastTransactionID"))
+        return self.snapshot.account_info()
+
+    async def sync_changes(self) -> None:
+        """Pull the account delta since the last applied transaction, plus current state."""
+        async with self._lock():
+            since = self.snapshot.last_transaction_id
+            status, body = await self._request(
+                "GET", "/changes", params={"sinceTransactionID": since}
+            )
+            if status != 200:
+                raise RuntimeError(f"Account changes failed: {body.get('errorMessage', body)}")
+            last = body.get("lastTransactionID", since)
+            self.snapshot.apply_changes(body.get("changes", {}), body.get("state", {}), last)
+
+    async def _refresh_state(self) -> None:
+        """NAV and unrealized P&L change with price alone: re-read them on a timer."""
+        while True:
+            await asyncio.sleep(self.state_refresh_seconds)
+            try:
+                await self.sync_changes()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                pass  # snapshot ages out; readers fall back to polling
+
+    async def _follow_transactions(self) -> None:
+        url = f"{self.stream_url}/v3/accounts/{self.account_id}/transactions/stream"
+        backoff = 1.0
+        reconnect = False
+        while True:
+            try:
+                # Heartbeats arrive every 5s, so a 30s read timeout means a dead link
+                async with self.client.stream("GET", url, headers=self._headers,
+                                              timeout=httpx.Timeout(30.0, connect=10.0)) as response:
+                    response.raise_for_status()
+                    if reconnect:
+                        # Catch up on whatever happened while disconnected
+                        await self.sync_changes()
+                    self.snapshot.live = True
+                    backoff = 1.0
+                    async for line in response.aiter_lines():
+                        if not line:
+                            continue
+                        transaction = json.loads(line)
+                        if transaction.get("type") == "HEARTBEAT":
+                            continue
+                        # A burst of fills is covered by the first sync after it
+                        if self.snapshot.apply_transaction(transaction):
+                            await self.sync_changes()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                pass
+            self.snapshot.live = False
+            reconnect = True
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.max_backoff)
+
+    # ─── Orders ──────────────────────────────────────────────────────────
+
+    async def place_market_order(
+        self,
+        symbol: str,
+        units: int,
+        stop_loss: Optional[float] = None,
+        take_profit: Optional[float] = None,
+        trailing_stop_distance: Optional[float] = None,
+    ) -> OrderResult:
+        """Market order with its SL/TP attached on fill, in one request."""
+        order: Dict[str, Any] = {
+            "type": "MARKET",
+            "instrument": _instrument(symbol),
+            "units": str(units),
+            "timeInForce": "FOK",
+            "positionFill": "DEFAULT",
+        }
+        if stop_loss:
+            order["stopLossOnFill"] = {"price": f"{stop_loss:.5f}"}
+        if take_profit:
+            order["takeProfitOnFill"] = {"price": f"{take_profit:.5f}"}
+        if trailing_stop_distance:
+            order["trailingStopLossOnFill"] = {"distance": f"{trailing_stop_distance:.5f}"}
+        try:
+            status, body = await self._request("POST", "/orders", json={"order": order})
+            return parse_order_response(status, body)
+        except Exception as e:
+            return OrderResult(success=False, message=f"Execution error: {str(e)}")
+
+    async def place_orders(self, orders: Sequence[Dict[str, Any]]) -> List[OrderResult]:
+        """Submit several bracket orders concurrently (kwargs of place_market_order)."""
+        return await asyncio.gather(*(self.place_market_order(**o) for o in orders))
+
+    async def modify_trade_sl_tp(
+        self,
+        trade_id: str,
+        stop_loss: Optional[float] = None,
+        take_profit: Optional[float] = None,
+    ) -> OrderResult:
+        data: Dict[str, Any] = {}
+        if stop_loss:
+            data["stopLoss"] = {"price": f"{stop_loss:.5f}"}
+        if take_profit:
+            data["takeProfit"] = {"price": f"{take_profit:.5f}"}
+        try:
+            status, body = await self._request("PUT", f"/trades/{trade_id}/orders", json=data,
+                                               idempotent=True)
+        except Exception as e:
+            return OrderResult(success=False, message=str(e))
+        if status == 200:
+            return OrderResult(success=True, trade_id=trade_id, message="Trade modified",
+                               raw_response=body)
+        return OrderResult(success=False, message=f"Modify failed: {body}", raw_response=body)
+
+    async def modify_trades(
+        self, changes: Dict[str, Tuple[Optional[float], Optional[float]]]
+    ) -> List[OrderResult]:
+        """Modify many trades at once: {trade_id: (stop_loss, take_profit)}."""
+        return await asyncio.gather(
+            *(self.modify_trade_sl_tp(tid, sl, tp) for tid, (sl, tp) in changes.items())
+        )
+
+    async def close_trade(self, trade_id: str, units: Optional[int] = None) -> OrderResult:
+        data = {"units": str(abs(units))} if units else {}
+        try:
+            # A full close can be repeated safely; a partial one cannot
+            status, body = await self._request("PUT", f"/trades/{trade_id}/close", json=data,
+                                               idempotent=not units)
+        except Exception as e:
+            return OrderResult(success=False, message=str(e))
+        if status == 200:
+            fill = body.get("orderFillTransaction", {})
+            return OrderResult(
+                success=True,
+                trade_id=trade_id,
+                fill_price=float(fill.get("price", 0)),
+                units=int(fill.get("units", 0)),
+                message="Trade closed",
+                raw_response=body,
+            )
+        return OrderResult(success=False, message=f"Close failed: {body}", raw_response=body)
+
+    async def close_position(self, symbol: str, units: Optional[int] = None) -> OrderResult:
+        """
+        Close a whole position. `units` (signed net units) picks the side;
+        without it the snapshot is used, then a position lookup.
+        """
+        instrument = _instrument(symbol)
+        if units is None:
+            position = self.snapshot.position(instrument) if self.snapshot.live else None
+            if position is None:
+                position = await self._fetch_position(instrument)
+            if position is None:
+                return OrderResult(success=False, message="No position to close")
+            units = position.units
+        data = {"longUnits": "ALL"} if units > 0 else {"shortUnits": "ALL"}
+        try:
+            status, body = await self._request("PUT", f"/positions/{instrument}/close", json=data,
+                                               idempotent=True)
+        except Exception as e:
+            return OrderResult(success=False, message=str(e))
+        if status == 200:
+            return OrderResult(success=True, message=f"Position {instrument} closed",
+                               raw_response=body)
+        return OrderResult(success=False, message=f"Close failed: {body}", raw_response=body)
+
+    async def close_all_positions(self) -> List[OrderResult]:
+        """Emergency flatten: every position closed concurrently."""
+        if self.snapshot.live:
+            positions = self.snapshot.positions()
+        else:
+            positions = await self.get_positions()
+        return await asyncio.gather(
+            *(self.close_position(p.instrument, p.units) for p in positions)
+        )
+
+    async def get_positions(self) -> List[Position]:
+        status, body = await self._request("GET", "/openPositions")
+        if status != 200:
+            return []
+        return [p for p in (parse_position(pos) for pos in body.get("positions", []))
+                if p is not None]
+
+    async def _fetch_position(self, instrument: str) -> Optional[Position]:
+        for position in await self.get_positions():
+            if position.instrument == instrument:
+                return position
+        return None
+
+    # ─── HTTP ────────────────────────────────────────────────────────────
+
+    async def _request(
+        self, method: str, path: str, idempotent: Optional[bool] = None, **kwargs
+    ) -> Tuple[int, dict]:
+        """
+        One account request, rate limited and retried like OANDATransport.request.
+        idempotent defaults to the method (GET); connection errors are
+        re-raised once retries are exhausted.
+        """
+        url = f"{self.base_url}/v3/accounts/{self.account_id}{path}"
+        label = endpoint_label(method, url)
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        transport = self.transport
+
+        attempt = 0
+        while True:
+            await transport.limiter.acquire_async()
+            start = time.perf_counter()
+            try:
+                async with self._semaphore():
+                    response = await self.client.request(method, url, headers=self._headers,
+                                                         **kwargs)
+            except httpx.TransportError:
+                transport.record(label, start, None)
+                if not idempotent or attempt >= transport.max_retries:
+                    raise
+                attempt += 1
+                await asyncio.sleep(transport.retry_delay(attempt, None))
+                continue
+
+            status = response.status_code
+            transport.record(label, start, status)
+            if not retryable(status, idempotent) or attempt >= transport.max_retries:
+                break
+            attempt += 1
+            await asyncio.sleep(transport.retry_delay(attempt, response.headers.get("Retry-After")))
+        try:
+            body = response.json()
+        except ValueError:
+            body = {"errorMessage": response.text}
+        return response.status_code, body
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # Created lazily so the executor can be built outside the event loop
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self._max_concurrency)
+        return self._slots
+
+    def _lock(self) -> asyncio.Lock:
+        if self._sync_lock is None:
+            self._sync_lock = asyncio.Lock()
+        return self._sync_lock
+
+
+class ExecutorLoop:
+    """Runs an AsyncOANDAExecutor on its own event-loop thread for sync callers."""
+
+    def __init__(self, executor: AsyncOANDAExecutor):
+        self.executor = executor
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever,
+                                        name="oanda-async-executor", daemon=True)
+
+    def start(self, timeout: float = 15.0) -> None:
+        """Start the loop thread and the executor; on failure or timeout, tear both down."""
+        if not self._thread.is_alive():
+            self._thread.start()
+        future = asyncio.run_coroutine_threadsafe(self.executor.start(), self._loop)
+        try:
+            future.result(timeout)
+        except BaseException:
+            # A late start would otherwise open a stream nobody reads
+            future.cancel()
+            try:
+                self.stop()
+            except Exception:
+                pass  # report the start failure, not the teardown
+            raise
+
+    def call(self, coro: Awaitable, timeout: Optional[float] = 30.0) -> Any:
+        """Run a coroutine on the executor loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        if self._thread.is_alive():
+            try:
+                self.call(self.executor.stop(), timeout=timeout)
+            finally:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._thread.join(timeout)
@@ -0,0 +1,361 @@
+"""
+Fake OANDA Broker
+=================
+In-memory OANDA v20 account served through httpx.MockTransport, so that
+AsyncOANDAExecutor can be exercised end to end without network access.
+
+Supported endpoints (under /v3/accounts/{id}):
+    GET  ""  /summary  /changes  /openPositions  /openTrades
+    GET  /transactions/stream           (newline-delimited JSON + heartbeats)
+    POST /orders                        (MARKET fills with SL/TP on fill)
+    PUT  /trades/{id}/orders  /trades/{id}/close  /positions/{inst}/close
+
+Every non-stream request waits `latency` seconds, and the broker counts
+how many requests are in flight at once. fail_next() answers the next
+matching requests with an error status (429 with Retry-After, 503, ...)
+before they reach the account.
+
+Usage:
+    broker = FakeBroker(prices={"EUR_USD": 1.0850}, latency=0.05)
+    executor = AsyncOANDAExecutor("token", broker.account_id, client=broker.client())
+"""
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import httpx
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f000Z")
+
+
+class FakeBroker:
+    """Single-account OANDA stand-in with market fills and a transaction stream."""
+
+    def __init__(
+        self,
+        account_id: str = "101-001-0000000-001",
+        balance: float = 100000.0,
+        prices: Optional[Dict[str, float]] = None,
+        latency: float = 0.0,
+        heartbeat_seconds: float = 5.0,
+        margin_rate: float = 0.02,
+    ):
+        self.account_id = account_id
+        self.balance = balance
+        self.prices: Dict[str, float] = dict(prices or {})
+        self.latency = latency
+        self.heartbeat_seconds = heartbeat_seconds
+        self.margin_rate = margin_rate
+
+        self.trades: Dict[str, dict] = {}
+        self.transactions: List[dict] = []
+        # (transaction id, kind, trade) for /changes: "opened", "reduced", "closed"
+        self._changes: List[Tuple[int, str, dict]] = []
+        self._touched: List[Tuple[int, str]] = []
+        self._subscribers: List[asyncio.Queue] = []
+        self._last_id = 0
+
+        self.requests: List[Tuple[str, str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        # [method, path suffix, status, remaining, headers]
+        self._faults: List[list] = []
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=self.transport())
+
+    def fail_next(
+        self,
+        method: str,
+        suffix: str,
+        status: int = 429,
+        times: int = 1,
+        retry_after: Optional[str] = None,
+    ) -> None:
+        """Answer the next `times` matching requests with `status`, leaving the account untouched."""
+        headers = {"Retry-After": retry_after} if retry_after is not None else {}
+        self._faults.append([method, suffix, status, times, headers])
+
+    def count(self, method: str, suffix: str = "") -> int:
+        """Requests seen with this method whose path ends with `suffix`."""
+        return sum(1 for m, path in self.requests if m == method and path.endswith(suffix))
+
+    # ─── Account state ───────────────────────────────────────────────────
+
+    def set_price(self, instrument: str, price: float) -> None:
+        self.prices[instrument] = price
+
+    def _unrealized(self, trade: dict) -> float:
+        units = int(trade["currentUnits"])
+        return (self.prices[trade["instrument"]] - float(trade["price"])) * units
+
+    def _position(self, instrument: str) -> dict:
+        sides = {"long": [0, 0.0, 0.0], "short": [0, 0.0, 0.0]}  # units, cost, PL
+        margin = 0.0
+        for trade in self.trades.values():
+            if trade["instrument"] != instrument:
+                continue
+            units = int(trade["currentUnits"])
+            side = sides["long" if units > 0 else "short"]
+            side[0] += units
+            side[1] += units * float(trade["price"])
+            side[2] += self._unrealized(trade)
+            margin += abs(units) * self.prices[instrument] * self.margin_rate
+
+        def side_json(units, cost, pl):
+            avg = f"{cost / units:.5f}" if units else None
+            return {"units": str(units), "averagePrice": avg, "unrealizedPL": f"{pl:.4f}"}
+
+        return {
+            "instrument": instrument,
+            "long": side_json(*sides["long"]),
+            "short": side_json(*sides["short"]),
+            "marginUsed": f"{margin:.4f}",
+            "unrealizedPL": f"{sides['long'][2] + sides['short'][2]:.4f}",
+        }
+
+    def _state(self) -> dict:
+        unrealized = sum(self._unrealized(t) for t in self.trades.values())
+        margin = sum(abs(int(t["currentUnits"])) * self.prices[t["instrument"]] * self.margin_rate
+                     for t in self.trades.values())
+        nav = self.balance + unrealized
+        return {
+            "balance": f"{self.balance:.4f}",
+            "unrealizedPL": f"{unrealized:.4f}",
+            "NAV": f"{nav:.4f}",
+            "marginUsed": f"{margin:.4f}",
+            "marginAvailable": f"{nav - margin:.4f}",
+            "positionValue": f"{margin / self.margin_rate:.4f}",
+        }
+
+    def _account(self, full: bool) -> dict:
+        instruments = sorted({t["instrument"] for t in self.trades.values()})
+        account = {
+            "id": self.account_id,
+            "currency": "USD",
+            "openTradeCount": len(self.trades),
+            "openPositionCount": len(instruments),
+            "lastTransactionID": str(self._last_id),
+            **self._state(),
+        }
+        if full:
+            account["trades"] = [dict(t) for t in self.trades.values()]
+            account["positions"] = [self._position(i) for i in instruments]
+            account["orders"] = []
+        return account
+
+    def _transaction(self, kind: str, **fields) -> dict:
+        self._last_id += 1
+        transaction = {"id": str(self._last_id), "type": kind, "time": _now(),
+                       "accountID": self.account_id, **fields}
+        self.transactions.append(transaction)
+        for queue in self._subscribers:
+            queue.put_nowait(transaction)
+        return transaction
+
+    # ─── Operations ──────────────────────────────────────────────────────
+
+    def _market_order(self, order: dict) -> Tuple[int, dict]:
+        instrument = order.get("instrument", "")
+        if instrument not in self.prices:
+            return 400, {"errorMessage": f"Invalid instrument {instrument}"}
+        units = int(order["units"])
+        price = self.prices[instrument]
+        create = self._transaction("MARKET_ORDER", instrument=instrument, units=str(units))
+        fill = self._transaction(
+            "ORDER_FILL",
+            orderID=create["id"],
+            instrument=instrument,
+            units=str(units),
+            price=f"{price:.5f}",
+            pl="0.0000",
+            accountBalance=f"{self.balance:.4f}",
+            tradeOpened={"tradeID": None, "units": str(units)},
+        )
+        trade = {
+            "id": fill["id"],
+            "instrument": instrument,
+            "price": f"{price:.5f}",
+            "openTime": fill["time"],
+            "initialUnits": str(units),
+            "currentUnits": str(units),
+            "state": "OPEN",
+            "realizedPL": "0.0000",
+        }
+        fill["tradeOpened"]["tradeID"] = trade["id"]
+        for key, field in (("stopLossOnFill", "stopLoss"), ("takeProfitOnFill", "takeProfit")):
+            if key in order:
+                trade[field] = order[key]["price"]
+        self.trades[trade["id"]] = trade
+        self._changes.append((self._last_id, "opened", dict(trade)))
+        self._touched.append((self._last_id, instrument))
+        return 201, {"orderCreateTransaction": create, "orderFillTransaction": fill,
+                     "lastTransactionID": str(self._last_id)}
+
+    def _close(self, trade: dict, units: Optional[int] = None) -> dict:
+        current = int(trade["currentUnits"])
+        closing = current if units is None else min(abs(units), abs(current)) * (1 if current > 0 else -1)
+        price = self.prices[trade["instrument"]]
+        pl = (price - float(trade["price"])) * closing
+        self.balance += pl
+        remaining = current - closing
+        fill = self._transaction(
+            "ORDER_FILL",
+            instrument=trade["instrument"],
+            units=str(-closing),
+            price=f"{price:.5f}",
+            pl=f"{pl:.4f}",
+            accountBalance=f"{self.balance:.4f}",
+        )
+        trade["realizedPL"] = f"{float(trade['realizedPL']) + pl:.4f}"
+        if remaining:
+            trade["currentUnits"] = str(remaining)
+            fill["tradeReduced"] = {"tradeID": trade["id"], "units": str(-closing)}
+            self._changes.append((self._last_id, "reduced", dict(trade)))
+        else:
+            self.trades.pop(trade["id"])
+            trade.update(state="CLOSED", currentUnits="0")
+            fill["tradesClosed"] = [{"tradeID": trade["id"], "units": str(-closing)}]
+            self._changes.append((self._last_id, "closed", dict(trade)))
+        self._touched.append((self._last_id, trade["instrument"]))
+        return fill
+
+    def _changes_since(self, since: int) -> dict:
+        changes: Dict[str, list] = {"tradesOpened": [], "tradesReduced": [], "tradesClosed": []}
+        key = {"opened": "tradesOpened", "reduced": "tradesReduced", "closed": "tradesClosed"}
+        for txn_id, kind, trade in self._changes:
+            if txn_id > since:
+                changes[key[kind]].append(trade)
+        touched = sorted({inst for txn_id, inst in self._touched if txn_id > since})
+        changes["positions"] = [self._position(i) for i in touched]
+
+        # AccountChangesState: calculated values that move with price
+        state = self._state()
+        state["positions"] = []
+        for instrument in sorted({t["instrument"] for t in self.trades.values()}):
+            position = self._position(instrument)
+            state["positions"].append({
+                "instrument": instrument,
+                "netUnrealizedPL": position["unrealizedPL"],
+                "longUnrealizedPL": position["long"]["unrealizedPL"],
+                "shortUnrealizedPL": position["short"]["unrealizedPL"],
+                "marginUsed": position["marginUsed"],
+            })
+        state["trades"] = [
+            {"id": t["id"], "unrealizedPL": f"{self._unrealized(t):.4f}",
+             "marginUsed": f"{abs(int(t['currentUnits'])) * self.prices[t['instrument']] * self.margin_rate:.4f}"}
+            for t in self.trades.values()
+        ]
+        return {
+            "changes": changes,
+            "state": state,
+            "lastTransactionID": str(self._last_id),
+        }
+
+    # ─── HTTP ────────────────────────────────────────────────────────────
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        prefix = f"/v3/accounts/{self.account_id}"
+        path = request.url.path
+        method = request.method
+        self.requests.append((method, path))
+        if not path.startswith(prefix):
+            return httpx.Response(404, json={"errorMessage": "Account not found"})
+        parts = [p for p in path[len(prefix):].split("/") if p]
+
+        if parts == ["transactions", "stream"]:
+            queue: asyncio.Queue = asyncio.Queue()
+            self._subscribers.append(queue)
+            return httpx.Response(200, content=self._stream(queue))
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            for fault in self._faults:
+                if fault[3] > 0 and fault[0] == method and path.endswith(fault[1]):
+                    fault[3] -= 1
+                    return httpx.Response(fault[2], headers=fault[4],
+                                          json={"errorMessage": f"Injected {fault[2]}"})
+            status, body = self._route(method, parts, request)
+        finally:
+            self.in_flight -= 1
+        return httpx.Response(status, json=body)
+
+    def _route(self, method: str, parts: List[str], request: httpx.Request) -> Tuple[int, Any]:
+        body = json.loads(request.content) if request.content else {}
+        last = {"lastTransactionID": str(self._last_id)}
+
+        if method == "GET":
+            if not parts:
+                return 200, {"account": self._account(full=True), **last}
+            if parts == ["summary"]:
+                return 200, {"account": self._account(full=False), **last}
+            if parts == ["changes"]:
+                return 200, self._changes_since(int(request.url.params.get("sinceTransactionID", 0)))
+            if parts == ["openPositions"]:
+                instruments = sorted({t["instrument"] for t in self.trades.values()})
+                return 200, {"positions": [self._position(i) for i in instruments], **last}
+            if parts == ["openTrades"]:
+                return 200, {"trades": [dict(t) for t in self.trades.values()], **last}
+
+        if method == "POST" and parts == ["orders"]:
+            order = body.get("order", {})
+            if order.get("type") != "MARKET":
+                return 400, {"errorMessage": f"Unsupported order type {order.get('type')}"}
+            return self._market_order(order)
+
+        if method == "PUT" and len(parts) == 3 and parts[0] == "trades":
+            trade = self.trades.get(parts[1])
+            if trade is None:
+                return 404, {"errorMessage": f"Trade {parts[1]} not found"}
+            if parts[2] == "orders":
+                for field in ("stopLoss", "takeProfit"):
+                    if field in body:
+                        trade[field] = body[field]["price"]
+                txn = self._transaction("TRADE_CLIENT_EXTENSIONS_MODIFY", tradeID=trade["id"])
+                return 200, {"lastTransactionID": txn["id"]}
+            if parts[2] == "close":
+                units = int(body["units"]) if body.get("units", "ALL") != "ALL" else None
+                fill = self._close(trade, units)
+                return 200, {"orderFillTransaction": fill, **last}
+
+        if method == "PUT" and len(parts) == 3 and parts[0] == "positions" and parts[2] == "close":
+            long_side = "longUnits" in body
+            trades = [t for t in list(self.trades.values())
+                      if t["instrument"] == parts[1] and (int(t["currentUnits"]) > 0) == long_side]
+            if not trades:
+                return 400, {"errorMessage": "CLOSEOUT_POSITION_DOESNT_EXIST"}
+            fills = [self._close(t) for t in trades]
+            key = "longOrderFillTransaction" if long_side else "shortOrderFillTransaction"
+            return 200, {key: fills[-1], "lastTransactionID": str(self._last_id)}
+
+        return 404, {"errorMessage": f"No route for {method} /{'/'.join(parts)}"}
+
+    async def _stream(self, queue: asyncio.Queue) -> AsyncIterator[bytes]:
+        try:
+            while True:
+                # asyncio.wait rather than wait_for: on 3.9-3.11 wait_for can swallow a
+                # cancel that lands as the queue yields, and the reader never stops
+                getter = asyncio.ensure_future(queue.get())
+                try:
+                    await asyncio.wait({getter}, timeout=self.heartbeat_seconds)
+                finally:
+                    if not getter.done():
+                        getter.cancel()
+                if getter.cancelled():
+                    transaction = {"type": "HEARTBEAT", "lastTransactionID": str(self._last_id),
+                                   "time": _now()}
+                else:
+                    transaction = getter.result()
+                yield (json.dumps(transaction) + "\n").encode()
+        finally:
+            self._subscribers.remove(queue)
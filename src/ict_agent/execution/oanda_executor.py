@@ -14,13 +14,16 @@ This is the execution layer for the autonomous trader.
 
 import os
 import json
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Tuple
 from enum import Enum
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
+from ict_agent.data.oanda_fetcher import OANDAConfig
+from ict_agent.data.oanda_transport import get_transport
+
 
 NY_TZ = ZoneInfo("America/New_York")
 
@@ -90,6 +93,81 @@ class AccountInfo:
     currency: str
 
 
+def parse_account(data: dict) -> AccountInfo:
+    """AccountInfo from an OANDA account (or account summary) object"""
+    return AccountInfo(
+        account_id=data.get("id", ""),
+        balance=float(data.get("balance", 0)),
+        unrealized_pnl=float(data.get("unrealizedPL", 0)),
+        nav=float(data.get("NAV", 0)),
+        margin_used=float(data.get("marginUsed", 0)),
+        margin_available=float(data.get("marginAvailable", 0)),
+        open_trade_count=int(data.get("openTradeCount", 0)),
+        open_position_count=int(data.get("openPositionCount", 0)),
+        currency=data.get("currency", "USD"),
+    )
+
+
+def parse_position(pos: dict) -> Optional[Position]:
+    """Net Position from an OANDA position object (None when flat)"""
+    # Combine long and short
+    long_units = int(pos.get("long", {}).get("units", 0))
+    short_units = int(pos.get("short", {}).get("units", 0))
+    units = long_units + short_units  # short is negative
+    
+    if units == 0:
+        return None
+    
+    side = pos.get("long", {}) if units > 0 else pos.get("short", {})
+    return Position(
+        instrument=pos.get("instrument", ""),
+        units=units,
+        average_price=float(side.get("averagePrice", 0)),
+        unrealized_pnl=float(side.get("unrealizedPL", 0)),
+        margin_used=float(pos.get("marginUsed", 0)),
+    )
+
+
+def parse_order_response(status_code: int, result: dict) -> OrderResult:
+    """OrderResult from an order-create response"""
+    if status_code in [200, 201]:
+        # Check for fill
+        if "orderFillTransaction" in result:
+            fill = result["orderFillTransaction"]
+            return OrderResult(
+                success=True,
+                order_id=fill.get("orderID"),
+                trade_id=fill.get("tradeOpened", {}).get("tradeID"),
+                fill_price=float(fill.get("price", 0)),
+                units=int(fill.get("units", 0)),
+                message="Order filled",
+                raw_response=result,
+            )
+        
+        # Pending order created
+        elif "orderCreateTransaction" in result:
+            create = result["orderCreateTransaction"]
+            return OrderResult(
+                success=True,
+                order_id=create.get("id"),
+                message="Order created (pending)",
+                raw_response=result,
+            )
+        
+        return OrderResult(
+            success=True,
+            message="Order processed",
+            raw_response=result,
+        )
+    
+    error_msg = result.get("errorMessage", str(result))
+    return OrderResult(
+        success=False,
+        message=f"Order failed: {error_msg}",
+        raw_response=result,
+    )
+
+
 class OANDAExecutor:
     """
     OANDA Trade Execution Engine
@@ -124,16 +202,19 @@ class OANDAExecutor:
         else:
             self.base_url = "https://api-fxpractice.oanda.com"
         
-        # Setup session
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "Accept-Datetime-Format": "RFC3339",
-        })
+        # Pooled, rate-limited session shared with the data fetchers
+        self.transport = get_transport(
+            OANDAConfig(api_key=self.api_key, account_id=self.account_id or "",
+                        environment=self.environment)
+        )
+        self.session = self.transport.session
         
         # Cache account info
         self._account_info: Optional[AccountInfo] = None
+        
+        # Stream-maintained AccountSnapshot (set by the controller when an
+        # AsyncOANDAExecutor is running); replaces summary/position polls
+        self.snapshot = None
     
     def _get_instrument(self, symbol: str) -> str:
         """Convert symbol format (EURUSD -> EUR_USD)"""
@@ -148,27 +229,18 @@ class OANDAExecutor:
     
     def get_account_info(self, force_refresh: bool = False) -> Optional[AccountInfo]:
         """Get account summary"""
+        if self.snapshot is not None and self.snapshot.current():
+            return self.snapshot.account_info()
+        
         if self._account_info and not force_refresh:
             return self._account_info
         
         try:
             url = f"{self.base_url}/v3/accounts/{self.account_id}/summary"
-            response = self.session.get(url)
+            response = self.transport.get(url)
             response.raise_for_status()
             
-            data = response.json().get("account", {})
-            
-            self._account_info = AccountInfo(
-                account_id=data.get("id", ""),
-                balance=float(data.get("balance", 0)),
-                unrealized_pnl=float(data.get("unrealizedPL", 0)),
-                nav=float(data.get("NAV", 0)),
-                margin_used=float(data.get("marginUsed", 0)),
-                margin_available=float(data.get("marginAvailable", 0)),
-                open_trade_count=int(data.get("openTradeCount", 0)),
-                open_position_count=int(data.get("openPositionCount", 0)),
-                currency=data.get("currency", "USD"),
-            )
+            self._account_info = parse_account(response.json().get("account", {}))
             
             return self._account_info
             
@@ -197,35 +269,19 @@ class OANDAExecutor:
     
     def get_positions(self) -> List[Position]:
         """Get all open positions"""
+        if self.snapshot is not None and self.snapshot.current():
+            return self.snapshot.positions()
+        
         try:
             url = f"{self.base_url}/v3/accounts/{self.account_id}/openPositions"
-            response = self.session.get(url)
+            response = self.transport.get(url)
             response.raise_for_status()
             
             positions = []
             for pos in response.json().get("positions", []):
-                # Combine long and short
-                long_units = int(pos.get("long", {}).get("units", 0))
-                short_units = int(pos.get("short", {}).get("units", 0))
-                units = long_units + short_units  # short is negative
-                
-                if units == 0:
-                    continue
-                
-                if units > 0:
-                    avg_price = float(pos.get("long", {}).get("averagePrice", 0))
-                    unrealized = float(pos.get("long", {}).get("unrealizedPL", 0))
-                else:
-                    avg_price = float(pos.get("short", {}).get("averagePrice", 0))
-                    unrealized = float(pos.get("short", {}).get("unrealizedPL", 0))
-                
-                positions.append(Position(
-                    instrument=pos.get("instrument", ""),
-                    units=units,
-                    average_price=avg_price,
-                    unrealized_pnl=unrealized,
-                    margin_used=float(pos.get("marginUsed", 0)),
-                ))
+                position = parse_position(pos)
+                if position is not None:
+                    positions.append(position)
             
             return positions
             
@@ -248,7 +304,7 @@ class OANDAExecutor:
         """Get all open trades with full details"""
         try:
             url = f"{self.base_url}/v3/accounts/{self.account_id}/openTrades"
-            response = self.session.get(url)
+            response = self.transport.get(url)
             response.raise_for_status()
             
             return response.json().get("trades", [])
@@ -395,47 +451,9 @@ class OANDAExecutor:
         """Execute an order via API"""
         try:
             url = f"{self.base_url}/v3/accounts/{self.account_id}/orders"
-            response = self.session.post(url, json=order_data)
-            
-            result = response.json()
+            response = self.transport.post(url, json=order_data)
             
-            if response.status_code in [200, 201]:
-                # Check for fill
-                if "orderFillTransaction" in result:
-                    fill = result["orderFillTransaction"]
-                    return OrderResult(
-                        success=True,
-                        order_id=fill.get("orderID"),
-                        trade_id=fill.get("tradeOpened", {}).get("tradeID"),
-                        fill_price=float(fill.get("price", 0)),
-                        units=int(fill.get("units", 0)),
-                        message="Order filled",
-                        raw_response=result,
-                    )
-                
-                # Pending order created
-                elif "orderCreateTransaction" in result:
-                    create = result["orderCreateTransaction"]
-                    return OrderResult(
-                        success=True,
-                        order_id=create.get("id"),
-                        message="Order created (pending)",
-                        raw_response=result,
-                    )
-                
-                return OrderResult(
-                    success=True,
-                    message="Order processed",
-                    raw_response=result,
-                )
-            
-            else:
-                error_msg = result.get("errorMessage", str(result))
-                return OrderResult(
-                    success=False,
-                    message=f"Order failed: {error_msg}",
-                    raw_response=result,
-                )
+            return parse_order_response(response.status_code, response.json())
                 
         except Exception as e:
             return OrderResult(
@@ -465,7 +483,7 @@ class OANDAExecutor:
             if take_profit:
                 order_data["takeProfit"] = {"price": f"{take_profit:.5f}"}
             
-            response = self.session.put(url, json=order_data)
+            response = self.transport.put(url, json=order_data)
             result = response.json()
             
             if response.status_code == 200:
@@ -500,7 +518,7 @@ class OANDAExecutor:
             if units:
                 data["units"] = str(abs(units))
             
-            response = self.session.put(url, json=data)
+            response = self.transport.put(url, json=data)
             result = response.json()
             
             if response.status_code == 200:
@@ -523,25 +541,27 @@ class OANDAExecutor:
         except Exception as e:
             return OrderResult(success=False, message=str(e))
     
-    def close_position(self, symbol: str) -> OrderResult:
-        """Close all of a position for a symbol"""
+    def close_position(self, symbol: str, units: Optional[int] = None) -> OrderResult:
+        """Close all of a position for a symbol (`units` = known net units, skips the lookup)"""
         instrument = self._get_instrument(symbol)
         
         try:
             url = f"{self.base_url}/v3/accounts/{self.account_id}/positions/{instrument}/close"
             
             # Get current position to know direction
-            position = self.get_position(symbol)
-            if not position:
-                return OrderResult(success=False, message="No position to close")
+            if units is None:
+                position = self.get_position(symbol)
+                if not position:
+                    return OrderResult(success=False, message="No position to close")
+                units = position.units
             
             # Close all units
-            if position.units > 0:
+            if units > 0:
                 data = {"longUnits": "ALL"}
             else:
                 data = {"shortUnits": "ALL"}
             
-            response = self.session.put(url, json=data)
+            response = self.transport.put(url, json=data)
             result = response.json()
             
             if response.status_code == 200:
@@ -564,7 +584,7 @@ class OANDAExecutor:
         """Cancel a pending order"""
         try:
             url = f"{self.base_url}/v3/accounts/{self.account_id}/orders/{order_id}/cancel"
-            response = self.session.put(url)
+            response = self.transport.put(url)
             result = response.json()
             
             if response.status_code == 200:
@@ -585,15 +605,14 @@ class OANDAExecutor:
             return OrderResult(success=False, message=str(e))
     
     def close_all_positions(self) -> List[OrderResult]:
-        """Emergency: close all open positions"""
-        results = []
+        """Emergency: close all open positions (concurrently)"""
         positions = self.get_positions()
+        if not positions:
+            return []
         
-        for pos in positions:
-            result = self.close_position(pos.instrument)
-            results.append(result)
-        
-        return results
+        # One close per position in parallel: latency is the slowest close, not the sum
+        with ThreadPoolExecutor(max_workers=min(len(positions), 8)) as pool:
+            return list(pool.map(lambda pos: self.close_position(pos.instrument, pos.units), positions))
     
     # ═══════════════════════════════════════════════════════════════════════════
     # UTILITY METHODS
@@ -1,13 +1,18 @@
 """ICT Frameworks - The Macro Structure"""
 
-from ict_agent.framework.irl_erl import (
-    IRLERLFramework,
-    LiquidityPool,
-    LiquidityType,
-    LiquiditySide,
-    DrawOnLiquidity,
-    RangeAnalysis,
-)
+from typing import TYPE_CHECKING
+
+from ict_agent._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ict_agent.framework.irl_erl import (
+        IRLERLFramework,
+        LiquidityPool,
+        LiquidityType,
+        LiquiditySide,
+        DrawOnLiquidity,
+        RangeAnalysis,
+    )
 
 __all__ = [
     "IRLERLFramework",
@@ -17,3 +22,14 @@ __all__ = [
     "DrawOnLiquidity",
     "RangeAnalysis",
 ]
+
+_EXPORTS = {
+    "IRLERLFramework": "ict_agent.framework.irl_erl",
+    "LiquidityPool": "ict_agent.framework.irl_erl",
+    "LiquidityType": "ict_agent.framework.irl_erl",
+    "LiquiditySide": "ict_agent.framework.irl_erl",
+    "DrawOnLiquidity": "ict_agent.framework.irl_erl",
+    "RangeAnalysis": "ict_agent.framework.irl_erl",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,5 +1,18 @@
 """VEX Grader module - Setup scoring and trade evaluation."""
 
-from .setup_grader import SetupGrader, SetupGrade, SetupCriteria
+from typing import TYPE_CHECKING
+
+from ict_agent._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .setup_grader import SetupGrader, SetupGrade, SetupCriteria
 
 __all__ = ["SetupGrader", "SetupGrade", "SetupCriteria"]
+
+_EXPORTS = {
+    "SetupGrader": "ict_agent.grader.setup_grader",
+    "SetupGrade": "ict_agent.grader.setup_grader",
+    "SetupCriteria": "ict_agent.grader.setup_grader",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,5 +1,19 @@
 """VEX Journal module - Trade journaling and tracking."""
 
-from .journal_engine import JournalEngine, PreTradeJournal, TradeEntry, PostTradeReview
+from typing import TYPE_CHECKING
+
+from ict_agent._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .journal_engine import JournalEngine, PreTradeJournal, TradeEntry, PostTradeReview
 
 __all__ = ["JournalEngine", "PreTradeJournal", "TradeEntry", "PostTradeReview"]
+
+_EXPORTS = {
+    "JournalEngine": "ict_agent.journal.journal_engine",
+    "PreTradeJournal": "ict_agent.journal.journal_engine",
+    "TradeEntry": "ict_agent.journal.journal_engine",
+    "PostTradeReview": "ict_agent.journal.journal_engine",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
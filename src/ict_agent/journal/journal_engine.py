@@ -217,6 +217,14 @@ class JournalEngine:
         with open(TRADES_DB, "w") as f:
             json.dump(self.trades_db, f, indent=2)
     
+    def _update_dashboard_stats(self):
+        """Fold newly closed trades into the dashboard's running aggregates."""
+        try:
+            from ict_agent.dashboard.stats_store import DashboardStatsStore
+            DashboardStatsStore(trades_db=TRADES_DB).sync(self.trades_db["trades"])
+        except Exception as e:
+            print(f"  ⚠️ Dashboard stats not updated: {e}")
+    
     def _sync_trade_to_cloud(self, trade: Dict):
         """Sync a trade to Turso cloud database."""
         if not self.turso:
@@ -436,6 +444,7 @@ class JournalEngine:
                 trade["updated_at"] = datetime.now().isoformat()
                 
                 self._save_trades_db()
+                self._update_dashboard_stats()
                 
                 # Sync to cloud
                 self._sync_trade_to_cloud(trade)
@@ -4,6 +4,18 @@ ICT Knowledge Base Module
 Provides search, retrieval, and analysis of ICT trading knowledge.
 """
 
-from .kb_search import KnowledgeBaseSearch, SearchResult
+from typing import TYPE_CHECKING
+
+from ict_agent._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .kb_search import KnowledgeBaseSearch, SearchResult
 
 __all__ = ['KnowledgeBaseSearch', 'SearchResult']
+
+_EXPORTS = {
+    "KnowledgeBaseSearch": "ict_agent.knowledge.kb_search",
+    "SearchResult": "ict_agent.knowledge.kb_search",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
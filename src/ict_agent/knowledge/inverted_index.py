@@ -0,0 +1,238 @@
+"""
+Inverted Index Module
+
+Tokenized inverted index with BM25 ranking for the ICT knowledge base.
+
+Each term maps to a postings list of (doc_id -> token positions). Positions
+are kept as compact unsigned int arrays so phrase matching and snippet
+location never need the raw document text in memory. Documents are only
+re-read from disk when a caller actually asks for their content.
+
+The index supports removing documents, so callers can patch it in place
+from a SourceManifest diff and persist it with pickle between processes.
+"""
+
+import math
+import pickle
+import re
+from array import array
+from bisect import bisect_right
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Bump when the on-disk layout changes so stale pickles are ignored
+INDEX_VERSION = 2
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase and split text into alphanumeric tokens"""
+    return TOKEN_RE.findall(text.lower())
+
+
+class InvertedIndex:
+    """
+    Positional inverted index with Okapi BM25 scoring.
+
+    Storage:
+    - postings: term -> {doc_id: array('I') of token positions}
+    - doc_lengths: doc_id -> token count
+    - line_starts: doc_id -> array('I') of the first token position of each line
+      (used to map a matched position back to a line number for snippets)
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, Dict[int, array]] = {}
+        self.doc_lengths: Dict[int, int] = {}
+        self.line_starts: Dict[int, array] = {}
+        self._total_length = 0
+
+    # ── Building ──────────────────────────────────────────────
+
+    def add_document(self, doc_id: int, content: str) -> None:
+        """Tokenize content and add its postings under doc_id"""
+        if doc_id in self.doc_lengths:
+            self.remove_document(doc_id)
+
+        doc_postings: Dict[str, array] = defaultdict(lambda: array("I"))
+        line_starts = array("I")
+        position = 0
+
+        for line in content.split("\n"):
+            line_starts.append(position)
+            for token in TOKEN_RE.findall(line.lower()):
+                doc_postings[token].append(position)
+                position += 1
+
+        for term, positions in doc_postings.items():
+            self.postings.setdefault(term, {})[doc_id] = positions
+
+        self.doc_lengths[doc_id] = position
+        self.line_starts[doc_id] = line_starts
+        self._total_length += position
+
+    def remove_document(self, doc_id: int) -> None:
+        """Drop every posting that belongs to doc_id"""
+        length = self.doc_lengths.pop(doc_id, None)
+        if length is None:
+            return
+
+        self.line_starts.pop(doc_id, None)
+        self._total_length -= length
+
+        empty_terms = []
+        for term, docs in self.postings.items():
+            if docs.pop(doc_id, None) is not None and not docs:
+                empty_terms.append(term)
+        for term in empty_terms:
+            del self.postings[term]
+
+    # ── Querying ──────────────────────────────────────────────
+
+    @property
+    def doc_count(self) -> int:
+        return len(self.doc_lengths)
+
+    @property
+    def avg_doc_length(self) -> float:
+        if not self.doc_lengths:
+            return 0.0
+        return self._total_length / len(self.doc_lengths)
+
+    def idf(self, term: str) -> float:
+        """BM25 inverse document frequency (always non-negative)"""
+        df = len(self.postings.get(term, {}))
+        if df == 0:
+            return 0.0
+        n = self.doc_count
+        return math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+
+    def bm25(
+        self,
+        terms: Iterable[str],
+        doc_ids: Optional[Iterable[int]] = None,
+    ) -> Dict[int, float]:
+        """
+        Score documents against query terms.
+
+        Args:
+            terms: Query tokens (duplicates are ignored)
+            doc_ids: Optional subset of documents to score
+
+        Returns:
+            Dict of doc_id -> BM25 score for documents matching any term
+        """
+        allowed = set(doc_ids) if doc_ids is not None else None
+        avgdl = self.avg_doc_length or 1.0
+        scores: Dict[int, float] = defaultdict(float)
+
+        for term in set(terms):
+            docs = self.postings.get(term)
+            if not docs:
+                continue
+            idf = self.idf(term)
+            for doc_id, positions in docs.items():
+                if allowed is not None and doc_id not in allowed:
+                    continue
+                tf = len(positions)
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / avgdl)
+                scores[doc_id] += idf * tf * (self.k1 + 1) / (tf + norm)
+
+        return dict(scores)
+
+    def phrase_positions(self, doc_id: int, terms: List[str]) -> List[int]:
+        """
+        Find start positions where terms occur consecutively in doc_id.
+
+        Intersects position sets starting from the rarest term so the
+        common case (a short phrase with one rare word) stays cheap.
+        """
+        if not terms:
+            return []
+
+        lists = []
+        for offset, term in enumerate(terms):
+            positions = self.postings.get(term, {}).get(doc_id)
+            if positions is None:
+                return []
+            lists.append((len(positions), offset, positions))
+
+        lists.sort(key=lambda x: x[0])
+        _, anchor_offset, anchor_positions = lists[0]
+        candidates = {p - anchor_offset for p in anchor_positions}
+
+        for _, offset, positions in lists[1:]:
+            candidates &= {p - offset for p in positions}
+            if not candidates:
+                return []
+
+        return sorted(candidates)
+
+    def first_position(self, doc_id: int, terms: List[str]) -> Optional[int]:
+        """Earliest position of the phrase, falling back to the rarest single term"""
+        starts = self.phrase_positions(doc_id, terms)
+        if starts:
+            return starts[0]
+
+        best: Optional[Tuple[int, int]] = None
+        for term in terms:
+            positions = self.postings.get(term, {}).get(doc_id)
+            if positions and (best is None or len(positions) < best[0]):
+                best = (len(positions), positions[0])
+        return best[1] if best else None
+
+    def line_for_position(self, doc_id: int, position: int) -> int:
+        """Map a token position to a zero-based line index"""
+        starts = self.line_starts.get(doc_id)
+        if not starts:
+            return 0
+        return max(0, bisect_right(starts, position) - 1)
+
+    # ── Persistence ───────────────────────────────────────────
+
+    def to_state(self) -> Dict:
+        return {
+            "k1": self.k1,
+            "b": self.b,
+            "postings": self.postings,
+            "doc_lengths": self.doc_lengths,
+            "line_starts": self.line_starts,
+            "total_length": self._total_length,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict) -> "InvertedIndex":
+        index = cls(k1=state["k1"], b=state["b"])
+        index.postings = state["postings"]
+        index.doc_lengths = state["doc_lengths"]
+        index.line_starts = state["line_starts"]
+        index._total_length = state["total_length"]
+        return index
+
+
+def save_pickle(path: Path, payload: Dict, version: int = INDEX_VERSION) -> None:
+    """Atomically write a versioned pickle payload"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump({"version": version, **payload}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp_path.replace(path)
+
+
+def load_pickle(path: Path, version: int = INDEX_VERSION) -> Optional[Dict]:
+    """Load a versioned pickle payload, or None if missing/stale/corrupt"""
+    if not path.exists():
+        return None
+    try:
+        with open(path, "rb") as f:
+            payload = pickle.load(f)
+    except Exception:
+        return None
+    if not isinstance(payload, dict) or payload.get("version") != version:
+        return None
+    return payload
@@ -12,10 +12,14 @@ from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 import yaml
 
+from .inverted_index import InvertedIndex, tokenize, load_pickle, save_pickle
+from .manifest import ManifestDiff, SourceManifest
+
 
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 KNOWLEDGE_BASE = PROJECT_ROOT / "knowledge_base"
+INDEX_CACHE = PROJECT_ROOT / "data" / "cache" / "kb_index.pkl"
 
 
 @dataclass
@@ -39,44 +43,137 @@ class KnowledgeBaseSearch:
     - concepts/: ICT concepts (CBDR, SIBI/BISI, etc.)
     - resources/documents/transcripts/: Episode transcripts
     - definitions/: Terminology YAML files
+    
+    Documents are held in a BM25 inverted index rather than as raw text.
+    The index (and parsed terminology) is persisted to data/cache/kb_index.pkl
+    together with a SourceManifest; on load only added, changed or deleted
+    files are re-tokenized (see refresh()).
     """
     
     SEARCHABLE_EXTENSIONS = {'.md', '.txt', '.yaml', '.yml'}
     
-    def __init__(self, knowledge_base_path: Optional[Path] = None):
+    def __init__(
+        self,
+        knowledge_base_path: Optional[Path] = None,
+        index_path: Optional[Path] = None,
+        use_cache: bool = True
+    ):
         self.kb_path = knowledge_base_path or KNOWLEDGE_BASE
+        self.index_path = index_path or INDEX_CACHE
+        self.use_cache = use_cache
         self._index: Dict[str, Dict] = {}
+        self._docs: Dict[int, Dict] = {}
+        self._next_doc_id = 0
+        self._inverted = InvertedIndex()
         self._terminology: Dict[str, str] = {}
+        self.generation = 0  # Bumped whenever refresh() changes the index
+        self._manifest = SourceManifest(self.kb_path, [self.kb_path], self.SEARCHABLE_EXTENSIONS)
         self._build_index()
     
     def _build_index(self):
-        """Build search index of knowledge base files"""
+        """Build (or load from disk and patch) the search index of knowledge base files"""
         if not self.kb_path.exists():
             return
         
-        for file_path in self.kb_path.rglob("*"):
-            if file_path.is_file() and file_path.suffix in self.SEARCHABLE_EXTENSIONS:
-                rel_path = file_path.relative_to(self.kb_path)
-                category = str(rel_path.parts[0]) if rel_path.parts else "root"
-                
-                try:
-                    content = file_path.read_text(encoding='utf-8')
-                    title = self._extract_title(content, file_path.name)
-                    
-                    self._index[str(rel_path)] = {
-                        "path": str(file_path),
-                        "rel_path": str(rel_path),
-                        "name": file_path.name,
-                        "category": category,
-                        "title": title,
-                        "content": content,
-                        "size": len(content)
-                    }
-                except Exception as e:
-                    pass  # Skip unreadable files
+        if self.use_cache:
+            self._load_cached_index()
+        
+        self.refresh()
+    
+    def refresh(self) -> ManifestDiff:
+        """
+        Re-index only the files added, changed or deleted since the last build.
         
-        # Load terminology
-        self._load_terminology()
+        Returns:
+            ManifestDiff describing what was patched
+        """
+        diff = self._manifest.scan()
+        if not diff.has_changes:
+            return diff
+        
+        for rel_path in diff.removed:
+            doc = self._index.pop(rel_path, None)
+            if doc is not None:
+                del self._docs[doc["doc_id"]]
+                self._inverted.remove_document(doc["doc_id"])
+        
+        self._index_files(diff.updated)
+        
+        term_paths = {"definitions/terminology.yaml", "terminology.yaml"}
+        if term_paths & set(diff.added + diff.removed):
+            self._terminology = {}
+            self._load_terminology()
+        
+        if self.use_cache:
+            self._save_index()
+        self.generation += 1
+        return diff
+    
+    def _index_files(self, rel_paths: List[str]):
+        """Tokenize files into the inverted index"""
+        for rel_path in rel_paths:
+            file_path = self.kb_path / rel_path
+            parts = Path(rel_path).parts
+            category = str(parts[0]) if parts else "root"
+            
+            try:
+                content = file_path.read_text(encoding='utf-8')
+            except Exception:
+                continue  # Skip unreadable files
+            
+            doc_id = self._next_doc_id
+            self._next_doc_id += 1
+            title = self._extract_title(content, file_path.name)
+            doc = {
+                "doc_id": doc_id,
+                "path": str(file_path),
+                "rel_path": rel_path,
+                "name": file_path.name,
+                "category": category,
+                "title": title,
+                "title_terms": set(tokenize(title)),
+                "size": len(content)
+            }
+            self._index[rel_path] = doc
+            self._docs[doc_id] = doc
+            self._inverted.add_document(doc_id, content)
+    
+    def _load_cached_index(self) -> bool:
+        """Restore a persisted index (and the manifest it was built from)"""
+        payload = load_pickle(self.index_path)
+        if not payload or payload.get("kb_path") != str(self.kb_path):
+            return False
+        
+        self._index = payload["documents"]
+        self._docs = {doc["doc_id"]: doc for doc in self._index.values()}
+        self._next_doc_id = payload["next_doc_id"]
+        self._inverted = InvertedIndex.from_state(payload["inverted"])
+        self._terminology = payload["terminology"]
+        self._manifest = SourceManifest(
+            self.kb_path, [self.kb_path], self.SEARCHABLE_EXTENSIONS, payload["manifest"]
+        )
+        return True
+    
+    def _save_index(self):
+        """Persist the index together with its source manifest"""
+        try:
+            save_pickle(self.index_path, {
+                "kb_path": str(self.kb_path),
+                "manifest": self._manifest.to_dict(),
+                "documents": self._index,
+                "next_doc_id": self._next_doc_id,
+                "inverted": self._inverted.to_state(),
+                "terminology": self._terminology,
+            })
+        except OSError:
+            pass  # Read-only checkout: index stays in memory only
+    
+    def _read_content(self, doc: Dict) -> str:
+        """Read a document's text from disk on demand"""
+        try:
+            return Path(doc["path"]).read_text(encoding='utf-8')
+        except Exception:
+            return ""
     
     def _extract_title(self, content: str, filename: str) -> str:
         """Extract title from markdown content"""
@@ -135,69 +232,70 @@ class KnowledgeBaseSearch:
             List of SearchResult objects
         """
         query_lower = query.lower()
-        query_words = query_lower.split()
-        results = []
+        query_terms = tokenize(query)
+        if not query_terms:
+            return []
         
-        for rel_path, doc in self._index.items():
-            if category and doc["category"] != category:
-                continue
-            
-            content_lower = doc["content"].lower()
-            title_lower = doc["title"].lower()
-            
-            # Calculate relevance score
+        allowed = [
+            doc_id for doc_id, doc in self._docs.items()
+            if not category or doc["category"] == category
+        ]
+        
+        # Content relevance from the inverted index
+        scores = self._inverted.bm25(query_terms, doc_ids=allowed)
+        
+        for doc_id in allowed:
+            doc = self._docs[doc_id]
             score = 0.0
             
             # Title match is highest priority
-            if query_lower in title_lower:
+            if query_lower in doc["title"].lower():
                 score += 10.0
             
             # Word matches in title
-            for word in query_words:
-                if word in title_lower:
+            for term in query_terms:
+                if term in doc["title_terms"]:
                     score += 3.0
             
             # Exact phrase match in content
-            if query_lower in content_lower:
-                score += 5.0
-            
-            # Word frequency in content
-            for word in query_words:
-                if len(word) >= 3:  # Skip short words
-                    count = content_lower.count(word)
-                    score += min(count * 0.5, 5.0)  # Cap at 5 points per word
+            if len(query_terms) > 1 and doc_id in scores:
+                if self._inverted.phrase_positions(doc_id, query_terms):
+                    score += 5.0
             
             if score > 0:
-                # Find snippet with query
-                snippet, line_num = self._extract_snippet(doc["content"], query)
-                
-                results.append(SearchResult(
-                    file_path=doc["path"],
-                    file_name=doc["name"],
-                    category=doc["category"],
-                    title=doc["title"],
-                    snippet=snippet,
-                    relevance_score=score,
-                    line_number=line_num
-                ))
-        
-        # Sort by relevance and return top results
-        results.sort(key=lambda x: -x.relevance_score)
-        return results[:max_results]
-    
-    def _extract_snippet(self, content: str, query: str, context_lines: int = 2) -> Tuple[str, int]:
-        """Extract a snippet around the query match"""
-        lines = content.split('\n')
-        query_lower = query.lower()
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
         
-        for i, line in enumerate(lines):
-            if query_lower in line.lower():
-                start = max(0, i - context_lines)
-                end = min(len(lines), i + context_lines + 1)
-                snippet = '\n'.join(lines[start:end])
-                return snippet[:500] + "..." if len(snippet) > 500 else snippet, i + 1
+        ranked = sorted(scores.items(), key=lambda x: -x[1])[:max_results]
         
-        # No exact match, return first few lines
+        results = []
+        for doc_id, score in ranked:
+            doc = self._docs[doc_id]
+            snippet, line_num = self._extract_snippet(doc, query_terms)
+            results.append(SearchResult(
+                file_path=doc["path"],
+                file_name=doc["name"],
+                category=doc["category"],
+                title=doc["title"],
+                snippet=snippet,
+                relevance_score=round(score, 2),
+                line_number=line_num
+            ))
+        
+        return results
+    
+    def _extract_snippet(self, doc: Dict, query_terms: List[str], context_lines: int = 2) -> Tuple[str, int]:
+        """Extract a snippet around the first indexed match of the query"""
+        lines = self._read_content(doc).split('\n')
+        position = self._inverted.first_position(doc["doc_id"], query_terms)
+        
+        if position is not None:
+            i = self._inverted.line_for_position(doc["doc_id"], position)
+            start = max(0, i - context_lines)
+            end = min(len(lines), i + context_lines + 1)
+            snippet = '\n'.join(lines[start:end])
+            return snippet[:500] + "..." if len(snippet) > 500 else snippet, i + 1
+        
+        # No indexed match (title-only hit), return first few lines
         snippet = '\n'.join(lines[:5])
         return snippet[:500] + "..." if len(snippet) > 500 else snippet, 1
     
@@ -223,7 +321,7 @@ class KnowledgeBaseSearch:
                     "name": doc["title"],
                     "file": doc["name"],
                     "path": doc["path"],
-                    "content": doc["content"]
+                    "content": self._read_content(doc)
                 }
         
         return None
@@ -250,7 +348,7 @@ class KnowledgeBaseSearch:
                     "name": doc["title"],
                     "file": doc["name"],
                     "path": doc["path"],
-                    "content": doc["content"]
+                    "content": self._read_content(doc)
                 }
         
         return None
@@ -276,7 +374,7 @@ class KnowledgeBaseSearch:
                     "episode": episode,
                     "file": doc["name"],
                     "path": doc["path"],
-                    "content": doc["content"]
+                    "content": self._read_content(doc)
                 }
         
         return None
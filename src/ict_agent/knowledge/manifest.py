@@ -0,0 +1,189 @@
+"""
+Source Manifest Module
+
+Tracks the knowledge source files (knowledge_base/, data/vex_memory/,
+journal/, ...) that a consumer has already ingested, so the consumer can
+re-parse only what was added, changed or deleted since its last build.
+
+Each file is recorded as (mtime_ns, size, sha256). A stat change alone is
+not treated as a content change: the file is re-hashed first, so touching
+or re-checking-out a file does not trigger re-ingestion.
+
+Usage:
+    manifest = SourceManifest(base=kb_root, sources=[kb_root], extensions={".md"})
+    diff = manifest.scan()
+    for rel_path in diff.removed:
+        ...drop rel_path from the consumer's index
+    for rel_path in diff.updated:
+        ...(re)parse rel_path into the consumer's index
+    manifest.save(path)  # or persist manifest.to_dict() with the index
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+
+def hash_file(path: Path, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class FileRecord:
+    """Last-ingested state of one source file"""
+    mtime_ns: int
+    size: int
+    sha256: str
+
+
+@dataclass
+class ManifestDiff:
+    """Files that differ from the last committed manifest"""
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.changed or self.deleted)
+
+    @property
+    def removed(self) -> List[str]:
+        """Paths whose previous contribution must be dropped"""
+        return self.changed + self.deleted
+
+    @property
+    def updated(self) -> List[str]:
+        """Paths that must be (re)parsed"""
+        return self.added + self.changed
+
+    def __str__(self) -> str:
+        return f"+{len(self.added)} ~{len(self.changed)} -{len(self.deleted)}"
+
+
+class SourceManifest:
+    """
+    File-change detector shared by the knowledge consumers.
+
+    Args:
+        base: Directory that manifest keys are relative to
+        sources: Directories and/or individual files
+        extensions: File suffixes to track (None = all files)
+        entries: Previously persisted records (from to_dict())
+        recursive: Scan source directories recursively (False = top level only)
+    """
+
+    def __init__(
+        self,
+        base: Path,
+        sources: Iterable[Path],
+        extensions: Optional[Set[str]] = None,
+        entries: Optional[Dict[str, Dict]] = None,
+        recursive: bool = True,
+    ):
+        self.base = Path(base)
+        self.sources = [Path(s) for s in sources]
+        self.extensions = extensions
+        self.recursive = recursive
+        self.entries: Dict[str, FileRecord] = {
+            rel_path: FileRecord(**record) for rel_path, record in (entries or {}).items()
+        }
+
+    def _iter_files(self) -> Iterator[Path]:
+        for source in self.sources:
+            if source.is_file():
+                yield source
+            elif source.is_dir():
+                for path in source.rglob("*") if self.recursive else source.glob("*"):
+                    if path.is_file() and (
+                        self.extensions is None or path.suffix in self.extensions
+                    ):
+                        yield path
+
+    def scan(self) -> ManifestDiff:
+        """
+        Compare sources on disk to the recorded state and update the records.
+
+        Returns:
+            ManifestDiff of relative paths (sorted)
+        """
+        diff = ManifestDiff()
+        seen = set()
+
+        for path in self._iter_files():
+            rel_path = path.relative_to(self.base).as_posix()
+            if rel_path in seen:
+                continue
+            seen.add(rel_path)
+
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+
+            record = self.entries.get(rel_path)
+            if record and record.mtime_ns == stat.st_mtime_ns and record.size == stat.st_size:
+                continue
+
+            try:
+                sha = hash_file(path)
+            except OSError:
+                continue
+
+            if record is None:
+                diff.added.append(rel_path)
+            elif record.sha256 != sha:
+                diff.changed.append(rel_path)
+            self.entries[rel_path] = FileRecord(stat.st_mtime_ns, stat.st_size, sha)
+
+        for rel_path in list(self.entries):
+            if rel_path not in seen:
+                diff.deleted.append(rel_path)
+                del self.entries[rel_path]
+
+        diff.added.sort()
+        diff.changed.sort()
+        diff.deleted.sort()
+        return diff
+
+    def to_dict(self) -> Dict[str, Dict]:
+        return {
+            rel_path: {"mtime_ns": r.mtime_ns, "size": r.size, "sha256": r.sha256}
+            for rel_path, r in self.entries.items()
+        }
+
+    def save(self, path: Path) -> None:
+        """Write the records as JSON (atomic replace)"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.to_dict(), f, indent=1, sort_keys=True)
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(
+        cls,
+        path: Path,
+        base: Path,
+        sources: Iterable[Path],
+        extensions: Optional[Set[str]] = None,
+    ) -> "SourceManifest":
+        """Restore records from JSON; a missing/corrupt file starts empty"""
+        entries = None
+        if path.exists():
+            try:
+                with open(path) as f:
+                    entries = json.load(f)
+            except (OSError, ValueError):
+                entries = None
+        return cls(base, sources, extensions, entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
@@ -5,15 +5,20 @@ Two systems:
 2. KnowledgeManager - Manages ALL knowledge (concepts, models, user teachings)
 """
 
-from ict_agent.learning.trade_learner import TradeLearner
-from ict_agent.learning.knowledge_manager import (
-    KnowledgeManager, 
-    get_knowledge_manager,
-    learn,
-    add_rule,
-    explain,
-    search,
-)
+from typing import TYPE_CHECKING
+
+from ict_agent._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ict_agent.learning.trade_learner import TradeLearner
+    from ict_agent.learning.knowledge_manager import (
+        KnowledgeManager, 
+        get_knowledge_manager,
+        learn,
+        add_rule,
+        explain,
+        search,
+    )
 
 __all__ = [
     "TradeLearner",
@@ -24,3 +29,15 @@ __all__ = [
     "explain",
     "search",
 ]
+
+_EXPORTS = {
+    "TradeLearner": "ict_agent.learning.trade_learner",
+    "KnowledgeManager": "ict_agent.learning.knowledge_manager",
+    "get_knowledge_manager": "ict_agent.learning.knowledge_manager",
+    "learn": "ict_agent.learning.knowledge_manager",
+    "add_rule": "ict_agent.learning.knowledge_manager",
+    "explain": "ict_agent.learning.knowledge_manager",
+    "search": "ict_agent.learning.knowledge_manager",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,124 @@
+"""
+Compiled Graph Index
+====================
+Precompiled, read-only view of an ICTGraphInternal used by GraphReasoner.
+
+The reasoner's hot path only ever asks two questions of the graph:
+"which edges of type X leave node Y?" and "how well does each model's
+requirement set match these signals?". Answering them by scanning
+``graph.edges`` is O(models x edges) per evaluation, so this module
+compiles the graph once into:
+
+  - adjacency:      (source_id, relation_type) -> [ICTRelationship, ...]
+  - signal bits:    requirement target_id -> column index
+  - weight matrix:  models x requirement-bits (NumPy, config weights applied)
+
+Scoring every model is then a single matrix-vector product, and a batch of
+signal dicts is a single matrix-matrix product.
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from ict_agent.knowledge.schema import ICTGraphInternal, ICTRelationship, ConceptType
+
+
+# Requirement ids that are satisfied by a signal flag rather than by
+# appearing in signals["patterns"] (see GraphReasoner._score_model)
+_SIGNAL_FLAG_REQUIREMENTS = {
+    "displacement": "displacement",
+    "liquidity_sweep": "liquidity_swept",
+    "market_structure_shift": "market_structure_shift",
+}
+_PATTERN_ALIAS_REQUIREMENTS = {
+    "fair_value_gap": "fvg",
+    "order_block": "ob",
+}
+
+
+def requirement_met(req_id: str, signals: Mapping[str, Any]) -> bool:
+    """True if a model requirement is satisfied by the signal dict."""
+    patterns = signals.get("patterns", [])
+    if req_id in patterns:
+        return True
+    flag = _SIGNAL_FLAG_REQUIREMENTS.get(req_id)
+    if flag is not None:
+        return bool(signals.get(flag))
+    alias = _PATTERN_ALIAS_REQUIREMENTS.get(req_id)
+    if alias is not None:
+        return alias in patterns
+    return False
+
+
+class CompiledGraph:
+    """Typed adjacency maps and model weight matrices for one graph + weights."""
+
+    def __init__(self, graph: ICTGraphInternal, weights_config: Dict[str, float]):
+        self.adjacency: Dict[Tuple[str, str], List[ICTRelationship]] = defaultdict(list)
+        for edge in graph.edges:
+            self.adjacency[(edge.source_id, edge.relation_type)].append(edge)
+
+        self.model_ids: List[str] = [
+            node.id for node in graph.nodes.values() if node.type == ConceptType.MODEL
+        ]
+        self.model_labels: List[str] = [graph.nodes[m].label for m in self.model_ids]
+
+        # Signal-to-bit mapping over every distinct requirement target
+        self.signal_bits: Dict[str, int] = {}
+        for model_id in self.model_ids:
+            for edge in self.edges_from(model_id, "requires"):
+                self.signal_bits.setdefault(edge.target_id, len(self.signal_bits))
+        self.bit_signals: List[str] = list(self.signal_bits)
+
+        n_models, n_bits = len(self.model_ids), len(self.signal_bits)
+        self.base_weights = np.zeros(n_models)
+        self.requirement_weights = np.zeros((n_models, n_bits))
+        self.time_window_weights = np.zeros(n_models)
+
+        kz_override = weights_config.get("killzone_active")
+        for row, model_id in enumerate(self.model_ids):
+            self.base_weights[row] = weights_config.get(f"model_{model_id}", 10.0)
+
+            for edge in self.edges_from(model_id, "requires"):
+                bit = self.signal_bits[edge.target_id]
+                self.requirement_weights[row, bit] += weights_config.get(
+                    edge.target_id, edge.weight
+                )
+
+            for edge in self.edges_from(model_id, "active_during"):
+                self.time_window_weights[row] += (
+                    kz_override if kz_override is not None else edge.weight
+                )
+
+    def edges_from(self, source_id: str, relation_type: str) -> List[ICTRelationship]:
+        """Outgoing edges of one relation type (empty list if none)."""
+        return self.adjacency.get((source_id, relation_type), [])
+
+    def signal_vector(self, signals: Mapping[str, Any]) -> np.ndarray:
+        """0/1 vector over requirement bits for one signal dict."""
+        return np.fromiter(
+            (requirement_met(req_id, signals) for req_id in self.bit_signals),
+            dtype=float,
+            count=len(self.bit_signals),
+        )
+
+    def score_many(self, signals_list: Sequence[Mapping[str, Any]]) -> np.ndarray:
+        """
+        Score every model against every signal dict.
+
+        Returns:
+            Array of shape (len(signals_list), n_models)
+        """
+        if not signals_list:
+            return np.zeros((0, len(self.model_ids)))
+
+        met = np.vstack([self.signal_vector(s) for s in signals_list])
+        in_killzone = np.array([bool(s.get("in_killzone")) for s in signals_list], dtype=float)
+
+        return (
+            self.base_weights[np.newaxis, :]
+            + met @ self.requirement_weights.T
+            + in_killzone[:, np.newaxis] * self.time_window_weights[np.newaxis, :]
+        )
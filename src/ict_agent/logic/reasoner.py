@@ -6,9 +6,15 @@ import yaml
 from enum import Enum
 
 from ict_agent.knowledge.schema import ICTGraphInternal, ConceptType
+from ict_agent.knowledge.manifest import ManifestDiff, SourceManifest
+from ict_agent.knowledge.inverted_index import load_pickle, save_pickle
+from ict_agent.logic.compiled_graph import CompiledGraph, requirement_met
 
 logger = logging.getLogger(__name__)
 
+# Bump when ICTGraphInternal's layout changes so old snapshots are rebuilt
+SNAPSHOT_VERSION = 1
+
 
 @dataclass
 class TradeDecision:
@@ -66,10 +72,47 @@ class GraphReasoner:
     def __init__(self, graph: Optional[ICTGraphInternal] = None):
         self.graph = graph or ICTGraphInternal()
         self.weights_config = {}
+        self.kb_root: Optional[Path] = None
+        self._manifest: Optional[SourceManifest] = None
+        self._snapshot_path: Optional[Path] = None
+        self._compiled: Optional[CompiledGraph] = None
+        self._compiled_key: Optional[tuple] = None
 
-    @classmethod
-    def from_knowledge_base(cls, kb_root: Path) -> "GraphReasoner":
-        """Factory: Loads graph from standard locations."""
+    @property
+    def compiled(self) -> CompiledGraph:
+        """Adjacency/weight index of the graph, rebuilt only when it changes."""
+        key = (
+            id(self.graph),
+            len(self.graph.nodes),
+            len(self.graph.edges),
+            tuple(sorted(self.weights_config.items())),
+        )
+        if self._compiled is None or key != self._compiled_key:
+            self._compiled = CompiledGraph(self.graph, self.weights_config)
+            self._compiled_key = key
+        return self._compiled
+
+    @staticmethod
+    def _source_manifest(kb_root: Path) -> SourceManifest:
+        """Manifest over every file from_knowledge_base reads."""
+        project_root = kb_root.parent
+        return SourceManifest(
+            project_root,
+            [
+                kb_root / "concept_relationships.yaml",
+                kb_root / "concepts",
+                project_root / "data" / "schemas" / "ict_ontology.yaml",
+                kb_root / "definitions" / "terminology.yaml",
+                kb_root / "logic_flows.yaml",
+            ],
+            extensions={".md"},
+            # enrich_from_directory only reads top-level concepts/*.md
+            recursive=False,
+        )
+
+    @staticmethod
+    def _build_graph(kb_root: Path) -> ICTGraphInternal:
+        """Parse and enrich the graph from all knowledge base sources."""
         yaml_path = kb_root / "concept_relationships.yaml"
         concepts_dir = kb_root / "concepts"
 
@@ -90,7 +133,48 @@ class GraphReasoner:
         if logic_flows_path.exists():
             graph.enrich_from_logic_flows(logic_flows_path)
 
+        return graph
+
+    @classmethod
+    def from_knowledge_base(
+        cls,
+        kb_root: Path,
+        snapshot_path: Optional[Path] = None,
+        use_snapshot: bool = True,
+    ) -> "GraphReasoner":
+        """Factory: Loads graph from standard locations.
+
+        The enriched graph is pickled to ``snapshot_path`` (default
+        data/cache/graph_snapshot.pkl) together with the source manifest.
+        Later loads reuse it unless a source file's hash changed, which
+        skips YAML parsing, markdown enrichment and pydantic validation.
+        """
+        if snapshot_path is None:
+            snapshot_path = kb_root.parent / "data" / "cache" / "graph_snapshot.pkl"
+
+        graph = None
+        manifest = cls._source_manifest(kb_root)
+        if use_snapshot:
+            payload = load_pickle(snapshot_path, version=SNAPSHOT_VERSION)
+            if payload and payload.get("kb_root") == str(kb_root):
+                manifest = SourceManifest(
+                    manifest.base, manifest.sources, manifest.extensions, payload["manifest"],
+                    recursive=manifest.recursive,
+                )
+                if not manifest.scan().has_changes:
+                    graph = payload["graph"]
+                    logger.info(f"Knowledge Graph restored from snapshot {snapshot_path}")
+
+        if graph is None:
+            manifest.scan()
+            graph = cls._build_graph(kb_root)
+            if use_snapshot:
+                cls._save_snapshot(snapshot_path, kb_root, graph, manifest)
+
         instance = cls(graph)
+        instance.kb_root = kb_root
+        instance._manifest = manifest
+        instance._snapshot_path = snapshot_path if use_snapshot else None
 
         # Try to load self-training config if it exists relative to kb_root
         # Typically config/self_training_config.yaml is ../config/ relative to knowledge_base
@@ -102,6 +186,54 @@ class GraphReasoner:
 
         return instance
 
+    @staticmethod
+    def _save_snapshot(
+        snapshot_path: Path, kb_root: Path, graph: ICTGraphInternal, manifest: SourceManifest
+    ) -> None:
+        try:
+            save_pickle(
+                snapshot_path,
+                {"kb_root": str(kb_root), "manifest": manifest.to_dict(), "graph": graph},
+                version=SNAPSHOT_VERSION,
+            )
+        except Exception as e:
+            logger.warning(f"Could not write graph snapshot to {snapshot_path}: {e}")
+
+    def refresh(self) -> Optional[ManifestDiff]:
+        """
+        Patch the graph with knowledge base files changed since it was built.
+
+        New concept markdown files are merged in place via enrich_from_file.
+        Enrichment only ever merges into nodes, so a changed or deleted
+        source (or any YAML change) cannot be undone in place and triggers
+        a full rebuild instead.
+
+        Returns:
+            The ManifestDiff applied, or None if not built from a knowledge base
+        """
+        if self._manifest is None or self.kb_root is None:
+            return None
+
+        diff = self._manifest.scan()
+        if not diff.has_changes:
+            return diff
+
+        additive_only = not diff.removed and all(
+            rel_path.endswith(".md") for rel_path in diff.added
+        )
+        if additive_only:
+            for rel_path in diff.added:
+                self.graph.enrich_from_file(self._manifest.base / rel_path)
+            logger.info(f"Graph patched in place ({diff})")
+        else:
+            self.graph = self._build_graph(self.kb_root)
+            logger.info(f"Graph rebuilt ({diff})")
+
+        if self._snapshot_path is not None:
+            self._save_snapshot(self._snapshot_path, self.kb_root, self.graph, self._manifest)
+
+        return diff
+
     def load_weights(self, config_path: Path):
         """Load custom scoring weights from self_training_config.yaml"""
         try:
@@ -179,27 +311,45 @@ class GraphReasoner:
         Evaluate current market signals against all known Models in the graph.
         Returns the best matching model and a Go/No-Go decision.
         """
+        return self.evaluate_many([signals])[0]
+
+    def evaluate_many(self, signals_list: List[Dict[str, Any]]) -> List[TradeDecision]:
+        """
+        Evaluate a batch of signal dicts (e.g. one per backtest bar).
+
+        All models are scored for all signal dicts in one matrix product over
+        the compiled graph; per-requirement explanations are only built for
+        each decision's winning model.
+        """
+        compiled = self.compiled
+        scores = compiled.score_many(signals_list)
+        return [
+            self._decide(signals, row, compiled)
+            for signals, row in zip(signals_list, scores)
+        ]
+
+    def _decide(self, signals: Dict[str, Any], scores, compiled: CompiledGraph) -> TradeDecision:
+        """Build a TradeDecision from one row of model scores."""
         best_model = None
         best_score = -1.0
         decision = TradeDecision()
 
         # 1. Identify Candidate Models
-        # Iterate over all nodes of type 'model'
-        for node in self.graph.nodes.values():
-            if node.type != ConceptType.MODEL:
-                continue
-
-            score, missing, reasons, factors = self._score_model(node.id, signals)
-            decision.model_scores[node.id] = score
-
-            if score > best_score:
+        decision.model_scores = {
+            model_id: float(score) for model_id, score in zip(compiled.model_ids, scores)
+        }
+        if len(scores):
+            # argmax returns the first maximum, matching node iteration order
+            best_idx = int(scores.argmax())
+            if scores[best_idx] > best_score:
+                best_model = compiled.model_ids[best_idx]
+                score, missing, reasons, factors = self._score_model(best_model, signals)
                 best_score = score
-                best_model = node.id
                 decision.missing_prerequisites = missing
                 decision.explanation = reasons
                 decision.confluence_factors = factors
                 decision.score_raw = score
-                decision.recommended_model_name = node.label  # e.g. "Silver Bullet"
+                decision.recommended_model_name = compiled.model_labels[best_idx]
 
         # 2. Check Anti-Patterns (Global Red Flags)
         # TODO: Implement global anti-pattern check logic
@@ -241,41 +391,16 @@ class GraphReasoner:
         factors["base_model_value"] = base_weight
 
         # Get edges starting from this model
-        requirements = [
-            e
-            for e in self.graph.edges
-            if e.source_id == model_id and e.relation_type == "requires"
-        ]
-        time_windows = [
-            e
-            for e in self.graph.edges
-            if e.source_id == model_id and e.relation_type == "active_during"
-        ]
+        compiled = self.compiled
+        requirements = compiled.edges_from(model_id, "requires")
+        time_windows = compiled.edges_from(model_id, "active_during")
 
         # 1. Check Requirements
         for req in requirements:
             req_id = req.target_id
 
-            # Map clean IDs to signals
-            is_met = False
-
-            # Direct pattern match
-            if req_id in signals.get("patterns", []):
-                is_met = True
-
-            # Detailed signal map
-            elif req_id == "displacement" and signals.get("displacement"):
-                is_met = True
-            elif req_id == "liquidity_sweep" and signals.get("liquidity_swept"):
-                is_met = True
-            elif req_id == "market_structure_shift" and signals.get(
-                "market_structure_shift"
-            ):
-                is_met = True
-            elif req_id == "fair_value_gap" and "fvg" in signals.get("patterns", []):
-                is_met = True
-            elif req_id == "order_block" and "ob" in signals.get("patterns", []):
-                is_met = True
+            # Map clean IDs to signals (direct pattern match or signal flag)
+            is_met = requirement_met(req_id, signals)
 
             # Determine weight: Config override > Graph weight > Default
             # Look for config weight for the REQUIREMENT (e.g. 'displacement': 10)
@@ -9,10 +9,15 @@ Three tiers:
 Integrates with EventStream via pub/sub pattern.
 """
 
-from ict_agent.memory.short_term import ShortTermMemory
-from ict_agent.memory.long_term import LongTermMemory
-from ict_agent.memory.recall import KnowledgeRecall
-from ict_agent.memory.memory_manager import MemoryManager
+from typing import TYPE_CHECKING
+
+from ict_agent._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ict_agent.memory.short_term import ShortTermMemory
+    from ict_agent.memory.long_term import LongTermMemory
+    from ict_agent.memory.recall import KnowledgeRecall
+    from ict_agent.memory.memory_manager import MemoryManager
 
 __all__ = [
     "ShortTermMemory",
@@ -20,3 +25,12 @@ __all__ = [
     "KnowledgeRecall",
     "MemoryManager",
 ]
+
+_EXPORTS = {
+    "ShortTermMemory": "ict_agent.memory.short_term",
+    "LongTermMemory": "ict_agent.memory.long_term",
+    "KnowledgeRecall": "ict_agent.memory.recall",
+    "MemoryManager": "ict_agent.memory.memory_manager",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -18,6 +18,8 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 from zoneinfo import ZoneInfo
 
+from ict_agent.knowledge.manifest import SourceManifest
+
 NY_TZ = ZoneInfo("America/New_York")
 
 
@@ -42,27 +44,44 @@ class KnowledgeRecall:
 
         self.vex_memory_dir = vex_memory_dir
         self._knowledge_cache: Dict[str, str] = {}
+        self._manifest: Optional[SourceManifest] = None
+        if self.vex_memory_dir:
+            self._manifest = SourceManifest(
+                self.vex_memory_dir, [self.vex_memory_dir], extensions={".md"}
+            )
         self._load_knowledge_files()
 
+    def _cache_keys(self, rel_path: str) -> List[str]:
+        """Cache keys a vex_memory file is stored under."""
+        path = Path(rel_path)
+        keys = [path.stem]
+        # Files under ict_patterns/ are also exposed as pattern_<stem>
+        if path.parts and path.parts[0] == "ict_patterns":
+            keys.append(f"pattern_{path.stem}")
+        return keys
+
     def _load_knowledge_files(self) -> None:
-        """Load all markdown knowledge files from vex_memory."""
-        if not self.vex_memory_dir or not self.vex_memory_dir.exists():
+        """Load markdown knowledge files from vex_memory that changed since last load."""
+        if self._manifest is None or not self.vex_memory_dir.exists():
             return
 
-        for f in self.vex_memory_dir.rglob("*.md"):
+        diff = self._manifest.scan()
+
+        for rel_path in diff.removed:
+            for key in self._cache_keys(rel_path):
+                self._knowledge_cache.pop(key, None)
+
+        for rel_path in diff.updated:
             try:
-                self._knowledge_cache[f.stem] = f.read_text()
+                content = (self.vex_memory_dir / rel_path).read_text()
             except IOError:
-                pass
-
-        # Also load from ict_patterns subdirectory
-        patterns_dir = self.vex_memory_dir / "ict_patterns"
-        if patterns_dir.exists():
-            for f in patterns_dir.rglob("*.md"):
-                try:
-                    self._knowledge_cache[f"pattern_{f.stem}"] = f.read_text()
-                except IOError:
-                    pass
+                continue
+            for key in self._cache_keys(rel_path):
+                self._knowledge_cache[key] = content
+
+    def refresh(self) -> None:
+        """Pick up added/changed/deleted vex_memory files without a full reload."""
+        self._load_knowledge_files()
 
     def recall(
         self,
@@ -1,9 +1,14 @@
 """ICT Trading Models"""
 
-from ict_agent.models.silver_bullet import SilverBulletModel
-from ict_agent.models.judas_swing import JudasSwingModel
-from ict_agent.models.power_of_three import PowerOfThreeModel
-from ict_agent.models.ote_retracement import OTERetracementModel
+from typing import TYPE_CHECKING
+
+from ict_agent._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ict_agent.models.silver_bullet import SilverBulletModel
+    from ict_agent.models.judas_swing import JudasSwingModel
+    from ict_agent.models.power_of_three import PowerOfThreeModel
+    from ict_agent.models.ote_retracement import OTERetracementModel
 
 __all__ = [
     "SilverBulletModel",
@@ -11,3 +16,12 @@ __all__ = [
     "PowerOfThreeModel",
     "OTERetracementModel",
 ]
+
+_EXPORTS = {
+    "SilverBulletModel": "ict_agent.models.silver_bullet",
+    "JudasSwingModel": "ict_agent.models.judas_swing",
+    "PowerOfThreeModel": "ict_agent.models.power_of_three",
+    "OTERetracementModel": "ict_agent.models.ote_retracement",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
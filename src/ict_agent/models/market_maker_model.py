@@ -49,6 +49,34 @@ import pandas as pd
 import numpy as np
 
 
+class _FirstBelowIndex:
+    """
+    Sparse table of range minimums over a fixed array.
+    
+    find(start, threshold) returns the first index >= start whose value is
+    strictly below threshold in O(log n), replacing forward bar-by-bar scans.
+    """
+    
+    def __init__(self, values: np.ndarray):
+        self.n = len(values)
+        self.levels = [np.asarray(values, dtype=float)]
+        width = 1
+        while width * 2 <= self.n:
+            prev = self.levels[-1]
+            self.levels.append(np.minimum(prev[:-width], prev[width:]))
+            width *= 2
+    
+    def find(self, start: int, threshold: float) -> Optional[int]:
+        pos = max(int(start), 0)  # start may be a numpy index (chain["last"])
+        for k in range(len(self.levels) - 1, -1, -1):
+            table = self.levels[k]
+            if pos < len(table) and table[pos] >= threshold:
+                pos += 1 << k
+        if pos < self.n and self.levels[0][pos] < threshold:
+            return int(pos)
+        return None
+
+
 class MarketMakerModelType(Enum):
     """Type of Market Maker Model"""
     BUY_MODEL = "mmbm"    # MMBM - Reversal from discount to premium
@@ -487,28 +515,29 @@ class MarketMakerModelDetector:
     ) -> List[MarketMakerSetup]:
         """
         Main analysis - scan for Market Maker Buy/Sell Models.
+        
+        Single pass over every candidate consolidation end. Everything the
+        per-scan helpers (detect_consolidation, detect_engineered_liquidity,
+        detect_mss) would recompute from scratch is precomputed once:
+        ATR, swing flags, breakout windows, curve extremes, and the
+        lower-high / higher-low chains (monotonic stack). Full setups are
+        only materialized for candidates that can win deduplication.
         """
-        if len(df) < 50:
+        n = len(df)
+        if n < 50:
             return []
         
-        setups = []
+        scan = self._precompute_scan(df)
+        best: Dict[str, MarketMakerSetup] = {}
         
-        # Scan for potential consolidation breakouts
-        for scan_end in range(50, len(df) - 20):
-            # Try to find consolidation
-            consolidation = self.detect_consolidation(df, scan_end)
-            
+        for scan_end in range(50, n - 20):
+            consolidation = self._scan_consolidation(scan, scan_end)
             if consolidation is None:
                 continue
             
-            # Determine model type based on breakout direction
-            next_candles = df.iloc[scan_end:min(scan_end + 10, len(df))]
-            
-            if len(next_candles) < 5:
-                continue
-            
-            broke_down = next_candles['low'].min() < consolidation.low
-            broke_up = next_candles['high'].max() > consolidation.high
+            # Determine model type from the 10 candles after the range
+            broke_down = scan["next_low"][scan_end] < consolidation.low
+            broke_up = scan["next_high"][scan_end] > consolidation.high
             
             if broke_down and not broke_up:
                 model_type = MarketMakerModelType.BUY_MODEL
@@ -517,31 +546,25 @@ class MarketMakerModelDetector:
             else:
                 continue  # No clear direction
             
-            # Detect engineered liquidity levels
-            engineered = self.detect_engineered_liquidity(df, scan_end, model_type)
-            
-            if len(engineered) < self.min_engineered_levels:
+            chain = scan[model_type]
+            first = self._first_engineered_idx(scan, scan_end, model_type)
+            legs = chain["depth"][first] if first is not None else 0
+            if legs < self.min_engineered_levels:
                 continue
             
-            # Detect PD Array
             pd_array = self.detect_pd_array(df, consolidation, model_type)
-            
-            # Detect MSS
-            mss_result = self.detect_mss(df, engineered, model_type)
+            mss_result = self._scan_mss(scan, chain["last"][first], model_type)
             
             if mss_result is None:
-                # Model still developing - might be in curve phase
                 phase = MMModelPhase.SELLSIDE_CURVE if model_type == MarketMakerModelType.BUY_MODEL \
                         else MMModelPhase.BUYSIDE_CURVE
             else:
                 phase = MMModelPhase.MSS_CONFIRMED
             
-            # Create setup
             setup = MarketMakerSetup(
                 type=model_type,
                 phase=phase,
                 consolidation=consolidation,
-                engineered_levels=engineered,
                 pd_array_high=pd_array[0] if pd_array else None,
                 pd_array_low=pd_array[1] if pd_array else None,
                 symbol=symbol,
@@ -549,46 +572,222 @@ class MarketMakerModelDetector:
                 timestamp=df.index[-1]
             )
             
+            entry_zone = None
             if mss_result:
                 setup.mss_level, setup.mss_candle_idx = mss_result
-                
-                # Find entry zone
                 entry_zone = self.find_entry_zone(df, setup.mss_candle_idx, model_type)
-                
                 if entry_zone:
                     setup.entry_zone_high = entry_zone['high']
                     setup.entry_zone_low = entry_zone['low']
                     setup.entry_type = entry_zone['type']
                     setup.phase = MMModelPhase.SMART_MONEY_REVERSAL
-                    
-                    # Calculate levels
-                    curve_section = df.iloc[scan_end:]
-                    lowest = curve_section['low'].min()
-                    highest = curve_section['high'].max()
-                    setup = self.calculate_trade_levels(setup, df, lowest, highest)
+                    setup = self.calculate_trade_levels(
+                        setup, df, scan["curve_low"][scan_end], scan["curve_high"][scan_end]
+                    )
             
-            # Calculate confidence
-            setup.confidence = self._calculate_confidence(setup)
+            setup.confidence = self._calculate_confidence(setup, legs_count=legs)
+            if setup.confidence < 0.5:
+                continue
             
-            if setup.confidence >= 0.5:
-                setups.append(setup)
-        
-        # Keep only the most recent/best setup per type
-        self.active_setups = self._deduplicate_setups(setups)
+            # Keep only the first best setup per type (same as _deduplicate_setups)
+            key = model_type.value
+            if key in best and setup.confidence <= best[key].confidence:
+                continue
+            
+            setup.engineered_levels = self._engineered_chain(df, scan, first, model_type)
+            if entry_zone:
+                setup.intermediate_targets = []
+                setup = self.calculate_trade_levels(
+                    setup, df, scan["curve_low"][scan_end], scan["curve_high"][scan_end]
+                )
+            best[key] = setup
+        
+        self.active_setups = list(best.values())
         return self.active_setups
     
-    def _calculate_confidence(self, setup: MarketMakerSetup) -> float:
-        """Calculate confidence score"""
+    def _precompute_scan(self, df: pd.DataFrame) -> Dict:
+        """Per-frame arrays shared by every scan_end in analyze()"""
+        n = len(df)
+        high = df['high'].to_numpy(dtype=float)
+        low = df['low'].to_numpy(dtype=float)
+        close = df['close'].to_numpy(dtype=float)
+        atr = self._calculate_atr(df, 14)
+        atr_values = atr.to_numpy(dtype=float) if atr is not None else None
+        
+        # Breakout window [scan_end, scan_end + 10)
+        next_low = np.full(n, np.nan)
+        next_high = np.full(n, np.nan)
+        if n >= 10:
+            next_low[:n - 9] = np.lib.stride_tricks.sliding_window_view(low, 10).min(axis=1)
+            next_high[:n - 9] = np.lib.stride_tricks.sliding_window_view(high, 10).max(axis=1)
+        
+        # Swing flags exactly as detect_engineered_liquidity evaluates them:
+        # compare against j = 1..min(swing_lookback, n - i - 1) on both sides
+        lb = self.swing_lookback
+        idx = np.arange(n)
+        swing_high = idx >= lb
+        swing_low = idx >= lb
+        for j in range(1, lb + 1):
+            checked = (idx >= lb) & (idx <= n - 1 - j)
+            left = np.clip(idx - j, 0, n - 1)
+            right = np.clip(idx + j, 0, n - 1)
+            swing_high &= ~(checked & ((high < high[left]) | (high < high[right])))
+            swing_low &= ~(checked & ((low > low[left]) | (low > low[right])))
+        
+        return {
+            "high": high,
+            "low": low,
+            "atr": atr_values,
+            "next_low": next_low,
+            "next_high": next_high,
+            "curve_low": np.minimum.accumulate(low[::-1])[::-1],
+            "curve_high": np.maximum.accumulate(high[::-1])[::-1],
+            MarketMakerModelType.BUY_MODEL: self._swing_chain(
+                np.where(swing_high, high, np.inf)
+            ),
+            MarketMakerModelType.SELL_MODEL: self._swing_chain(
+                np.where(swing_low, -low, np.inf)
+            ),
+            "mss_up": _FirstBelowIndex(-close),
+            "mss_down": _FirstBelowIndex(close),
+            "mss_cache": {},
+        }
+    
+    @staticmethod
+    def _swing_chain(keyed: np.ndarray) -> Dict:
+        """
+        Chains of strictly decreasing swing values (inf = not a swing).
+        
+        nxt[i] is the next swing strictly below swing i, found with a
+        monotonic stack; depth/last give each chain's length and end.
+        """
+        n = len(keyed)
+        nxt = np.full(n, -1, dtype=np.int64)
+        stack: List[int] = []
+        for i in np.flatnonzero(np.isfinite(keyed)):
+            while stack and keyed[stack[-1]] > keyed[i]:
+                nxt[stack.pop()] = i
+            stack.append(int(i))
+        
+        depth = np.zeros(n, dtype=np.int64)
+        last = np.arange(n, dtype=np.int64)
+        for i in range(n - 1, -1, -1):
+            if nxt[i] >= 0:
+                depth[i] = depth[nxt[i]] + 1
+                last[i] = last[nxt[i]]
+            else:
+                depth[i] = 1
+        
+        return {"keyed": keyed, "nxt": nxt, "depth": depth, "last": last,
+                "index": _FirstBelowIndex(keyed)}
+    
+    def _scan_consolidation(self, scan: Dict, end_idx: int) -> Optional[ConsolidationRange]:
+        """detect_consolidation() over precomputed arrays"""
+        atr = scan["atr"]
+        if end_idx < self.consolidation_min_candles or atr is None or end_idx >= len(atr):
+            return None
+        
+        window_atr = atr[max(0, end_idx - 50):end_idx]
+        valid = ~np.isnan(window_atr)
+        if not valid.any():
+            return None
+        avg_atr = np.where(valid, window_atr, 0.0).sum() / valid.sum()
+        max_range = avg_atr * self.consolidation_max_atr_mult * 10
+        
+        max_lookback = min(100, end_idx)
+        if max_lookback <= self.consolidation_min_candles:
+            return None
+        
+        # Windows [end_idx - lookback, end_idx) grow backward from end_idx
+        highs = scan["high"][end_idx - max_lookback + 1:end_idx][::-1]
+        lows = scan["low"][end_idx - max_lookback + 1:end_idx][::-1]
+        run_high = np.maximum.accumulate(highs)
+        run_low = np.minimum.accumulate(lows)
+        
+        lookbacks = np.arange(self.consolidation_min_candles, max_lookback)
+        tight = (run_high - run_low)[lookbacks - 1] <= max_range
+        # Range only widens with lookback, so tight windows form a prefix
+        lookbacks = lookbacks[:np.argmin(tight)] if not tight.all() else lookbacks
+        if len(lookbacks) == 0:
+            return None
+        
+        in_window = np.arange(len(highs))[np.newaxis, :] < lookbacks[:, np.newaxis]
+        top = run_high[lookbacks - 1]
+        bottom = run_low[lookbacks - 1]
+        upper_touches = ((highs[np.newaxis, :] >= top[:, np.newaxis] * 0.998) & in_window).sum(axis=1)
+        lower_touches = ((lows[np.newaxis, :] <= bottom[:, np.newaxis] * 1.002) & in_window).sum(axis=1)
+        hits = np.flatnonzero((upper_touches >= 2) & (lower_touches >= 2))
+        if len(hits) == 0:
+            return None
+        
+        lookback = int(lookbacks[hits[0]])
+        return ConsolidationRange(
+            high=top[hits[0]],
+            low=bottom[hits[0]],
+            start_idx=end_idx - lookback,
+            end_idx=end_idx,
+            candle_count=lookback
+        )
+    
+    def _first_engineered_idx(
+        self, scan: Dict, start_idx: int, model_type: MarketMakerModelType
+    ) -> Optional[int]:
+        """First -1 / +1 level after start_idx (see detect_engineered_liquidity)"""
+        chain = scan[model_type]
+        if model_type == MarketMakerModelType.BUY_MODEL:
+            threshold = scan["high"][start_idx]
+        else:
+            threshold = -scan["low"][start_idx]
+        return chain["index"].find(start_idx + self.swing_lookback, threshold)
+    
+    def _engineered_chain(
+        self, df: pd.DataFrame, scan: Dict, first: int, model_type: MarketMakerModelType
+    ) -> List[EngineeredLiquidity]:
+        """Materialize the engineered levels starting at swing index first"""
+        nxt = scan[model_type]["nxt"]
+        prices = scan["high"] if model_type == MarketMakerModelType.BUY_MODEL else scan["low"]
+        step = -1 if model_type == MarketMakerModelType.BUY_MODEL else 1
+        
+        levels = []
+        i = first
+        while i >= 0:
+            levels.append(EngineeredLiquidity(
+                level_number=step * (len(levels) + 1),
+                price=prices[i],
+                candle_idx=int(i),
+                timestamp=df.index[i]
+            ))
+            i = nxt[i]
+        return levels
+    
+    def _scan_mss(
+        self, scan: Dict, last_idx: int, model_type: MarketMakerModelType
+    ) -> Optional[Tuple[float, int]]:
+        """detect_mss() for the chain ending at last_idx"""
+        cache_key = (model_type, int(last_idx))
+        if cache_key not in scan["mss_cache"]:
+            if model_type == MarketMakerModelType.BUY_MODEL:
+                price = scan["high"][last_idx]
+                idx = scan["mss_up"].find(last_idx + 1, -price)
+            else:
+                price = scan["low"][last_idx]
+                idx = scan["mss_down"].find(last_idx + 1, price)
+            scan["mss_cache"][cache_key] = (price, idx) if idx is not None else None
+        return scan["mss_cache"][cache_key]
+    
+    def _calculate_confidence(self, setup: MarketMakerSetup, legs_count: Optional[int] = None) -> float:
+        """Calculate confidence score (legs_count overrides len(engineered_levels))"""
         confidence = 0.3  # Base
+        legs = setup.legs_count if legs_count is None else legs_count
         
         # Consolidation quality
         if setup.consolidation and setup.consolidation.candle_count >= 15:
             confidence += 0.15
         
         # Number of engineered levels (more = better)
-        if len(setup.engineered_levels) >= 3:
+        if legs >= 3:
             confidence += 0.15
-        elif len(setup.engineered_levels) >= 2:
+        elif legs >= 2:
             confidence += 0.10
         
         # MSS confirmed
@@ -22,10 +22,12 @@ TURTLE SOUP SELL (Bearish):
 Key insight: The sweep IS the manipulation - we trade the reversal.
 """
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Tuple
 from enum import Enum
 from datetime import datetime
+import numpy as np
 import pandas as pd
 
 
@@ -102,6 +104,56 @@ class TurtleSoupSetup:
         return None
 
 
+@dataclass
+class _Bars:
+    """OHLC columns as arrays plus the 3-bar pivots detect_mss looks back for"""
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    prev_peak: np.ndarray    # last i <= k with a 3-bar high pivot (or -1)
+    prev_trough: np.ndarray  # last i <= k with a 3-bar low pivot (or -1)
+    
+    @classmethod
+    def from_df(cls, df: pd.DataFrame) -> "_Bars":
+        high = df['high'].to_numpy(dtype=float)
+        low = df['low'].to_numpy(dtype=float)
+        n = len(df)
+        
+        peak = np.zeros(n, dtype=bool)
+        trough = np.zeros(n, dtype=bool)
+        if n >= 4:
+            peak[2:n - 1] = (high[2:n - 1] > high[1:n - 2]) & (high[2:n - 1] > high[3:])
+            trough[2:n - 1] = (low[2:n - 1] < low[1:n - 2]) & (low[2:n - 1] < low[3:])
+        idx = np.arange(n)
+        
+        return cls(
+            open=df['open'].to_numpy(dtype=float),
+            high=high,
+            low=low,
+            close=df['close'].to_numpy(dtype=float),
+            prev_peak=np.maximum.accumulate(np.where(peak, idx, -1)) if n else idx,
+            prev_trough=np.maximum.accumulate(np.where(trough, idx, -1)) if n else idx,
+        )
+
+
+@dataclass
+class _LevelBook:
+    """Liquidity levels of one type sorted by (price, position in liquidity_levels)"""
+    prices: List[float] = field(default_factory=list)
+    positions: List[int] = field(default_factory=list)
+    levels: List[LiquidityLevel] = field(default_factory=list)
+    
+    def first_unswept_between(self, low: float, high: float) -> Optional[Tuple[int, LiquidityLevel]]:
+        """Unswept level with low < price < high that comes first in liquidity_levels"""
+        best = None
+        for k in range(bisect_right(self.prices, low), bisect_left(self.prices, high)):
+            level = self.levels[k]
+            if not level.swept and (best is None or self.positions[k] < best[0]):
+                best = (self.positions[k], level)
+        return best
+
+
 class TurtleSoupDetector:
     """
     Detects ICT Turtle Soup patterns - failed breakouts following liquidity sweeps.
@@ -132,6 +184,11 @@ class TurtleSoupDetector:
         self.active_setups: List[TurtleSoupSetup] = []
         self.completed_setups: List[TurtleSoupSetup] = []
         
+        # Sorted SSL/BSL views of liquidity_levels for sweep and target lookups
+        self._books: Dict[str, _LevelBook] = {}
+        self._books_source: Optional[List[LiquidityLevel]] = None
+        self._books_size = 0
+        
     def identify_swing_points(self, df: pd.DataFrame) -> Tuple[List[Dict], List[Dict]]:
         """
         Identify swing highs and swing lows in price data.
@@ -139,41 +196,35 @@ class TurtleSoupDetector:
         Returns:
             Tuple of (swing_highs, swing_lows) with price and index info
         """
-        swing_highs = []
-        swing_lows = []
-        
-        lookback = min(self.swing_lookback, len(df) // 3)
-        
-        for i in range(lookback, len(df) - lookback):
-            # Check for swing high
-            is_swing_high = True
-            for j in range(1, lookback + 1):
-                if df['high'].iloc[i] <= df['high'].iloc[i - j] or \
-                   df['high'].iloc[i] <= df['high'].iloc[i + j]:
-                    is_swing_high = False
-                    break
-            
-            if is_swing_high:
-                swing_highs.append({
-                    'price': df['high'].iloc[i],
-                    'index': i,
-                    'timestamp': df.index[i] if hasattr(df.index[i], 'timestamp') else df.index[i]
-                })
-            
-            # Check for swing low
-            is_swing_low = True
-            for j in range(1, lookback + 1):
-                if df['low'].iloc[i] >= df['low'].iloc[i - j] or \
-                   df['low'].iloc[i] >= df['low'].iloc[i + j]:
-                    is_swing_low = False
-                    break
-            
-            if is_swing_low:
-                swing_lows.append({
-                    'price': df['low'].iloc[i],
-                    'index': i,
-                    'timestamp': df.index[i] if hasattr(df.index[i], 'timestamp') else df.index[i]
-                })
+        n = len(df)
+        lookback = min(self.swing_lookback, n // 3)
+        high = df['high'].to_numpy(dtype=float)
+        low = df['low'].to_numpy(dtype=float)
+        
+        is_swing_high = np.zeros(n, dtype=bool)
+        is_swing_low = np.zeros(n, dtype=bool)
+        if n - lookback > lookback:
+            inner = slice(lookback, n - lookback)
+            if lookback == 0:
+                is_swing_high[inner] = True
+                is_swing_low[inner] = True
+            else:
+                # Strictly above/below every bar within lookback on both sides
+                high_max = np.lib.stride_tricks.sliding_window_view(high, lookback).max(axis=1)
+                low_min = np.lib.stride_tricks.sliding_window_view(low, lookback).min(axis=1)
+                left = slice(0, n - 2 * lookback)
+                right = slice(lookback + 1, n - lookback + 1)
+                is_swing_high[inner] = (high[inner] > high_max[left]) & (high[inner] > high_max[right])
+                is_swing_low[inner] = (low[inner] < low_min[left]) & (low[inner] < low_min[right])
+        
+        swing_highs = [
+            {'price': high[i], 'index': int(i), 'timestamp': df.index[i]}
+            for i in np.flatnonzero(is_swing_high)
+        ]
+        swing_lows = [
+            {'price': low[i], 'index': int(i), 'timestamp': df.index[i]}
+            for i in np.flatnonzero(is_swing_low)
+        ]
         
         return swing_highs, swing_lows
     
@@ -186,43 +237,62 @@ class TurtleSoupDetector:
         swing_highs, swing_lows = self.identify_swing_points(df)
         
         self.liquidity_levels = []
+        threshold = self.sweep_threshold_pips * self.pip_value
         
-        # SSL levels (above swing highs where buy stops rest)
-        for sh in swing_highs:
-            level = LiquidityLevel(
-                price=sh['price'],
-                timestamp=sh['timestamp'],
-                type='SSL',
-                strength=1
-            )
-            # Check if similar level exists (cluster)
-            for existing in self.liquidity_levels:
-                if existing.type == 'SSL' and \
-                   abs(existing.price - level.price) < self.sweep_threshold_pips * self.pip_value:
-                    existing.strength += 1
-                    break
-            else:
-                self.liquidity_levels.append(level)
-        
+        # SSL levels (above swing highs where buy stops rest), then
         # BSL levels (below swing lows where sell stops rest)
-        for sl in swing_lows:
-            level = LiquidityLevel(
-                price=sl['price'],
-                timestamp=sl['timestamp'],
-                type='BSL',
-                strength=1
-            )
-            # Check if similar level exists (cluster)
-            for existing in self.liquidity_levels:
-                if existing.type == 'BSL' and \
-                   abs(existing.price - level.price) < self.sweep_threshold_pips * self.pip_value:
-                    existing.strength += 1
-                    break
-            else:
-                self.liquidity_levels.append(level)
-        
+        for level_type, swings in (('SSL', swing_highs), ('BSL', swing_lows)):
+            cluster_prices: List[float] = []
+            clusters: List[Tuple[int, LiquidityLevel]] = []
+            
+            for swing in swings:
+                level = LiquidityLevel(
+                    price=swing['price'],
+                    timestamp=swing['timestamp'],
+                    type=level_type,
+                    strength=1
+                )
+                # Check if similar level exists (cluster): the earliest
+                # existing level within the threshold absorbs this swing
+                match = None
+                lo = bisect_left(cluster_prices, level.price - 2 * abs(threshold))
+                hi = bisect_right(cluster_prices, level.price + 2 * abs(threshold))
+                for position, existing in clusters[lo:hi]:
+                    if abs(existing.price - level.price) < threshold and \
+                       (match is None or position < match[0]):
+                        match = (position, existing)
+                
+                if match:
+                    match[1].strength += 1
+                else:
+                    k = bisect_right(cluster_prices, level.price)
+                    cluster_prices.insert(k, level.price)
+                    clusters.insert(k, (len(self.liquidity_levels), level))
+                    self.liquidity_levels.append(level)
+        
+        self._index_levels()
         return self.liquidity_levels
     
+    def _index_levels(self) -> None:
+        """(Re)build the sorted SSL/BSL books over self.liquidity_levels"""
+        self._books = {'SSL': _LevelBook(), 'BSL': _LevelBook()}
+        for position, level in enumerate(self.liquidity_levels):
+            book = self._books.get(level.type)
+            if book is None:
+                continue
+            k = bisect_right(book.prices, level.price)
+            book.prices.insert(k, level.price)
+            book.positions.insert(k, position)
+            book.levels.insert(k, level)
+        self._books_source = self.liquidity_levels
+        self._books_size = len(self.liquidity_levels)
+    
+    def _level_books(self) -> Dict[str, _LevelBook]:
+        if self._books_source is not self.liquidity_levels or \
+           self._books_size != len(self.liquidity_levels):
+            self._index_levels()
+        return self._books
+    
     def detect_sweep(self, df: pd.DataFrame, candle_idx: int) -> Optional[Tuple[LiquidityLevel, TurtleSoupType]]:
         """
         Detect if the current candle sweeps any liquidity level.
@@ -234,43 +304,42 @@ class TurtleSoupDetector:
         """
         if candle_idx >= len(df):
             return None
-            
-        candle = df.iloc[candle_idx]
-        current_price = candle['close']
+        return self._sweep_at(_Bars.from_df(df), df.index, candle_idx)
+    
+    def _sweep_at(
+        self, bars: _Bars, index: pd.Index, candle_idx: int
+    ) -> Optional[Tuple[LiquidityLevel, TurtleSoupType]]:
+        """detect_sweep() as two range lookups in the sorted level books"""
+        o, h, l, c = (bars.open[candle_idx], bars.high[candle_idx],
+                      bars.low[candle_idx], bars.close[candle_idx])
+        total_range = h - l
+        if not total_range > 0:
+            return None
         
-        for level in self.liquidity_levels:
-            if level.swept:
-                continue
-                
-            if level.type == 'BSL':
-                # Bullish Turtle Soup: Sweep below swing low
-                # Price wicks below but closes above
-                if candle['low'] < level.price and candle['close'] > level.price:
-                    # Check for rejection (lower wick)
-                    body = abs(candle['close'] - candle['open'])
-                    lower_wick = min(candle['open'], candle['close']) - candle['low']
-                    total_range = candle['high'] - candle['low']
-                    
-                    if total_range > 0 and lower_wick / total_range >= self.min_sweep_rejection:
-                        level.swept = True
-                        level.sweep_time = df.index[candle_idx]
-                        return (level, TurtleSoupType.BULLISH)
-            
-            elif level.type == 'SSL':
-                # Bearish Turtle Soup: Sweep above swing high
-                # Price wicks above but closes below
-                if candle['high'] > level.price and candle['close'] < level.price:
-                    # Check for rejection (upper wick)
-                    body = abs(candle['close'] - candle['open'])
-                    upper_wick = candle['high'] - max(candle['open'], candle['close'])
-                    total_range = candle['high'] - candle['low']
-                    
-                    if total_range > 0 and upper_wick / total_range >= self.min_sweep_rejection:
-                        level.swept = True
-                        level.sweep_time = df.index[candle_idx]
-                        return (level, TurtleSoupType.BEARISH)
+        books = self._level_books()
+        candidates = []
         
-        return None
+        # Bullish Turtle Soup: wick below a BSL level, close back above it
+        lower_wick = min(o, c) - l
+        if lower_wick / total_range >= self.min_sweep_rejection:
+            hit = books['BSL'].first_unswept_between(l, c)
+            if hit:
+                candidates.append((hit[0], hit[1], TurtleSoupType.BULLISH))
+        
+        # Bearish Turtle Soup: wick above an SSL level, close back below it
+        upper_wick = h - max(o, c)
+        if upper_wick / total_range >= self.min_sweep_rejection:
+            hit = books['SSL'].first_unswept_between(c, h)
+            if hit:
+                candidates.append((hit[0], hit[1], TurtleSoupType.BEARISH))
+        
+        if not candidates:
+            return None
+        
+        _, level, soup_type = min(candidates, key=lambda x: x[0])
+        level.swept = True
+        level.sweep_time = index[candle_idx]
+        return (level, soup_type)
     
     def detect_mss(self, df: pd.DataFrame, start_idx: int, soup_type: TurtleSoupType) -> Optional[Tuple[float, int]]:
         """
@@ -284,45 +353,33 @@ class TurtleSoupDetector:
         """
         if start_idx >= len(df):
             return None
-            
-        end_idx = min(start_idx + self.mss_lookback, len(df))
+        return self._mss_at(_Bars.from_df(df), start_idx, soup_type)
+    
+    def _mss_at(self, bars: _Bars, start_idx: int, soup_type: TurtleSoupType) -> Optional[Tuple[float, int]]:
+        """detect_mss() using the precomputed pivot arrays"""
+        if start_idx < 1:
+            return None
+        end_idx = min(start_idx + self.mss_lookback, len(bars.close))
         
+        # Most recent 3-bar pivot within the previous 20 bars
         if soup_type == TurtleSoupType.BULLISH:
-            # Looking for break of a lower high (bullish MSS)
-            # Find the most recent lower high before the sweep
-            swing_high = None
-            for i in range(start_idx - 1, max(0, start_idx - 20), -1):
-                if i >= 2 and df['high'].iloc[i] > df['high'].iloc[i-1] and \
-                   df['high'].iloc[i] > df['high'].iloc[i+1]:
-                    swing_high = df['high'].iloc[i]
-                    break
-            
-            if swing_high is None:
-                return None
-            
-            # Check if price breaks above this level
-            for i in range(start_idx + 1, end_idx):
-                if df['close'].iloc[i] > swing_high:
-                    return (swing_high, i)
+            pivot = bars.prev_peak[start_idx - 1]
+        else:
+            pivot = bars.prev_trough[start_idx - 1]
+        if pivot <= max(0, start_idx - 20):
+            return None
         
-        else:  # BEARISH
-            # Looking for break of a higher low (bearish MSS)
-            swing_low = None
-            for i in range(start_idx - 1, max(0, start_idx - 20), -1):
-                if i >= 2 and df['low'].iloc[i] < df['low'].iloc[i-1] and \
-                   df['low'].iloc[i] < df['low'].iloc[i+1]:
-                    swing_low = df['low'].iloc[i]
-                    break
-            
-            if swing_low is None:
-                return None
-            
-            # Check if price breaks below this level
-            for i in range(start_idx + 1, end_idx):
-                if df['close'].iloc[i] < swing_low:
-                    return (swing_low, i)
+        closes = bars.close[start_idx + 1:end_idx]
+        if soup_type == TurtleSoupType.BULLISH:
+            level = bars.high[pivot]
+            breaks = np.flatnonzero(closes > level)
+        else:
+            level = bars.low[pivot]
+            breaks = np.flatnonzero(closes < level)
         
-        return None
+        if len(breaks) == 0:
+            return None
+        return (level, start_idx + 1 + int(breaks[0]))
     
     def find_entry_zone(self, df: pd.DataFrame, mss_idx: int, soup_type: TurtleSoupType) -> Optional[Dict]:
         """
@@ -330,57 +387,30 @@ class TurtleSoupDetector:
         
         Returns entry zone details including high, low, and type.
         """
+        return self._entry_zone_at(_Bars.from_df(df), mss_idx, soup_type)
+    
+    def _entry_zone_at(self, bars: _Bars, mss_idx: int, soup_type: TurtleSoupType) -> Optional[Dict]:
         lookback = min(5, mss_idx)
+        o, h, l, c = bars.open, bars.high, bars.low, bars.close
         
-        if soup_type == TurtleSoupType.BULLISH:
-            # Look for bullish FVG or bullish OB
-            for i in range(mss_idx, mss_idx - lookback, -1):
-                if i < 2:
-                    continue
-                    
-                # Check for bullish FVG (gap between candle 1 high and candle 3 low)
-                if df['low'].iloc[i] > df['high'].iloc[i-2]:
-                    return {
-                        'type': 'FVG',
-                        'high': df['low'].iloc[i],
-                        'low': df['high'].iloc[i-2],
-                        'index': i
-                    }
-                
-                # Check for bullish OB (last down candle before up move)
-                if df['close'].iloc[i-1] < df['open'].iloc[i-1] and \
-                   df['close'].iloc[i] > df['open'].iloc[i]:
-                    return {
-                        'type': 'OB',
-                        'high': df['high'].iloc[i-1],
-                        'low': df['low'].iloc[i-1],
-                        'index': i-1
-                    }
-        
-        else:  # BEARISH
-            # Look for bearish FVG or bearish OB
-            for i in range(mss_idx, mss_idx - lookback, -1):
-                if i < 2:
-                    continue
-                    
-                # Check for bearish FVG
-                if df['high'].iloc[i] < df['low'].iloc[i-2]:
-                    return {
-                        'type': 'FVG',
-                        'high': df['low'].iloc[i-2],
-                        'low': df['high'].iloc[i],
-                        'index': i
-                    }
-                
-                # Check for bearish OB
-                if df['close'].iloc[i-1] > df['open'].iloc[i-1] and \
-                   df['close'].iloc[i] < df['open'].iloc[i]:
-                    return {
-                        'type': 'OB',
-                        'high': df['high'].iloc[i-1],
-                        'low': df['low'].iloc[i-1],
-                        'index': i-1
-                    }
+        for i in range(mss_idx, mss_idx - lookback, -1):
+            if i < 2:
+                continue
+            
+            if soup_type == TurtleSoupType.BULLISH:
+                # Bullish FVG (gap between candle 1 high and candle 3 low)
+                if l[i] > h[i-2]:
+                    return {'type': 'FVG', 'high': l[i], 'low': h[i-2], 'index': i}
+                # Bullish OB (last down candle before up move)
+                if c[i-1] < o[i-1] and c[i] > o[i]:
+                    return {'type': 'OB', 'high': h[i-1], 'low': l[i-1], 'index': i-1}
+            else:
+                # Bearish FVG
+                if h[i] < l[i-2]:
+                    return {'type': 'FVG', 'high': l[i-2], 'low': h[i], 'index': i}
+                # Bearish OB
+                if c[i-1] > o[i-1] and c[i] < o[i]:
+                    return {'type': 'OB', 'high': h[i-1], 'low': l[i-1], 'index': i-1}
         
         return None
     
@@ -404,8 +434,9 @@ class TurtleSoupDetector:
             setup.stop_loss = setup.sweep_low - buffer
             
             # Target: Next SSL (swing high) above
-            for level in sorted(self.liquidity_levels, key=lambda x: x.price):
-                if level.type == 'SSL' and level.price > setup.entry_price and not level.swept:
+            book = self._level_books()['SSL']
+            for level in book.levels[bisect_right(book.prices, setup.entry_price):]:
+                if not level.swept:
                     setup.take_profit = level.price
                     break
             
@@ -423,10 +454,16 @@ class TurtleSoupDetector:
             setup.stop_loss = setup.sweep_high + buffer
             
             # Target: Next BSL (swing low) below
-            for level in sorted(self.liquidity_levels, key=lambda x: x.price, reverse=True):
-                if level.type == 'BSL' and level.price < setup.entry_price and not level.swept:
-                    setup.take_profit = level.price
-                    break
+            book = self._level_books()['BSL']
+            k = bisect_left(book.prices, setup.entry_price)
+            while k > 0 and setup.take_profit is None:
+                # Walk down one price at a time; equal prices in list order
+                lo = bisect_left(book.prices, book.prices[k - 1], 0, k)
+                for level in book.levels[lo:k]:
+                    if not level.swept:
+                        setup.take_profit = level.price
+                        break
+                k = lo
             
             if setup.take_profit is None:
                 # Use 2:1 RR as default
@@ -457,6 +494,7 @@ class TurtleSoupDetector:
         
         # Build liquidity map
         self.build_liquidity_map(df)
+        bars = _Bars.from_df(df)
         
         setups = []
         
@@ -464,7 +502,7 @@ class TurtleSoupDetector:
         scan_start = max(self.swing_lookback, len(df) - 50)
         
         for i in range(scan_start, len(df)):
-            sweep_result = self.detect_sweep(df, i)
+            sweep_result = self._sweep_at(bars, df.index, i)
             
             if sweep_result:
                 level, soup_type = sweep_result
@@ -475,15 +513,15 @@ class TurtleSoupDetector:
                     status=SweepStatus.SWEPT,
                     swept_level=level,
                     sweep_candle_idx=i,
-                    sweep_low=df['low'].iloc[i] if soup_type == TurtleSoupType.BULLISH else 0,
-                    sweep_high=df['high'].iloc[i] if soup_type == TurtleSoupType.BEARISH else 0,
+                    sweep_low=bars.low[i] if soup_type == TurtleSoupType.BULLISH else 0,
+                    sweep_high=bars.high[i] if soup_type == TurtleSoupType.BEARISH else 0,
                     symbol=symbol,
                     timeframe=timeframe,
                     timestamp=df.index[i] if hasattr(df.index[i], 'timestamp') else datetime.now()
                 )
                 
                 # Check for MSS confirmation
-                mss_result = self.detect_mss(df, i, soup_type)
+                mss_result = self._mss_at(bars, i, soup_type)
                 
                 if mss_result:
                     mss_level, mss_idx = mss_result
@@ -493,7 +531,7 @@ class TurtleSoupDetector:
                     setup.status = SweepStatus.CONFIRMED
                     
                     # Find entry zone
-                    entry_zone = self.find_entry_zone(df, mss_idx, soup_type)
+                    entry_zone = self._entry_zone_at(bars, mss_idx, soup_type)
                     
                     if entry_zone:
                         setup.entry_zone_high = entry_zone['high']
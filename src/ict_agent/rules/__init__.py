@@ -1,5 +1,20 @@
 """VEX Rules module - Rule enforcement and violation tracking."""
 
-from .rules_engine import RulesEngine, RuleCheck, RuleCheckResult, RuleSeverity, ViolationType
+from typing import TYPE_CHECKING
+
+from ict_agent._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .rules_engine import RulesEngine, RuleCheck, RuleCheckResult, RuleSeverity, ViolationType
 
 __all__ = ["RulesEngine", "RuleCheck", "RuleCheckResult", "RuleSeverity", "ViolationType"]
+
+_EXPORTS = {
+    "RulesEngine": "ict_agent.rules.rules_engine",
+    "RuleCheck": "ict_agent.rules.rules_engine",
+    "RuleCheckResult": "ict_agent.rules.rules_engine",
+    "RuleSeverity": "ict_agent.rules.rules_engine",
+    "ViolationType": "ict_agent.rules.rules_engine",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,5 +1,16 @@
 """VEX Session module - Daily workflow and session management."""
 
-from .session_workflow import SessionWorkflow
+from typing import TYPE_CHECKING
+
+from ict_agent._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .session_workflow import SessionWorkflow
 
 __all__ = ["SessionWorkflow"]
+
+_EXPORTS = {
+    "SessionWorkflow": "ict_agent.session.session_workflow",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
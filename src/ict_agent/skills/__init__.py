@@ -1,11 +1,17 @@
 """VEX Skill System - Pluggable capabilities for the agent."""
-from ict_agent.skills.base import Skill, SkillResult, SkillRegistry
-from ict_agent.skills.scan_skill import ScanSkill
-from ict_agent.skills.analyze_skill import AnalyzeSkill
-from ict_agent.skills.execute_skill import ExecuteSkill
-from ict_agent.skills.learn_skill import LearnSkill
-from ict_agent.skills.news_skill import NewsSkill
-from ict_agent.skills.strategy_skill import StrategySkill
+
+from typing import TYPE_CHECKING
+
+from ict_agent._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ict_agent.skills.base import Skill, SkillResult, SkillRegistry
+    from ict_agent.skills.scan_skill import ScanSkill
+    from ict_agent.skills.analyze_skill import AnalyzeSkill
+    from ict_agent.skills.execute_skill import ExecuteSkill
+    from ict_agent.skills.learn_skill import LearnSkill
+    from ict_agent.skills.news_skill import NewsSkill
+    from ict_agent.skills.strategy_skill import StrategySkill
 
 __all__ = [
     "Skill",
@@ -18,3 +24,17 @@ __all__ = [
     "NewsSkill",
     "StrategySkill",
 ]
+
+_EXPORTS = {
+    "Skill": "ict_agent.skills.base",
+    "SkillResult": "ict_agent.skills.base",
+    "SkillRegistry": "ict_agent.skills.base",
+    "ScanSkill": "ict_agent.skills.scan_skill",
+    "AnalyzeSkill": "ict_agent.skills.analyze_skill",
+    "ExecuteSkill": "ict_agent.skills.execute_skill",
+    "LearnSkill": "ict_agent.skills.learn_skill",
+    "NewsSkill": "ict_agent.skills.news_skill",
+    "StrategySkill": "ict_agent.skills.strategy_skill",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -14,6 +14,15 @@ from ict_agent.events.event_types import SignalEvent, EventType
 NY_TZ = ZoneInfo("America/New_York")
 
 
+def _watch_levels(result) -> list:
+    """Prices whose crossing should trigger a re-analysis (scheduler input)."""
+    levels = [lvl.price for lvl in result.liquidity_levels if not lvl.swept]
+    for pd_array in result.pd_arrays:
+        if pd_array.valid and not pd_array.mitigated:
+            levels.extend((pd_array.top, pd_array.bottom))
+    return sorted(set(levels))
+
+
 class AnalyzeSkill(Skill):
     name = "analyze"
     description = "Deep ICT analysis of a symbol using VexCoreEngine (8-gate system)"
@@ -109,6 +118,8 @@ class AnalyzeSkill(Skill):
                             "rejection_reason": rejection_reason,
                             "knowledge_validation": validation,
                             "gate_trace": gate_trace_data,
+                            "watch_levels": _watch_levels(result),
+                            "cached": result.cached,
                         },
                         events=events,
                         execution_time_ms=(time.time() - start) * 1000,
@@ -172,6 +183,8 @@ class AnalyzeSkill(Skill):
                         "setup_dict": setup.to_dict(),
                         "knowledge_validation": validation,
                         "gate_trace": gate_trace_data,
+                        "watch_levels": _watch_levels(result),
+                        "cached": result.cached,
                     },
                     events=events,
                     execution_time_ms=(time.time() - start) * 1000,
@@ -199,6 +212,8 @@ class AnalyzeSkill(Skill):
                         "liquidity_count": len(result.liquidity_levels),
                         "pd_array_count": len(result.pd_arrays),
                         "gate_trace": gate_trace_data,
+                        "watch_levels": _watch_levels(result),
+                        "cached": result.cached,
                     },
                     events=events,
                     execution_time_ms=(time.time() - start) * 1000,
@@ -1,5 +1,17 @@
 """VEX Tools module - Trading calculators and utilities."""
 
-from .cbdr_calculator import CBDRCalculator, CBDRData
+from typing import TYPE_CHECKING
+
+from ict_agent._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .cbdr_calculator import CBDRCalculator, CBDRData
 
 __all__ = ["CBDRCalculator", "CBDRData"]
+
+_EXPORTS = {
+    "CBDRCalculator": "ict_agent.tools.cbdr_calculator",
+    "CBDRData": "ict_agent.tools.cbdr_calculator",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,5 +1,16 @@
 """VEX Visualization module - Enhanced charting and trade visualization."""
 
-from .visualizer import EnhancedVisualizer
+from typing import TYPE_CHECKING
+
+from ict_agent._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .visualizer import EnhancedVisualizer
 
 __all__ = ["EnhancedVisualizer"]
+
+_EXPORTS = {
+    "EnhancedVisualizer": "ict_agent.visualization.visualizer",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
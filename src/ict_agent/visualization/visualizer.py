@@ -6,12 +6,16 @@ Features:
 - Before/after trade comparison charts
 - Trade replay functionality
 - Session-based chart saving
+- Batch markup of a whole watchlist in a process pool
 """
 
 import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Union
 import sys
 
 # Add project root to path
@@ -20,6 +24,7 @@ sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+from matplotlib.collections import LineCollection, PolyCollection
 from matplotlib.patches import Rectangle, FancyBboxPatch
 import numpy as np
 import pandas as pd
@@ -57,6 +62,49 @@ STYLE_CONFIG = {
     "liquidity_low": "#ffffff88"
 }
 
+# Candles as fetched (DataFrame) or as the legacy list of dicts
+Candles = Union[pd.DataFrame, List[Dict]]
+
+
+def _as_frame(candles: Candles) -> pd.DataFrame:
+    """OHLC DataFrame for either candle form, indexed by time when known."""
+    if isinstance(candles, pd.DataFrame):
+        return candles
+    df = pd.DataFrame(candles)
+    if 'time' in df.columns:
+        df['time'] = pd.to_datetime(df['time'])
+        df.set_index('time', inplace=True)
+    return df
+
+
+def _ohlc_arrays(candles: Candles) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """(open, high, low, close) float arrays."""
+    df = _as_frame(candles)
+    if df.empty:
+        empty = np.empty(0)
+        return empty, empty, empty, empty
+    return tuple(df[col].to_numpy(dtype=float) for col in ("open", "high", "low", "close"))
+
+
+def _swing_levels(highs, lows) -> Tuple[np.ndarray, np.ndarray]:
+    """Swing highs/lows: bars beyond the two bars on either side."""
+    h = np.asarray(highs, dtype=float)
+    l = np.asarray(lows, dtype=float)
+    if len(h) < 5:
+        return np.empty(0), np.empty(0)
+    mid_h, mid_l = h[2:-2], l[2:-2]
+    swing_high = (mid_h > h[1:-3]) & (mid_h > h[:-4]) & (mid_h > h[3:-1]) & (mid_h > h[4:])
+    swing_low = (mid_l < l[1:-3]) & (mid_l < l[:-4]) & (mid_l < l[3:-1]) & (mid_l < l[4:])
+    return mid_h[swing_high], mid_l[swing_low]
+
+
+def _zone_rects(zones: List[Dict], n: int) -> List[np.ndarray]:
+    """Rectangles from each zone's candle to the right edge."""
+    return [
+        np.array([(z["index"], z["bottom"]), (z["index"], z["top"]), (n, z["top"]), (n, z["bottom"])])
+        for z in zones
+    ]
+
 
 class EnhancedVisualizer:
     """
@@ -70,22 +118,32 @@ class EnhancedVisualizer:
         self.structure_analyzer = StructureAnalyzer()
         SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
         
-    def fetch_candles(self, pair: str, timeframe: str, bars: int) -> List[Dict]:
-        """Fetch candles and convert to list of dicts."""
+    def fetch_frame(self, pair: str, timeframe: str, bars: int) -> pd.DataFrame:
+        """Fetch candles as an OHLCV DataFrame (empty on error)."""
         try:
             config = DataConfig(symbol=pair, timeframe=timeframe, limit=bars)
-            df = self.fetcher.fetch(config)
-            
-            candles = []
-            for idx, row in df.iterrows():
-                c = row.to_dict()
-                c['time'] = idx # Add timestamp
-                candles.append(c)
-                
-            return candles
+            return self.fetcher.fetch(config)
         except Exception as e:
             print(f"Error fetching candles: {e}")
+            return pd.DataFrame()
+
+    def fetch_frames(self, pair: str, timeframes: List[str], bars: int) -> Dict[str, pd.DataFrame]:
+        """Fetch every timeframe of a pair concurrently."""
+        if len(timeframes) <= 1:
+            return {tf: self.fetch_frame(pair, tf, bars) for tf in timeframes}
+        with ThreadPoolExecutor(max_workers=len(timeframes)) as pool:
+            futures = {tf: pool.submit(self.fetch_frame, pair, tf, bars) for tf in timeframes}
+            return {tf: future.result() for tf, future in futures.items()}
+
+    def fetch_candles(self, pair: str, timeframe: str, bars: int) -> List[Dict]:
+        """Fetch candles and convert to list of dicts."""
+        df = self.fetch_frame(pair, timeframe, bars)
+        if df.empty:
             return []
+        candles = df.to_dict("records")
+        for c, idx in zip(candles, df.index):
+            c['time'] = idx  # Add timestamp
+        return candles
     
     def create_markup(
         self,
@@ -96,7 +154,8 @@ class EnhancedVisualizer:
         show_liquidity: bool = True,
         show_pd_zones: bool = True,
         bars: int = 100,
-        save: bool = True
+        save: bool = True,
+        frames: Optional[Dict[str, pd.DataFrame]] = None
     ) -> Tuple[plt.Figure, str]:
         """
         Create comprehensive ICT markup chart.
@@ -110,9 +169,11 @@ class EnhancedVisualizer:
             show_pd_zones: Show premium/discount zones
             bars: Number of bars to fetch
             save: Whether to save the chart
+            frames: Pre-fetched candles per timeframe (fetched concurrently
+                if omitted)
         
         Returns:
-            (figure, filepath) tuple
+            (figure, filepath, analysis_data) tuple
         """
         if timeframes is None:
             timeframes = ["D", "H4", "H1", "M15"]
@@ -132,14 +193,15 @@ class EnhancedVisualizer:
             axes = [axes]
         
         analysis_data = {}
+        if frames is None:
+            frames = self.fetch_frames(pair, timeframes, bars)
         
         for idx, tf in enumerate(timeframes):
             ax = axes[idx]
             ax.set_facecolor(STYLE_CONFIG["background"])
             
-            # Fetch data
-            candles = self.fetch_candles(pair, tf, bars)
-            if not candles:
+            candles = frames.get(tf)
+            if candles is None or candles.empty:
                 ax.text(0.5, 0.5, f"No data for {tf}", transform=ax.transAxes,
                        ha='center', va='center', color=STYLE_CONFIG["text_color"])
                 continue
@@ -148,29 +210,28 @@ class EnhancedVisualizer:
             self._plot_candlesticks(ax, candles)
             
             # Detect ICT elements
-            closes = [c["close"] for c in candles]
-            highs = [c["high"] for c in candles]
-            lows = [c["low"] for c in candles]
+            opens, highs, lows, closes = _ohlc_arrays(candles)
+            n = len(closes)
             
             # Premium/Discount zones
             if show_pd_zones:
-                self._plot_pd_zones(ax, highs, lows, len(candles))
+                self._plot_pd_zones(ax, highs, lows, n)
             
             # FVGs
             if show_fvg:
                 fvgs = self._detect_fvgs(candles)
-                self._plot_fvgs(ax, fvgs, len(candles))
+                self._plot_fvgs(ax, fvgs, n)
                 analysis_data[f"{tf}_fvgs"] = len(fvgs)
             
             # Order Blocks
             if show_ob:
                 obs = self._detect_order_blocks(candles)
-                self._plot_order_blocks(ax, obs, len(candles))
+                self._plot_order_blocks(ax, obs, n)
                 analysis_data[f"{tf}_obs"] = len(obs)
             
             # Liquidity levels
             if show_liquidity:
-                self._plot_liquidity_levels(ax, highs, lows, len(candles))
+                self._plot_liquidity_levels(ax, highs, lows, n)
             
             # Styling
             ax.set_title(f"{pair} - {tf}", color=STYLE_CONFIG["text_color"], 
@@ -182,9 +243,9 @@ class EnhancedVisualizer:
                 spine.set_color(STYLE_CONFIG["grid_color"])
             
             # Store analysis
-            current_price = closes[-1] if closes else 0
-            swing_high = max(highs[-20:]) if len(highs) >= 20 else max(highs)
-            swing_low = min(lows[-20:]) if len(lows) >= 20 else min(lows)
+            current_price = float(closes[-1])
+            swing_high = highs[-20:].max()
+            swing_low = lows[-20:].min()
             mid = (swing_high + swing_low) / 2
             
             if current_price > mid:
@@ -211,6 +272,58 @@ class EnhancedVisualizer:
         
         return fig, filepath, analysis_data
     
+    def create_markups(
+        self,
+        pairs: List[str],
+        timeframes: List[str] = None,
+        bars: int = 100,
+        workers: Optional[int] = None,
+        **options
+    ) -> Dict[str, Tuple[str, Dict]]:
+        """
+        Markup charts for a whole watchlist, one pair per worker process.
+        
+        Each worker fetches its pair's timeframes concurrently, renders
+        off-screen and saves the PNG; figures never come back to this
+        process. With workers=1 the pairs are rendered here in turn.
+        
+        Args:
+            pairs: Trading pairs
+            timeframes: Timeframes per chart (create_markup default if None)
+            bars: Number of bars to fetch
+            workers: Process count (default: one per pair, up to CPU count)
+            **options: show_fvg / show_ob / show_liquidity / show_pd_zones
+        
+        Returns:
+            {pair: (filepath, analysis_data)} in the order given
+        """
+        workers = workers or min(len(pairs), os.cpu_count() or 1)
+        results = {}
+        
+        if workers <= 1:
+            for pair in pairs:
+                fig, filepath, analysis = self.create_markup(pair, timeframes, bars=bars, **options)
+                plt.close(fig)
+                results[pair] = (filepath, analysis)
+            return results
+        
+        # spawn: the parent may hold fetch threads and open sockets
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            futures = {
+                pool.submit(_render_markup_job, pair, timeframes, bars, options): pair
+                for pair in pairs
+            }
+            for future in as_completed(futures):
+                pair = futures[future]
+                try:
+                    results[pair] = future.result()
+                except Exception as e:
+                    print(f"Error rendering {pair}: {e}")
+                    results[pair] = ("", {})
+        
+        return {pair: results[pair] for pair in pairs}
+    
     def create_trade_chart(
         self,
         pair: str,
@@ -391,27 +504,31 @@ class EnhancedVisualizer:
         print(f"✅ Before/After chart saved: {filepath}")
         return fig, filepath
     
-    def _plot_candlesticks(self, ax, candles: List[Dict]):
-        """Plot candlestick chart."""
-        for i, candle in enumerate(candles):
-            o, h, l, c = candle["open"], candle["high"], candle["low"], candle["close"]
-            
-            color = STYLE_CONFIG["candle_up"] if c >= o else STYLE_CONFIG["candle_down"]
-            
-            # Wick
-            ax.plot([i, i], [l, h], color=color, linewidth=1)
-            
-            # Body
-            body_bottom = min(o, c)
-            body_height = abs(c - o)
-            if body_height < 0.00001:  # Doji
-                body_height = 0.00001
-            
-            rect = Rectangle((i - 0.4, body_bottom), 0.8, body_height,
-                            facecolor=color, edgecolor=color)
-            ax.add_patch(rect)
-        
-        ax.set_xlim(-1, len(candles))
+    def _plot_candlesticks(self, ax, candles: Candles):
+        """Plot candlestick chart (one collection for wicks, one for bodies)."""
+        opens, highs, lows, closes = _ohlc_arrays(candles)
+        n = len(closes)
+        x = np.arange(n, dtype=float)
+        colors = np.where(closes >= opens, STYLE_CONFIG["candle_up"], STYLE_CONFIG["candle_down"]).tolist()
+        
+        # Wicks
+        wicks = np.stack([np.column_stack([x, lows]), np.column_stack([x, highs])], axis=1)
+        ax.add_collection(LineCollection(wicks, colors=colors, linewidths=1))
+        
+        # Bodies (dojis get a minimal height)
+        body_bottom = np.minimum(opens, closes)
+        body_top = body_bottom + np.maximum(np.abs(closes - opens), 0.00001)
+        left, right = x - 0.4, x + 0.4
+        bodies = np.stack([
+            np.column_stack([left, body_bottom]),
+            np.column_stack([left, body_top]),
+            np.column_stack([right, body_top]),
+            np.column_stack([right, body_bottom]),
+        ], axis=1)
+        ax.add_collection(PolyCollection(bodies, facecolors=colors, edgecolors=colors))
+        
+        ax.set_xlim(-1, n)
+        ax.autoscale_view(scalex=False)
     
     def _plot_pd_zones(self, ax, highs: List[float], lows: List[float], n: int):
         """Plot premium/discount zones."""
@@ -429,122 +546,86 @@ class EnhancedVisualizer:
         ax.axhline(y=mid, color=STYLE_CONFIG["equilibrium"], linestyle='--', 
                   linewidth=1, alpha=0.5)
     
-    def _detect_fvgs(self, candles: List[Dict]) -> List[Dict]:
+    def _detect_fvgs(self, candles: Candles) -> List[Dict]:
         """Detect Fair Value Gaps using FVGDetector."""
-        if not candles:
+        df = _as_frame(candles)
+        if df.empty:
             return []
-            
-        df = pd.DataFrame(candles)
-        if 'time' in df.columns:
-            df['time'] = pd.to_datetime(df['time'])
-            df.set_index('time', inplace=True)
-            
-        result = self.fvg_detector.detect(df)
-        fvgs = []
-        
-        # Iterate through detected FVGs and format for plotting
-        # FVGDetector stores detected FVGs in self.fvg_detector._fvgs
-        # But for visualization of a specific batch, we should rely on the returned DataFrame or rebuild logic
-        # The DataFrame contains fvg_top, fvg_bottom, fvg_direction columns
         
-        for idx_val, row in result.iterrows():
-            if not pd.isna(row['fvg_top']):
-                # Find integer index in the current candles list
-                # This assumes candles list aligns with df index
-                try:
-                    # Get integer location
-                    idx = df.index.get_loc(idx_val)
-                    
-                    direction = "bullish" if row['fvg_direction'] == FVGDirection.BULLISH.value else "bearish"
-                    
-                    fvgs.append({
-                        "type": direction,
-                        "top": row['fvg_top'],
-                        "bottom": row['fvg_bottom'],
-                        "index": idx
-                    })
-                except KeyError:
-                    continue
-                    
-        return fvgs
+        result = self.fvg_detector.detect(df)
+        rows = np.flatnonzero(result['fvg_top'].notna().to_numpy())
+        directions = result['fvg_direction'].to_numpy()[rows]
+        tops = result['fvg_top'].to_numpy()[rows]
+        bottoms = result['fvg_bottom'].to_numpy()[rows]
+        
+        return [
+            {
+                "type": "bullish" if direction == FVGDirection.BULLISH.value else "bearish",
+                "top": top,
+                "bottom": bottom,
+                "index": int(idx)
+            }
+            for idx, direction, top, bottom in zip(rows, directions, tops, bottoms)
+        ]
 
     def _plot_fvgs(self, ax, fvgs: List[Dict], n: int):
-        """Plot FVGs on chart."""
-        for fvg in fvgs:
-            color = STYLE_CONFIG["fvg_bullish"] if fvg["type"] == "bullish" else STYLE_CONFIG["fvg_bearish"]
-            # Extend FVG to the right
-            ax.axhspan(fvg["bottom"], fvg["top"], 
-                      xmin=fvg["index"]/n, xmax=1,
-                      alpha=0.3, color=color)
+        """Plot FVGs on chart, extended to the right."""
+        if not fvgs:
+            return
+        colors = [STYLE_CONFIG["fvg_bullish"] if f["type"] == "bullish" else STYLE_CONFIG["fvg_bearish"]
+                  for f in fvgs]
+        ax.add_collection(PolyCollection(_zone_rects(fvgs, n), facecolors=colors,
+                                         edgecolors="none", alpha=0.3))
 
-    def _detect_order_blocks(self, candles: List[Dict]) -> List[Dict]:
+    def _detect_order_blocks(self, candles: Candles) -> List[Dict]:
         """Detect Order Blocks using OrderBlockDetector."""
-        if not candles:
+        df = _as_frame(candles)
+        if df.empty:
             return []
-            
-        df = pd.DataFrame(candles)
-        if 'time' in df.columns:
-            df['time'] = pd.to_datetime(df['time'])
-            df.set_index('time', inplace=True)
-            
-        result = self.ob_detector.detect(df)
-        obs = []
         
-        for idx_val, row in result.iterrows():
-            if not pd.isna(row['ob_top']):
-                try:
-                    idx = df.index.get_loc(idx_val)
-                    
-                    direction = "bullish" if row['ob_direction'] == OBDirection.BULLISH.value else "bearish"
-                    
-                    # Use body for OB definition if available (more precise ICT method)
-                    top = row['ob_body_top'] if 'ob_body_top' in row and not pd.isna(row['ob_body_top']) else row['ob_top']
-                    bottom = row['ob_body_bottom'] if 'ob_body_bottom' in row and not pd.isna(row['ob_body_bottom']) else row['ob_bottom']
-                    
-                    obs.append({
-                        "type": direction,
-                        "top": top,
-                        "bottom": bottom,
-                        "index": idx
-                    })
-                except KeyError:
-                    continue
-        
-        return obs
+        result = self.ob_detector.detect(df)
+        rows = np.flatnonzero(result['ob_top'].notna().to_numpy())
+        directions = result['ob_direction'].to_numpy()[rows]
+        
+        # Use body for OB definition if available (more precise ICT method)
+        tops = result['ob_body_top'].fillna(result['ob_top']).to_numpy()[rows]
+        bottoms = result['ob_body_bottom'].fillna(result['ob_bottom']).to_numpy()[rows]
+        
+        return [
+            {
+                "type": "bullish" if direction == OBDirection.BULLISH.value else "bearish",
+                "top": top,
+                "bottom": bottom,
+                "index": int(idx)
+            }
+            for idx, direction, top, bottom in zip(rows, directions, tops, bottoms)
+        ]
     
     def _plot_order_blocks(self, ax, obs: List[Dict], n: int):
         """Plot Order Blocks on chart."""
-        for ob in obs:
-            color = STYLE_CONFIG["ob_bullish"] if ob["type"] == "bullish" else STYLE_CONFIG["ob_bearish"]
-            rect = Rectangle(
-                (ob["index"], ob["bottom"]),
-                n - ob["index"],
-                ob["top"] - ob["bottom"],
-                facecolor=color,
-                edgecolor=color.replace("44", "88"),
-                linewidth=1
-            )
-            ax.add_patch(rect)
+        if not obs:
+            return
+        colors = [STYLE_CONFIG["ob_bullish"] if ob["type"] == "bullish" else STYLE_CONFIG["ob_bearish"]
+                  for ob in obs]
+        ax.add_collection(PolyCollection(
+            _zone_rects(obs, n),
+            facecolors=colors,
+            edgecolors=[c.replace("44", "88") for c in colors],
+            linewidths=1
+        ))
     
-    def _plot_liquidity_levels(self, ax, highs: List[float], lows: List[float], n: int):
+    def _plot_liquidity_levels(self, ax, highs, lows, n: int):
         """Plot liquidity levels (swing highs/lows)."""
-        # Find swing highs
-        for i in range(2, len(highs) - 2):
-            if highs[i] > highs[i-1] and highs[i] > highs[i-2] and \
-               highs[i] > highs[i+1] and highs[i] > highs[i+2]:
-                ax.axhline(y=highs[i], color=STYLE_CONFIG["liquidity_high"], linestyle=':', 
-                          linewidth=1, alpha=0.5)
-                ax.annotate('BSL', (n-5, highs[i]), color=STYLE_CONFIG["liquidity_high"], 
-                           fontsize=8, alpha=0.7)
-        
-        # Find swing lows
-        for i in range(2, len(lows) - 2):
-            if lows[i] < lows[i-1] and lows[i] < lows[i-2] and \
-               lows[i] < lows[i+1] and lows[i] < lows[i+2]:
-                ax.axhline(y=lows[i], color=STYLE_CONFIG["liquidity_low"], linestyle=':', 
-                          linewidth=1, alpha=0.5)
-                ax.annotate('SSL', (n-5, lows[i]), color=STYLE_CONFIG["liquidity_low"], 
-                           fontsize=8, alpha=0.7)
+        swing_highs, swing_lows = _swing_levels(highs, lows)
+        for levels, label, color in (
+            (swing_highs, 'BSL', STYLE_CONFIG["liquidity_high"]),
+            (swing_lows, 'SSL', STYLE_CONFIG["liquidity_low"]),
+        ):
+            if not len(levels):
+                continue
+            ax.hlines(levels, -1, n, colors=color, linestyles=':', linewidth=1, alpha=0.5)
+            for level in levels:
+                ax.annotate(label, (n-5, level), color=color, fontsize=8, alpha=0.7)
     
     def _add_legend(self, fig):
         """Add legend explaining chart elements."""
@@ -563,6 +644,21 @@ class EnhancedVisualizer:
                   framealpha=0.8)
 
 
+_worker_visualizer: Optional[EnhancedVisualizer] = None
+
+
+def _render_markup_job(pair: str, timeframes: Optional[List[str]], bars: int,
+                       options: Dict) -> Tuple[str, Dict]:
+    """Process-pool task: render and save one pair's markup off-screen."""
+    global _worker_visualizer
+    plt.switch_backend("Agg")
+    if _worker_visualizer is None:
+        _worker_visualizer = EnhancedVisualizer()
+    fig, filepath, analysis = _worker_visualizer.create_markup(pair, timeframes, bars=bars, **options)
+    plt.close(fig)
+    return filepath, analysis
+
+
 def main():
     """CLI entry point for visualization."""
     import sys
@@ -572,6 +668,7 @@ def main():
     if len(sys.argv) < 2:
         print("Usage:")
         print("  python visualizer.py markup PAIR [TF1,TF2,...]")
+        print("  python visualizer.py batch PAIR1,PAIR2,... [TF1,TF2,...]")
         print("  python visualizer.py trade PAIR DIRECTION ENTRY STOP TARGET")
         print("  python visualizer.py beforeafter TRADE_ID")
         return
@@ -587,6 +684,14 @@ def main():
             print(f"  {k}: {v}")
         plt.show()
     
+    elif cmd == "batch" and len(sys.argv) >= 3:
+        pairs = sys.argv[2].upper().split(",")
+        timeframes = sys.argv[3].upper().split(",") if len(sys.argv) > 3 else None
+        for pair, (path, data) in viz.create_markups(pairs, timeframes).items():
+            print(f"\n{pair}: {path or 'failed'}")
+            for k, v in data.items():
+                print(f"  {k}: {v}")
+    
     elif cmd == "trade" and len(sys.argv) >= 7:
         pair = sys.argv[2].upper()
         direction = sys.argv[3].upper()
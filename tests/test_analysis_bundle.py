@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Tests for detector outputs shared between MTF analysis and SignalGenerator.
+
+Run from train-ict root:
+    python -m pytest tests/test_analysis_bundle.py -v
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+_TRAIN_ICT_ROOT = Path(__file__).resolve().parent.parent
+_TRAIN_ICT_SRC = _TRAIN_ICT_ROOT / "src"
+sys.path.insert(0, str(_TRAIN_ICT_SRC))
+
+from ict_agent.engine.analysis_bundle import AnalysisBundle
+from ict_agent.engine.mtf_analyzer import Bias, MultiTimeframeAnalyzer, Timeframe
+from ict_agent.engine.signal_generator import SignalGenerator
+
+
+def _ohlc(n: int = 200, freq: str = "15min", seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 1.10 + np.cumsum(rng.normal(0, 0.0008, n))
+    open_ = np.r_[close[0], close[:-1]]
+    spread = np.abs(rng.normal(0, 0.0005, n))
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) + spread,
+            "low": np.minimum(open_, close) - spread,
+            "close": close,
+            "volume": rng.integers(100, 1000, n),
+        },
+        index=pd.date_range("2024-01-02", periods=n, freq=freq),
+    )
+
+
+class TestAnalysisBundle(unittest.TestCase):
+    def test_unchanged_windows_hit_cache(self):
+        analyzer = MultiTimeframeAnalyzer()
+        htf, itf, ltf = _ohlc(100, "1D"), _ohlc(150, "1h"), _ohlc(200)
+
+        analyzer.analyze_mtf(htf, itf, ltf, symbol="EURUSD")
+        result = analyzer.analyze_mtf(htf, itf, ltf.iloc[:-1], symbol="EURUSD")
+
+        self.assertEqual(analyzer.bundles.hits, 2)
+        self.assertEqual(analyzer.bundles.misses, 4)
+        self.assertTrue(result.ltf_bundle.matches(ltf.iloc[:-1], analyzer.pip_size))
+
+    def test_signal_generator_reuses_matching_bundle(self):
+        ltf = _ohlc()
+        result = MultiTimeframeAnalyzer().analyze_mtf(
+            _ohlc(100, "1D"), _ohlc(150, "1h"), ltf, Timeframe.D1, Timeframe.H1, Timeframe.M15
+        )
+        generator = SignalGenerator()
+        with mock.patch.object(AnalysisBundle, "build", side_effect=AssertionError("rebuilt")):
+            generator.generate_signal("EURUSD", ltf, Bias.BULLISH, bundle=result.ltf_bundle)
+        self.assertIs(generator.fvg_detector, result.ltf_bundle.fvg_detector)
+
+    def test_signal_generator_rebuilds_stale_bundle(self):
+        ltf = _ohlc()
+        stale = AnalysisBundle.build(ltf.iloc[:-5], symbol="EURUSD")
+        generator = SignalGenerator()
+        generator.generate_signal("EURUSD", ltf, Bias.BEARISH, bundle=stale)
+        self.assertIsNot(generator.fvg_detector, stale.fvg_detector)
+
+        expected = SignalGenerator().generate_signal("EURUSD", ltf, Bias.BEARISH)
+        actual = SignalGenerator().generate_signal(
+            "EURUSD", ltf, Bias.BEARISH, bundle=AnalysisBundle.build(ltf, symbol="EURUSD")
+        )
+        self.assertEqual(expected is None, actual is None)
+        if expected is not None:
+            self.assertEqual(expected.entry_price, actual.entry_price)
+            self.assertEqual(expected.stop_loss, actual.stop_loss)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Tests for the AnalysisCache and VexCoreEngine's memoized data gates:
+hits while the bars are unchanged, invalidation on a new bar, and the
+time gates (killzone, session phase) still evaluated on every call.
+
+Run from train-ict root:
+    python -m pytest tests/test_analysis_cache.py -v
+"""
+
+import sys
+import unittest
+from datetime import datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+_TRAIN_ICT_SRC = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(_TRAIN_ICT_SRC))
+
+import numpy as np
+import pandas as pd
+
+from ict_agent.core.analysis_cache import AnalysisCache
+from ict_agent.core.vex_core_engine import VexCoreEngine
+
+NY_TZ = ZoneInfo("America/New_York")
+NY_AM = datetime(2026, 1, 6, 8, 30, tzinfo=NY_TZ)
+EVENING = datetime(2026, 1, 6, 17, 30, tzinfo=NY_TZ)
+
+
+def make_frame(n: int = 200, freq: str = "15min", seed: int = 3) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 0.0012, n))
+    open_ = np.r_[close[0], close[:-1]]
+    return pd.DataFrame({
+        "open": open_,
+        "high": np.maximum(open_, close) + rng.uniform(0, 0.0008, n),
+        "low": np.minimum(open_, close) - rng.uniform(0, 0.0008, n),
+        "close": close,
+        "volume": rng.integers(1, 100, n),
+    }, index=pd.date_range("2026-01-04", periods=n, freq=freq, tz="UTC"))
+
+
+def make_engine(cache: AnalysisCache) -> VexCoreEngine:
+    engine = VexCoreEngine(analysis_cache=cache)
+    engine.graph_reasoner = None
+    engine.mem0_advisor = None
+    return engine
+
+
+def trace_of(result):
+    return [(g.gate, g.passed, g.summary) for g in result.gate_trace]
+
+
+class TestAnalysisCache(unittest.TestCase):
+    def test_lru_bound_and_private_copies(self):
+        cache = AnalysisCache(max_entries=2)
+        df = make_frame(20)
+        keys = [cache.key(s, "15m", (df,), "cfg") for s in ("EUR_USD", "GBP_USD", "XAU_USD")]
+        for key in keys:
+            cache.put(key, {"levels": [1.1]})
+        self.assertIsNone(cache.get(keys[0]))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+        cache.get(keys[1])["levels"].append(9.9)
+        self.assertEqual(cache.get(keys[1]), {"levels": [1.1]})
+        self.assertEqual(cache.invalidate("GBP_USD"), 1)
+        self.assertEqual(len(cache), 1)
+
+    def test_new_bar_drops_older_entry(self):
+        cache = AnalysisCache()
+        df = make_frame(50)
+        old = cache.key("EUR_USD", "15m", (df.iloc[:-1],), "cfg")
+        cache.put(old, "gates")
+        cache.put(cache.key("GBP_USD", "15m", (df.iloc[:-1],), "cfg"), "gates")
+
+        self.assertIsNone(cache.get(cache.key("EUR_USD", "15m", (df,), "cfg")))
+        self.assertIsNone(cache.get(old))
+        stats = cache.stats()
+        self.assertEqual((stats["entries"], stats["invalidations"]), (1, 1))
+
+
+class TestEngineMemoization(unittest.TestCase):
+    def setUp(self):
+        self.df = make_frame()
+        self.htf = make_frame(100, "1h")
+
+    def test_hit_matches_fresh_analysis(self):
+        cache = AnalysisCache()
+        engine = make_engine(cache)
+        first = engine.analyze("EUR_USD", self.df, self.htf, current_time=NY_AM)
+        second = engine.analyze("EUR_USD", self.df, self.htf, current_time=NY_AM)
+        fresh = make_engine(AnalysisCache(max_entries=0)).analyze(
+            "EUR_USD", self.df, self.htf, current_time=NY_AM
+        )
+
+        self.assertFalse(first.cached)
+        self.assertTrue(second.cached)
+        self.assertFalse(fresh.cached)
+        self.assertEqual(cache.stats()["hits"], 1)
+        for result in (second, fresh):
+            self.assertEqual(trace_of(result), trace_of(first))
+            self.assertEqual(result.rejection_reason, first.rejection_reason)
+            self.assertEqual(result.bias, first.bias)
+            self.assertEqual(len(result.pd_arrays), len(first.pd_arrays))
+        # The engine got its own copies of the cached levels
+        if first.liquidity_levels:
+            self.assertIsNot(second.liquidity_levels[0], first.liquidity_levels[0])
+
+    def test_new_bar_or_config_recomputes(self):
+        cache = AnalysisCache()
+        engine = make_engine(cache)
+        engine.analyze("EUR_USD", self.df.iloc[:-1], self.htf, current_time=NY_AM)
+        self.assertFalse(engine.analyze("EUR_USD", self.df, self.htf, current_time=NY_AM).cached)
+        self.assertEqual(cache.stats()["invalidations"], 1)
+
+        engine.fvg_detector.min_gap_pips = 2.0
+        self.assertFalse(engine.analyze("EUR_USD", self.df, self.htf, current_time=NY_AM).cached)
+
+    def test_time_gates_still_evaluated(self):
+        engine = make_engine(AnalysisCache())
+        engine.analyze("EUR_USD", self.df, self.htf, current_time=NY_AM)
+
+        outside = engine.analyze("EUR_USD", self.df, self.htf, current_time=EVENING)
+        self.assertFalse(outside.killzone_active)
+        self.assertEqual(outside.rejection_reason, "Outside killzone - no trades allowed")
+
+        later = engine.analyze(
+            "EUR_USD", self.df, self.htf, current_time=NY_AM.replace(hour=10)
+        )
+        self.assertTrue(later.cached)
+        g1, g2 = later.gate_trace[:2]
+        self.assertEqual(g1.details["time"], "10:30 ET")
+        self.assertEqual(g2.gate, "G2_SESSION")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""Tests for the ict_agent.api read service: snapshot store, conditional
+responses, server-sent events and KB endpoints.
+
+Run from train-ict root:
+    python -m pytest tests/test_api.py -v
+"""
+
+import asyncio
+import json
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+_TRAIN_ICT_SRC = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(_TRAIN_ICT_SRC))
+
+from fastapi.testclient import TestClient
+
+from ict_agent.api.app import create_app, snapshot_events
+from ict_agent.api.publisher import ControllerPublisher
+from ict_agent.api.snapshots import SnapshotStore
+from ict_agent.knowledge.kb_search import KnowledgeBaseSearch
+
+
+def gate_data(passed: int, trade: bool = False):
+    # The engine stops at the first failing gate
+    trace = [{"gate": f"G{i + 1}", "passed": i < passed, "summary": f"gate {i + 1}"}
+             for i in range(min(passed + 1, 9))]
+    return {"gate_trace": trace, "trade": trade, "direction": "BUY" if trade else "",
+            "rejection_reason": "" if trade else "no sweep", "confidence": 0.7}
+
+
+class TestSnapshotStore(unittest.TestCase):
+    def test_publish_dedups_and_versions(self):
+        store = SnapshotStore()
+        heard = []
+        store.add_listener(heard.append)
+        first = store.publish("positions", [{"symbol": "EUR_USD"}])
+        self.assertIs(store.publish("positions", [{"symbol": "EUR_USD"}]), first)
+        second = store.publish("positions", [])
+        self.assertGreater(second.version, first.version)
+        self.assertNotEqual(second.etag, first.etag)
+        self.assertEqual([s.version for s in heard], [first.version, second.version])
+        self.assertEqual(json.loads(store.get("positions").body), [])
+
+    def test_mirror_is_followed_by_another_store(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            publisher, follower = SnapshotStore(Path(tmp)), SnapshotStore(Path(tmp))
+            self.assertIsNone(follower.get("status"))
+            snap = publisher.publish("status", {"state": "scanning"})
+            self.assertEqual(follower.get("status").etag, snap.etag)
+            publisher.publish("status", {"state": "idle", "cycle_count": 2})
+            self.assertEqual(json.loads(follower.get("status").body)["cycle_count"], 2)
+
+
+class TestControllerPublisher(unittest.TestCase):
+    def test_cycle_topics(self):
+        store = SnapshotStore()
+        controller = SimpleNamespace(get_status=lambda: {"state": "idle", "cycle_count": 3})
+        publisher = ControllerPublisher(controller, store)
+        publisher.record_analysis("EUR_USD", gate_data(5))
+        publisher.record_analysis("GBP_USD", gate_data(9, trade=True))
+        publisher.publish_positions([{"id": "42", "instrument": "EUR_USD", "currentUnits": "-1000",
+                                      "unrealizedPL": "12.5"}])
+        publisher.cycle_complete()
+
+        traces = json.loads(store.get("gate_traces").body)
+        self.assertEqual(traces["EUR_USD"]["gate_stopped"], "G6")
+        self.assertTrue(traces["GBP_USD"]["trade"])
+        self.assertEqual(json.loads(store.get("positions").body)[0]["direction"], "SELL")
+        self.assertEqual(json.loads(store.get("status").body)["cycle_count"], 3)
+
+        version = store.get("gate_traces").version
+        publisher.cycle_complete()
+        self.assertEqual(store.get("gate_traces").version, version)
+
+
+class TestReadApi(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        kb_path = Path(cls.tmp.name) / "knowledge_base"
+        (kb_path / "concepts").mkdir(parents=True)
+        (kb_path / "concepts" / "cbdr.md").write_text(
+            "# Central Bank Dealers Range\n\nThe CBDR is measured 2pm-8pm NY.\n"
+        )
+        cls.kb_builds = 0
+
+        def kb_factory():
+            cls.kb_builds += 1
+            return KnowledgeBaseSearch(kb_path, Path(cls.tmp.name) / "kb.pkl", use_cache=False)
+
+        cls.store = SnapshotStore()
+        cls.client = TestClient(create_app(cls.store, kb_factory))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_defaults_before_first_publish(self):
+        self.assertEqual(self.client.get("/api/positions").json(), [])
+        self.assertEqual(self.client.get("/api/signals").json(), [])
+
+    def test_etag_and_conditional_get(self):
+        self.store.publish("status", {"state": "analyzing", "cycle_count": 7})
+        first = self.client.get("/api/status")
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.json()["cycle_count"], 7)
+        etag = first.headers["etag"]
+
+        cached = self.client.get("/api/status", headers={"If-None-Match": etag})
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.content, b"")
+
+        self.store.publish("status", {"state": "idle", "cycle_count": 8})
+        changed = self.client.get("/api/status", headers={"If-None-Match": etag})
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed.headers["etag"], etag)
+
+    def test_gates_per_symbol(self):
+        publisher = ControllerPublisher(SimpleNamespace(get_status=dict), self.store)
+        publisher.record_analysis("EUR_USD", gate_data(4))
+        publisher.cycle_complete()
+        self.assertIn("EUR_USD", self.client.get("/api/gates").json())
+        entry = self.client.get("/api/gates/EUR_USD")
+        self.assertEqual(entry.json()["gate_stopped"], "G5")
+        again = self.client.get("/api/gates/EUR_USD", headers={"If-None-Match": entry.headers["etag"]})
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(self.client.get("/api/gates/XAU_USD").status_code, 404)
+
+    def test_kb_endpoints(self):
+        results = self.client.get("/api/kb/search", params={"q": "cbdr"}).json()
+        self.assertEqual(results[0]["file_name"], "cbdr.md")
+        concept = self.client.get("/api/kb/concepts/cbdr").json()
+        self.assertIn("2pm-8pm", concept["content"])
+        self.assertEqual(self.client.get("/api/kb/concepts/nope").status_code, 404)
+        self.assertEqual(self.client.get("/api/kb/search").status_code, 422)
+        self.assertEqual(self.kb_builds, 1)
+
+    def test_gate_entry_follows_republish(self):
+        publisher = ControllerPublisher(SimpleNamespace(get_status=dict), self.store)
+        publisher.record_analysis("GBP_USD", gate_data(2))
+        publisher.cycle_complete()
+        first = self.client.get("/api/gates/GBP_USD")
+        publisher.record_analysis("GBP_USD", gate_data(6))
+        publisher.cycle_complete()
+        second = self.client.get("/api/gates/GBP_USD")
+        self.assertEqual((first.json()["gate_stopped"], second.json()["gate_stopped"]), ("G3", "G7"))
+        self.assertNotEqual(first.headers["etag"], second.headers["etag"])
+
+
+class TestKbRefresh(unittest.TestCase):
+    def test_edited_concept_is_served_after_refresh(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            concept = Path(tmp) / "knowledge_base" / "concepts" / "cbdr.md"
+            concept.parent.mkdir(parents=True)
+            concept.write_text("# CBDR\n\nMeasured 2pm-8pm NY.\n")
+            kb = KnowledgeBaseSearch(concept.parents[1], Path(tmp) / "kb.pkl", use_cache=False)
+            client = TestClient(create_app(SnapshotStore(), lambda: kb, kb_refresh_seconds=0))
+
+            self.assertIn("2pm-8pm", client.get("/api/kb/concepts/cbdr").json()["content"])
+            concept.write_text("# CBDR\n\nMeasured 2pm-8pm NY, 20-40 pips wide.\n")
+            self.assertIn("20-40 pips", client.get("/api/kb/concepts/cbdr").json()["content"])
+            self.assertEqual(client.get("/api/kb/search", params={"q": "pips"}).json()[0]["file_name"],
+                             "cbdr.md")
+
+
+class TestServerSentEvents(unittest.TestCase):
+    def test_stream_sends_current_then_changes(self):
+        store = SnapshotStore()
+        store.publish("status", {"state": "idle"})
+
+        async def collect():
+            done = asyncio.Event()
+
+            async def disconnected():
+                return done.is_set()
+
+            frames = []
+            events = snapshot_events(store, ["status", "positions"], disconnected, poll_interval=0.05)
+            async for frame in events:
+                frames.append(frame)
+                if len(frames) == 1:
+                    # Publish from another thread, as the controller does
+                    threading.Thread(target=lambda: (
+                        store.publish("positions", [{"symbol": "EUR_USD"}]),
+                        store.publish("signals", ["ignored topic"]),
+                        store.publish("status", {"state": "scanning"}),
+                    )).start()
+                if len(frames) == 3:
+                    done.set()
+            return frames
+
+        frames = asyncio.run(asyncio.wait_for(collect(), timeout=5))
+        self.assertEqual(len(frames), 3)
+        self.assertTrue(frames[0].startswith(b"event: status\nid: 1\n"))
+        self.assertIn(b"event: positions", frames[1])
+        self.assertIn(b'data: {"state":"scanning"}', frames[2])
+        self.assertEqual(store._listeners, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
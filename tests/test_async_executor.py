@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""Tests for the async OANDA executor against the in-memory fake broker:
+single-request bracket orders, concurrent flatten, the stream-maintained
+account snapshot, the shared transport's limiter and retries, and the sync
+executor reading the snapshot.
+
+Run from train-ict root:
+    python -m pytest tests/test_async_executor.py -v
+"""
+
+import asyncio
+import json
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+_TRAIN_ICT_SRC = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(_TRAIN_ICT_SRC))
+
+import requests
+from requests.adapters import BaseAdapter
+
+from ict_agent.data.oanda_fetcher import OANDAConfig
+from ict_agent.data.oanda_transport import OANDATransport, get_transport, reset_transports
+from ict_agent.execution.async_executor import AsyncOANDAExecutor, ExecutorLoop
+from ict_agent.execution.fake_broker import FakeBroker
+from ict_agent.execution.oanda_executor import OANDAExecutor
+
+PRICES = {f"C{i:02d}_USD": 1.0 + i / 100 for i in range(12)}
+
+
+async def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        await asyncio.sleep(0.01)
+
+
+def make_executor(broker: FakeBroker, **kwargs) -> AsyncOANDAExecutor:
+    # A private, generous limiter so timing assertions don't depend on earlier tests
+    kwargs.setdefault("transport", OANDATransport("token", rate_per_second=10000, burst=100,
+                                                  backoff_base=0.01))
+    return AsyncOANDAExecutor("token", broker.account_id, client=broker.client(), **kwargs)
+
+
+class TestAsyncExecutor(unittest.TestCase):
+    def test_bracket_order_is_one_request(self):
+        async def scenario():
+            broker = FakeBroker(prices=PRICES)
+            executor = make_executor(broker)
+            result = await executor.place_market_order("C01USD", 5000, stop_loss=0.99,
+                                                       take_profit=1.05)
+            await executor.stop()
+            return broker, result
+
+        broker, result = asyncio.run(scenario())
+        self.assertTrue(result.success)
+        self.assertEqual(result.units, 5000)
+        self.assertEqual(broker.count("POST", "/orders"), 1)
+        self.assertEqual(broker.count("PUT"), 0)
+        trade = broker.trades[result.trade_id]
+        self.assertEqual((trade["stopLoss"], trade["takeProfit"]), ("0.99000", "1.05000"))
+
+    def test_flatten_latency_is_slowest_close_not_sum(self):
+        latency = 0.1
+
+        async def scenario():
+            broker = FakeBroker(prices=PRICES, heartbeat_seconds=0.05)
+            executor = make_executor(broker, max_concurrency=len(PRICES))
+            await executor.start()
+            await executor.place_orders([
+                {"symbol": inst, "units": 1000 if i % 2 else -1000}
+                for i, inst in enumerate(PRICES)
+            ])
+            await wait_for(lambda: len(executor.snapshot.positions()) == len(PRICES))
+
+            broker.latency = latency
+            start = time.perf_counter()
+            results = await executor.close_all_positions()
+            elapsed = time.perf_counter() - start
+            await wait_for(lambda: not executor.snapshot.positions())
+            await executor.stop()
+            return broker, results, elapsed
+
+        broker, results, elapsed = asyncio.run(scenario())
+        self.assertEqual(len(results), len(PRICES))
+        self.assertTrue(all(r.success for r in results))
+        self.assertFalse(broker.trades)
+        self.assertLess(elapsed, latency * 3)  # sequential would be 12 × latency
+        self.assertEqual(broker.max_in_flight, len(PRICES))
+        # Directions came from the snapshot: no position lookups before closing
+        self.assertEqual(broker.count("GET", "/openPositions"), 0)
+
+    def test_stream_keeps_snapshot_current_without_polling(self):
+        async def scenario():
+            broker = FakeBroker(prices=PRICES, heartbeat_seconds=0.02)
+            executor = make_executor(broker, state_refresh_seconds=None)
+            await executor.start()
+            await wait_for(lambda: executor.snapshot.live)
+
+            opened = await executor.place_market_order("C02_USD", 10000)
+            await wait_for(lambda: executor.snapshot.status()["open_trades"] == 1)
+            position = executor.snapshot.position("C02_USD")
+
+            broker.set_price("C02_USD", 1.03)
+            await executor.close_trade(opened.trade_id, units=4000)
+            await wait_for(lambda: executor.snapshot.position("C02_USD").units == 6000)
+            await asyncio.sleep(0.1)  # a few heartbeats: no extra requests
+            account = executor.snapshot.account_info()
+            await executor.stop()
+            return broker, position, account
+
+        broker, position, account = asyncio.run(scenario())
+        self.assertEqual(position.units, 10000)
+        self.assertAlmostEqual(position.average_price, 1.02)
+        self.assertAlmostEqual(account.balance, 100000 + 4000 * 0.01, places=4)
+        self.assertEqual(account.open_trade_count, 1)
+        self.assertEqual(broker.count("GET", f"/{broker.account_id}"), 1)  # initial load
+        self.assertEqual(broker.count("GET", "/summary"), 0)
+        self.assertEqual(broker.count("GET", "/changes"), 2)  # one per fill
+
+    def test_nav_follows_price_without_transactions(self):
+        async def scenario():
+            broker = FakeBroker(prices=PRICES, heartbeat_seconds=0.02)
+            executor = make_executor(broker, state_refresh_seconds=0.05)
+            await executor.start()
+            opened = await executor.place_market_order("C03_USD", 10000)
+            await wait_for(lambda: executor.snapshot.status()["open_trades"] == 1)
+            transactions = len(broker.transactions)
+
+            broker.set_price("C03_USD", 1.01)  # 0.02 against the long
+            await wait_for(lambda: executor.snapshot.account_info().nav < 100000 - 199)
+            account = executor.snapshot.account_info()
+            position = executor.snapshot.position("C03_USD")
+            trade = executor.snapshot.trades()[0]
+            await executor.stop()
+            return broker, transactions, account, position, trade, opened
+
+        broker, transactions, account, position, trade, opened = asyncio.run(scenario())
+        self.assertEqual(len(broker.transactions), transactions)
+        self.assertAlmostEqual(account.nav, 100000 - 200, places=4)
+        self.assertAlmostEqual(account.unrealized_pnl, -200, places=4)
+        self.assertAlmostEqual(position.unrealized_pnl, -200, places=4)
+        self.assertEqual(trade["id"], opened.trade_id)
+        self.assertAlmostEqual(float(trade["unrealizedPL"]), -200, places=4)
+
+    def test_flatten_retries_rate_limited_close(self):
+        async def scenario():
+            broker = FakeBroker(prices=PRICES, heartbeat_seconds=0.02)
+            executor = make_executor(broker)
+            await executor.start()
+            await executor.place_orders([{"symbol": i, "units": 1000} for i in list(PRICES)[:3]])
+            await wait_for(lambda: len(executor.snapshot.positions()) == 3)
+
+            broker.fail_next("PUT", "/positions/C01_USD/close", 429, retry_after="0.05")
+            broker.fail_next("PUT", "/positions/C02_USD/close", 503)
+            start = time.perf_counter()
+            results = await executor.close_all_positions()
+            elapsed = time.perf_counter() - start
+            await executor.stop()
+            return broker, executor.transport.stats(), results, elapsed
+
+        broker, stats, results, elapsed = asyncio.run(scenario())
+        self.assertTrue(all(r.success for r in results), [r.message for r in results])
+        self.assertFalse(broker.trades)
+        self.assertEqual(broker.count("PUT", "/close"), 5)
+        self.assertGreaterEqual(elapsed, 0.05)  # Retry-After honored
+        self.assertEqual((stats["rate_limited"], stats["retries"]), (1, 2))
+        closes = stats["endpoints"]["PUT /v3/accounts/{account}/positions/{instrument}/close"]
+        self.assertEqual((closes["count"], closes["errors"]), (5, 2))
+
+    def test_order_post_is_not_retried_on_server_error(self):
+        async def scenario():
+            broker = FakeBroker(prices=PRICES)
+            executor = make_executor(broker)
+            broker.fail_next("POST", "/orders", 503)
+            result = await executor.place_market_order("C01_USD", 1000)
+            await executor.stop()
+            return broker, result
+
+        broker, result = asyncio.run(scenario())
+        self.assertFalse(result.success)
+        self.assertEqual(broker.count("POST", "/orders"), 1)
+        self.assertFalse(broker.trades)
+
+    def test_shares_the_sync_transport(self):
+        reset_transports()
+        self.addCleanup(reset_transports)
+        executor = AsyncOANDAExecutor("token", "101-001-0000000-001", client=FakeBroker().client())
+        config = OANDAConfig(api_key="token", account_id="101-001-0000000-001")
+        self.assertIs(executor.transport, get_transport(config))
+
+    def test_modify_trades_concurrently(self):
+        async def scenario():
+            broker = FakeBroker(prices=PRICES, latency=0.05)
+            executor = make_executor(broker)
+            opened = await executor.place_orders([{"symbol": i, "units": 1000} for i in list(PRICES)[:4]])
+            start = time.perf_counter()
+            results = await executor.modify_trades({o.trade_id: (0.9, 1.2) for o in opened})
+            elapsed = time.perf_counter() - start
+            missing = await executor.modify_trade_sl_tp("999", stop_loss=0.9)
+            await executor.stop()
+            return broker, results, elapsed, missing
+
+        broker, results, elapsed, missing = asyncio.run(scenario())
+        self.assertTrue(all(r.success for r in results))
+        self.assertLess(elapsed, 0.15)
+        self.assertTrue(all(t["stopLoss"] == "0.90000" for t in broker.trades.values()))
+        self.assertFalse(missing.success)
+
+
+class RefuseHTTP(BaseAdapter):
+    """Fails on any request; counts them."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def send(self, request, **kwargs):
+        self.calls += 1
+        raise requests.ConnectionError("no network in tests")
+
+    def close(self):
+        pass
+
+
+class SlowClose(BaseAdapter):
+    """Answers position closes after a delay; tracks concurrency."""
+
+    def __init__(self, delay):
+        super().__init__()
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps({"lastTransactionID": "1"}).encode()
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+class TestSyncExecutorWithSnapshot(unittest.TestCase):
+    def setUp(self):
+        reset_transports()
+        self.addCleanup(reset_transports)
+
+    def _run_loop(self, broker):
+        loop = ExecutorLoop(make_executor(broker))
+        loop.start()
+        self.addCleanup(loop.stop)
+        loop.call(loop.executor.place_orders([{"symbol": i, "units": 1000} for i in list(PRICES)[:6]]))
+        deadline = time.monotonic() + 2
+        while len(loop.executor.snapshot.positions()) < 6 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return loop
+
+    def test_reads_live_snapshot_instead_of_polling(self):
+        loop = self._run_loop(FakeBroker(prices=PRICES, heartbeat_seconds=0.05))
+        executor = OANDAExecutor(api_key="token", account_id="101-001-0000000-001")
+        adapter = RefuseHTTP()
+        executor.transport.session.mount("https://", adapter)
+        executor.snapshot = loop.executor.snapshot
+
+        account = executor.get_account_info(force_refresh=True)
+        self.assertEqual(account.open_position_count, 6)
+        self.assertEqual(len(executor.get_positions()), 6)
+        self.assertEqual(adapter.calls, 0)
+
+        executor.snapshot.live = False
+        self.assertIsNone(executor.get_account_info(force_refresh=True))
+        self.assertGreater(adapter.calls, 0)
+
+    def test_stale_state_falls_back_to_polling(self):
+        loop = self._run_loop(FakeBroker(prices=PRICES, heartbeat_seconds=0.05))
+        executor = OANDAExecutor(api_key="token", account_id="101-001-0000000-001")
+        adapter = RefuseHTTP()
+        executor.transport.session.mount("https://", adapter)
+        executor.snapshot = loop.executor.snapshot
+
+        # Stream still connected, but NAV has not been refreshed for too long
+        executor.snapshot.state_at = time.monotonic() - executor.snapshot.max_state_age - 1
+        self.assertTrue(executor.snapshot.live)
+        self.assertIsNone(executor.get_account_info(force_refresh=True))
+        self.assertGreater(adapter.calls, 0)
+
+    def test_failed_start_tears_the_loop_down(self):
+        broker = FakeBroker(prices=PRICES)
+        loop = ExecutorLoop(AsyncOANDAExecutor("token", "999-unknown", client=broker.client(),
+                                               transport=OANDATransport("token")))
+        with self.assertRaises(RuntimeError):
+            loop.start()
+        self.assertFalse(loop._thread.is_alive())
+        self.assertIsNone(loop.executor._stream_task)
+        self.assertEqual(broker.count("GET", "/transactions/stream"), 0)
+
+    def test_sync_flatten_is_concurrent(self):
+        loop = self._run_loop(FakeBroker(prices=PRICES, heartbeat_seconds=0.05))
+        executor = OANDAExecutor(api_key="token", account_id="101-001-0000000-001")
+        adapter = SlowClose(delay=0.1)
+        executor.transport.session.mount("https://", adapter)
+        executor.snapshot = loop.executor.snapshot
+
+        start = time.perf_counter()
+        results = executor.close_all_positions()
+        elapsed = time.perf_counter() - start
+        self.assertEqual(len(results), 6)
+        self.assertTrue(all(r.success for r in results))
+        self.assertEqual(adapter.peak, 6)
+        self.assertLess(elapsed, 0.35)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Parity tests for the array-based BacktestEngine exit/equity path.
+
+A scripted agent replays a fixed signal schedule so the run is fully
+deterministic. Expected trades and equity in
+tests/fixtures/backtest_parity_expected.json were recorded from the
+original dict-per-trade implementation.
+
+Run from train-ict root:
+    python -m pytest tests/test_backtest_engine.py -v
+"""
+
+import json
+import sys
+import time
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+_TRAIN_ICT_ROOT = Path(__file__).resolve().parent.parent
+_TRAIN_ICT_SRC = _TRAIN_ICT_ROOT / "src"
+sys.path.insert(0, str(_TRAIN_ICT_SRC))
+
+from ict_agent.backtest.engine import BacktestConfig, BacktestEngine
+from ict_agent.engine.mtf_analyzer import Bias
+from ict_agent.engine.signal_generator import Confluences, ModelType, SignalType, TradeSignal
+
+EXPECTED_JSON = Path(__file__).resolve().parent / "fixtures" / "backtest_parity_expected.json"
+MODELS = [ModelType.SILVER_BULLET, ModelType.OTE_RETRACEMENT, ModelType.FVG_REBALANCE]
+
+
+def make_ltf(n: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 1.10 + np.cumsum(rng.normal(0, 0.0006, n))
+    open_ = np.r_[close[0], close[:-1]]
+    wick = np.abs(rng.normal(0, 0.0004, n))
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) + wick,
+            "low": np.minimum(open_, close) - wick,
+            "close": close,
+        },
+        index=pd.date_range("2024-01-01", periods=n, freq="15min"),
+    )
+
+
+def resample(df: pd.DataFrame, rule: str) -> pd.DataFrame:
+    return df.resample(rule).agg({"open": "first", "high": "max", "low": "min", "close": "last"}).dropna()
+
+
+class ScriptedAgent:
+    """Emits a signal on every `every`-th analyze() call"""
+
+    def __init__(self, every: int = 7):
+        self.every = every
+        self.calls = 0
+
+    def analyze(self, symbol, htf, itf, ltf):
+        self.calls += 1
+        if self.calls % self.every:
+            return None
+        n = self.calls // self.every
+        long = n % 3 != 0
+        close = float(ltf["close"].iloc[-1])
+        risk = (8 + n % 17) * 0.0001
+        sign = 1 if long else -1
+        return TradeSignal(
+            timestamp=ltf.index[-1],
+            symbol=symbol,
+            signal_type=SignalType.LONG if long else SignalType.SHORT,
+            model=MODELS[n % len(MODELS)],
+            entry_price=close,
+            stop_loss=close - sign * risk,
+            target_1=close + sign * risk * 1.2,
+            target_2=None if n % 5 == 0 else close + sign * risk * 3,
+            risk_reward=3.0,
+            confluences=Confluences(fvg=True, displacement=n % 2 == 0, killzone=True),
+            confidence=0.7,
+            htf_bias=Bias.BULLISH if long else Bias.BEARISH,
+            killzone=None,
+        )
+
+
+class ScriptedEngine(BacktestEngine):
+    def __init__(self, every: int = 7, **kwargs):
+        self.every = every
+        super().__init__(**kwargs)
+
+    def _reset_state(self) -> None:
+        super()._reset_state()
+        self.agent = ScriptedAgent(self.every)
+
+
+def run_scripted(n: int = 3000, seed: int = 5, every: int = 7, max_trades_per_day: int = 6):
+    ltf = make_ltf(n, seed)
+    engine = ScriptedEngine(every=every, config=BacktestConfig(max_trades_per_day=max_trades_per_day))
+    metrics = engine.run("EURUSD", resample(ltf, "4h"), resample(ltf, "1h"), ltf)
+    return engine, metrics
+
+
+def serialize(metrics) -> dict:
+    return {
+        "final_capital": metrics.final_capital,
+        "trades": [
+            [t.id, t.direction, str(t.entry_time), str(t.exit_time), t.entry_price,
+             t.exit_price, t.position_size, t.pnl, t.exit_reason, t.model, t.confluences]
+            for t in metrics.trades
+        ],
+        "equity": metrics.equity_curve["equity"].tolist(),
+        "open_trades": metrics.equity_curve["open_trades"].tolist(),
+        "equity_index": [str(metrics.equity_curve.index[0]), str(metrics.equity_curve.index[-1])],
+        "index_name": metrics.equity_curve.index.name,
+    }
+
+
+class TestBacktestEngineParity(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.expected = json.loads(EXPECTED_JSON.read_text())
+        _, metrics = run_scripted()
+        cls.actual = json.loads(json.dumps(serialize(metrics)))
+
+    def test_trades_match_fixture(self):
+        self.assertEqual(len(self.actual["trades"]), len(self.expected["trades"]))
+        for actual, expected in zip(self.actual["trades"], self.expected["trades"]):
+            self.assertEqual(actual[:7] + actual[8:], expected[:7] + expected[8:])
+            self.assertAlmostEqual(actual[7], expected[7], places=9)
+        self.assertAlmostEqual(self.actual["final_capital"], self.expected["final_capital"], places=6)
+        reasons = {t[8] for t in self.expected["trades"]}
+        self.assertTrue({"stop_loss", "target_2"} <= reasons)
+
+    def test_equity_curve_matches_fixture(self):
+        np.testing.assert_allclose(self.actual["equity"], self.expected["equity"], rtol=0, atol=1e-6)
+        self.assertEqual(self.actual["open_trades"], self.expected["open_trades"])
+        self.assertEqual(self.actual["equity_index"], self.expected["equity_index"])
+        self.assertEqual(self.actual["index_name"], self.expected["index_name"])
+        self.assertGreater(max(self.expected["open_trades"]), 1)
+
+
+class TestBacktestEngineScaling(unittest.TestCase):
+    def test_many_open_trades(self):
+        start = time.perf_counter()
+        engine, metrics = run_scripted(n=20_000, seed=9, every=2, max_trades_per_day=40)
+        elapsed = time.perf_counter() - start
+        self.assertGreater(metrics.total_trades, 1000)
+        self.assertEqual(len(metrics.equity_curve), 20_000 - 100)
+        self.assertLess(elapsed, 60.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
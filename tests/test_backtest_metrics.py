@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""Tests for the vectorized BacktestMetrics: parity with the original
+per-list formulas, rolling series, bootstrap intervals and combine().
+
+Run from train-ict root:
+    python -m pytest tests/test_backtest_metrics.py -v
+"""
+
+import math
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+_TRAIN_ICT_ROOT = Path(__file__).resolve().parent.parent
+_TRAIN_ICT_SRC = _TRAIN_ICT_ROOT / "src"
+sys.path.insert(0, str(_TRAIN_ICT_SRC))
+
+from ict_agent.backtest.metrics import BacktestMetrics, Trade
+
+MODELS = ["silver_bullet", "ote_retracement", "fvg_rebalance"]
+
+
+def make_metrics(n_trades: int, seed: int, symbol: str = "EURUSD", capital: float = 10_000.0,
+                 start: str = "2024-01-01") -> BacktestMetrics:
+    rng = np.random.default_rng(seed)
+    pnl = np.round(rng.normal(15, 120, n_trades), 2)
+    times = pd.date_range(start, periods=n_trades, freq="5h")
+    trades = [
+        Trade(
+            id=i + 1, symbol=symbol, direction="long" if i % 2 else "short",
+            entry_time=times[i], exit_time=times[i] + pd.Timedelta("3h"),
+            entry_price=1.1, exit_price=1.1, position_size=0.5, pnl=float(pnl[i]),
+            exit_reason="target_2", model=MODELS[i % 3], confluences=int(1 + i % 13),
+        )
+        for i in range(n_trades)
+    ]
+    bars = pd.date_range(start, periods=n_trades * 20, freq="15min", name="timestamp")
+    steps = np.zeros(len(bars))
+    steps[np.arange(n_trades) * 20 + 19] = pnl
+    equity = capital + np.cumsum(steps)
+    curve = pd.DataFrame({"equity": equity, "open_trades": (np.arange(len(bars)) % 20 < 12).astype(int)}, index=bars)
+    return BacktestMetrics(
+        symbol=symbol, start_date=bars[0], end_date=bars[-1], initial_capital=capital,
+        final_capital=capital + pnl.sum(), trades=trades, equity_curve=curve, signals=[],
+    )
+
+
+def reference(m: BacktestMetrics) -> dict:
+    """The original list/pandas formulas"""
+    pnls = [t.pnl for t in m.trades]
+    wins = [p for p in pnls if p > 0]
+    losses = [p for p in pnls if p <= 0]
+    returns = pd.Series([p / m.initial_capital for p in pnls])
+    equity = m.equity_curve["equity"]
+    peak = equity.expanding().max()
+    dd = equity - peak
+    neg = returns[returns < 0]
+    excess = returns.mean() - 0.02 / 252
+    streak_w = streak_l = cur_w = cur_l = 0
+    for p in pnls:
+        if p > 0:
+            cur_w, cur_l = cur_w + 1, 0
+            streak_w = max(streak_w, cur_w)
+        else:
+            cur_l, cur_w = cur_l + 1, 0
+            streak_l = max(streak_l, cur_l)
+    by_model = {}
+    for model in set(t.model for t in m.trades):
+        mp = [t.pnl for t in m.trades if t.model == model]
+        by_model[model] = {"trades": len(mp), "win_rate": len([p for p in mp if p > 0]) / len(mp),
+                           "total_pnl": sum(mp), "avg_pnl": np.mean(mp)}
+    by_conf = {}
+    for c in range(1, 12):
+        cp = [t.pnl for t in m.trades if t.confluences == c]
+        if cp:
+            by_conf[c] = {"trades": len(cp), "win_rate": len([p for p in cp if p > 0]) / len(cp),
+                          "total_pnl": sum(cp), "avg_pnl": np.mean(cp)}
+    return {
+        "total_pnl": sum(pnls), "win_rate": len(wins) / len(pnls), "gross_profit": sum(wins),
+        "gross_loss": abs(sum(losses)), "avg_win": np.mean(wins), "avg_loss": abs(np.mean(losses)),
+        "largest_win": max(wins), "largest_loss": min(losses),
+        "max_drawdown": abs(dd.min()), "max_drawdown_pct": abs(dd.min() / peak[dd.idxmin()] * 100),
+        "sharpe_ratio": excess / returns.std() * np.sqrt(252),
+        "sortino_ratio": excess / neg.std() * np.sqrt(252),
+        "consecutive_wins": streak_w, "consecutive_losses": streak_l,
+        "model_performance": by_model, "confluence_performance": by_conf,
+    }
+
+
+class TestMetricsParity(unittest.TestCase):
+    def assertStatsClose(self, actual: dict, expected: dict):
+        self.assertEqual(set(actual), set(expected))
+        for key, stats in expected.items():
+            for field, value in stats.items():
+                self.assertAlmostEqual(actual[key][field], value, places=6, msg=(key, field))
+
+    def test_matches_reference_formulas(self):
+        for seed in (0, 1, 2):
+            m = make_metrics(400, seed)
+            expected = reference(m)
+            for key in ("total_pnl", "win_rate", "gross_profit", "gross_loss", "avg_win", "avg_loss",
+                        "largest_win", "largest_loss", "max_drawdown", "max_drawdown_pct",
+                        "sharpe_ratio", "sortino_ratio", "consecutive_wins", "consecutive_losses"):
+                self.assertAlmostEqual(getattr(m, key), expected[key], places=6, msg=key)
+            self.assertStatsClose(m.model_performance, expected["model_performance"])
+            self.assertStatsClose(m.confluence_performance, expected["confluence_performance"])
+
+    def test_empty_and_single_trade(self):
+        empty = BacktestMetrics("X", None, None, 1000.0, 1000.0, [], pd.DataFrame(), [])
+        self.assertEqual(empty.total_trades, 0)
+        self.assertEqual(empty.to_dict()["sharpe_ratio"], 0)
+        self.assertEqual(empty.rolling_sharpe(5).size, 0)
+
+        single = make_metrics(1, 3)
+        self.assertEqual(single.total_trades, 1)
+        self.assertTrue(math.isnan(single.sharpe_ratio))
+
+
+class TestRollingAndBootstrap(unittest.TestCase):
+    def setUp(self):
+        self.m = make_metrics(300, 4)
+
+    def test_rolling_sharpe_matches_window(self):
+        window = 25
+        series = self.m.rolling_sharpe(window)
+        self.assertEqual(len(series), 300)
+        self.assertTrue(series.iloc[: window - 1].isna().all())
+        for end in (window, 150, 300):
+            tail = self.m._pnl[end - window:end] / self.m.initial_capital
+            expected = (tail.mean() - 0.02 / 252) / tail.std(ddof=1) * np.sqrt(252)
+            self.assertAlmostEqual(series.iloc[end - 1], expected, places=6)
+
+    def test_rolling_drawdown(self):
+        dd = self.m.rolling_drawdown(96)
+        self.assertEqual(len(dd), len(self.m.equity_curve))
+        self.assertLessEqual(dd.max(), 0.0)
+        self.assertGreaterEqual(dd.min(), -self.m.max_drawdown_pct - 1e-9)
+
+    def test_bootstrap_ci(self):
+        low, high = self.m.bootstrap_ci("avg_trade", n_resamples=1000, seed=7)
+        self.assertLess(low, self.m.avg_trade)
+        self.assertGreater(high, self.m.avg_trade)
+        self.assertEqual((low, high), self.m.bootstrap_ci("avg_trade", n_resamples=1000, seed=7))
+        for statistic in ("total_pnl", "win_rate", "profit_factor", "sharpe_ratio"):
+            low, high = self.m.bootstrap_ci(statistic, n_resamples=300, seed=1, block_size=64)
+            self.assertLessEqual(low, high)
+            self.assertLessEqual(low, getattr(self.m, statistic))
+            self.assertGreaterEqual(high, getattr(self.m, statistic))
+        with self.assertRaises(ValueError):
+            self.m.bootstrap_ci("median")
+
+    def test_bootstrap_chunks_are_bounded_by_trade_count(self):
+        n = len(self.m._pnl)
+        shapes = []
+        original = BacktestMetrics._resampled_statistic
+
+        def spy(metrics, statistic, sample):
+            shapes.append(sample.shape)
+            return original(metrics, statistic, sample)
+
+        with mock.patch.object(BacktestMetrics, "_BOOTSTRAP_MAX_CELLS", 10 * n), \
+                mock.patch.object(BacktestMetrics, "_resampled_statistic", spy):
+            low, high = self.m.bootstrap_ci("avg_trade", n_resamples=95, seed=7)
+        self.assertEqual(sum(rows for rows, _ in shapes), 95)
+        self.assertEqual(max(rows for rows, _ in shapes), 10)
+        self.assertLess(low, high)
+
+
+class TestCombine(unittest.TestCase):
+    def test_combined_totals_match_pooled_trades(self):
+        a = make_metrics(200, 5, "EURUSD", 10_000.0)
+        b = make_metrics(150, 6, "GBPUSD", 5_000.0, start="2024-01-10")
+        merged = BacktestMetrics.combine([a, b])
+
+        pooled_pnl = np.concatenate([a._pnl, b._pnl])
+        self.assertEqual(merged.symbol, "EURUSD+GBPUSD")
+        self.assertEqual(merged.total_trades, 350)
+        self.assertAlmostEqual(merged.total_pnl, pooled_pnl.sum(), places=6)
+        self.assertAlmostEqual(merged.win_rate, (pooled_pnl > 0).mean())
+        self.assertAlmostEqual(merged.avg_win, pooled_pnl[pooled_pnl > 0].mean(), places=6)
+        self.assertAlmostEqual(merged.largest_loss, pooled_pnl.min())
+        self.assertAlmostEqual(merged.return_pct, pooled_pnl.sum() / 15_000.0 * 100, places=6)
+
+        returns = pooled_pnl / 15_000.0
+        neg = returns[returns < 0]
+        excess = returns.mean() - 0.02 / 252
+        self.assertAlmostEqual(merged.sharpe_ratio, excess / returns.std(ddof=1) * np.sqrt(252), places=6)
+        self.assertAlmostEqual(merged.sortino_ratio, excess / neg.std(ddof=1) * np.sqrt(252), places=6)
+
+        pooled_models = {}
+        for part in (a, b):
+            for model, stats in part.model_performance.items():
+                pooled_models[model] = pooled_models.get(model, 0) + stats["trades"]
+        self.assertEqual({k: v["trades"] for k, v in merged.model_performance.items()}, pooled_models)
+
+        self.assertEqual(merged.equity_curve.index.min(), a.equity_curve.index.min())
+        self.assertAlmostEqual(merged.equity_curve["equity"].iloc[-1], merged.final_capital, places=6)
+        self.assertAlmostEqual(merged.equity_curve["equity"].iloc[0], a.equity_curve["equity"].iloc[0] + 5_000.0)
+        self.assertGreater(merged.max_drawdown, 0)
+        self.assertEqual(merged.consecutive_losses, max(a.consecutive_losses, b.consecutive_losses))
+
+        low, high = merged.bootstrap_ci("avg_trade", n_resamples=200, seed=0)
+        self.assertLess(low, high)
+        self.assertEqual(merged.to_dict()["total_trades"], 350)
+
+    def test_combine_with_empty_run(self):
+        a = make_metrics(50, 8)
+        empty = BacktestMetrics("GBPUSD", None, None, 1000.0, 1000.0, [], pd.DataFrame(), [])
+        merged = BacktestMetrics.combine([a, empty])
+        self.assertEqual(merged.total_trades, 50)
+        self.assertAlmostEqual(merged.equity_curve["equity"].iloc[-1], a.final_capital + 1000.0)
+        self.assertEqual(BacktestMetrics.combine([empty]).total_trades, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Tests for the columnar OANDA candle parser: parity with the row-by-row
+parse, bid/ask components, incomplete candles, UNIX timestamps and the
+fetcher's use of it.
+
+Run from train-ict root:
+    python -m pytest tests/test_candle_parser.py -v
+"""
+
+import json
+import sys
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+_TRAIN_ICT_SRC = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(_TRAIN_ICT_SRC))
+
+import numpy as np
+import pandas as pd
+import requests
+from requests.adapters import BaseAdapter
+
+from ict_agent.data.candle_parser import parse_candles, price_param
+from ict_agent.data.oanda_fetcher import OANDAConfig, OANDAFetcher
+from ict_agent.data.oanda_transport import OANDATransport
+
+START = datetime(2026, 1, 5, tzinfo=timezone.utc)
+
+
+def make_payload(n: int, seed: int = 0) -> dict:
+    rng = np.random.default_rng(seed)
+
+    def quote(p):
+        return {"o": f"{p:.5f}", "h": f"{p + 0.0010:.5f}", "l": f"{p - 0.0010:.5f}", "c": f"{p + 0.0002:.5f}"}
+
+    candles = []
+    for i in range(n):
+        mid = 1.1 + rng.normal(0, 0.01)
+        candles.append({
+            "time": (START + timedelta(minutes=i)).strftime("%Y-%m-%dT%H:%M:%S.000000000Z"),
+            "complete": True,
+            "volume": int(rng.integers(1, 500)),
+            "mid": quote(mid),
+            "bid": quote(mid - 0.00005),
+            "ask": quote(mid + 0.00005),
+        })
+    return {"instrument": "EUR_USD", "granularity": "M1", "candles": candles}
+
+
+def row_parse(candles):
+    """The previous per-row implementation, kept as the reference."""
+    rows = []
+    for candle in candles:
+        if not candle.get("complete", True):
+            continue
+        mid = candle.get("mid", {})
+        rows.append({
+            "timestamp": pd.to_datetime(candle["time"]),
+            "open": float(mid.get("o", 0)),
+            "high": float(mid.get("h", 0)),
+            "low": float(mid.get("l", 0)),
+            "close": float(mid.get("c", 0)),
+            "volume": int(candle.get("volume", 0)),
+        })
+    df = pd.DataFrame(rows)
+    df.set_index("timestamp", inplace=True)
+    df.sort_index(inplace=True)
+    return df
+
+
+class TestParseCandles(unittest.TestCase):
+    def test_matches_row_parse(self):
+        payload = make_payload(300)
+        payload["candles"][-1]["complete"] = False
+        df = parse_candles(json.dumps(payload).encode())
+        pd.testing.assert_frame_equal(df, row_parse(payload["candles"]), check_freq=False)
+        self.assertTrue(all(dtype == np.float64 for dtype in df.dtypes[:4]))
+
+    def test_bid_ask_components(self):
+        payload = make_payload(50)
+        df = parse_candles(payload, components=("mid", "bid", "ask"))
+        self.assertEqual(list(df.columns), [
+            "open", "high", "low", "close",
+            "bid_open", "bid_high", "bid_low", "bid_close",
+            "ask_open", "ask_high", "ask_low", "ask_close",
+            "volume",
+        ])
+        np.testing.assert_allclose(df["ask_close"] - df["bid_close"], 0.0001, atol=1e-9)
+
+        bid_only = parse_candles(payload, components=("bid",), primary="bid")
+        self.assertEqual(bid_only["close"].iloc[0], float(payload["candles"][0]["bid"]["c"]))
+        self.assertEqual(price_param(("mid", "bid", "ask")), "MBA")
+
+    def test_incomplete_flag_and_unix_times(self):
+        candles = make_payload(3)["candles"]
+        candles[-1]["complete"] = False
+        for candle, offset in zip(candles, range(3)):
+            candle["time"] = f"{START.timestamp() + 60 * offset:.9f}"
+        df = parse_candles(candles, include_incomplete=True)
+        self.assertEqual(df["complete"].tolist(), [True, True, False])
+        self.assertEqual(df.index[0], pd.Timestamp(START))
+        self.assertTrue(parse_candles({"candles": []}).empty)
+
+    def test_5000_candle_page_speed(self):
+        payload = make_payload(5000)
+        body = json.dumps(payload).encode()
+        start = time.perf_counter()
+        df = parse_candles(body, components=("mid", "bid", "ask"))
+        elapsed = time.perf_counter() - start
+        self.assertEqual(len(df), 5000)
+        self.assertLess(elapsed, 0.5)
+
+
+class OneCandleAdapter(BaseAdapter):
+    def __init__(self):
+        super().__init__()
+        self.params = []
+
+    def send(self, request, **kwargs):
+        self.params.append(parse_qs(urlsplit(request.url).query))
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(make_payload(2)).encode()
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+class TestFetcherParsing(unittest.TestCase):
+    def setUp(self):
+        self.adapter = OneCandleAdapter()
+        transport = OANDATransport("token", sleep=lambda s: None)
+        transport.session.mount("https://", self.adapter)
+        self.transport = transport
+
+    def test_fetch_requests_only_needed_components(self):
+        fetcher = OANDAFetcher(OANDAConfig(api_key="token"), transport=self.transport)
+        df = fetcher.fetch_latest("EURUSD", "M1", 2)
+        self.assertEqual(self.adapter.params[-1]["price"], ["M"])
+        self.assertEqual(list(df.columns), ["open", "high", "low", "close", "volume"])
+
+        spread_fetcher = OANDAFetcher(OANDAConfig(api_key="token"), transport=self.transport,
+                                      components=("mid", "bid", "ask"))
+        self.assertIn("ask_close", spread_fetcher.fetch_latest("EURUSD", "M1", 2).columns)
+        self.assertEqual(self.adapter.params[-1]["price"], ["MBA"])
+
+    def test_fetch_without_mid_uses_first_component(self):
+        fetcher = OANDAFetcher(OANDAConfig(api_key="token"), transport=self.transport,
+                               components=("bid", "ask"))
+        df = fetcher.fetch_latest("EURUSD", "M1", 2)
+        self.assertEqual(self.adapter.params[-1]["price"], ["BA"])
+        self.assertEqual(list(df.columns), ["open", "high", "low", "close",
+                                            "ask_open", "ask_high", "ask_low", "ask_close", "volume"])
+        last = make_payload(2)["candles"][-1]
+        self.assertEqual(df["close"].iloc[-1], float(last["bid"]["c"]))
+
+    def test_current_price(self):
+        fetcher = OANDAFetcher(OANDAConfig(api_key="token"), transport=self.transport)
+        price = fetcher.get_current_price("EURUSD")
+        last = make_payload(2)["candles"][-1]
+        self.assertEqual(price["bid"], float(last["bid"]["c"]))
+        self.assertEqual(price["ask"], float(last["ask"]["c"]))
+        self.assertEqual(price["mid"], float(last["mid"]["c"]))
+        self.assertEqual(price["time"], last["time"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Tests for the compiled adjacency index behind GraphReasoner.evaluate.
+
+Run from train-ict root:
+    python -m pytest tests/test_compiled_graph.py -v
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+_TRAIN_ICT_ROOT = Path(__file__).resolve().parent.parent
+_TRAIN_ICT_SRC = _TRAIN_ICT_ROOT / "src"
+sys.path.insert(0, str(_TRAIN_ICT_SRC))
+
+from ict_agent.knowledge.schema import ConceptType, ICTGraphInternal, ICTNode
+from ict_agent.logic.reasoner import GraphReasoner
+
+
+def _graph() -> ICTGraphInternal:
+    graph = ICTGraphInternal()
+    for model_id in ("silver_bullet", "unicorn"):
+        graph.add_node(ICTNode(id=model_id, label=model_id.title(), type=ConceptType.MODEL))
+    graph.add_edge("silver_bullet", "fair_value_gap", "requires", weight=2.0)
+    graph.add_edge("silver_bullet", "liquidity_sweep", "requires", weight=2.0)
+    graph.add_edge("silver_bullet", "ny_am", "active_during", weight=1.5)
+    graph.add_edge("unicorn", "breaker_block", "requires", weight=2.0)
+    graph.add_edge("unicorn", "fair_value_gap", "requires", weight=2.0)
+    graph.add_edge("unicorn", "displacement", "requires", weight=2.0)
+    return graph
+
+
+class TestCompiledGraph(unittest.TestCase):
+    def setUp(self):
+        self.reasoner = GraphReasoner(_graph())
+
+    def test_adjacency_and_requirement_columns(self):
+        compiled = self.reasoner.compiled
+        self.assertEqual(compiled.model_ids, ["silver_bullet", "unicorn"])
+        self.assertEqual(len(compiled.edges_from("unicorn", "requires")), 3)
+        self.assertEqual(compiled.edges_from("unicorn", "active_during"), [])
+        fvg_bit = compiled.signal_bits["fair_value_gap"]
+        self.assertTrue((compiled.requirement_weights[:, fvg_bit] > 0).all())
+
+    def test_evaluate_matches_per_model_scoring(self):
+        signals = {
+            "patterns": ["fvg", "breaker_block"],
+            "displacement": True,
+            "liquidity_swept": False,
+            "in_killzone": True,
+        }
+        decision = self.reasoner.evaluate(signals)
+        for model_id, score in decision.model_scores.items():
+            self.assertAlmostEqual(score, self.reasoner._score_model(model_id, signals)[0])
+        self.assertEqual(decision.recommendation, "unicorn")
+        self.assertEqual(decision.model_scores["unicorn"], 16.0)
+        self.assertEqual(decision.model_scores["silver_bullet"], 13.5)
+
+    def test_evaluate_many_and_weight_invalidation(self):
+        batch = [
+            {"patterns": ["fvg", "liquidity_sweep"], "in_killzone": True},
+            {"patterns": [], "displacement": True},
+        ]
+        decisions = self.reasoner.evaluate_many(batch)
+        self.assertEqual([d.recommendation for d in decisions], ["silver_bullet", "unicorn"])
+
+        self.reasoner.weights_config["model_unicorn"] = 50.0
+        self.assertEqual(self.reasoner.evaluate(batch[0]).recommendation, "unicorn")
+
+
+class TestGraphSnapshot(unittest.TestCase):
+    def test_second_load_uses_snapshot(self):
+        kb_root = _TRAIN_ICT_ROOT / "knowledge_base"
+        with tempfile.TemporaryDirectory() as tmp:
+            snapshot = Path(tmp) / "graph_snapshot.pkl"
+            built = GraphReasoner.from_knowledge_base(kb_root, snapshot_path=snapshot)
+            self.assertTrue(snapshot.exists())
+
+            with mock.patch.object(
+                GraphReasoner, "_build_graph", side_effect=AssertionError("rebuilt")
+            ):
+                restored = GraphReasoner.from_knowledge_base(kb_root, snapshot_path=snapshot)
+
+            self.assertEqual(set(restored.graph.nodes), set(built.graph.nodes))
+            self.assertEqual(len(restored.graph.edges), len(built.graph.edges))
+            self.assertFalse(restored.refresh().has_changes)
+
+    def test_manifest_tracks_only_loaded_concepts(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            kb_root = Path(tmp) / "knowledge_base"
+            (kb_root / "concepts" / "drafts").mkdir(parents=True)
+            (kb_root / "concepts" / "fvg.md").write_text("# Fair Value Gap\n")
+            (kb_root / "concepts" / "drafts" / "notes.md").write_text("# Notes\n")
+            manifest = GraphReasoner._source_manifest(kb_root)
+            self.assertEqual(manifest.scan().added, ["knowledge_base/concepts/fvg.md"])
+
+            (kb_root / "concepts" / "drafts" / "notes.md").write_text("# Notes, edited\n")
+            self.assertFalse(manifest.scan().has_changes)
+
+
+if __name__ == "__main__":
+    unittest.main()
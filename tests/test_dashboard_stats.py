@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Tests for the materialized dashboard stats (DashboardStatsStore) and
+PerformanceDashboard's cached HTML sections.
+
+Run from train-ict root:
+    python -m pytest tests/test_dashboard_stats.py -v
+"""
+
+import json
+import random
+import sys
+import tempfile
+import unittest
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+_TRAIN_ICT_ROOT = Path(__file__).resolve().parent.parent
+_TRAIN_ICT_SRC = _TRAIN_ICT_ROOT / "src"
+sys.path.insert(0, str(_TRAIN_ICT_SRC))
+
+from ict_agent.dashboard import dashboard as dashboard_module
+from ict_agent.dashboard.stats_store import DashboardStatsStore, empty_stats
+
+
+def make_trades(n: int, seed: int):
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 5, 9)
+    trades = []
+    for i in range(n):
+        pnl = rng.choice([round(rng.uniform(-300, 500), 2), 0, 100])
+        result = "WIN" if pnl > 0 else "LOSS" if pnl < 0 else "BREAKEVEN"
+        trades.append({
+            "id": f"t{i}",
+            "status": "closed" if i % 5 else "active",
+            "result": result,
+            "pnl_dollars": pnl,
+            "created_at": (start + timedelta(hours=7 * i)).isoformat() if i % 13 else "",
+            "pre_trade": {
+                "pair": rng.choice(["EURUSD", "GBPUSD", "UNKNOWN"]),
+                "killzone": rng.choice(["LONDON", "NY_AM", "NY_PM"]),
+                "setup_grade": rng.choice("ABC"),
+            },
+        })
+    return trades
+
+
+def reference_stats(trades):
+    """The original from-scratch calculate_stats loop"""
+    stats = empty_stats()
+    closed = [t for t in trades if t.get("status") == "closed"]
+    if not closed:
+        return stats
+    wins, losses = [], []
+    equity = 10000
+    curve = [(0, equity)]
+    groups = {k: defaultdict(lambda: {"wins": 0, "losses": 0, "pnl": 0})
+              for k in ("by_pair", "by_session", "by_day", "by_setup")}
+    calendar = defaultdict(lambda: {"trades": 0, "pnl": 0, "result": "neutral"})
+    streak = max_win = max_loss = 0
+    for i, t in enumerate(closed):
+        pre = t.get("pre_trade", {})
+        result, pnl = t.get("result", ""), t.get("pnl_dollars", 0)
+        created = t.get("created_at", "")
+        try:
+            dt = datetime.fromisoformat(created.replace("Z", "+00:00"))
+            day, date = dt.strftime("%A"), dt.strftime("%Y-%m-%d")
+        except ValueError:
+            day = date = "UNKNOWN"
+        names = dict(by_pair=pre.get("pair", "UNKNOWN"), by_session=pre.get("killzone", "UNKNOWN"),
+                     by_day=day, by_setup=pre.get("setup_grade", "UNKNOWN"))
+        stats["total_trades"] += 1
+        stats["total_pnl"] += pnl
+        equity += pnl
+        curve.append((i + 1, equity))
+        calendar[date]["trades"] += 1
+        calendar[date]["pnl"] += pnl
+        if result == "WIN":
+            stats["wins"] += 1
+            wins.append(pnl)
+            for k, name in names.items():
+                groups[k][name]["wins"] += 1
+            calendar[date]["result"] = "win" if calendar[date]["pnl"] > 0 else "loss"
+            streak = streak + 1 if streak >= 0 else 1
+            max_win = max(max_win, streak)
+        elif result == "LOSS":
+            stats["losses"] += 1
+            losses.append(pnl)
+            for k, name in names.items():
+                groups[k][name]["losses"] += 1
+            calendar[date]["result"] = "loss" if calendar[date]["pnl"] < 0 else "win"
+            streak = streak - 1 if streak <= 0 else -1
+            max_loss = max(max_loss, abs(streak))
+        else:
+            stats["breakeven"] += 1
+        for k, name in names.items():
+            groups[k][name]["pnl"] += pnl
+    decided = stats["wins"] + stats["losses"]
+    stats["win_rate"] = round(stats["wins"] / decided * 100, 1)
+    stats["avg_win"], stats["largest_win"] = round(sum(wins) / len(wins), 2), round(max(wins), 2)
+    stats["avg_loss"], stats["largest_loss"] = round(sum(losses) / len(losses), 2), round(min(losses), 2)
+    stats["profit_factor"] = round(sum(wins) / abs(sum(losses)), 2)
+    rate = stats["wins"] / decided
+    stats["expectancy"] = round(rate * stats["avg_win"] - (1 - rate) * abs(stats["avg_loss"]), 2)
+
+    def calc_win_rate(d):
+        total = d["wins"] + d["losses"]
+        return round(d["wins"] / total * 100, 1) if total > 0 else 0
+
+    for k, group in groups.items():
+        stats[k] = {name: {**v, "win_rate": calc_win_rate(v)} for name, v in group.items()}
+    stats["equity_curve"] = curve
+    stats["calendar"] = dict(calendar)
+    stats["streaks"] = {"current_win": max(streak, 0), "current_loss": max(-streak, 0),
+                        "max_win": max_win, "max_loss": max_loss}
+    stats["total_pnl"] = round(stats["total_pnl"], 2)
+    return stats
+
+
+class StoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.db_path = self.tmp / "trades_database.json"
+        self.stats_path = self.tmp / "dashboard_stats.json"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def write_db(self, trades):
+        self.db_path.write_text(json.dumps({"trades": trades}))
+
+    def store(self) -> DashboardStatsStore:
+        return DashboardStatsStore(self.stats_path, self.db_path)
+
+
+class TestStatsStore(StoreTestCase):
+    def test_incremental_matches_full_recompute(self):
+        trades = make_trades(200, 1)
+        for end in (0, 1, 40, 41, 120, 200):
+            self.write_db(trades[:end])
+            store = self.store()
+            store.sync(trades[:end])
+            self.assertEqual(store.stats(), reference_stats(trades[:end]), end)
+        self.assertEqual(len(self.store().state["keys"]), 160)
+
+    def test_counts_only_new_trades(self):
+        trades = make_trades(100, 2)
+        store = self.store()
+        self.assertEqual(store.sync(trades[:50]), 40)
+        self.assertEqual(store.sync(trades), 40)
+        self.assertEqual(store.sync(trades), 0)
+
+    def test_out_of_order_close_and_edit_rebuild(self):
+        trades = make_trades(60, 3)
+        store = self.store()
+        store.sync(trades)
+
+        trades[0]["status"] = "closed"  # closes before already-counted trades
+        store.sync(trades)
+        self.assertEqual(store.stats(), reference_stats(trades))
+
+        trades[7]["pnl_dollars"] = -999.5
+        trades[7]["result"] = "LOSS"
+        store.sync(trades)
+        self.assertEqual(store.stats(), reference_stats(trades))
+
+    def test_signature_tracks_database(self):
+        trades = make_trades(30, 4)
+        self.write_db(trades)
+        store = self.store()
+        self.assertFalse(store.is_current())
+        store.sync(trades)
+        self.assertTrue(self.store().is_current())
+        self.write_db(trades + make_trades(1, 5))
+        self.assertFalse(self.store().is_current())
+
+
+class TestPerformanceDashboard(StoreTestCase):
+    def dashboard(self):
+        return dashboard_module.PerformanceDashboard(self.store())
+
+    def test_unchanged_database_is_not_reloaded(self):
+        trades = make_trades(80, 6)
+        self.write_db(trades)
+        with mock.patch.object(dashboard_module, "TRADES_DB", self.db_path):
+            first = self.dashboard()
+            stats = first.calculate_stats()
+            self.assertEqual(stats, reference_stats(trades))
+            html = first.generate_html(stats)
+
+            second = self.dashboard()
+            with mock.patch.object(second, "_generate_category_rows") as rows, \
+                    mock.patch.object(second, "_generate_insights_rows") as insights:
+                cached_html = second.generate_html(second.calculate_stats())
+            rows.assert_not_called()
+            insights.assert_not_called()
+            self.assertIsNone(second._trades)
+
+        strip = lambda text: text.split("Last updated:")[1].split("</p>", 1)[1]
+        self.assertEqual(strip(cached_html), strip(html))
+        self.assertIn("EURUSD", html)
+
+    def test_sections_rerender_when_inputs_change(self):
+        trades = make_trades(40, 7)
+        self.write_db(trades)
+        with mock.patch.object(dashboard_module, "TRADES_DB", self.db_path):
+            self.dashboard().generate_html(self.dashboard().calculate_stats())
+
+            trades.append({**trades[1], "id": "new", "pnl_dollars": 1234.0, "result": "WIN"})
+            self.write_db(trades)
+            dashboard = self.dashboard()
+            stats = dashboard.calculate_stats()
+            self.assertEqual(stats, reference_stats(trades))
+            html = dashboard.generate_html(stats)
+
+        self.assertIn(str(stats["equity_curve"][-1][1]), html)
+        self.assertIn(f"${stats['by_pair'][trades[1]['pre_trade']['pair']]['pnl']:,.2f}", html)
+
+
+if __name__ == "__main__":
+    unittest.main()
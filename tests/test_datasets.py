@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Tests for the streaming dataset layer (ict_agent.data.datasets).
+
+Run from train-ict root:
+    python -m pytest tests/test_datasets.py -v
+"""
+
+import io
+import json
+import sys
+import tempfile
+import unittest
+from collections import Counter
+from pathlib import Path
+
+_TRAIN_ICT_ROOT = Path(__file__).resolve().parent.parent
+_TRAIN_ICT_SRC = _TRAIN_ICT_ROOT / "src"
+sys.path.insert(0, str(_TRAIN_ICT_SRC))
+
+from ict_agent.data.datasets import (
+    DiskHashSet,
+    JsonlWriter,
+    _iter_json_array,
+    content_hash,
+    iter_records,
+    parallel_map,
+    split_for,
+)
+
+TRAINING_DIR = _TRAIN_ICT_ROOT / "data" / "training"
+
+
+class TestIterRecords(unittest.TestCase):
+    def test_matches_json_load_on_training_files(self):
+        for name in ("final_ict_training_mix_v9.json", "shorthand_training_data.json", "qa/ict_concepts_qa.json"):
+            path = TRAINING_DIR / name
+            with open(path) as f:
+                expected = json.load(f)
+            for chunk_size in (64, 1 << 16):
+                self.assertEqual(list(iter_records(path, chunk_size=chunk_size)), expected, name)
+
+    def test_values_split_across_chunks(self):
+        for text in ('[]', ' [1, 2.5 ,"x",{"a":[1,2]}, null ,true] ', '[1.5e10,-3]', '{"a": 1}'):
+            expected = json.loads(text)
+            if not isinstance(expected, list):
+                expected = [expected]
+            for chunk_size in (1, 2, 3, 100):
+                self.assertEqual(list(_iter_json_array(io.StringIO(text), chunk_size)), expected, text)
+
+    def test_malformed_arrays_raise(self):
+        for text in ("[1,", '[{"a": 1}', "[1 2]", "[1,]", "[,1]", ""):
+            with self.assertRaises(json.JSONDecodeError, msg=text):
+                list(_iter_json_array(io.StringIO(text), 2))
+
+    def test_jsonl_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "out.jsonl"
+            records = [{"input": f"q{i}", "output": "ÿ"} for i in range(5)]
+            with JsonlWriter(path) as out:
+                for record in records:
+                    out.write(record)
+            self.assertEqual(out.count, 5)
+            self.assertEqual(list(iter_records(path)), records)
+
+    def test_writer_keeps_target_on_error(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "out.jsonl"
+            path.write_text('{"old": true}\n')
+            with self.assertRaises(RuntimeError):
+                with JsonlWriter(path) as out:
+                    out.write({"new": True})
+                    raise RuntimeError
+            self.assertEqual(list(iter_records(path)), [{"old": True}])
+            self.assertEqual(list(Path(tmp).iterdir()), [path])
+
+
+class TestDedupAndSplits(unittest.TestCase):
+    def test_disk_hash_set(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "seen.sqlite"
+            with DiskHashSet(path) as seen:
+                self.assertTrue(seen.add(content_hash({"input": "a", "output": 1}, fields=("input",))))
+                self.assertFalse(seen.add(content_hash({"output": 2, "input": "a"}, fields=("input",))))
+                self.assertTrue(seen.add(content_hash({"input": "b"})))
+                self.assertEqual(len(seen), 2)
+            with DiskHashSet(path) as reopened:
+                self.assertIn(content_hash({"input": "b"}), reopened)
+
+    def test_split_is_stable_and_proportional(self):
+        keys = [f"question {i}" for i in range(20_000)]
+        counts = Counter(split_for(k) for k in keys)
+        self.assertAlmostEqual(counts["train"] / len(keys), 0.8, delta=0.02)
+        self.assertAlmostEqual(counts["blind"] / len(keys), 0.1, delta=0.02)
+        self.assertEqual([split_for(k) for k in keys[:100]], [split_for(k) for k in keys[:100]])
+        self.assertEqual(split_for("x", {"only": 1.0}), "only")
+
+
+class TestParallelMap(unittest.TestCase):
+    def test_ordered_results(self):
+        items = [f"item {i}" for i in range(1000)]
+        expected = [s.upper() for s in items]
+        self.assertEqual(list(parallel_map(str.upper, items, workers=1)), expected)
+        self.assertEqual(list(parallel_map(str.upper, iter(items), workers=2, batch_size=64)), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,16 +1,43 @@
+import csv
+import json
+import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
 import sys
 import os
 
+import numpy as np
+
 # Add project root to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from experiments.evaluation_harness_v1 import EvaluationSystem
 
+
+class CountingEncoder:
+    """Deterministic bag-of-letters encoder that counts encoded texts."""
+    model_name = "counting-test"
+
+    def __init__(self):
+        self.encoded = 0
+
+    def encode(self, texts, batch_size=64):
+        self.encoded += len(texts)
+        vectors = np.zeros((len(texts), 26), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for ch in text.lower():
+                if "a" <= ch <= "z":
+                    vectors[row, ord(ch) - 97] += 1
+        return vectors
+
 class TestEvaluationSystem(unittest.TestCase):
     def setUp(self):
-        self.harness = EvaluationSystem()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.harness = EvaluationSystem(cache_dir=self.tmp.name)
+        self.harness.embedding_model = CountingEncoder()
 
     def test_initialization(self):
         """Test that the evaluation system initializes correctly."""
@@ -39,5 +66,96 @@ class TestEvaluationSystem(unittest.TestCase):
         self.assertIsInstance(response, str)
         self.assertTrue(len(response) > 0)
 
+
+class TestBatchedEvaluation(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.qa_path = root / "qa.json"
+        self.csv_path = root / "summary.csv"
+        self.cache_dir = root / "cache"
+        qa = [
+            {"category": f"Cat {i % 3}", "question": f"Question {i}", "explanation": f"Gold answer {i} about FVG"}
+            for i in range(9)
+        ]
+        self.qa_path.write_text(json.dumps(qa))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make_harness(self, encoder):
+        harness = EvaluationSystem(str(self.qa_path), str(self.csv_path), cache_dir=str(self.cache_dir))
+        harness.embedding_model = encoder
+        return harness
+
+    def test_batch_matches_per_pair(self):
+        harness = self.make_harness(CountingEncoder())
+        outputs = ["market maker model", "fair value gap", ""]
+        golds = ["Market maker buy model", "FVG fair value gap", "anything"]
+        keyword, cosine = harness.calculate_batch_metrics(outputs, golds)
+        for i, (output, gold) in enumerate(zip(outputs, golds)):
+            single = harness.calculate_metrics(output, gold)
+            self.assertAlmostEqual(single["keyword_presence"], keyword[i])
+            self.assertAlmostEqual(single["cosine_similarity"], cosine[i], places=4)
+        self.assertGreater(cosine[1], 0.0)
+        self.assertEqual(cosine[2], 0.0)
+
+    def test_gold_embeddings_cached_on_disk(self):
+        first = CountingEncoder()
+        self.make_harness(first).run_evaluation()
+        self.assertGreater(first.encoded, 0)
+
+        second = CountingEncoder()
+        self.make_harness(second).run_evaluation()
+        self.assertEqual(second.encoded, 0)
+
+    def test_cache_saved_per_category(self):
+        harness = self.make_harness(CountingEncoder())
+        harness.load_embedding_model()
+        cache = harness.embedding_cache
+        saves = []
+        save = cache.save
+
+        def counting_save():
+            saves.append(len(cache))
+            save()
+
+        cache.save = counting_save
+        harness.run_evaluation()
+        self.assertEqual(len(saves), 1 + 3)  # gold answers, then each category
+        self.assertTrue(cache.path.exists())
+
+    def test_category_workers_encode_concurrently(self):
+        class SlowEncoder(CountingEncoder):
+            def __init__(self):
+                super().__init__()
+                self.active = 0
+                self.peak = 0
+                self.lock = threading.Lock()
+
+            def encode(self, texts, batch_size=64):
+                with self.lock:
+                    self.active += 1
+                    self.peak = max(self.peak, self.active)
+                time.sleep(0.05)
+                with self.lock:
+                    self.active -= 1
+                return super().encode(texts, batch_size)
+
+        encoder = SlowEncoder()
+        self.make_harness(encoder).run_evaluation()
+        self.assertGreater(encoder.peak, 1)
+
+    def test_resume_skips_written_categories(self):
+        harness = self.make_harness(CountingEncoder())
+        harness.save_results("run-1", {"Cat 0": {"avg_keyword_presence": 1.0, "avg_cosine_similarity": 2.0, "samples": 3}})
+        results = harness.run_evaluation(resume="run-1")
+        self.assertEqual(set(results), {"Cat 1", "Cat 2"})
+
+        with open(self.csv_path, newline="") as f:
+            rows = [r for r in csv.DictReader(f) if r["timestamp"] == "run-1"]
+        self.assertEqual(sorted(r["category"] for r in rows), ["Cat 0", "Cat 1", "Cat 2"])
+
+
 if __name__ == '__main__':
     unittest.main()
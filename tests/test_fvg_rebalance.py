@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Tests for the FVG rebalance tracker's per-pair interval index: parity
+with a full scan, archiving of rebalanced gaps, re-added ids and a
+10k-gap / 20-pair tick benchmark.
+
+Run from train-ict root:
+    python -m pytest tests/test_fvg_rebalance.py -v
+"""
+
+import random
+import sys
+import time
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+_TRAIN_ICT_SRC = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(_TRAIN_ICT_SRC))
+
+from ict_agent.detectors.fvg_rebalance import FVGRebalanceTracker, FVGStatus, FVGType
+
+START = datetime(2026, 3, 2, 9, 30)
+PAIRS = [f"P{i:02d}_USD" for i in range(20)]
+
+
+def populate(tracker, n, rng, pairs=PAIRS):
+    for i in range(n):
+        pair = pairs[i % len(pairs)]
+        low = 1.0 + rng.random() * 0.1
+        tracker.add_fvg(pair, rng.choice(["M15", "H1", "H4"]),
+                        rng.choice([FVGType.BISI, FVGType.SIBI]),
+                        high=low + rng.uniform(0.0002, 0.0030), low=low,
+                        formation_time=START + timedelta(minutes=i))
+
+
+def full_scan_update(tracker, pair, high, low, open_, close, timestamp):
+    """Reference: the previous update_price, checking every gap of the pair."""
+    alerts = []
+    for fvg in list(tracker.tracked_fvgs.values()):
+        if fvg.pair != pair or fvg.status == FVGStatus.REBALANCED:
+            continue
+        alert = tracker._check_fvg_interaction(fvg, high, low, open_, close, timestamp)
+        if alert:
+            alerts.append(alert)
+    return alerts
+
+
+def random_candles(rng, n):
+    price = {pair: 1.05 for pair in PAIRS}
+    for i in range(n):
+        pair = rng.choice(PAIRS)
+        open_ = price[pair]
+        close = min(1.1, max(1.0, open_ + rng.gauss(0, 0.002)))
+        high = max(open_, close) + rng.random() * 0.001
+        low = min(open_, close) - rng.random() * 0.001
+        price[pair] = close
+        yield pair, high, low, open_, close, START + timedelta(seconds=i)
+
+
+class TestIndexedUpdates(unittest.TestCase):
+    def test_matches_full_scan(self):
+        indexed, reference = FVGRebalanceTracker(), FVGRebalanceTracker()
+        populate(indexed, 2000, random.Random(7))
+        populate(reference, 2000, random.Random(7))
+
+        for pair, high, low, open_, close, ts in random_candles(random.Random(3), 3000):
+            got = indexed.update_price(pair, close, high, low, open_, close, ts)
+            want = full_scan_update(reference, pair, high, low, open_, close, ts)
+            self.assertEqual(got, want)
+
+        everything = {f.id: f for f in indexed.get_active_fvgs(exclude_rebalanced=False)}
+        self.assertEqual(len(everything), len(reference.tracked_fvgs))
+        for fvg_id, ref in reference.tracked_fvgs.items():
+            fvg = everything[fvg_id]
+            self.assertEqual((fvg.status, fvg.fill_percentage, len(fvg.fill_events)),
+                             (ref.status, ref.fill_percentage, len(ref.fill_events)))
+
+    def test_rebalanced_gaps_are_archived(self):
+        tracker = FVGRebalanceTracker()
+        fvg = tracker.add_fvg("EUR_USD", "M15", FVGType.BISI, 1.0860, 1.0850, START)
+        other = tracker.add_fvg("EUR_USD", "M15", FVGType.SIBI, 1.0900, 1.0890,
+                                START + timedelta(minutes=15))
+
+        # Down through the gap (sellside), then up through it (buyside)
+        tracker.update_price("EUR_USD", 1.0845, 1.0855, 1.0840, 1.0855, 1.0845, START)
+        self.assertEqual(fvg.status, FVGStatus.FULL_FILL)
+        alerts = tracker.update_price("EUR_USD", 1.0865, 1.0865, 1.0848, 1.0848, 1.0865, START)
+        self.assertEqual(alerts[0]["new_status"], "rebalanced")
+
+        self.assertNotIn(fvg.id, tracker.tracked_fvgs)
+        self.assertIs(tracker.archived[fvg.id], fvg)
+        self.assertIs(tracker.get_fvg(fvg.id), fvg)
+        self.assertEqual(len(tracker._index["EUR_USD"]), 1)
+        self.assertEqual(tracker.get_active_fvgs(pair="EUR_USD"), [other])
+        self.assertEqual(tracker.get_active_fvgs(exclude_rebalanced=False), [fvg, other])
+        self.assertEqual(tracker.update_price("EUR_USD", 1.0855, 1.0860, 1.0850, 1.0850, 1.0860, START), [])
+
+    def test_readding_an_id_replaces_it(self):
+        tracker = FVGRebalanceTracker()
+        tracker.add_fvg("EUR_USD", "H1", FVGType.BISI, 1.0860, 1.0850, START)
+        fvg = tracker.add_fvg("EUR_USD", "H1", FVGType.BISI, 1.0960, 1.0950, START)
+        self.assertEqual(len(tracker.tracked_fvgs), 1)
+        self.assertEqual(tracker.update_price("EUR_USD", 1.0855, 1.0858, 1.0852, 1.0853, 1.0857, START), [])
+        alerts = tracker.update_price("EUR_USD", 1.0955, 1.0958, 1.0952, 1.0953, 1.0957, START)
+        self.assertEqual([a["fvg_id"] for a in alerts], [fvg.id])
+
+
+class TestTickBenchmark(unittest.TestCase):
+    def test_10k_gaps_20_pairs(self):
+        tracker = FVGRebalanceTracker()
+        populate(tracker, 10_000, random.Random(11))
+        rng = random.Random(5)
+        ticks = []
+        for i in range(20_000):
+            mid = 1.0 + rng.random() * 0.1
+            ticks.append((PAIRS[i % 20], mid + 0.00005, mid - 0.00005, START + timedelta(seconds=i)))
+
+        # Same gaps and the first ticks through the previous full scan, as a
+        # baseline measured on this machine in this run
+        reference = FVGRebalanceTracker()
+        populate(reference, 10_000, random.Random(11))
+        sample = ticks[:1000]
+        start = time.perf_counter()
+        for pair, high, low, ts in sample:
+            full_scan_update(reference, pair, high, low, low, high, ts)
+        scan_us = (time.perf_counter() - start) / len(sample) * 1e6
+
+        start = time.perf_counter()
+        for pair, high, low, ts in ticks:
+            tracker.update_price(pair, low, high, low, low, high, ts)
+        elapsed = time.perf_counter() - start
+
+        per_tick_us = elapsed / len(ticks) * 1e6
+        print(f"\n   FVG tracker: {per_tick_us:.1f} µs/tick (full scan {scan_us:.1f} µs/tick), "
+              f"{len(tracker.tracked_fvgs)} active / {len(tracker.archived)} archived")
+        self.assertLess(per_tick_us, scan_us)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""Tests for the bulk history downloader: page splitting, concurrent
+in-order writes into the bar store, resume after an interrupted run and
+paginated date-range fetches.
+
+Run from train-ict root:
+    python -m pytest tests/test_history.py -v
+"""
+
+import json
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+_TRAIN_ICT_SRC = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(_TRAIN_ICT_SRC))
+
+import pandas as pd
+import requests
+from requests.adapters import BaseAdapter
+
+from ict_agent.data.fetcher import DataConfig
+from ict_agent.data.history import BarStore, HistoryDownloader, page_ranges
+from ict_agent.data.oanda_fetcher import OANDAConfig, OANDAFetcher
+from ict_agent.data.oanda_transport import OANDATransport
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def fake_candles(start: datetime, end: datetime, seconds: int):
+    """Weekday candles in [start, end), OANDA JSON shape."""
+    t = start
+    out = []
+    while t < end:
+        if t.weekday() < 5:
+            price = f"{1.1 + (t - START).total_seconds() / 1e9:.5f}"
+            out.append({
+                "time": t.strftime("%Y-%m-%dT%H:%M:%S.000000000Z"),
+                "complete": True,
+                "volume": 10,
+                "mid": {"o": price, "h": price, "l": price, "c": price},
+            })
+        t += timedelta(seconds=seconds)
+    return out
+
+
+class FakeOANDA(BaseAdapter):
+    """Serves M15 candles for from/to requests; can fail one page."""
+
+    def __init__(self, fail_from=None, delay=0.0):
+        super().__init__()
+        self.fail_from = fail_from
+        self.delay = delay
+        self.requests = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        query = parse_qs(urlsplit(request.url).query)
+        start = datetime.fromisoformat(query["from"][0].replace("Z", "+00:00"))
+        end = datetime.fromisoformat(query["to"][0].replace("Z", "+00:00"))
+        with self.lock:
+            self.requests.append(start)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        if self.fail_from is not None and start == self.fail_from:
+            response.status_code = 400
+            response._content = b'{"errorMessage": "bad page"}'
+        else:
+            response.status_code = 200
+            response._content = json.dumps({"candles": fake_candles(start, end, 900)}).encode()
+        return response
+
+    def close(self):
+        pass
+
+
+def make_fetcher(adapter: FakeOANDA) -> OANDAFetcher:
+    transport = OANDATransport("token", sleep=lambda s: None, rate_per_second=10000, burst=100)
+    transport.session.mount("https://", adapter)
+    return OANDAFetcher(OANDAConfig(api_key="token"), transport=transport)
+
+
+class TestPaging(unittest.TestCase):
+    def test_page_ranges(self):
+        pages = page_ranges(START, START + timedelta(days=10), "M15", page_size=200)
+        self.assertEqual(pages[0], (START, START + timedelta(minutes=15 * 200)))
+        self.assertEqual(pages[-1][1], START + timedelta(days=10))
+        self.assertTrue(all(a[1] == b[0] for a, b in zip(pages, pages[1:])))
+        self.assertEqual(len(page_ranges(START, START + timedelta(days=3650), "M1")),
+                         -(-3650 * 1440 // 5000))
+
+
+class TestDownloader(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.store = BarStore(Path(self.tmp.name) / "bars.sqlite")
+        self.addCleanup(self.store.close)
+        self.end = START + timedelta(days=30)
+        self.expected = len(fake_candles(START, self.end, 900))
+
+    def test_concurrent_download_is_complete_and_ordered(self):
+        adapter = FakeOANDA(delay=0.01)
+        downloader = HistoryDownloader(make_fetcher(adapter), self.store, workers=4, page_size=300)
+        seen = []
+        summary = downloader.download("EURUSD", "15m", START, self.end,
+                                      progress=lambda s: seen.append(s["through"]))
+
+        self.assertEqual(summary["stored"], self.expected)
+        self.assertEqual(summary["pages"], summary["total_pages"])
+        self.assertEqual(seen, sorted(seen))
+        self.assertGreater(adapter.peak, 1)
+
+        df = self.store.load("EUR_USD", "M15")
+        self.assertEqual(len(df), self.expected)
+        self.assertTrue(df.index.is_monotonic_increasing)
+        self.assertEqual(str(df.index.tz), "UTC")
+        self.assertEqual(df["close"].dtype, "float64")
+
+    def test_resume_after_interruption(self):
+        pages = page_ranges(START, self.end, "M15", page_size=300)
+        failing = FakeOANDA(fail_from=pages[5][0])
+        with self.assertRaises(requests.HTTPError):
+            HistoryDownloader(make_fetcher(failing), self.store, workers=3, page_size=300) \
+                .download("EUR_USD", "M15", START, self.end)
+
+        # Everything before the failed page is stored, nothing after it
+        last = self.store.last_time("EUR_USD", "M15")
+        self.assertLess(last, pd.Timestamp(pages[5][0]))
+        self.assertEqual(self.store.count("EUR_USD", "M15"),
+                         len(fake_candles(START, pages[5][0], 900)))
+
+        adapter = FakeOANDA()
+        summary = HistoryDownloader(make_fetcher(adapter), self.store, workers=3, page_size=300) \
+            .download("EUR_USD", "M15", START, self.end)
+        self.assertEqual(summary["stored"], self.expected)
+        self.assertGreaterEqual(min(adapter.requests), last.to_pydatetime())
+        self.assertLess(len(adapter.requests), len(pages))
+
+        # A rerun with everything stored fetches nothing new
+        again = HistoryDownloader(make_fetcher(FakeOANDA()), self.store, page_size=300) \
+            .download("EUR_USD", "M15", START, self.end)
+        self.assertEqual(again["candles"], 0)
+        self.assertEqual(again["stored"], self.expected)
+
+    def test_wider_window_backfills_before_first_stored_candle(self):
+        recent = self.end - timedelta(days=12)
+        HistoryDownloader(make_fetcher(FakeOANDA()), self.store, page_size=300) \
+            .download("EUR_USD", "M15", recent, self.end)
+        self.assertEqual(self.store.count("EUR_USD", "M15"), len(fake_candles(recent, self.end, 900)))
+
+        # Widening the window fetches only the missing head, newest page first
+        head = page_ranges(START, recent, "M15", page_size=300)
+        failing = FakeOANDA(fail_from=head[1][0])
+        with self.assertRaises(requests.HTTPError):
+            HistoryDownloader(make_fetcher(failing), self.store, workers=1, page_size=300) \
+                .download("EUR_USD", "M15", START, self.end)
+        # Interrupted backfill leaves a contiguous range ending at the old tail
+        stored = self.store.load("EUR_USD", "M15")
+        self.assertEqual(len(stored), len(fake_candles(stored.index[0].to_pydatetime(), self.end, 900)))
+
+        adapter = FakeOANDA()
+        summary = HistoryDownloader(make_fetcher(adapter), self.store, page_size=300) \
+            .download("EUR_USD", "M15", START, self.end)
+        self.assertEqual(summary["stored"], self.expected)
+        self.assertTrue(all(t < recent for t in adapter.requests))
+        self.assertEqual(self.store.first_time("EUR_USD", "M15"), pd.Timestamp(START))
+
+
+class TestFetcherRanges(unittest.TestCase):
+    def test_date_range_fetch_is_paginated(self):
+        adapter = FakeOANDA()
+        fetcher = make_fetcher(adapter)
+        end = START + timedelta(days=120)  # > 5000 M15 candles
+        df = fetcher.fetch(DataConfig(symbol="EUR_USD", timeframe="M15",
+                                      start_date=START, end_date=end))
+        self.assertEqual(len(df), len(fake_candles(START, end, 900)))
+        self.assertEqual(len(adapter.requests), len(page_ranges(START, end, "M15")))
+        self.assertFalse(df.index.has_duplicates)
+
+    def test_parse_skips_incomplete(self):
+        fetcher = make_fetcher(FakeOANDA())
+        candles = fake_candles(START, START + timedelta(hours=1), 900)
+        candles[-1]["complete"] = False
+        df = fetcher._parse_candles(candles)
+        self.assertEqual(len(df), 3)
+        self.assertEqual(df.index.name, "timestamp")
+        self.assertEqual(df.index[0], pd.Timestamp(START))
+        self.assertEqual(df["volume"].tolist(), [10, 10, 10])
+
+
+if __name__ == "__main__":
+    unittest.main()
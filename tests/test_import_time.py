@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Import-time budget for the ict_agent packages and the vex.py CLI.
+
+Each entry point runs in a fresh interpreter under ``-X importtime``; the
+test fails if it pulls in the scientific stack or blows its budget.
+
+Run from train-ict root:
+    python -m pytest tests/test_import_time.py -v
+"""
+
+import importlib
+import pkgutil
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from typing import Dict
+
+_TRAIN_ICT_ROOT = Path(__file__).resolve().parent.parent
+_TRAIN_ICT_SRC = _TRAIN_ICT_ROOT / "src"
+sys.path.insert(0, str(_TRAIN_ICT_SRC))
+
+# Modules that only the trading/analysis paths should ever load
+HEAVY_MODULES = {"pandas", "numpy", "pydantic", "loguru", "yfinance", "matplotlib"}
+
+# Cumulative import time budget (microseconds) for package-level imports.
+# Measured ~1-3 ms after lazy exports (was ~450 ms); generous for slow CI.
+PACKAGE_BUDGET_US = 150_000
+
+
+def _importtime(args) -> Dict[str, int]:
+    """Run python -X importtime with args; return {module: cumulative_us}."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=_TRAIN_ICT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def _import(module: str) -> Dict[str, int]:
+    return _importtime(["-c", f"import sys; sys.path.insert(0, 'src'); import {module}"])
+
+
+class TestImportTime(unittest.TestCase):
+    def assertLight(self, modules: Dict[str, int], label: str):
+        loaded = HEAVY_MODULES & set(modules)
+        self.assertFalse(loaded, f"{label} imported {sorted(loaded)}")
+
+    def test_packages_are_lazy(self):
+        for package in ("ict_agent", "ict_agent.core", "ict_agent.engine", "ict_agent.knowledge",
+                        "ict_agent.grader", "ict_agent.rules", "ict_agent.journal"):
+            modules = _import(package)
+            self.assertLight(modules, package)
+            self.assertLess(modules[package], PACKAGE_BUDGET_US, package)
+
+    def test_json_only_cli_commands(self):
+        for command in ("rules", "lessons", "stats", "patterns"):
+            self.assertLight(_importtime(["vex.py", command]), f"vex.py {command}")
+
+    def test_attribute_access_loads_on_demand(self):
+        # importtime does not log modules loaded via importlib.import_module,
+        # only their nested imports, so check the detector stack came in
+        modules = _importtime([
+            "-c",
+            "import sys; sys.path.insert(0, 'src'); import ict_agent; ict_agent.SignalGenerator",
+        ])
+        self.assertIn("ict_agent.engine.mtf_analyzer", modules)
+        self.assertIn("pandas", modules)
+
+
+class TestLazyExports(unittest.TestCase):
+    def test_every_export_resolves(self):
+        import ict_agent
+
+        packages = ["ict_agent"] + [
+            f"ict_agent.{m.name}" for m in pkgutil.iter_modules(ict_agent.__path__) if m.ispkg
+        ]
+        for package in packages:
+            module = importlib.import_module(package)
+            for name in module.__all__:
+                self.assertIn(name, dir(module))
+                try:
+                    value = getattr(module, name)
+                except ModuleNotFoundError as exc:
+                    if exc.name.startswith("ict_agent"):
+                        raise
+                    continue  # optional third-party dependency not installed
+                self.assertIs(module.__dict__[name], value)
+
+    def test_unknown_attribute(self):
+        import ict_agent.core
+
+        with self.assertRaises(AttributeError):
+            ict_agent.core.DoesNotExist
+        self.assertTrue(hasattr(ict_agent.core, "stop_hunt"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Tests for the BM25 inverted index behind KnowledgeBaseSearch.
+
+Run from train-ict root:
+    python -m pytest tests/test_kb_search.py -v
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+_TRAIN_ICT_SRC = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(_TRAIN_ICT_SRC))
+
+from ict_agent.knowledge.inverted_index import InvertedIndex, tokenize
+from ict_agent.knowledge.kb_search import KnowledgeBaseSearch
+from ict_agent.knowledge.manifest import SourceManifest
+
+
+class TestInvertedIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = InvertedIndex()
+        self.index.add_document(0, "Fair value gap\nThe FVG is a fair value gap in price")
+        self.index.add_document(1, "Order block\nBullish order block below a fair level")
+        self.index.add_document(2, "Kill zones and the CBDR range")
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize("SIBI/BISI - 50%"), ["sibi", "bisi", "50"])
+
+    def test_bm25_ranks_matching_docs(self):
+        scores = self.index.bm25(tokenize("fair value gap"))
+        self.assertEqual(max(scores, key=scores.get), 0)
+        self.assertNotIn(2, scores)
+
+    def test_phrase_positions(self):
+        self.assertEqual(self.index.phrase_positions(0, ["fair", "value", "gap"]), [0, 7])
+        self.assertEqual(self.index.phrase_positions(1, ["fair", "value"]), [])
+
+    def test_line_for_position(self):
+        pos = self.index.first_position(1, ["bullish"])
+        self.assertEqual(self.index.line_for_position(1, pos), 1)
+
+    def test_remove_document(self):
+        self.index.remove_document(2)
+        self.assertNotIn("cbdr", self.index.postings)
+        self.assertEqual(self.index.doc_count, 2)
+
+
+class TestSourceManifest(unittest.TestCase):
+    def test_scan_detects_added_changed_deleted(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "a.md").write_text("alpha")
+            (root / "b.md").write_text("beta")
+            (root / "skip.png").write_bytes(b"\x89PNG")
+
+            manifest = SourceManifest(root, [root], extensions={".md"})
+            self.assertEqual(manifest.scan().added, ["a.md", "b.md"])
+            self.assertFalse(manifest.scan().has_changes)
+
+            (root / "a.md").write_text("alpha v2")
+            (root / "b.md").unlink()
+            (root / "c.md").write_text("gamma")
+            restored = SourceManifest(root, [root], {".md"}, manifest.to_dict())
+            diff = restored.scan()
+            self.assertEqual((diff.added, diff.changed, diff.deleted), (["c.md"], ["a.md"], ["b.md"]))
+
+
+class TestKnowledgeBaseSearch(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.kb_path = root / "knowledge_base"
+        (self.kb_path / "concepts").mkdir(parents=True)
+        (self.kb_path / "models").mkdir()
+        (self.kb_path / "concepts" / "cbdr.md").write_text(
+            "# Central Bank Dealers Range\n\nThe CBDR is measured 2pm-8pm NY.\n"
+        )
+        (self.kb_path / "models" / "model_9.md").write_text(
+            "# One Shot One Kill\n\nWeekly range model.\nUses the CBDR for projections.\n"
+        )
+        self.index_path = root / "cache" / "kb_index.pkl"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _kb(self):
+        return KnowledgeBaseSearch(self.kb_path, index_path=self.index_path)
+
+    def test_search_and_snippet(self):
+        results = self._kb().search("cbdr")
+        self.assertEqual(len(results), 2)
+        model_hit = [r for r in results if r.category == "models"][0]
+        self.assertEqual(model_hit.line_number, 4)
+        self.assertIn("CBDR", model_hit.snippet)
+
+    def test_category_filter(self):
+        results = self._kb().search("cbdr", category="models")
+        self.assertEqual([r.file_name for r in results], ["model_9.md"])
+
+    def test_index_persisted_and_invalidated(self):
+        self._kb()
+        self.assertTrue(self.index_path.exists())
+
+        (self.kb_path / "concepts" / "sibi.md").write_text("# SIBI\n\nSellside imbalance.\n")
+        results = self._kb().search("sellside")
+        self.assertEqual([r.file_name for r in results], ["sibi.md"])
+
+    def test_refresh_patches_changed_and_deleted_files(self):
+        kb = self._kb()
+        (self.kb_path / "models" / "model_9.md").write_text("# One Shot One Kill\n\nWeekly profile.\n")
+        (self.kb_path / "concepts" / "cbdr.md").unlink()
+
+        diff = kb.refresh()
+        self.assertEqual(diff.changed, ["models/model_9.md"])
+        self.assertEqual(diff.deleted, ["concepts/cbdr.md"])
+        self.assertEqual(kb.search("cbdr"), [])
+        self.assertEqual(len(kb.search("weekly profile")), 1)
+
+    def test_get_model_reads_content_lazily(self):
+        model = self._kb().get_model("model_9")
+        self.assertIn("Weekly range model", model["content"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Tests for VexLiveDashboard dirty-panel tracking and throttled rendering.
+
+Run from train-ict root:
+    python -m pytest tests/test_live_dashboard.py -v
+"""
+
+import io
+import sys
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+_TRAIN_ICT_ROOT = Path(__file__).resolve().parent.parent
+_TRAIN_ICT_SRC = _TRAIN_ICT_ROOT / "src"
+sys.path.insert(0, str(_TRAIN_ICT_SRC))
+
+from rich.console import Console
+
+from ict_agent.dashboard.live_dashboard import (
+    CycleRecord,
+    MarketQuote,
+    Position,
+    VexLiveDashboard,
+)
+
+SYMBOLS = [f"PAIR{i:02d}_USD" for i in range(24)]
+
+
+def make_trace(n: int, failed_at: int = -1):
+    return [
+        {"gate": f"G{i + 1}_GATE", "passed": i != failed_at, "summary": f"gate {i + 1} " * 8}
+        for i in range(n)
+    ]
+
+
+def make_dashboard(**kwargs) -> VexLiveDashboard:
+    console = Console(file=io.StringIO(), force_terminal=True, width=140, height=40, record=True)
+    return VexLiveDashboard(console=console, **kwargs)
+
+
+def rendered_text(dash: VexLiveDashboard) -> str:
+    dash.render()
+    return dash.console.export_text()
+
+
+class TestDirtyPanels(unittest.TestCase):
+    def test_only_changed_panels_are_rebuilt(self):
+        dash = make_dashboard()
+        dash.build_layout()
+        self.assertEqual(dash._dirty, set())
+
+        dash.update_quotes([MarketQuote("EUR_USD", 1.1)])
+        dash.update_quotes([MarketQuote("EUR_USD", 1.1)])
+        dash.set_mode(dry_run=False)  # already LIVE
+        dash.update_positions([])
+        self.assertEqual(dash._dirty, {"market"})
+
+        with mock.patch.object(dash, "_gates_panel", wraps=dash._gates_panel) as gates:
+            dash._builders["gates"] = gates
+            dash.build_layout()
+            gates.assert_not_called()
+
+            dash.update_gate_trace("EUR_USD", make_trace(9, failed_at=5), "NO TRADE", "G6")
+            dash.update_gate_trace("EUR_USD", make_trace(9, failed_at=5), "NO TRADE", "G6")
+            dash.log_cycle(CycleRecord(1, "09:30:00 ET", "NY_AM", "NO TRADE"))
+            self.assertEqual(dash._dirty, {"gates", "log"})
+            dash.build_layout()
+            self.assertEqual(gates.call_count, 1)
+
+    def test_layout_matches_full_rebuild(self):
+        dash = make_dashboard()
+        dash.update_header(3, "ANALYZING", "NY_AM")
+        dash.update_quotes([MarketQuote(s, 1.0 + i / 100) for i, s in enumerate(SYMBOLS)])
+        dash.update_positions([Position("T-1001", "EUR_USD", "BUY", 1000, 12.5)])
+        dash.build_layout()
+        dash.update_gate_trace("GBP_USD", make_trace(11), "BUY GBP_USD")
+
+        fresh = make_dashboard()
+        fresh.state = dash.state
+        self.assertEqual(rendered_text(dash), rendered_text(fresh))
+        self.assertIn("GBP/USD", rendered_text(fresh))
+
+
+class TestLiveRendering(unittest.TestCase):
+    def test_bursts_coalesce_into_few_frames(self):
+        frames = []
+        dash = make_dashboard(max_fps=20, on_frame=frames.append)
+        live = dash.start_live()
+        live.__enter__()
+        try:
+            start = time.perf_counter()
+            for cycle in range(5):
+                dash.update_header(cycle, "SCANNING", "NY_AM")
+                for symbol in SYMBOLS:
+                    dash.update_gate_trace(symbol, make_trace(11, failed_at=cycle), "NO TRADE")
+                dash.refresh()
+            updates = time.perf_counter() - start
+            time.sleep(0.3)
+        finally:
+            live.__exit__(None, None, None)
+            dash.stop_live()
+
+        self.assertGreaterEqual(len(frames), 1)
+        self.assertLessEqual(len(frames), 2 + int(updates / dash.frame_interval))
+        self.assertIn("gates", set().union(*(f.panels for f in frames)))
+        self.assertEqual(frames[-1].frame, dash.frame_count)
+        self.assertTrue(all(f.build_ms >= 0 and f.render_ms >= 0 for f in frames))
+        self.assertIsNone(dash._thread)
+
+    def test_max_fps_must_be_positive(self):
+        for max_fps in (0, -1):
+            with self.assertRaises(ValueError):
+                make_dashboard(max_fps=max_fps)
+
+
+if __name__ == "__main__":
+    unittest.main()
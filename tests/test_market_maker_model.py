@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Parity tests for the single-pass MarketMakerModelDetector.analyze.
+
+Run from train-ict root:
+    python -m pytest tests/test_market_maker_model.py -v
+"""
+
+import sys
+import time
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+_TRAIN_ICT_ROOT = Path(__file__).resolve().parent.parent
+_TRAIN_ICT_SRC = _TRAIN_ICT_ROOT / "src"
+sys.path.insert(0, str(_TRAIN_ICT_SRC))
+
+from ict_agent.models.market_maker_model import (
+    MarketMakerModelDetector,
+    MarketMakerModelType,
+    MarketMakerSetup,
+    MMModelPhase,
+    detect_mmbm,
+)
+
+
+def _ohlc(n: int, seed: int, freq: str = "1h") -> pd.DataFrame:
+    """Random walk with alternating quiet ranges and trending legs"""
+    rng = np.random.default_rng(seed)
+    vol = np.where((np.arange(n) // 40) % 2 == 0, 0.0002, 0.0012)
+    drift = np.where((np.arange(n) // 80) % 2 == 0, -0.0003, 0.0003)
+    close = 1.10 + np.cumsum(rng.normal(drift, vol))
+    open_ = np.r_[close[0], close[:-1]]
+    wick = np.abs(rng.normal(0, vol / 2))
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) + wick,
+            "low": np.minimum(open_, close) - wick,
+            "close": close,
+        },
+        index=pd.date_range("2024-01-01", periods=n, freq=freq),
+    )
+
+
+def _reference_analyze(detector: MarketMakerModelDetector, df: pd.DataFrame):
+    """The original per-scan_end loop built from the public detect_* steps"""
+    setups = []
+    for scan_end in range(50, len(df) - 20):
+        consolidation = detector.detect_consolidation(df, scan_end)
+        if consolidation is None:
+            continue
+        next_candles = df.iloc[scan_end:min(scan_end + 10, len(df))]
+        broke_down = next_candles["low"].min() < consolidation.low
+        broke_up = next_candles["high"].max() > consolidation.high
+        if broke_down and not broke_up:
+            model_type = MarketMakerModelType.BUY_MODEL
+        elif broke_up and not broke_down:
+            model_type = MarketMakerModelType.SELL_MODEL
+        else:
+            continue
+        engineered = detector.detect_engineered_liquidity(df, scan_end, model_type)
+        if len(engineered) < detector.min_engineered_levels:
+            continue
+        pd_array = detector.detect_pd_array(df, consolidation, model_type)
+        mss_result = detector.detect_mss(df, engineered, model_type)
+        phase = MMModelPhase.MSS_CONFIRMED if mss_result else (
+            MMModelPhase.SELLSIDE_CURVE if model_type == MarketMakerModelType.BUY_MODEL
+            else MMModelPhase.BUYSIDE_CURVE
+        )
+        setup = MarketMakerSetup(
+            type=model_type, phase=phase, consolidation=consolidation,
+            engineered_levels=engineered, pd_array_high=pd_array[0],
+            pd_array_low=pd_array[1], timestamp=df.index[-1],
+        )
+        if mss_result:
+            setup.mss_level, setup.mss_candle_idx = mss_result
+            entry_zone = detector.find_entry_zone(df, setup.mss_candle_idx, model_type)
+            if entry_zone:
+                setup.entry_zone_high = entry_zone["high"]
+                setup.entry_zone_low = entry_zone["low"]
+                setup.entry_type = entry_zone["type"]
+                setup.phase = MMModelPhase.SMART_MONEY_REVERSAL
+                curve = df.iloc[scan_end:]
+                setup = detector.calculate_trade_levels(
+                    setup, df, curve["low"].min(), curve["high"].max()
+                )
+        setup.confidence = detector._calculate_confidence(setup)
+        if setup.confidence >= 0.5:
+            setups.append(setup)
+    return detector._deduplicate_setups(setups)
+
+
+class TestMarketMakerModelParity(unittest.TestCase):
+    def test_matches_reference_scan(self):
+        compared = 0
+        for seed in (0, 1, 4):
+            df = _ohlc(300, seed)
+            detector = MarketMakerModelDetector()
+            self.assertEqual(detector.analyze(df), _reference_analyze(detector, df))
+            compared += len(detector.active_setups)
+        self.assertGreater(compared, 0)
+
+    def test_mss_index_is_python_int(self):
+        setups = [s for seed in (0, 1, 4)
+                  for s in MarketMakerModelDetector().analyze(_ohlc(300, seed))
+                  if s.mss_candle_idx is not None]
+        self.assertTrue(setups)
+        self.assertTrue(all(type(s.mss_candle_idx) is int for s in setups))
+
+    def test_short_frames(self):
+        detector = MarketMakerModelDetector()
+        self.assertEqual(detector.analyze(_ohlc(49, 0)), [])
+        df = _ohlc(75, 1)
+        self.assertEqual(detector.analyze(df), _reference_analyze(detector, df))
+
+    def test_full_year_h1_scales(self):
+        df = _ohlc(6240, 11)
+        start = time.perf_counter()
+        detect_mmbm(df)
+        self.assertLess(time.perf_counter() - start, 20.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Tests for the shared OANDA transport: token-bucket pacing, retry rules
+per method, endpoint latency histograms and one session per credentials.
+
+Run from train-ict root:
+    python -m pytest tests/test_oanda_transport.py -v
+"""
+
+import json
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+_TRAIN_ICT_SRC = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(_TRAIN_ICT_SRC))
+
+import requests
+from requests.adapters import BaseAdapter
+
+from ict_agent.data.oanda_fetcher import OANDAConfig, OANDAFetcher
+from ict_agent.data.oanda_transport import (
+    OANDATransport,
+    TokenBucket,
+    endpoint_label,
+    get_transport,
+    reset_transports,
+)
+from ict_agent.execution.oanda_executor import OANDAExecutor
+
+BASE = "https://api-fxpractice.oanda.com"
+
+
+class ScriptedAdapter(BaseAdapter):
+    """Answers from a script of (status, body, headers) or exceptions."""
+
+    def __init__(self, script=None):
+        super().__init__()
+        self.script = list(script or [])
+        self.sent = []
+        self.lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self.lock:
+            self.sent.append((request.method, request.url, kwargs.get("timeout")))
+            step = self.script.pop(0) if self.script else (200, {"candles": []}, {})
+        if isinstance(step, Exception):
+            raise step
+        status, body, headers = step
+        response = requests.Response()
+        response.status_code = status
+        response._content = json.dumps(body).encode()
+        response.headers.update(headers)
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def make_transport(script=None, **kwargs):
+    sleeps = []
+    transport = OANDATransport("token", sleep=sleeps.append, **kwargs)
+    adapter = ScriptedAdapter(script)
+    transport.session.mount("https://", adapter)
+    return transport, adapter, sleeps
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_paced(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, burst=3, clock=clock, sleep=clock.sleep)
+        waits = [bucket.acquire() for _ in range(5)]
+        self.assertEqual(waits[:3], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(clock.now, 0.2)
+        self.assertEqual(bucket.waits, 2)
+
+
+class TestRetries(unittest.TestCase):
+    def test_get_retried_on_5xx_and_connection_error(self):
+        transport, adapter, sleeps = make_transport([
+            (503, {}, {}),
+            requests.ConnectionError("reset"),
+            (200, {"candles": [1]}, {}),
+        ])
+        response = transport.get(f"{BASE}/v3/instruments/EUR_USD/candles")
+        self.assertEqual(response.json(), {"candles": [1]})
+        self.assertEqual(len(adapter.sent), 3)
+        self.assertEqual(adapter.sent[0][2], (5.0, 30.0))
+        self.assertEqual(len(sleeps), 2)
+        self.assertEqual(transport.stats()["retries"], 2)
+
+    def test_post_retried_only_on_429(self):
+        transport, adapter, sleeps = make_transport([
+            (429, {}, {"Retry-After": "1.5"}),
+            (503, {"errorMessage": "busy"}, {}),
+        ])
+        response = transport.post(f"{BASE}/v3/accounts/101-1/orders", json={"order": {}})
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(len(adapter.sent), 2)
+        self.assertEqual(sleeps, [1.5])
+        self.assertEqual(transport.stats()["rate_limited"], 1)
+
+        adapter.script = [requests.ConnectionError("reset")]
+        with self.assertRaises(requests.ConnectionError):
+            transport.post(f"{BASE}/v3/accounts/101-1/orders", json={"order": {}})
+        self.assertEqual(len(adapter.sent), 3)
+
+    def test_gives_up_after_max_retries(self):
+        transport, adapter, _ = make_transport([(502, {}, {})] * 5, max_retries=2)
+        self.assertEqual(transport.get(f"{BASE}/v3/accounts/101-1/summary").status_code, 502)
+        self.assertEqual(len(adapter.sent), 3)
+
+
+class TestMetrics(unittest.TestCase):
+    def test_endpoint_labels(self):
+        self.assertEqual(endpoint_label("get", f"{BASE}/v3/instruments/EUR_USD/candles?count=5"),
+                         "GET /v3/instruments/{instrument}/candles")
+        self.assertEqual(endpoint_label("PUT", f"{BASE}/v3/accounts/101-1/trades/42/close"),
+                         "PUT /v3/accounts/{account}/trades/{trade}/close")
+        self.assertEqual(endpoint_label("GET", f"{BASE}/v3/accounts/101-1/openPositions"),
+                         "GET /v3/accounts/{account}/openPositions")
+
+    def test_concurrent_requests_share_histograms(self):
+        transport, adapter, _ = make_transport(rate_per_second=1000, burst=50)
+        threads = [
+            threading.Thread(target=lambda s=s: [
+                transport.get(f"{BASE}/v3/instruments/{s}/candles") for _ in range(10)
+            ])
+            for s in ("EUR_USD", "GBP_USD", "USD_JPY", "XAU_USD")
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        stats = transport.stats()
+        self.assertEqual(stats["requests"], 40)
+        candles = stats["endpoints"]["GET /v3/instruments/{instrument}/candles"]
+        self.assertEqual(candles["count"], 40)
+        self.assertEqual(sum(candles["buckets"].values()), 40)
+        self.assertIsNotNone(candles["p95_ms"])
+
+
+class TestSharedTransport(unittest.TestCase):
+    def setUp(self):
+        reset_transports()
+        self.addCleanup(reset_transports)
+
+    def test_clients_share_one_session(self):
+        config = OANDAConfig(api_key="token", account_id="101-1", environment="practice")
+        fetcher = OANDAFetcher(config)
+        executor = OANDAExecutor(api_key="token", account_id="101-1")
+        self.assertIs(fetcher.transport, executor.transport)
+        self.assertIs(OANDAFetcher(config).session, fetcher.session)
+        live = get_transport(OANDAConfig(api_key="token", environment="live"))
+        self.assertIsNot(live, fetcher.transport)
+
+        adapter = ScriptedAdapter([(200, {"candles": [{
+            "time": "2026-01-06T12:00:00.000000000Z", "complete": True, "volume": 7,
+            "mid": {"o": "1.1", "h": "1.2", "l": "1.0", "c": "1.15"},
+        }]}, {})])
+        fetcher.session.mount("https://", adapter)
+        df = fetcher.fetch_latest("EURUSD", "M15", 1)
+        self.assertEqual(float(df["close"].iloc[0]), 1.15)
+        self.assertIn("GET /v3/instruments/{instrument}/candles",
+                      executor.transport.stats()["endpoints"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Tests for the controller's EventScheduler: candle-close and killzone
+timers, level-cross wakes from the price stream, and blocking wait().
+
+Run from train-ict root:
+    python -m pytest tests/test_scheduler.py -v
+"""
+
+import json
+import sys
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+_TRAIN_ICT_SRC = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(_TRAIN_ICT_SRC))
+
+from ict_agent.controller.scheduler import EventScheduler, next_candle_close
+from ict_agent.data.price_stream import OANDAPriceStream
+from ict_agent.engine.killzone import KillzoneManager
+
+SYMBOLS = ["EUR_USD", "GBP_USD", "XAU_USD"]
+
+
+def utc(hour: int, minute: int = 0, second: int = 0, day: int = 6) -> datetime:
+    # 2026-01-06 is a Tuesday; the KillzoneManager clock is UTC-5
+    return datetime(2026, 1, day, hour, minute, second, tzinfo=timezone.utc)
+
+
+class Clock:
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def make_scheduler(now: datetime, **kwargs) -> EventScheduler:
+    return EventScheduler(SYMBOLS, KillzoneManager(), clock=Clock(now), **kwargs)
+
+
+class TestCandleClose(unittest.TestCase):
+    def test_next_close_per_granularity(self):
+        now = utc(12, 7, 30)
+        self.assertEqual(next_candle_close(now, "M15"), utc(12, 15))
+        self.assertEqual(next_candle_close(utc(12, 15), "M15"), utc(12, 30))
+        self.assertEqual(next_candle_close(now, "H1"), utc(13))
+        # H4 and D roll at 17:00 New York (EST in January)
+        self.assertEqual(next_candle_close(now, "H4"), utc(14))
+        self.assertEqual(next_candle_close(now, "D"), utc(22))
+
+
+class TestSchedulerTimers(unittest.TestCase):
+    def test_killzone_open_and_candle_close(self):
+        scheduler = make_scheduler(utc(11, 40), heartbeat_seconds=3600)  # 06:40 EST
+        self.assertEqual(scheduler.poll(utc(11, 45, 2)), [])
+        self.assertEqual(scheduler.stats()["wakes"], {"candle_close_suppressed": 1})
+
+        wakes = scheduler.poll(utc(12, 0, 2))  # NY AM opened at 12:00 UTC
+        self.assertEqual([w.reason for w in wakes], ["killzone_open", "candle_close"])
+        self.assertEqual(wakes[1].detail, "M15,H1")
+        self.assertEqual(scheduler.symbols_for(wakes), SYMBOLS)
+
+        wakes = scheduler.poll(utc(12, 15, 2))
+        self.assertEqual([(w.reason, w.detail) for w in wakes], [("candle_close", "M15")])
+
+    def test_killzone_close_and_heartbeat(self):
+        scheduler = make_scheduler(utc(15, 50), heartbeat_seconds=300)  # Silver bullet NY AM
+        self.assertTrue(scheduler.stats()["in_killzone"])
+        self.assertEqual(scheduler.stats()["next_killzone_change"], utc(16, 0, 1).isoformat())
+
+        self.assertEqual([w.reason for w in scheduler.poll(utc(15, 55))], ["heartbeat"])
+        wakes = scheduler.poll(utc(16, 0, 2))
+        self.assertEqual([w.reason for w in wakes], ["killzone_close"])
+        self.assertEqual(scheduler.symbols_for(wakes), [])
+        # The 16:00 and 16:15 closes fall outside the killzone; only the heartbeat is left
+        self.assertEqual([w.reason for w in scheduler.poll(utc(16, 15, 2))], ["heartbeat"])
+        self.assertEqual(scheduler.stats()["wakes"]["candle_close_suppressed"], 2)
+
+    def test_weekend_candles_do_not_wake(self):
+        scheduler = make_scheduler(utc(12, 5, day=10), heartbeat_seconds=3600)  # Saturday
+        self.assertEqual(scheduler.poll(utc(12, 15, 2, day=10)), [])
+
+    def test_weekend_killzones_do_not_open(self):
+        clock = Clock(utc(11, 40, day=10))  # Saturday
+        scheduler = EventScheduler(SYMBOLS, KillzoneManager(), clock=clock,
+                                   heartbeat_seconds=3600)
+        self.assertEqual(scheduler.poll(utc(12, 0, 2, day=10)), [])  # NY AM window
+        self.assertFalse(scheduler.stats()["in_killzone"])
+
+        scheduler.watch_levels("EUR_USD", [1.1000])
+        clock.now = utc(12, 10, day=10)
+        scheduler.on_price("EUR_USD", 1.0990, 1.0992)
+        scheduler.on_price("EUR_USD", 1.1005, 1.1007)
+        self.assertEqual(scheduler.poll(utc(12, 10, 5, day=10)), [])
+        self.assertEqual(scheduler.stats()["wakes"]["level_cross_suppressed"], 1)
+
+        # ...and its end: no killzone_close, only the hourly heartbeat
+        self.assertEqual([w.reason for w in scheduler.poll(utc(16, 0, 2, day=10))], ["heartbeat"])
+
+
+class TestLevelCross(unittest.TestCase):
+    def test_cross_wakes_only_that_symbol(self):
+        clock = Clock(utc(12, 5))
+        scheduler = EventScheduler(SYMBOLS, KillzoneManager(), clock=clock,
+                                   level_cooldown_seconds=60)
+        scheduler.watch_levels("GBP_USD", [1.2700, 1.2650])
+        scheduler.on_price("GBP_USD", 1.2690, 1.2692)
+        scheduler.on_price("GBP_USD", 1.2695, 1.2697)  # No level in between
+        self.assertEqual(scheduler.poll(), [])
+
+        scheduler.on_price("GBP_USD", 1.2701, 1.2703)
+        scheduler.on_price("GBP_USD", 1.2698, 1.2699)  # Back through, inside cooldown
+        wakes = scheduler.poll()
+        self.assertEqual([(w.reason, w.detail) for w in wakes], [("level_cross", "1.27")])
+        self.assertEqual(scheduler.symbols_for(wakes), ["GBP_USD"])
+
+        clock.now += timedelta(seconds=61)
+        scheduler.on_price("GBP_USD", 1.2640, 1.2642)
+        self.assertEqual(scheduler.symbols_for(scheduler.poll()), ["GBP_USD"])
+        self.assertEqual(scheduler.stats()["wakes"]["level_cross_cooldown"], 1)
+
+    def test_crosses_outside_killzone_suppressed(self):
+        scheduler = make_scheduler(utc(17, 30))  # 12:30 EST, NY lunch
+        scheduler.watch_levels("EUR_USD", [1.1000])
+        scheduler.on_price("EUR_USD", 1.0990, 1.0992)
+        scheduler.on_price("EUR_USD", 1.1005, 1.1007)
+        self.assertEqual(scheduler.poll(), [])
+        self.assertEqual(scheduler.stats()["wakes"]["level_cross_suppressed"], 1)
+
+    def test_wait_returns_on_tick_and_stop(self):
+        scheduler = make_scheduler(utc(12, 5))
+        scheduler.watch_levels("XAU_USD", [2650.0])
+        scheduler.on_price("XAU_USD", 2649.0, 2649.5)
+        threading.Timer(0.05, scheduler.on_price, ("XAU_USD", 2650.5, 2651.0)).start()
+
+        start = time.perf_counter()
+        wakes = scheduler.wait()
+        self.assertLess(time.perf_counter() - start, 2)
+        self.assertEqual(scheduler.symbols_for(wakes), ["XAU_USD"])
+
+        threading.Timer(0.05, scheduler.stop).start()
+        self.assertEqual(scheduler.wait(), [])
+
+    def test_price_stream_lines(self):
+        ticks = []
+        stream = OANDAPriceStream(SYMBOLS, lambda *tick: ticks.append(tick))
+        stream.handle_line(b'{"type":"HEARTBEAT","time":"2026-01-06T12:00:00Z"}')
+        stream.handle_line(json.dumps({
+            "type": "PRICE", "instrument": "EUR_USD",
+            "bids": [{"price": "1.10010", "liquidity": 1000000}],
+            "asks": [{"price": "1.10025", "liquidity": 1000000}],
+        }).encode())
+        stream.handle_line(b"")
+        self.assertEqual(ticks, [("EUR_USD", 1.1001, 1.10025)])
+
+
+if __name__ == "__main__":
+    unittest.main()
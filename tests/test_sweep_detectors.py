@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""Parity tests for the array-based TurtleSoupDetector and StopHuntDetector.
+
+Expected outputs in tests/fixtures/sweep_parity_expected.json were recorded
+from the original bar-by-bar implementations on tests/fixtures/sweep_bars.csv.
+
+Run from train-ict root:
+    python -m pytest tests/test_sweep_detectors.py -v
+"""
+
+import json
+import sys
+import time
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+_TRAIN_ICT_ROOT = Path(__file__).resolve().parent.parent
+_TRAIN_ICT_SRC = _TRAIN_ICT_ROOT / "src"
+sys.path.insert(0, str(_TRAIN_ICT_SRC))
+
+from ict_agent.core.stop_hunt import StopHuntDetector
+from ict_agent.models.turtle_soup import TurtleSoupDetector, TurtleSoupType
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+BARS_CSV = FIXTURES / "sweep_bars.csv"
+EXPECTED_JSON = FIXTURES / "sweep_parity_expected.json"
+
+# Window end offsets into the fixture frame scanned by TurtleSoupDetector
+TURTLE_WINDOW = 400
+TURTLE_STEP = 25
+
+
+def _random_bars(n: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    vol = np.where((np.arange(n) // 60) % 2 == 0, 0.0004, 0.0009)
+    close = 1.10 + np.cumsum(rng.normal(0, vol))
+    open_ = np.r_[close[0], close[:-1]]
+    upper = np.abs(rng.normal(0, vol * 0.8))
+    lower = np.abs(rng.normal(0, vol * 0.8))
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) + upper,
+            "low": np.minimum(open_, close) - lower,
+            "close": close,
+            "volume": rng.integers(100, 5000, n).astype(float),
+        },
+        index=pd.date_range("2024-01-01", periods=n, freq="15min"),
+    )
+
+
+def load_bars() -> pd.DataFrame:
+    return pd.read_csv(BARS_CSV, index_col=0, parse_dates=True)
+
+
+def _num(value):
+    return None if value is None else float(value)
+
+
+def serialize_turtle(detector: TurtleSoupDetector, setups) -> dict:
+    return {
+        "levels": [
+            [l.price, l.type, l.strength, l.swept, str(l.sweep_time)]
+            for l in detector.liquidity_levels
+        ],
+        "setups": [
+            {
+                "type": s.type.value,
+                "status": s.status.value,
+                "level": [s.swept_level.price, s.swept_level.type, s.swept_level.strength],
+                "sweep_idx": s.sweep_candle_idx,
+                "sweep_low": _num(s.sweep_low),
+                "sweep_high": _num(s.sweep_high),
+                "mss": [_num(s.mss_level), s.mss_candle_idx],
+                "zone": [_num(s.entry_zone_high), _num(s.entry_zone_low), s.entry_type],
+                "trade": [_num(s.entry_price), _num(s.stop_loss), _num(s.take_profit)],
+                "confidence": s.confidence,
+                "timestamp": str(s.timestamp),
+            }
+            for s in setups
+        ],
+    }
+
+
+def serialize_hunts(detector: StopHuntDetector, hunts) -> dict:
+    return {
+        "targets": [
+            [t.price, t.level_type, t.strength, t.index, t.is_protected]
+            for t in detector._liquidity_targets
+        ],
+        "hunts": [
+            {
+                "type": h.hunt_type.value,
+                "index": h.sweep_index,
+                "time": str(h.sweep_time),
+                "levels": [h.target_level, h.sweep_extreme, h.close_price],
+                "wick": h.wick_size_pips,
+                "rejection": [h.body_rejection_pips, h.rejection_quality.value],
+                "volume": [bool(h.volume_spike), float(h.volume_ratio)],
+                "displacement": bool(h.displacement_confirmed),
+                "trade": [_num(h.entry_price), _num(h.stop_loss), _num(h.target_price), _num(h.risk_reward)],
+                "confidence": h.confidence,
+                "notes": h.notes,
+            }
+            for h in hunts
+        ],
+    }
+
+
+def compute_outputs(df: pd.DataFrame) -> dict:
+    turtle = []
+    for end in range(TURTLE_WINDOW, len(df) + 1, TURTLE_STEP):
+        detector = TurtleSoupDetector()
+        setups = detector.analyze(df.iloc[end - TURTLE_WINDOW:end], "EURUSD", "15m")
+        turtle.append(serialize_turtle(detector, setups))
+
+    hunts = {}
+    for lookback in (5, 10):
+        detector = StopHuntDetector(swing_lookback=lookback)
+        hunts[str(lookback)] = serialize_hunts(detector, detector.detect(df, "EURUSD", "15m"))
+    no_volume = StopHuntDetector()
+    hunts["no_volume"] = serialize_hunts(
+        no_volume, no_volume.detect(df.drop(columns=["volume"]), "EURUSD", "15m")
+    )
+    return {"turtle_soup": turtle, "stop_hunt": hunts, "steps": compute_steps(df)}
+
+
+def compute_steps(df: pd.DataFrame) -> list:
+    """Per-candle detect_sweep / detect_mss / find_entry_zone on one window"""
+    window = df.iloc[:TURTLE_WINDOW]
+    detector = TurtleSoupDetector()
+    detector.build_liquidity_map(window)
+    steps = []
+    for i in range(TURTLE_WINDOW - 100, TURTLE_WINDOW):
+        sweep = detector.detect_sweep(window, i)
+        row = [None if sweep is None else [sweep[0].price, sweep[1].value]]
+        for soup_type in TurtleSoupType:
+            mss = detector.detect_mss(window, i, soup_type)
+            zone = detector.find_entry_zone(window, i, soup_type)
+            row.append(None if mss is None else [float(mss[0]), mss[1]])
+            row.append(None if zone is None else [zone["type"], float(zone["high"]), float(zone["low"]), zone["index"]])
+        steps.append(row)
+    return steps
+
+
+class TestSweepDetectorParity(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.df = load_bars()
+        cls.expected = json.loads(EXPECTED_JSON.read_text())
+        cls.actual = json.loads(json.dumps(compute_outputs(cls.df)))
+
+    def test_turtle_soup_matches_fixture(self):
+        self.assertEqual(len(self.actual["turtle_soup"]), len(self.expected["turtle_soup"]))
+        for actual, expected in zip(self.actual["turtle_soup"], self.expected["turtle_soup"]):
+            self.assertEqual(actual, expected)
+        self.assertTrue(any(w["setups"] for w in self.expected["turtle_soup"]))
+
+    def test_stop_hunt_matches_fixture(self):
+        for key, expected in self.expected["stop_hunt"].items():
+            self.assertEqual(self.actual["stop_hunt"][key], expected, key)
+            self.assertTrue(expected["hunts"])
+
+    def test_public_step_methods(self):
+        self.assertEqual(self.actual["steps"], self.expected["steps"])
+
+
+class TestSweepDetectorScaling(unittest.TestCase):
+    def test_50k_bar_frames(self):
+        df = _random_bars(50_000, 3)
+
+        start = time.perf_counter()
+        TurtleSoupDetector().analyze(df)
+        turtle_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        StopHuntDetector().detect(df)
+        hunt_elapsed = time.perf_counter() - start
+
+        self.assertLess(turtle_elapsed, 10.0)
+        self.assertLess(hunt_elapsed, 10.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
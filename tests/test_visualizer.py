@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Tests for EnhancedVisualizer batch markup: concurrent fetch, detector
+reuse on frames and collection-based candles.
+
+Run from train-ict root:
+    python -m pytest tests/test_visualizer.py -v
+"""
+
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+_TRAIN_ICT_SRC = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(_TRAIN_ICT_SRC))
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection, PolyCollection
+import numpy as np
+import pandas as pd
+
+from ict_agent.visualization import visualizer
+from ict_agent.visualization.visualizer import EnhancedVisualizer
+
+
+def make_frame(n: int = 200, seed: int = 1) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 0.0015, n))
+    open_ = np.r_[close[0], close[:-1]] + rng.normal(0, 0.0003, n)
+    return pd.DataFrame({
+        "open": open_,
+        "high": np.maximum(open_, close) + rng.uniform(0, 0.001, n),
+        "low": np.minimum(open_, close) - rng.uniform(0, 0.001, n),
+        "close": close,
+        "volume": rng.integers(1, 100, n),
+    }, index=pd.date_range("2026-01-05", periods=n, freq="15min", tz="UTC"))
+
+
+class FakeFetcher:
+    """Returns the same frame for every request, counting concurrent calls."""
+
+    def __init__(self, frame: pd.DataFrame, delay: float = 0.0):
+        self.frame = frame
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def fetch(self, config):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        return self.frame.tail(config.limit)
+
+
+def make_visualizer(frame: pd.DataFrame, delay: float = 0.0) -> EnhancedVisualizer:
+    viz = EnhancedVisualizer()
+    viz.fetcher = FakeFetcher(frame, delay)
+    return viz
+
+
+class TestBatchMarkup(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(visualizer, "SCREENSHOTS_DIR", Path(self.tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+        self.frame = make_frame()
+        plt.close("all")
+
+    def test_timeframes_fetched_concurrently(self):
+        viz = make_visualizer(self.frame, delay=0.05)
+        frames = viz.fetch_frames("EUR_USD", ["D", "H4", "H1", "M15"], 100)
+        self.assertEqual(list(frames), ["D", "H4", "H1", "M15"])
+        self.assertEqual(len(frames["H1"]), 100)
+        self.assertGreater(viz.fetcher.peak, 1)
+
+    def test_frame_and_candle_list_give_same_zones(self):
+        viz = make_visualizer(self.frame)
+        candles = viz.fetch_candles("EUR_USD", "M15", 200)
+        self.assertEqual(len(candles), 200)
+        self.assertEqual(candles[-1]["time"], self.frame.index[-1])
+
+        fvgs = viz._detect_fvgs(self.frame)
+        self.assertTrue(fvgs)
+        self.assertEqual(viz._detect_fvgs(candles), fvgs)
+        self.assertEqual(len(fvgs), len(viz.fvg_detector._fvgs))
+
+        obs = viz._detect_order_blocks(self.frame)
+        self.assertEqual(viz._detect_order_blocks(candles), obs)
+        body_tops = {ob.index: ob.body_top for ob in viz.ob_detector._order_blocks}
+        self.assertEqual({ob["index"]: ob["top"] for ob in obs}, body_tops)
+
+    def test_candles_drawn_as_collections(self):
+        viz = make_visualizer(self.frame)
+        fig, ax = plt.subplots()
+        viz._plot_candlesticks(ax, self.frame)
+        self.assertEqual([type(c) for c in ax.collections], [LineCollection, PolyCollection])
+        self.assertEqual(len(ax.collections[1].get_paths()), len(self.frame))
+        self.assertEqual(len(ax.patches), 0)
+        self.assertEqual(ax.get_xlim(), (-1, len(self.frame)))
+        low, high = ax.get_ylim()
+        self.assertLessEqual(low, self.frame["low"].min())
+        self.assertGreaterEqual(high, self.frame["high"].max())
+        plt.close(fig)
+
+    def test_swing_levels_match_loop(self):
+        highs, lows = self.frame["high"].to_numpy(), self.frame["low"].to_numpy()
+        expected_highs = [highs[i] for i in range(2, len(highs) - 2)
+                          if highs[i] > max(highs[i - 2], highs[i - 1], highs[i + 1], highs[i + 2])]
+        expected_lows = [lows[i] for i in range(2, len(lows) - 2)
+                         if lows[i] < min(lows[i - 2], lows[i - 1], lows[i + 1], lows[i + 2])]
+        swing_highs, swing_lows = visualizer._swing_levels(highs, lows)
+        self.assertEqual(swing_highs.tolist(), expected_highs)
+        self.assertEqual(swing_lows.tolist(), expected_lows)
+
+    def test_create_markup_with_prefetched_frames(self):
+        viz = make_visualizer(self.frame)
+        fig, path, data = viz.create_markup(
+            "EURUSD", ["H1", "M15"], frames={"H1": self.frame, "M15": pd.DataFrame()}
+        )
+        plt.close(fig)
+        self.assertTrue(Path(path).exists())
+        self.assertEqual(viz.fetcher.peak, 0)
+        self.assertEqual(data["H1_fvgs"], len(viz._detect_fvgs(self.frame)))
+        self.assertEqual(data["H1_price"], self.frame["close"].iloc[-1])
+        self.assertNotIn("M15_price", data)
+
+    def test_create_markups_inline(self):
+        viz = make_visualizer(self.frame)
+        results = viz.create_markups(["GBPUSD", "EURUSD"], ["H1"], bars=80, workers=1)
+        self.assertEqual(list(results), ["GBPUSD", "EURUSD"])
+        for path, data in results.values():
+            self.assertTrue(Path(path).exists())
+            self.assertIn(data["H1_zone"], ("PREMIUM", "DISCOUNT"))
+        self.assertEqual(plt.get_fignums(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -467,6 +467,17 @@ def cmd_viz(args):
             fig, path = viz.create_before_after(args.trade_id)
             if fig:
                 plt.show()
+        elif args.action == 'batch':
+            if args.pair:
+                pairs = args.pair.upper().split(",")
+            else:
+                from ict_agent.controller.agent_controller import VexConfig
+                pairs = VexConfig().symbols
+            timeframes = args.timeframes.upper().split(",") if args.timeframes else None
+            for pair, (path, data) in viz.create_markups(pairs, timeframes).items():
+                print(f"\n{pair}: {path or 'failed'}")
+                for k, v in data.items():
+                    print(f"  {k}: {v}")
         else:
             # Default: markup
             pair = args.pair or "EURUSD"
@@ -1041,6 +1052,7 @@ Commands:
   stats                          Show trading statistics
   patterns                       Show observed patterns
   remember <text>                Store something in memory
+  viz batch [PAIR1,PAIR2,...]    Markup the whole watchlist in parallel
   viz trade <PAIR> <DIR> <E> <S> <T>  Trade visualization
   viz beforeafter <TRADE_ID>     Before/after comparison
         """
@@ -1088,7 +1100,7 @@ Commands:
     # Visualization command
     viz_parser = subparsers.add_parser('viz', help='Enhanced visualization')
     viz_parser.add_argument('action', nargs='?', default='markup',
-                           choices=['markup', 'trade', 'beforeafter'],
+                           choices=['markup', 'batch', 'trade', 'beforeafter'],
                            help='Visualization action')
     viz_parser.add_argument('pair', nargs='?', help='Currency pair')
     viz_parser.add_argument('direction', nargs='?', help='Trade direction')